@@ -1,123 +1,56 @@
-"""One-time backfill: update team & position for players with empty team field.
+"""Backfill: update team & position for every player with an empty team field.
 
-Uses MLB Stats API + Supabase REST API (no supabase Python package needed).
+players를 player_id keyset 페이징으로 전부 읽고 (limit 없음), MLB Stats API를
+TokenBucket 속도 제한 아래 동시 조회한 뒤 players에 batch upsert.
+엔진은 src/etl/player_maintenance.py (normalize_team_names.py와 공유).
+
+Usage:
+    python -m scripts.backfill_player_teams
+    python -m scripts.backfill_player_teams --rate 20 --api-workers 8
 """
 
-import json
+import argparse
+import logging
 import os
-import time
-import requests
-
-SUPABASE_URL = os.environ.get("SUPABASE_URL", "https://igrcygsbefgpbywadzno.supabase.co")
-SUPABASE_KEY = os.environ.get("SUPABASE_KEY", "")
-MLB_API_BASE = "https://statsapi.mlb.com/api/v1"
-
-HEADERS = {
-    "apikey": SUPABASE_KEY,
-    "Authorization": f"Bearer {SUPABASE_KEY}",
-    "Content-Type": "application/json",
-    "Prefer": "return=minimal",
-}
-
+import sys
 
-def fetch_team_id_to_abbrev() -> dict[int, str]:
-    """Build team ID → abbreviation mapping from MLB Teams API."""
-    resp = requests.get(f"{MLB_API_BASE}/teams", params={"sportId": 1}, timeout=10)
-    resp.raise_for_status()
-    return {t["id"]: t.get("abbreviation", "") for t in resp.json()["teams"]}
+from dotenv import load_dotenv
 
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s', datefmt='%H:%M:%S')
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-def fetch_empty_team_players() -> list[dict]:
-    """Get all players with empty team field from Supabase."""
-    resp = requests.get(
-        f"{SUPABASE_URL}/rest/v1/players",
-        params={"select": "player_id,full_name,position", "team": "eq.", "limit": "200"},
-        headers=HEADERS,
-    )
-    resp.raise_for_status()
-    return resp.json()
+from src.etl.batch_uploader import UPLOAD_WORKERS
+from src.etl.player_maintenance import MLB_API_RATE, backfill_player_teams, maintenance_api_client
+from src.etl.player_registry import MLB_API_WORKERS
+from src.etl.upload_to_supabase import get_supabase_client
 
 
-def fetch_mlb_api(player_id: int, team_map: dict[int, str]) -> dict | None:
-    """Fetch player metadata from MLB Stats API."""
-    try:
-        resp = requests.get(
-            f"{MLB_API_BASE}/people/{player_id}",
-            params={"hydrate": "currentTeam"},
-            timeout=10,
-        )
-        resp.raise_for_status()
-        people = resp.json().get("people", [])
-        if not people:
-            return None
-        p = people[0]
-        team_obj = p.get("currentTeam", {})
-        team_abbrev = team_map.get(team_obj.get("id", 0), "")
-        return {
-            "team": team_abbrev,
-            "position": p.get("primaryPosition", {}).get("abbreviation", ""),
-            "full_name": p.get("fullName", ""),
-            "first_name": p.get("firstName", ""),
-            "last_name": p.get("lastName", ""),
-        }
-    except Exception as e:
-        print(f"  MLB API error for {player_id}: {e}")
-        return None
-
-
-def update_player(player_id: int, data: dict) -> bool:
-    """Update a player record in Supabase via REST API."""
-    resp = requests.patch(
-        f"{SUPABASE_URL}/rest/v1/players",
-        params={"player_id": f"eq.{player_id}"},
-        headers=HEADERS,
-        data=json.dumps(data),
-    )
-    return resp.status_code < 300
+def parse_args():
+    parser = argparse.ArgumentParser(description='Backfill empty player teams from the MLB Stats API')
+    parser.add_argument('--rate', type=float, default=MLB_API_RATE,
+                        help='MLB API requests per second across all workers')
+    parser.add_argument('--api-workers', type=int, default=MLB_API_WORKERS,
+                        help='Concurrent MLB API requests')
+    parser.add_argument('--upload-workers', type=int, default=UPLOAD_WORKERS,
+                        help='Concurrent Supabase upsert batches')
+    return parser.parse_args()
 
 
 def main():
-    if not SUPABASE_KEY:
+    args = parse_args()
+    if not os.environ.get('SUPABASE_KEY'):
         print("ERROR: SUPABASE_KEY environment variable required")
         return
 
-    print("Loading MLB team mappings...")
-    team_map = fetch_team_id_to_abbrev()
-    print(f"  {len(team_map)} teams loaded\n")
-
-    players = fetch_empty_team_players()
-    print(f"Found {len(players)} players with empty team field\n")
-
-    updated = 0
-    failed = 0
-    still_empty = 0
-
-    for p in players:
-        pid = p["player_id"]
-        info = fetch_mlb_api(pid, team_map)
-        if not info or not info["team"]:
-            print(f"  SKIP {pid:>8} {p['full_name']:30s} (no team from API — FA/retired)")
-            still_empty += 1
-            continue
-
-        update_data = {"team": info["team"], "position": info["position"]}
-
-        # Also fix full_name if it was a fallback like "Player 123456"
-        if p["full_name"].startswith("Player ") and info["full_name"]:
-            update_data["full_name"] = info["full_name"]
-            update_data["first_name"] = info["first_name"]
-            update_data["last_name"] = info["last_name"]
-
-        if update_player(pid, update_data):
-            print(f"  OK   {pid:>8} {p['full_name']:30s} -> {info['team']:4s} {info['position']}")
-            updated += 1
-        else:
-            print(f"  FAIL {pid:>8} {p['full_name']:30s}")
-            failed += 1
-
-        time.sleep(0.1)  # Be polite to MLB API
+    client = get_supabase_client()
+    api = maintenance_api_client(rate=args.rate, workers=args.api_workers)
+    stats = backfill_player_teams(client, api, workers=args.upload_workers)
 
-    print(f"\nDone: {updated} updated, {failed} failed, {still_empty} still empty (FA/retired)")
+    for pid in stats['still_empty']:
+        print(f"  SKIP {pid:>8} (no team from API — FA/retired)")
+    print(f"\nDone: {stats['updated']} updated, {len(stats['still_empty'])} still empty (FA/retired) "
+          f"of {stats['total']} players with empty team")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+"""Statcast Backfill CLI — 시즌 단위 병렬 수집 → 로컬 Statcast 캐시.
+
+Usage:
+    python -m scripts.backfill_statcast --start 2025-03-27 --end 2025-09-28
+    python -m scripts.backfill_statcast --start 2024-03-20 --end 2025-09-28 --workers 6 --chunk-days 7
+    python -m scripts.backfill_statcast --start 2025-04-01 --end 2025-04-30 --refresh
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import date
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s', datefmt='%H:%M:%S')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.etl.backfill_fetcher import BACKFILL_CHUNK_DAYS, BACKFILL_WORKERS, backfill_statcast
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Chunked parallel Statcast backfill')
+    parser.add_argument('--start', type=str, required=True, help='Start date (YYYY-MM-DD)')
+    parser.add_argument('--end', type=str, required=True, help='End date (YYYY-MM-DD, inclusive)')
+    parser.add_argument('--workers', type=int, default=BACKFILL_WORKERS, help='Concurrent chunk fetches')
+    parser.add_argument('--chunk-days', type=int, default=BACKFILL_CHUNK_DAYS, help='Days per chunk')
+    parser.add_argument('--refresh', action='store_true', help='Refetch chunks that are already cached')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    result = backfill_statcast(
+        date.fromisoformat(args.start), date.fromisoformat(args.end),
+        workers=args.workers, chunk_days=args.chunk_days, refresh=args.refresh,
+    )
+
+    print("\n" + "=" * 60)
+    print("BACKFILL SUMMARY")
+    print("=" * 60)
+    game_days = sum(1 for rows in result['days'].values() if rows)
+    print(f"  Chunks fetched: {result['chunks']} (skipped cached: {result['skipped']})")
+    print(f"  Game days: {game_days}, pitches: {sum(result['days'].values()):,}")
+    for chunk_start, chunk_end, error in result['failed']:
+        print(f"  FAILED {chunk_start} ~ {chunk_end}: {error}")
+    print("=" * 60)
+    if result['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
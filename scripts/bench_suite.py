@@ -0,0 +1,254 @@
+"""
+엔진 / ETL 벤치마크 suite (synthetic season — Supabase / 실제 Statcast parquet 불필요)
+
+src/etl/synthetic_season.py의 합성 리그(~1,470명)로 Statcast 투구 frame과 PA frame을 만들고
+파이프라인 단계별 핫스팟을 측정:
+
+    convert_statcast_to_pa       투구 → PA
+    elo_process / _array         EloBatch.process (파이프라인 기본 engine / array engine)
+    talent_process / _jit        TalentBatch.process (storage='matrix' / numba jit)
+    prepare_pa_records           plate_appearances 레코드
+    get_player_elo_records       player_elo 레코드 (이전 scripts/bench_player_records.py)
+    prepare_pa_detail_records    elo_pa_detail 레코드
+    prepare_ohlc_records         daily_ohlc 레코드
+    get_talent_player_records    talent_player_current 레코드
+    prepare_talent_*_records     talent_pa_detail / talent_daily_ohlc 레코드
+
+case마다 먼저 'day' 규모 입력으로 한 번 시간 측정 없이 실행 (numba compile / cache load,
+lazy import 제외 — jit은 입력 크기가 아니라 타입별로 compile). 그다음 최소 repeat회,
+그리고 측정 시간 합이 min_time(기본 0.5초)에 닿을 때까지 반복해 최솟값(best)을 기록
+(ms 단위 case의 timer 잡음 제거). scripts/bench_baselines.json의 같은 scale baseline보다
+threshold배(기본 1.25) 이상, 그리고 NOISE_FLOOR_SECONDS 이상 느리면 regression → exit code 1.
+baseline은 측정한 머신 기준이므로 다른 머신에서는 --update-baseline으로 다시 저장.
+
+Usage:
+    python -m scripts.bench_suite                              # season 규모, baseline 비교
+    python -m scripts.bench_suite --scale day --repeat 5
+    python -m scripts.bench_suite --only elo_process_array get_player_elo_records
+    python -m scripts.bench_suite --update-baseline
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.engine.elo_batch import EloBatch
+from src.engine.park_factor import ParkFactor
+from src.engine.re24_baseline import RE24Baseline
+from src.engine.talent_batch import TalentBatch
+from src.etl.statcast_to_pa import convert_statcast_to_pa
+from src.etl.synthetic_season import SCALES, synthetic_pa, synthetic_statcast
+from src.etl.upload_to_supabase import prepare_pa_records
+from scripts.run_elo import (
+    prepare_ohlc_records, prepare_pa_detail_records,
+    prepare_talent_ohlc_records, prepare_talent_pa_detail_records,
+)
+
+BASELINE_PATH = Path(__file__).parent / 'bench_baselines.json'
+REGRESSION_THRESHOLD = 1.25
+NOISE_FLOOR_SECONDS = 0.002     # baseline과의 차이가 이보다 작으면 regression 아님
+MIN_CASE_SECONDS = 0.5          # case별 측정 시간 합 하한 (짧은 case는 반복 횟수 증가)
+MAX_ROUNDS = 1000
+WARMUP_SCALE = 'day'
+DEFAULT_SEED = 2025
+
+
+class Workload:
+    """scale별 합성 입력과 처리 완료된 batch (case 간 공유, 필요할 때 생성)."""
+
+    def __init__(self, scale: str, seed: int = DEFAULT_SEED):
+        self.scale = scale
+        self.seed = seed
+        self._cache: dict = {}
+
+    def _get(self, name: str, build: Callable):
+        if name not in self._cache:
+            self._cache[name] = build()
+        return self._cache[name]
+
+    @property
+    def pa_df(self):
+        return self._get('pa_df', lambda: synthetic_pa(self.scale, self.seed))
+
+    @property
+    def pitches(self):
+        return self._get('pitches', lambda: synthetic_statcast(self.scale, self.seed, pa_df=self.pa_df))
+
+    @property
+    def elo_batch(self) -> EloBatch:
+        def build():
+            batch = EloBatch(engine='array', re24_baseline=RE24Baseline(), park_factor=ParkFactor())
+            batch.process(self.pa_df)
+            return batch
+        return self._get('elo_batch', build)
+
+    @property
+    def talent_batch(self) -> TalentBatch:
+        def build():
+            batch = TalentBatch(storage='matrix')
+            batch.process(self.pa_df)
+            return batch
+        return self._get('talent_batch', build)
+
+
+class Case(NamedTuple):
+    """setup(workload) → 입력 (시간 제외), run(입력) → 결과 (시간 측정), rows(workload) → 처리 행 수."""
+    setup: Callable
+    run: Callable
+    rows: Callable
+
+
+def _elo_batch(engine: str) -> Callable:
+    return lambda w: (EloBatch(engine=engine, re24_baseline=RE24Baseline(), park_factor=ParkFactor()), w.pa_df)
+
+
+def _talent_batch(**kwargs) -> Callable:
+    return lambda w: (TalentBatch(**kwargs), w.pa_df)
+
+
+def _pa_rows(w: Workload) -> int:
+    return len(w.pa_df)
+
+
+CASES: dict[str, Case] = {
+    'convert_statcast_to_pa': Case(lambda w: w.pitches, convert_statcast_to_pa, lambda w: len(w.pitches)),
+    'elo_process': Case(_elo_batch('python'), lambda args: args[0].process(args[1]), _pa_rows),
+    'elo_process_array': Case(_elo_batch('array'), lambda args: args[0].process(args[1]), _pa_rows),
+    'talent_process': Case(_talent_batch(storage='matrix'), lambda args: args[0].process(args[1]), _pa_rows),
+    'talent_process_jit': Case(_talent_batch(jit=True), lambda args: args[0].process(args[1]), _pa_rows),
+    'prepare_pa_records': Case(lambda w: w.pa_df, prepare_pa_records, _pa_rows),
+    'get_player_elo_records': Case(lambda w: w.elo_batch, lambda b: b.get_player_elo_records(),
+                                   lambda w: len(w.elo_batch.players)),
+    'prepare_pa_detail_records': Case(lambda w: w.elo_batch.pa_details, prepare_pa_detail_records,
+                                      lambda w: len(w.elo_batch.pa_details)),
+    'prepare_ohlc_records': Case(lambda w: w.elo_batch.daily_ohlc, prepare_ohlc_records,
+                                 lambda w: len(w.elo_batch.daily_ohlc)),
+    'get_talent_player_records': Case(lambda w: w.talent_batch, lambda b: b.get_talent_player_records(),
+                                      lambda w: len(w.talent_batch.get_talent_player_records())),
+    'prepare_talent_pa_detail_records': Case(lambda w: w.talent_batch.talent_pa_details,
+                                             prepare_talent_pa_detail_records,
+                                             lambda w: len(w.talent_batch.talent_pa_details)),
+    'prepare_talent_ohlc_records': Case(lambda w: w.talent_batch.talent_daily_ohlc, prepare_talent_ohlc_records,
+                                        lambda w: len(w.talent_batch.talent_daily_ohlc)),
+}
+
+
+def _time_case(case: Case, workload: Workload, repeat: int, min_time: float) -> list[float]:
+    """최소 repeat회, 측정 시간 합이 min_time 이상이 될 때까지 (MAX_ROUNDS 이하) 반복."""
+    timings: list[float] = []
+    while len(timings) < max(1, repeat) or (sum(timings) < min_time and len(timings) < MAX_ROUNDS):
+        args = case.setup(workload)
+        started = time.perf_counter()
+        case.run(args)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def run_suite(scale: str = 'season', repeat: int = 1, only: Optional[Iterable[str]] = None,
+              seed: int = DEFAULT_SEED, workload: Optional[Workload] = None,
+              min_time: float = MIN_CASE_SECONDS, warmup: bool = True) -> dict[str, dict]:
+    """case 이름 → {'seconds' (best), 'median', 'rounds', 'rows', 'rows_per_sec'}."""
+    if scale not in SCALES:
+        raise ValueError(f"Unknown scale: {scale!r} (expected one of {tuple(SCALES)})")
+    names = list(only) if only else list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {unknown} (expected among {list(CASES)})")
+    workload = workload or Workload(scale, seed)
+    warmup_workload = workload if scale == WARMUP_SCALE else Workload(WARMUP_SCALE, seed)
+
+    results = {}
+    for name in names:
+        case = CASES[name]
+        if warmup:
+            case.run(case.setup(warmup_workload))
+        timings = _time_case(case, workload, repeat, min_time)
+        best = min(timings)
+        rows = case.rows(workload)
+        results[name] = {
+            'seconds': round(best, 6),
+            'median': round(statistics.median(timings), 6),
+            'rounds': len(timings),
+            'rows': rows,
+            'rows_per_sec': round(rows / best, 1) if best > 0 else None,
+        }
+    return results
+
+
+def load_baselines(path: Path = BASELINE_PATH) -> dict:
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baselines(results: dict[str, dict], scale: str, path: Path = BASELINE_PATH) -> Path:
+    """scale의 case별 best seconds를 baseline으로 저장 (다른 scale / case는 유지)."""
+    baselines = load_baselines(path)
+    entry = baselines.setdefault(scale, {'cases': {}})
+    entry['cases'].update({name: r['seconds'] for name, r in results.items()})
+    entry['machine'] = f"{platform.system()} {platform.machine()}, Python {platform.python_version()}"
+    with open(path, 'w') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write('\n')
+    return path
+
+
+def compare(results: dict[str, dict], baseline: dict[str, float],
+            threshold: float = REGRESSION_THRESHOLD,
+            noise_floor: float = NOISE_FLOOR_SECONDS) -> dict[str, float]:
+    """baseline × threshold보다, 그리고 noise_floor초 이상 느린 case → 비율 (baseline 없는 case는 제외)."""
+    regressions = {}
+    for name, r in results.items():
+        base = baseline.get(name)
+        if base and r['seconds'] > base * threshold and r['seconds'] - base >= noise_floor:
+            regressions[name] = r['seconds'] / base
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Engine / ETL benchmark suite on a synthetic season')
+    parser.add_argument('--scale', choices=list(SCALES), default='season')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--min-time', type=float, default=MIN_CASE_SECONDS,
+                        help='Keep repeating a case until its timed runs add up to this many seconds')
+    parser.add_argument('--only', nargs='+', choices=list(CASES), help='Run only these cases')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='Regression if best time > baseline × threshold')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true', help='Store this run as the baseline')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    workload = Workload(args.scale, args.seed)
+    print(f"scale={args.scale}: {len(workload.pa_df):,} PAs, {len(workload.pitches):,} pitches")
+    results = run_suite(args.scale, args.repeat, args.only, workload=workload, min_time=args.min_time)
+    baseline = load_baselines(args.baseline).get(args.scale, {}).get('cases', {})
+    regressions = compare(results, baseline, args.threshold)
+
+    print(f"{'case':34s} {'best s':>10s} {'median s':>10s} {'rounds':>7s} {'rows/s':>14s} {'vs base':>8s}")
+    for name, r in results.items():
+        ratio = f"{r['seconds'] / baseline[name]:.2f}x" if baseline.get(name) else '-'
+        flag = '  REGRESSION' if name in regressions else ''
+        rate = f"{r['rows_per_sec']:,.0f}" if r['rows_per_sec'] is not None else '-'
+        print(f"{name:34s} {r['seconds']:10.4f} {r['median']:10.4f} {r['rounds']:7d} {rate:>14s} {ratio:>8s}{flag}")
+
+    if args.update_baseline:
+        print(f"\nBaseline saved: {save_baselines(results, args.scale, args.baseline)}")
+    elif regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.2f}x baseline")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
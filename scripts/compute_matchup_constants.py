@@ -8,32 +8,24 @@ Output: JSON to paste into frontend/src/lib/matchupPredictor.ts
 """
 import json
 import os
+import sys
 from collections import Counter
 
 from dotenv import load_dotenv
 from supabase import create_client
 
 load_dotenv()
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.etl.table_reader import read_table
 
 client = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_KEY"])
 
 # ---------- 1. ELO Distribution ----------
 
 print("=== Querying talent_player_current for ELO distribution ===")
-rows = []
-offset = 0
-page_size = 1000
-while True:
-    resp = (
-        client.table("talent_player_current")
-        .select("talent_type, player_role, season_elo")
-        .range(offset, offset + page_size - 1)
-        .execute()
-    )
-    rows.extend(resp.data)
-    if len(resp.data) < page_size:
-        break
-    offset += page_size
+rows = read_table(client, "talent_player_current", "talent_type, player_role, season_elo",
+                  key="player_id", unique=False).to_dict("records")
 
 print(f"  Fetched {len(rows)} rows")
 
@@ -57,23 +49,11 @@ for (talent_type, player_role), elos in sorted(groups.items()):
 # ---------- 2. League Averages ----------
 
 print("\n=== Querying plate_appearances for league averages ===")
-pa_rows = []
-offset = 0
-while True:
-    resp = (
-        client.table("plate_appearances")
-        .select("result_type")
-        .range(offset, offset + page_size - 1)
-        .execute()
-    )
-    pa_rows.extend(resp.data)
-    if len(resp.data) < page_size:
-        break
-    offset += page_size
-
-print(f"  Fetched {len(pa_rows)} plate appearances")
-
-counts = Counter(r["result_type"] for r in pa_rows)
+pa_df = read_table(client, "plate_appearances", "result_type", key="pa_id")
+
+print(f"  Fetched {len(pa_df)} plate appearances")
+
+counts = Counter(pa_df["result_type"].value_counts().to_dict())
 total = sum(counts.values())
 
 print(f"  Result type counts:")
@@ -3,15 +3,18 @@
 Usage:
     python -m scripts.daily_elo                        # 어제 처리
     python -m scripts.daily_elo --date 2026-04-02      # 특정 날짜
-    python -m scripts.daily_elo --date 2026-04-02 --force  # 강제 재처리
-    python -m scripts.daily_elo --range 2026-04-01 2026-04-03  # 범위 처리
+    python -m scripts.daily_elo --date 2026-04-02 --force  # 강제 재처리 (Statcast는 로컬 캐시 사용)
+    python -m scripts.daily_elo --date 2026-04-02 --force --refresh-statcast  # Statcast 재수집
+    python -m scripts.daily_elo --range 2026-04-01 2026-04-03  # 범위 처리 (in-memory)
+    python -m scripts.daily_elo --range 2026-04-01 2026-04-14 --checkpoint-days 7  # 7일마다 업로드
+    python -m scripts.daily_elo --date 2026-04-02 --elo-engine python  # 기존 루프 engine (결과 동일)
 """
 
 import argparse
 import logging
 import os
 import sys
-from datetime import date, timedelta
+from datetime import date
 
 from dotenv import load_dotenv
 
@@ -20,7 +23,8 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s', datefm
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.pipeline.daily_pipeline import run_daily_pipeline
+from src.engine.elo_batch import ENGINE_MODES
+from src.pipeline.daily_pipeline import DEFAULT_ELO_ENGINE, run_daily_pipeline, run_range_pipeline
 
 
 def parse_args():
@@ -29,6 +33,15 @@ def parse_args():
     parser.add_argument('--force', action='store_true', help='Force re-processing')
     parser.add_argument('--range', nargs=2, metavar=('START', 'END'),
                         help='Date range (YYYY-MM-DD YYYY-MM-DD, inclusive)')
+    parser.add_argument('--refresh-statcast', action='store_true',
+                        help='Ignore the local Statcast cache and refetch from Baseball Savant')
+    parser.add_argument('--checkpoint-days', type=int, default=None,
+                        help='Range mode: flush uploads every N processed dates (default: once at the end)')
+    parser.add_argument('--reapply-without-snapshot', action='store_true',
+                        help='With --force and no state snapshot matching Supabase, re-apply the dates on the '
+                             'current ratings (counts them twice; default: refuse)')
+    parser.add_argument('--elo-engine', choices=ENGINE_MODES, default=DEFAULT_ELO_ENGINE,
+                        help='EloBatch engine (all modes give identical ratings)')
     return parser.parse_args()
 
 
@@ -36,31 +49,32 @@ def main():
     args = parse_args()
 
     if args.range:
-        # Range mode: process each date in range
+        # Range mode: fetch once, keep state in memory, flush uploads at checkpoints
         start = date.fromisoformat(args.range[0])
         end = date.fromisoformat(args.range[1])
-        current = start
-        results = []
-        while current <= end:
-            result = run_daily_pipeline(target_date=current, force=args.force)
-            results.append(result)
-            current += timedelta(days=1)
+        result = run_range_pipeline(start, end, force=args.force, checkpoint_days=args.checkpoint_days,
+                                    refresh_statcast=args.refresh_statcast, elo_engine=args.elo_engine,
+                                    reapply_without_snapshot=args.reapply_without_snapshot)
 
         # Summary
         print("\n" + "=" * 60)
         print("RANGE PROCESSING SUMMARY")
         print("=" * 60)
-        for r in results:
-            status = r['status']
-            d = r['date']
-            if status == 'success':
-                print(f"  {d}: {r['pa_count']} PAs, {r['active_players']} players")
-            else:
-                print(f"  {d}: {status}")
+        for d in result['days']:
+            print(f"  {d['date']}: {d['pa_count']} PAs")
+        for d in result['skipped']:
+            print(f"  {d}: already_processed")
+        if result['status'] == 'success':
+            print(f"  Total: {result['pa_count']} PAs, {result['active_players']} players, "
+                  f"{result['new_players']} new players, {result['checkpoints']} upload checkpoint(s)")
+        else:
+            print(f"  {result['start']} ~ {result['end']}: {result['status']}")
     else:
         # Single date mode
         target = date.fromisoformat(args.date) if args.date else None
-        result = run_daily_pipeline(target_date=target, force=args.force)
+        result = run_daily_pipeline(target_date=target, force=args.force,
+                                    refresh_statcast=args.refresh_statcast, elo_engine=args.elo_engine,
+                                    reapply_without_snapshot=args.reapply_without_snapshot)
 
         print("\n" + "=" * 60)
         print(f"Result: {result['status']}")
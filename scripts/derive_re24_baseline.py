@@ -22,6 +22,7 @@ from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from src.etl.table_reader import read_table
 from src.etl.upload_to_supabase import get_supabase_client
 
 
@@ -62,27 +63,8 @@ def load_pa_data(client) -> pd.DataFrame:
     """Supabase에서 PA 데이터 로드 (state 계산에 필요한 컬럼만)."""
     print("Loading PA data from Supabase...")
 
-    all_rows = []
-    page_size = 1000
-    offset = 0
-
-    while True:
-        response = (
-            client.table('plate_appearances')
-            .select('on_1b, on_2b, on_3b, outs_when_up, delta_run_exp')
-            .order('pa_id')
-            .range(offset, offset + page_size - 1)
-            .execute()
-        )
-        rows = response.data
-        if not rows:
-            break
-        all_rows.extend(rows)
-        offset += page_size
-        if len(rows) < page_size:
-            break
-
-    df = pd.DataFrame(all_rows)
+    df = read_table(client, 'plate_appearances', 'on_1b, on_2b, on_3b, outs_when_up, delta_run_exp',
+                    key='pa_id')
     print(f"  Loaded {len(df):,} PAs")
     return df
 
@@ -0,0 +1,35 @@
+-- Phase 11: Bulk server-side delete for force reprocessing
+-- delete_date_data(client, date)가 pa_id를 페이징한 뒤 100개씩 DELETE하던 것을
+-- RPC 1회로 대체. 삭제 순서는 FK 의존성 (detail → ohlc → plate_appearances).
+-- 각 DELETE는 SQLite에서도 실행 가능한 subquery 형태 (tests/test_bulk_delete_261016.py).
+
+CREATE OR REPLACE FUNCTION delete_date_data(p_game_date DATE)
+RETURNS TABLE (table_name TEXT, deleted BIGINT) AS $$
+DECLARE
+  n BIGINT;
+BEGIN
+  DELETE FROM elo_pa_detail
+    WHERE pa_id IN (SELECT pa_id FROM plate_appearances WHERE game_date = p_game_date);
+  GET DIAGNOSTICS n = ROW_COUNT;
+  table_name := 'elo_pa_detail'; deleted := n; RETURN NEXT;
+
+  DELETE FROM talent_pa_detail
+    WHERE pa_id IN (SELECT pa_id FROM plate_appearances WHERE game_date = p_game_date);
+  GET DIAGNOSTICS n = ROW_COUNT;
+  table_name := 'talent_pa_detail'; deleted := n; RETURN NEXT;
+
+  DELETE FROM daily_ohlc WHERE game_date = p_game_date;
+  GET DIAGNOSTICS n = ROW_COUNT;
+  table_name := 'daily_ohlc'; deleted := n; RETURN NEXT;
+
+  DELETE FROM talent_daily_ohlc WHERE game_date = p_game_date;
+  GET DIAGNOSTICS n = ROW_COUNT;
+  table_name := 'talent_daily_ohlc'; deleted := n; RETURN NEXT;
+
+  DELETE FROM plate_appearances WHERE game_date = p_game_date;
+  GET DIAGNOSTICS n = ROW_COUNT;
+  table_name := 'plate_appearances'; deleted := n; RETURN NEXT;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+-- talent_pa_detail은 UNIQUE (pa_id, player_id, talent_type)의 선두 컬럼이 pa_id → 별도 인덱스 불필요
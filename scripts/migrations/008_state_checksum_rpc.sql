@@ -0,0 +1,16 @@
+-- Phase 12: Remote state checksum for the local warm-state cache
+-- fetch_state_watermark()가 row 수만 비교하면 scripts/run_elo.py 전체 재업로드나 설정 변경처럼
+-- 행 수는 같고 값만 바뀐 경우를 놓침 → 테이블별 row 수 + 전체 행 내용 md5를 RPC 1회로 반환.
+-- 행 순서는 PK 기준으로 고정 (같은 내용 → 같은 checksum).
+
+CREATE OR REPLACE FUNCTION state_checksum()
+RETURNS TABLE (table_name TEXT, row_count BIGINT, checksum TEXT) AS $$
+  SELECT 'player_elo'::TEXT, COUNT(*),
+         md5(COALESCE(string_agg(md5(pe::TEXT), '' ORDER BY pe.player_id), ''))
+  FROM player_elo pe
+  UNION ALL
+  SELECT 'talent_player_current'::TEXT, COUNT(*),
+         md5(COALESCE(string_agg(md5(tc::TEXT), ''
+                                 ORDER BY tc.player_id, tc.talent_type, tc.player_role), ''))
+  FROM talent_player_current tc;
+$$ LANGUAGE sql STABLE;
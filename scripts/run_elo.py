@@ -23,83 +23,104 @@ logging.basicConfig(level=logging.INFO, format='%(message)s')
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from src.engine.detail_buffer import DetailBuffer
 from src.engine.elo_batch import EloBatch
 from src.engine.elo_config import INITIAL_ELO
 from src.engine.re24_baseline import RE24Baseline
 from src.engine.park_factor import ParkFactor
+from src.engine.state_snapshot import SnapshotStore
 from src.engine.talent_batch import TalentBatch
+from src.etl.record_serializer import records_from_columns
+from src.etl.table_reader import read_table
 from src.etl.upload_to_supabase import get_supabase_client, upload_table
+from src.pipeline.state_cache import StateCache
 
 
 def load_pa_from_supabase(client) -> pd.DataFrame:
     """Supabase에서 전체 PA 데이터 로드 (정렬: game_date, pa_id)."""
     print("Loading PA data from Supabase...")
 
-    all_rows = []
-    page_size = 1000
-    offset = 0
-
-    while True:
-        response = (
-            client.table('plate_appearances')
-            .select('pa_id, game_pk, game_date, batter_id, pitcher_id, result_type, delta_run_exp, on_1b, on_2b, on_3b, outs_when_up, home_team')
-            .order('game_date')
-            .order('pa_id')
-            .range(offset, offset + page_size - 1)
-            .execute()
-        )
-        rows = response.data
-        if not rows:
-            break
-        all_rows.extend(rows)
-        offset += page_size
-        if len(rows) < page_size:
-            break
-
-    df = pd.DataFrame(all_rows)
+    df = read_table(
+        client, 'plate_appearances',
+        'pa_id, game_pk, game_date, batter_id, pitcher_id, result_type, delta_run_exp, '
+        'on_1b, on_2b, on_3b, outs_when_up, home_team',
+        key='pa_id',
+    )
+    if not df.empty:
+        df = df.sort_values(['game_date', 'pa_id'], kind='stable').reset_index(drop=True)
     print(f"  Loaded {len(df):,} PAs")
     return df
 
 
-def prepare_pa_detail_records(pa_details: list[dict]) -> list[dict]:
-    """elo_pa_detail 레코드 변환."""
-    records = []
-    for d in pa_details:
-        records.append({
-            'pa_id': int(d['pa_id']),
-            'batter_id': int(d['batter_id']),
-            'pitcher_id': int(d['pitcher_id']),
-            'result_type': d['result_type'],
-            'batter_elo_before': round(d['batter_elo_before'], 4),
-            'batter_elo_after': round(d['batter_elo_after'], 4),
-            'pitcher_elo_before': round(d['pitcher_elo_before'], 4),
-            'pitcher_elo_after': round(d['pitcher_elo_after'], 4),
-            'on_base_delta': round(d['elo_delta'], 4),
+def prepare_pa_detail_records(pa_details: DetailBuffer) -> list[dict]:
+    """elo_pa_detail 레코드 변환 (컬럼 버퍼 → dict)."""
+    return records_from_columns(
+        {
+            'pa_id': pa_details.column('pa_id'),
+            'batter_id': pa_details.column('batter_id'),
+            'pitcher_id': pa_details.column('pitcher_id'),
+            'result_type': pa_details.column('result_type'),
+            'batter_elo_before': pa_details.column('batter_elo_before'),
+            'batter_elo_after': pa_details.column('batter_elo_after'),
+            'pitcher_elo_before': pa_details.column('pitcher_elo_before'),
+            'pitcher_elo_after': pa_details.column('pitcher_elo_after'),
+            'on_base_delta': pa_details.column('elo_delta'),
             'power_delta': 0.0,
-            'k_base': round(d.get('k_base', 0.0), 4),
-            'physics_mod': round(d.get('physics_mod', 1.0), 4),
-            'k_effective': round(d.get('k_effective', 0.0), 4),
-        })
-    return records
+            'k_base': pa_details.column('k_base'),
+            'physics_mod': pa_details.column('physics_mod'),
+            'k_effective': pa_details.column('k_effective'),
+        },
+        round_columns=['batter_elo_before', 'batter_elo_after', 'pitcher_elo_before',
+                       'pitcher_elo_after', 'on_base_delta', 'k_base', 'physics_mod', 'k_effective'],
+    )
+
+
+def prepare_talent_pa_detail_records(details: DetailBuffer) -> list[dict]:
+    """talent_pa_detail 레코드 변환 (컬럼 버퍼 → dict)."""
+    return records_from_columns(
+        {name: details.column(name)
+         for name in ('pa_id', 'player_id', 'player_role', 'talent_type', 'elo_before', 'elo_after')},
+        round_columns=['elo_before', 'elo_after'],
+    )
 
 
 def prepare_ohlc_records(daily_ohlc) -> list[dict]:
     """daily_ohlc 레코드 변환."""
-    records = []
-    for ohlc in daily_ohlc:
-        records.append({
-            'player_id': int(ohlc.player_id),
-            'game_date': ohlc.game_date.isoformat(),
-            'elo_type': ohlc.elo_type,
-            'open': round(ohlc.open_elo, 4),
-            'high': round(ohlc.high_elo, 4),
-            'low': round(ohlc.low_elo, 4),
-            'close': round(ohlc.close_elo, 4),
-            'games_played': ohlc.games_played,
-            'total_pa': ohlc.total_pa,
-            'role': ohlc.role,
-        })
-    return records
+    return records_from_columns(
+        {
+            'player_id': [o.player_id for o in daily_ohlc],
+            'game_date': [o.game_date for o in daily_ohlc],
+            'elo_type': [o.elo_type for o in daily_ohlc],
+            'open': [o.open_elo for o in daily_ohlc],
+            'high': [o.high_elo for o in daily_ohlc],
+            'low': [o.low_elo for o in daily_ohlc],
+            'close': [o.close_elo for o in daily_ohlc],
+            'games_played': [o.games_played for o in daily_ohlc],
+            'total_pa': [o.total_pa for o in daily_ohlc],
+            'role': [o.role for o in daily_ohlc],
+        },
+        int_columns=['player_id'],
+        round_columns=['open', 'high', 'low', 'close'],
+        date_columns=['game_date'],
+    )
+
+
+def prepare_talent_ohlc_records(talent_daily_ohlc: list[dict]) -> list[dict]:
+    """talent_daily_ohlc 레코드 변환."""
+    return records_from_columns(
+        {
+            'player_id': [o['player_id'] for o in talent_daily_ohlc],
+            'game_date': [o['game_date'] for o in talent_daily_ohlc],
+            'talent_type': [o['talent_type'] for o in talent_daily_ohlc],
+            'elo_type': [o['elo_type'] for o in talent_daily_ohlc],
+            'open_elo': [o['open'] for o in talent_daily_ohlc],
+            'high_elo': [o['high'] for o in talent_daily_ohlc],
+            'low_elo': [o['low'] for o in talent_daily_ohlc],
+            'close_elo': [o['close'] for o in talent_daily_ohlc],
+            'total_pa': [o['total_pa'] for o in talent_daily_ohlc],
+        },
+        round_columns=['open_elo', 'high_elo', 'low_elo', 'close_elo'],
+    )
 
 
 def print_summary(batch: EloBatch):
@@ -184,12 +205,12 @@ def main():
 
     # 3. Run ELO calculation
     print("\nRunning ELO calculation (V5.3 state norm + park factor)...")
-    batch = EloBatch(re24_baseline=baseline, park_factor=park_factor)
+    batch = EloBatch(re24_baseline=baseline, park_factor=park_factor, engine='array')
     batch.process(pa_df)
 
     # 3b. Run talent ELO calculation
     print("\nRunning 9D Talent ELO calculation...")
-    talent_batch = TalentBatch()
+    talent_batch = TalentBatch(storage='matrix', jit=True)
     talent_batch.process(pa_df)
     print(f"  Talent PA details: {len(talent_batch.talent_pa_details):,}")
     print(f"  Talent OHLC records: {len(talent_batch.talent_daily_ohlc):,}")
@@ -199,10 +220,12 @@ def main():
     # 4. Summary
     print_summary(batch)
 
-    # 5. Upload results
+    # 5. Upload results (전체 재계산 → daily pipeline local state cache / state snapshot은 stale)
     print("\n" + "=" * 60)
     print("UPLOADING RESULTS TO SUPABASE")
     print("=" * 60)
+    StateCache().invalidate()
+    print(f"  Cleared {SnapshotStore().clear():,} stale state snapshots")
 
     # 5a. player_elo
     print("\n--- player_elo ---")
@@ -230,31 +253,14 @@ def main():
 
     # 5e. talent_pa_detail
     print("\n--- talent_pa_detail ---")
-    talent_pa_records = [{
-        'pa_id': d['pa_id'],
-        'player_id': d['player_id'],
-        'player_role': d['player_role'],
-        'talent_type': d['talent_type'],
-        'elo_before': round(d['elo_before'], 4),
-        'elo_after': round(d['elo_after'], 4),
-    } for d in talent_batch.talent_pa_details]
+    talent_pa_records = prepare_talent_pa_detail_records(talent_batch.talent_pa_details)
     n = upload_table(client, 'talent_pa_detail', talent_pa_records, batch_size=1000,
                      on_conflict='pa_id,player_id,talent_type')
     print(f"  Uploaded: {n:,}")
 
     # 5f. talent_daily_ohlc
     print("\n--- talent_daily_ohlc ---")
-    talent_ohlc_records = [{
-        'player_id': o['player_id'],
-        'game_date': o['game_date'],
-        'talent_type': o['talent_type'],
-        'elo_type': o['elo_type'],
-        'open_elo': round(o['open'], 4),
-        'high_elo': round(o['high'], 4),
-        'low_elo': round(o['low'], 4),
-        'close_elo': round(o['close'], 4),
-        'total_pa': o['total_pa'],
-    } for o in talent_batch.talent_daily_ohlc]
+    talent_ohlc_records = prepare_talent_ohlc_records(talent_batch.talent_daily_ohlc)
     n = upload_table(client, 'talent_daily_ohlc', talent_ohlc_records, batch_size=1000,
                      on_conflict='player_id,game_date,talent_type,elo_type')
     print(f"  Uploaded: {n:,}")
@@ -0,0 +1,336 @@
+"""Config Sweep — 여러 ELO 설정 변형을 시즌 1회 replay로 동시 계산.
+
+상태 배열에 선행 config 축(C)을 두고, 날짜별 wavefront wave(see wavefront)마다
+모든 변형을 한 번의 NumPy scatter update로 갱신. 변형별 결과는 같은 설정으로
+EloBatch / TalentBatch를 따로 돌린 시즌 ELO와 동일.
+
+- run_elo_sweep:    V5.3 ELO — K_FACTOR, EVENT_K_FACTORS, PHYSICS_ALPHA 변형
+- run_talent_sweep: 9D talent — MultiEloConfig 변형 (YAML expected_divisor 등)
+
+Usage:
+    result = run_elo_sweep(pa_df, [EloVariant('base'), EloVariant('k10', k_factor=10.0)])
+    result.summary(top_n=20)        # 변형별 zero-sum drift / spread / top-N overlap
+    result.ratings('k10')           # 변형별 최종 rating DataFrame
+
+    configs = [base, base.with_expected_divisors(batter={'contact': 150.0})]
+    run_talent_sweep(pa_df, configs, names=['base', 'contact150']).summary()
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.engine.elo_arrays import day_run_ids, float_column, game_date_strings, object_column, truthy_column
+from src.engine.elo_config import EVENT_K_FACTORS, INITIAL_ELO, K_FACTOR, MIN_ELO, PHYSICS_ALPHA
+from src.engine.elo_features import (
+    bip_mask,
+    compute_elo_features,
+    elo_deltas,
+    event_k_base,
+    field_error_mask,
+    physics_modifiers,
+)
+from src.engine.multi_elo_config import MultiEloConfig
+from src.engine.multi_elo_types import (
+    BATTER_DEFAULT_WEIGHTS,
+    BATTER_DIM_NAMES,
+    DEFAULT_ELO,
+    ELO_MAX,
+    ELO_MIN,
+    PITCHER_DIM_NAMES,
+    PITCHER_ROLE_WEIGHTS,
+    reliability_ramp,
+)
+from src.engine.player_index import PlayerIndex
+from src.engine.talent_kernel import clutch_scales
+from src.engine.wavefront import build_wavefront
+
+
+@dataclass(frozen=True)
+class EloVariant:
+    """V5.3 ELO 설정 변형 (event_k_overrides는 EVENT_K_FACTORS 위에 덮어씀)."""
+    name: str = 'baseline'
+    k_factor: float = K_FACTOR
+    event_k_overrides: dict[str, float] = field(default_factory=dict)
+    physics_alpha: float = PHYSICS_ALPHA
+
+    @property
+    def event_k_factors(self) -> dict[str, float]:
+        return {**EVENT_K_FACTORS, **self.event_k_overrides}
+
+
+def _top_n_overlap(scores: np.ndarray, mask: np.ndarray, top_n: int) -> np.ndarray:
+    """변형별 top-N 선수 집합과 첫 변형 top-N의 겹침 비율 (C,)."""
+    candidates = np.flatnonzero(mask)
+    n = min(top_n, len(candidates))
+    if n == 0:
+        return np.full(len(scores), np.nan)
+    order = np.argsort(-scores[:, candidates], axis=1, kind='stable')[:, :n]
+    top = candidates[order]
+    baseline = set(top[0].tolist())
+    return np.array([len(baseline.intersection(t.tolist())) / n for t in top])
+
+
+def _spread(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """변형별 표준편차 (대상 선수 없으면 NaN)."""
+    if not mask.any():
+        return np.full(len(values), np.nan)
+    return values[:, mask].std(axis=1)
+
+
+def _variant_index(names: list[str], key) -> int:
+    if isinstance(key, str):
+        if key not in names:
+            raise KeyError(f"Unknown variant: {key!r}")
+        return names.index(key)
+    return int(key)
+
+
+# ─── V5.3 ELO sweep ───
+
+
+@dataclass
+class EloSweepResult:
+    """변형별 최종 batting/pitching ELO (C × players, player 순서는 EloBatch.players와 동일)."""
+    variants: list[EloVariant]
+    player_ids: np.ndarray
+    batting_elo: np.ndarray   # (C, P)
+    pitching_elo: np.ndarray  # (C, P)
+    batting_pa: np.ndarray    # (P,) 변형과 무관
+    pitching_pa: np.ndarray   # (P,)
+
+    @property
+    def names(self) -> list[str]:
+        return [v.name for v in self.variants]
+
+    def ratings(self, variant) -> pd.DataFrame:
+        """변형(이름 또는 index)의 선수별 최종 rating."""
+        i = _variant_index(self.names, variant)
+        return pd.DataFrame({
+            'player_id': self.player_ids,
+            'batting_elo': self.batting_elo[i],
+            'pitching_elo': self.pitching_elo[i],
+            'batting_pa': self.batting_pa,
+            'pitching_pa': self.pitching_pa,
+        })
+
+    def summary(self, top_n: int = 20, min_pa: int = 1) -> pd.DataFrame:
+        """변형별 요약.
+
+        zero_sum_drift: Σ(batting - INITIAL) + Σ(pitching - INITIAL) (MIN_ELO clamp / 에러 마스크로 생긴 순증감)
+        *_spread:       min_pa 이상 선수의 ELO 표준편차
+        *_top_overlap:  top_n 선수 집합이 첫 변형과 겹치는 비율
+        """
+        batters = self.batting_pa >= min_pa
+        pitchers = self.pitching_pa >= min_pa
+        return pd.DataFrame({
+            'variant': self.names,
+            'zero_sum_drift': ((self.batting_elo - INITIAL_ELO).sum(axis=1)
+                               + (self.pitching_elo - INITIAL_ELO).sum(axis=1)),
+            'batting_spread': _spread(self.batting_elo, batters),
+            'pitching_spread': _spread(self.pitching_elo, pitchers),
+            'batting_top_overlap': _top_n_overlap(self.batting_elo, batters, top_n),
+            'pitching_top_overlap': _top_n_overlap(self.pitching_elo, pitchers, top_n),
+        })
+
+
+def run_elo_sweep(pa_df: pd.DataFrame, variants: list[EloVariant],
+                  re24_baseline=None, park_factor=None) -> EloSweepResult:
+    """모든 변형을 시즌 1회 replay로 계산 (신규 시즌, 초기 상태 INITIAL_ELO).
+
+    변형과 무관한 RV 보정(park / RE24)은 한 번만 계산하고, 변형별로는
+    K-Modulation factor만 다시 계산.
+    """
+    if not variants:
+        raise ValueError("variants must not be empty")
+    n_cfg, total = len(variants), len(pa_df)
+    base = compute_elo_features(pa_df, re24_baseline=re24_baseline, park_factor=park_factor)
+    has_rv = base['has_rv'].to_numpy()
+    rv = base['delta_run_exp'].to_numpy()
+    rv_diff = base['rv_diff'].to_numpy()
+    result_types = object_column(pa_df, 'result_type')
+    xwoba = float_column(pa_df, 'xwoba')
+    is_bip = bip_mask(result_types)
+    is_error = field_error_mask(result_types)
+
+    k_effective = np.empty((n_cfg, total))
+    for c, variant in enumerate(variants):
+        k_effective[c] = (event_k_base(result_types, variant.k_factor, variant.event_k_factors)
+                          * physics_modifiers(is_bip, xwoba, variant.physics_alpha))
+    batter_deltas, pitcher_deltas = elo_deltas(k_effective, rv_diff, is_error, has_rv)
+
+    # 신규 선수 등록 순서를 EloBatch와 맞춤 (타석마다 batter → pitcher)
+    interleaved = np.empty(2 * total, dtype=np.int64)
+    interleaved[0::2] = pa_df['batter_id'].to_numpy()
+    interleaved[1::2] = pa_df['pitcher_id'].to_numpy()
+    index = PlayerIndex()
+    all_idx = index.intern_many(interleaved)
+    b_idx, p_idx = all_idx[0::2], all_idx[1::2]
+    n_players = len(index)
+
+    bat = np.full((n_cfg, n_players), INITIAL_ELO)
+    pit = np.full((n_cfg, n_players), INITIAL_ELO)
+    if total:
+        schedule = build_wavefront(day_run_ids(game_date_strings(pa_df)), b_idx, p_idx)
+        for wave in schedule.waves():
+            rv_pa = wave[has_rv[wave]]
+            if not len(rv_pa):
+                continue
+            rb, rp = b_idx[rv_pa], p_idx[rv_pa]
+            new_b = bat[:, rb] + batter_deltas[:, rv_pa]
+            bat[:, rb] = np.where(new_b > MIN_ELO, new_b, MIN_ELO)
+            new_p = pit[:, rp] + pitcher_deltas[:, rv_pa]
+            pit[:, rp] = np.where(new_p > MIN_ELO, new_p, MIN_ELO)
+
+    return EloSweepResult(
+        variants=list(variants),
+        player_ids=index.ids,
+        batting_elo=bat,
+        pitching_elo=pit,
+        batting_pa=np.bincount(b_idx, minlength=n_players),
+        pitching_pa=np.bincount(p_idx, minlength=n_players),
+    )
+
+
+# ─── 9D talent sweep ───
+
+
+@dataclass
+class TalentSweepResult:
+    """변형별 최종 season talent ELO (batter C × N × 5, pitcher C × M × 4)."""
+    names: list[str]
+    batter_ids: np.ndarray
+    pitcher_ids: np.ndarray
+    batter_elo: np.ndarray   # (C, N, 5)
+    pitcher_elo: np.ndarray  # (C, M, 4)
+    batter_pa: np.ndarray    # (N,)
+    pitcher_pa: np.ndarray   # (M,)
+
+    def ratings(self, variant) -> pd.DataFrame:
+        """변형의 선수 × 차원 season ELO (get_talent_player_records와 같은 long format)."""
+        i = _variant_index(self.names, variant)
+        frames = []
+        for role, ids, elo, pa, dims in (
+            ('batter', self.batter_ids, self.batter_elo[i], self.batter_pa, BATTER_DIM_NAMES),
+            ('pitcher', self.pitcher_ids, self.pitcher_elo[i], self.pitcher_pa, PITCHER_DIM_NAMES),
+        ):
+            frames.append(pd.DataFrame({
+                'player_id': np.repeat(ids, len(dims)),
+                'player_role': role,
+                'talent_type': np.tile(dims, len(ids)),
+                'season_elo': elo.ravel(),
+                'pa_count': np.repeat(pa, len(dims)),
+            }))
+        return pd.concat(frames, ignore_index=True)
+
+    def summary(self, top_n: int = 20, min_pa: int = 1) -> pd.DataFrame:
+        """변형별 요약 (composite ELO 기준, 투수는 starter 가중치).
+
+        *_drift:       min_pa 이상 선수의 composite 평균 - DEFAULT_ELO
+        *_spread:      composite 표준편차
+        *_top_overlap: top_n 선수 집합이 첫 변형과 겹치는 비율
+        """
+        batters = self.batter_pa >= min_pa
+        pitchers = self.pitcher_pa >= min_pa
+        b_comp = self.batter_elo @ BATTER_DEFAULT_WEIGHTS
+        p_comp = self.pitcher_elo @ PITCHER_ROLE_WEIGHTS['starter']
+
+        def drift(values, mask):
+            if not mask.any():
+                return np.full(len(values), np.nan)
+            return values[:, mask].mean(axis=1) - DEFAULT_ELO
+
+        return pd.DataFrame({
+            'variant': self.names,
+            'batter_drift': drift(b_comp, batters),
+            'pitcher_drift': drift(p_comp, pitchers),
+            'batter_spread': _spread(b_comp, batters),
+            'pitcher_spread': _spread(p_comp, pitchers),
+            'batter_top_overlap': _top_n_overlap(b_comp, batters, top_n),
+            'pitcher_top_overlap': _top_n_overlap(p_comp, pitchers, top_n),
+        })
+
+
+def _stack_configs(configs: list[MultiEloConfig]):
+    """config 축으로 쌓은 테이블 (이벤트 코드 / 차원 구조가 같아야 함)."""
+    first = configs[0]
+    for config in configs[1:]:
+        if (config.tables.event_codes != first.tables.event_codes
+                or not np.array_equal(config.stacked.opp_idx, first.stacked.opp_idx)):
+            raise ValueError("sweep configs must share event types and dimension layout")
+    stacked = [c.stacked for c in configs]
+    return {
+        name: np.stack([getattr(st, name) for st in stacked])
+        for name in ('weights', 'actual', 'k_scale', 'threshold', 'divisor')
+    }
+
+
+def run_talent_sweep(pa_df: pd.DataFrame, configs: list[MultiEloConfig],
+                     names: Optional[list[str]] = None) -> TalentSweepResult:
+    """MultiEloConfig 변형들을 시즌 1회 replay로 계산 (신규 시즌, season 상태만).
+
+    변형별 결과는 TalentBatch(config=변형).process(pa_df)의 season ELO와 동일.
+    """
+    if not configs:
+        raise ValueError("configs must not be empty")
+    names = list(names) if names is not None else [f"v{i}" for i in range(len(configs))]
+    if len(names) != len(configs):
+        raise ValueError("names and configs must have the same length")
+    tables = _stack_configs(configs)
+    first = configs[0].stacked
+    n_b, clutch_cols, opp_idx = first.n_batter, first.clutch_cols, first.opp_idx
+    n_cfg, total = len(configs), len(pa_df)
+
+    batter_ids = pa_df['batter_id'].to_numpy().astype(np.int64)
+    pitcher_ids = pa_df['pitcher_id'].to_numpy().astype(np.int64)
+    if 'result_type' in pa_df.columns:
+        result_types = pd.Series(object_column(pa_df, 'result_type'), dtype=object)
+    else:
+        result_types = pd.Series(['OUT'] * total, dtype=object)
+    codes = result_types.map(configs[0].tables.event_code).to_numpy().astype(np.int64)
+    is_risp = truthy_column(pa_df, 'on_2b') | truthy_column(pa_df, 'on_3b')
+    scales = np.stack([clutch_scales(c, codes, is_risp) for c in configs])  # (C, n)
+
+    b_index, p_index = PlayerIndex(), PlayerIndex()
+    b_rows = b_index.intern_many(batter_ids)
+    p_rows = p_index.intern_many(pitcher_ids)
+    b_elo = np.full((n_cfg, len(b_index), n_b), DEFAULT_ELO)
+    p_elo = np.full((n_cfg, len(p_index), len(PITCHER_DIM_NAMES)), DEFAULT_ELO)
+    b_cnt = np.zeros_like(b_elo)
+    p_cnt = np.zeros_like(p_elo)
+
+    weights_t, actual_t = tables['weights'], tables['actual']
+    k_scale = tables['k_scale'][:, None, :]
+    threshold = tables['threshold'][:, None, :]
+    divisor = tables['divisor'][:, None, :]
+    if total:
+        schedule = build_wavefront(day_run_ids(game_date_strings(pa_df)), batter_ids, pitcher_ids)
+        for wave in schedule.waves():
+            b, p, code = b_rows[wave], p_rows[wave], codes[wave]
+            weights = weights_t[:, code]
+            weights[:, :, clutch_cols] *= scales[:, wave][:, :, None]
+            elo = np.concatenate((b_elo[:, b], p_elo[:, p]), axis=2)
+            expected = 1.0 / (1.0 + 10.0 ** ((elo[:, :, opp_idx] - elo) / divisor))
+            counts = np.concatenate((b_cnt[:, b], p_cnt[:, p]), axis=2)
+            reliability = reliability_ramp(counts, threshold)
+            delta = k_scale * np.abs(weights) * (actual_t[:, code] - expected) * reliability
+            hit = delta != 0
+            for elo_mat, cnt_mat, rows, cols in ((b_elo, b_cnt, b, slice(None, n_b)),
+                                                 (p_elo, p_cnt, p, slice(n_b, None))):
+                updated = elo_mat[:, rows] + delta[:, :, cols]
+                np.maximum(updated, ELO_MIN, out=updated)
+                np.minimum(updated, ELO_MAX, out=updated)
+                elo_mat[:, rows] = updated
+                cnt_mat[:, rows] += hit[:, :, cols]
+
+    return TalentSweepResult(
+        names=names,
+        batter_ids=b_index.ids,
+        pitcher_ids=p_index.ids,
+        batter_elo=b_elo,
+        pitcher_elo=p_elo,
+        batter_pa=np.bincount(b_rows, minlength=len(b_index)),
+        pitcher_pa=np.bincount(p_rows, minlength=len(p_index)),
+    )
@@ -0,0 +1,185 @@
+"""Columnar Detail Buffer — PA detail 레코드를 타입 고정 NumPy 배열로 누적.
+
+타석(또는 타석 × talent 차원)마다 dict를 만드는 대신 컬럼별 배열에 append하고,
+용량이 부족하면 2배로 확장. 문자열 컬럼(result_type, talent_type 등)은
+categorical code(int8)로 저장.
+
+to_frame() / to_arrow()는 배열을 복사하지 않는 view를 반환
+(이후 append로 버퍼가 재할당되면 이전 view는 분리됨).
+len() / [i] / iter()는 기존 list[dict] 사용처와 호환.
+
+Usage:
+    buf = DetailBuffer({'pa_id': 'int64', 'result_type': 'category', 'elo_before': 'float64'})
+    buf.append(pa_id=1, result_type='HR', elo_before=1500.0)
+    buf.extend({'pa_id': ids, 'result_type': types, 'elo_before': elos})
+    df = buf.to_frame()
+"""
+
+from typing import Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+CATEGORY = 'category'
+_CODE_DTYPES = (np.int8, np.int16, np.int32)
+
+
+class DetailBuffer:
+    """Growable 컬럼 버퍼 (schema: 컬럼명 → NumPy dtype 문자열 또는 'category')."""
+
+    def __init__(self, schema: dict[str, str], capacity: int = 1024):
+        self.schema = dict(schema)
+        self._size = 0
+        self._capacity = max(int(capacity), 1)
+        self._data: dict[str, np.ndarray] = {}
+        self._categories: dict[str, list] = {}
+        self._category_codes: dict[str, dict] = {}
+        for name, dtype in self.schema.items():
+            if dtype == CATEGORY:
+                self._data[name] = np.empty(self._capacity, dtype=np.int8)
+                self._categories[name] = []
+                self._category_codes[name] = {}
+            else:
+                self._data[name] = np.empty(self._capacity, dtype=dtype)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.schema)
+
+    @property
+    def nbytes(self) -> int:
+        """할당된 배열 바이트 수 (capacity 기준)."""
+        return sum(arr.nbytes for arr in self._data.values())
+
+    # ─── write ───
+
+    def _reserve(self, extra: int):
+        needed = self._size + extra
+        if needed <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        for name, arr in self._data.items():
+            grown = np.empty(capacity, dtype=arr.dtype)
+            grown[:self._size] = arr[:self._size]
+            self._data[name] = grown
+        self._capacity = capacity
+
+    def _widen_codes(self, name: str):
+        """카테고리 수가 code dtype 범위를 넘으면 더 넓은 정수형으로 교체."""
+        n_categories = len(self._categories[name])
+        arr = self._data[name]
+        if n_categories <= np.iinfo(arr.dtype).max:
+            return
+        for dtype in _CODE_DTYPES:
+            if n_categories <= np.iinfo(dtype).max:
+                self._data[name] = arr.astype(dtype)
+                return
+
+    def _encode(self, name: str, value) -> int:
+        """카테고리 값 → code (None/NaN → -1, 새 값은 등록)."""
+        if value is None or value != value:
+            return -1
+        codes = self._category_codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._categories[name])
+            self._categories[name].append(value)
+            self._widen_codes(name)
+        return code
+
+    def append(self, **values):
+        """레코드 1건 추가 (모든 schema 컬럼 필요)."""
+        self._reserve(1)
+        i = self._size
+        for name, dtype in self.schema.items():
+            value = values[name]
+            self._data[name][i] = self._encode(name, value) if dtype == CATEGORY else value
+        self._size += 1
+
+    def extend(self, columns: dict):
+        """컬럼 단위 일괄 추가 (각 값은 같은 길이의 array-like)."""
+        n = len(next(iter(columns.values()))) if columns else 0
+        if n == 0:
+            return
+        self._reserve(n)
+        start, stop = self._size, self._size + n
+        for name, dtype in self.schema.items():
+            values = columns[name]
+            if dtype == CATEGORY:
+                codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+                mapping = np.array([self._encode(name, u) for u in uniques] or [-1], dtype=np.int64)
+                encoded = np.where(codes < 0, -1, mapping[np.maximum(codes, 0)])
+                self._data[name][start:stop] = encoded
+            else:
+                self._data[name][start:stop] = np.asarray(values, dtype=dtype)
+        self._size = stop
+
+    # ─── read ───
+
+    def column(self, name: str):
+        """컬럼 view (category 컬럼은 codes를 공유하는 pd.Categorical)."""
+        arr = self._data[name][:self._size]
+        if self.schema[name] == CATEGORY:
+            return pd.Categorical.from_codes(
+                arr, dtype=pd.CategoricalDtype(list(self._categories[name])), validate=False,
+            )
+        return arr
+
+    def to_frame(self) -> pd.DataFrame:
+        """복사 없는 DataFrame view."""
+        return pd.DataFrame(
+            {name: pd.Series(self.column(name), copy=False) for name in self.schema},
+            copy=False,
+        )
+
+    def to_arrow(self):
+        """pyarrow.Table view (category → DictionaryArray)."""
+        import pyarrow as pa
+
+        arrays = []
+        for name in self.schema:
+            col = self.column(name)
+            if isinstance(col, pd.Categorical):
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(col.codes, mask=col.codes < 0),
+                    pa.array(list(col.categories), type=pa.string()),
+                ))
+            else:
+                arrays.append(pa.array(col))
+        return pa.Table.from_arrays(arrays, names=list(self.schema))
+
+    def to_lists(self, columns: Optional[list[str]] = None) -> dict[str, list]:
+        """컬럼 → Python list (Python scalar, 결측 category는 None)."""
+        out = {}
+        for name in columns or self.schema:
+            arr = self._data[name][:self._size]
+            if self.schema[name] == CATEGORY:
+                table = self._categories[name] + [None]  # code -1 → None
+                out[name] = [table[c] for c in arr.tolist()]
+            else:
+                out[name] = arr.tolist()
+        return out
+
+    def __getitem__(self, i: int) -> dict:
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError('DetailBuffer index out of range')
+        row = {}
+        for name, dtype in self.schema.items():
+            value = self._data[name][i].item()
+            if dtype == CATEGORY:
+                value = self._categories[name][value] if value >= 0 else None
+            row[name] = value
+        return row
+
+    def __iter__(self) -> Iterator[dict]:
+        lists = self.to_lists()
+        keys = list(lists)
+        for values in zip(*(lists[k] for k in keys)):
+            yield dict(zip(keys, values))
@@ -0,0 +1,145 @@
+"""Struct-of-Arrays ELO 상태 + PA 컬럼 추출 (array 엔진용).
+
+선수 상태를 PlayerEloState dict 대신 dense index 기반 NumPy 배열로 보관하고,
+PA DataFrame을 iterrows() 없이 타입이 고정된 컬럼으로 변환.
+
+Usage:
+    arrays = EloArrayState.from_player_states(batch.players)
+    b_idx = arrays.index.intern_many(pa_df['batter_id'])
+    ...
+    arrays.to_player_states(batch.players)
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.engine.elo_calculator import PlayerEloState
+from src.engine.elo_config import INITIAL_ELO
+from src.engine.player_index import PlayerIndex
+
+
+class EloArrayState:
+    """선수 ELO 상태 (batting/pitching ELO, PA, cumulative RV) — 연속 NumPy 배열."""
+
+    def __init__(self, index: Optional[PlayerIndex] = None):
+        self.index = index or PlayerIndex()
+        n = len(self.index)
+        self.batting_elo = np.full(n, INITIAL_ELO, dtype=np.float64)
+        self.pitching_elo = np.full(n, INITIAL_ELO, dtype=np.float64)
+        self.batting_pa = np.zeros(n, dtype=np.int64)
+        self.pitching_pa = np.zeros(n, dtype=np.int64)
+        self.cumulative_rv = np.zeros(n, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.batting_elo)
+
+    def sync_size(self) -> None:
+        """index에 새로 등록된 선수만큼 배열 확장 (기본값 INITIAL_ELO / 0)."""
+        grow = len(self.index) - len(self.batting_elo)
+        if grow <= 0:
+            return
+        self.batting_elo = np.concatenate([self.batting_elo, np.full(grow, INITIAL_ELO)])
+        self.pitching_elo = np.concatenate([self.pitching_elo, np.full(grow, INITIAL_ELO)])
+        self.batting_pa = np.concatenate([self.batting_pa, np.zeros(grow, dtype=np.int64)])
+        self.pitching_pa = np.concatenate([self.pitching_pa, np.zeros(grow, dtype=np.int64)])
+        self.cumulative_rv = np.concatenate([self.cumulative_rv, np.zeros(grow)])
+
+    @classmethod
+    def from_player_states(cls, states: dict[int, PlayerEloState]) -> 'EloArrayState':
+        """PlayerEloState dict → 배열 상태."""
+        arrays = cls(PlayerIndex(states.keys()))
+        for i, state in enumerate(states.values()):
+            arrays.batting_elo[i] = state.batting_elo
+            arrays.pitching_elo[i] = state.pitching_elo
+            arrays.batting_pa[i] = state.batting_pa
+            arrays.pitching_pa[i] = state.pitching_pa
+            arrays.cumulative_rv[i] = state.cumulative_rv
+        return arrays
+
+    def to_player_states(self, states: dict[int, PlayerEloState]) -> None:
+        """배열 상태를 PlayerEloState dict에 반영 (없는 선수는 생성)."""
+        ids = self.index.ids.tolist()
+        for pid, b_elo, p_elo, b_pa, p_pa, rv in zip(
+            ids,
+            self.batting_elo.tolist(), self.pitching_elo.tolist(),
+            self.batting_pa.tolist(), self.pitching_pa.tolist(),
+            self.cumulative_rv.tolist(),
+        ):
+            state = states.get(pid)
+            if state is None:
+                state = states[pid] = PlayerEloState(player_id=pid)
+            state.batting_elo = b_elo
+            state.pitching_elo = p_elo
+            state.batting_pa = b_pa
+            state.pitching_pa = p_pa
+            state.cumulative_rv = rv
+
+
+# ─── PA column extraction ───
+
+
+def game_date_strings(pa_df: pd.DataFrame) -> np.ndarray:
+    """game_date → 'YYYY-MM-DD' 문자열 배열 (str(x)[:10]과 동일)."""
+    col = pa_df['game_date']
+    if pd.api.types.is_datetime64_any_dtype(col.dtype):
+        return col.dt.strftime('%Y-%m-%d').to_numpy(dtype=object)
+    return np.array([str(v)[:10] for v in col.tolist()], dtype=object)
+
+
+def day_run_ids(dates: np.ndarray) -> np.ndarray:
+    """연속된 같은 날짜 구간마다 증가하는 run ID (날짜 변경 감지와 동일)."""
+    if len(dates) == 0:
+        return np.zeros(0, dtype=np.int64)
+    changed = np.empty(len(dates), dtype=bool)
+    changed[0] = False
+    changed[1:] = dates[1:] != dates[:-1]
+    return np.cumsum(changed, dtype=np.int64)
+
+
+def truthy_column(pa_df: pd.DataFrame, col: str) -> np.ndarray:
+    """bool(row.get(col))과 동일한 bool 배열 (컬럼 없으면 False)."""
+    if col not in pa_df.columns:
+        return np.zeros(len(pa_df), dtype=bool)
+    s = pa_df[col]
+    if s.dtype == bool:
+        return s.to_numpy()
+    if isinstance(s.dtype, np.dtype) and s.dtype.kind in 'iuf':
+        return s.to_numpy() != 0  # NaN → True (bool(nan))
+    return np.fromiter((bool(v) for v in s.tolist()), dtype=bool, count=len(s))
+
+
+def base_out_states(pa_df: pd.DataFrame) -> np.ndarray:
+    """Base-out state (0~23) = on_1b + on_2b*2 + on_3b*4 + outs*8."""
+    if 'outs_when_up' in pa_df.columns:
+        outs = pa_df['outs_when_up'].to_numpy().astype(np.int64)
+    else:
+        outs = np.zeros(len(pa_df), dtype=np.int64)
+    return (truthy_column(pa_df, 'on_1b').astype(np.int64)
+            + truthy_column(pa_df, 'on_2b').astype(np.int64) * 2
+            + truthy_column(pa_df, 'on_3b').astype(np.int64) * 4
+            + outs * 8)
+
+
+def float_column(pa_df: pd.DataFrame, col: str) -> np.ndarray:
+    """Optional float 컬럼 → float64 배열 (None/컬럼 없음 → NaN)."""
+    if col not in pa_df.columns:
+        return np.full(len(pa_df), np.nan)
+    return pa_df[col].astype('float64').to_numpy()
+
+
+def object_column(pa_df: pd.DataFrame, col: str) -> list:
+    """Optional object 컬럼 → Python list (컬럼 없으면 None)."""
+    if col not in pa_df.columns:
+        return [None] * len(pa_df)
+    return pa_df[col].tolist()
+
+
+def day_slices(dates: np.ndarray) -> list[tuple[str, slice]]:
+    """연속된 같은 날짜 구간 → [(날짜, 위치 slice), ...] (day_run_ids와 같은 경계)."""
+    if len(dates) == 0:
+        return []
+    starts = np.flatnonzero(np.r_[True, dates[1:] != dates[:-1]])
+    stops = np.r_[starts[1:], len(dates)]
+    return [(dates[start], slice(start, stop)) for start, stop in zip(starts.tolist(), stops.tolist())]
@@ -9,8 +9,20 @@ Usage:
     batch.process(pa_df)
     # Results:
     batch.players        → {player_id: PlayerEloState}
-    batch.pa_details     → [dict, ...]  (elo_pa_detail 레코드)
+    batch.pa_details     → DetailBuffer  (elo_pa_detail 레코드, 컬럼 단위)
     batch.daily_ohlc     → [DailyOhlc, ...]
+
+snapshot_store=SnapshotStore(...)이면 날짜 종료(_finalize_day)마다 전체 선수 상태를
+'elo/<date>.npz'로 저장 (array 엔진은 날짜 단위로 나눠 처리). restore_snapshot()으로 복원.
+
+Engine modes:
+    'python' — PA별 PlayerEloState + EloCalculator.process_plate_appearance (기본)
+    'array'  — player_id를 dense index로 인터닝, 상태를 NumPy 배열로 유지.
+               상태 무관 factor는 compute_elo_features로 일괄 계산하고
+               루프는 MIN_ELO clamp만 적용. 결과는 'python' 모드와 bit 단위로 동일.
+    'wavefront' — 'array'와 같은 pre-pass 후, 날짜별 PA를 선수 충돌 없는 wave로
+               나눠(see wavefront) wave마다 NumPy scatter update 1회로 적용.
+               결과는 'python' 모드와 bit 단위로 동일. 날짜별 병렬도는 batch.wave_stats.
 """
 
 import logging
@@ -18,10 +30,23 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from src.engine.elo_config import INITIAL_ELO, K_FACTOR
+from src.engine.detail_buffer import CATEGORY, DetailBuffer
+from src.engine.elo_arrays import (
+    EloArrayState,
+    day_run_ids,
+    day_slices,
+    game_date_strings,
+    object_column,
+)
+from src.engine.elo_features import compute_elo_features
+from src.engine.elo_config import INITIAL_ELO, K_FACTOR, MIN_ELO, PHYSICS_ALPHA
 from src.engine.elo_calculator import PlayerEloState, EloCalculator
+from src.engine.player_index import PlayerIndex
+from src.engine.state_snapshot import SnapshotStore
+from src.engine.wavefront import build_wavefront, wavefront_day_stats
 
 logger = logging.getLogger(__name__)
 
@@ -49,20 +74,48 @@ class DailyOhlc:
         return self.high_elo - self.low_elo
 
 
+ENGINE_MODES = ('python', 'array', 'wavefront')
+
+PA_DETAIL_SCHEMA = {
+    'pa_id': 'int64',
+    'batter_id': 'int64',
+    'pitcher_id': 'int64',
+    'result_type': CATEGORY,
+    'batter_elo_before': 'float64',
+    'batter_elo_after': 'float64',
+    'pitcher_elo_before': 'float64',
+    'pitcher_elo_after': 'float64',
+    'elo_delta': 'float64',
+    'k_base': 'float64',
+    'physics_mod': 'float64',
+    'k_effective': 'float64',
+}
+
+
 class EloBatch:
     """V5.3 ELO 배치 프로세서."""
 
     def __init__(self, k_factor: float = None, re24_baseline=None, park_factor=None,
-                 initial_states: dict[int, PlayerEloState] = None):
+                 initial_states: dict[int, PlayerEloState] = None, engine: str = 'python',
+                 event_k_factors: dict[str, float] = None, physics_alpha: float = PHYSICS_ALPHA,
+                 snapshot_store: Optional[SnapshotStore] = None):
+        if engine not in ENGINE_MODES:
+            raise ValueError(f"Unknown engine mode: {engine!r} (expected one of {ENGINE_MODES})")
+        self.engine = engine
         self.calc = EloCalculator(
             k_factor=k_factor or K_FACTOR,
             re24_baseline=re24_baseline,
             park_factor_obj=park_factor,
+            event_k_factors=event_k_factors,
+            physics_alpha=physics_alpha,
         )
         self.players: dict[int, PlayerEloState] = dict(initial_states) if initial_states else {}
-        self.pa_details: list[dict] = []
+        self.pa_details = DetailBuffer(PA_DETAIL_SCHEMA)
         self.daily_ohlc: list[DailyOhlc] = []
         self._active_player_ids: set[int] = set()
+        self._last_game_date: dict[int, date] = {}  # player_id → 마지막 OHLC 날짜
+        self.wave_stats: list[dict] = []  # 'wavefront' 모드 날짜별 병렬도
+        self.snapshot_store = snapshot_store
 
         # OHLC 추적용 내부 상태 — 키: (player_id, role)
         self._current_date: Optional[str] = None
@@ -98,7 +151,11 @@ class EloBatch:
     def _finalize_day(self, game_date_str: str):
         """하루 종료 시 OHLC 레코드 생성 (role별)."""
         game_date_val = date.fromisoformat(game_date_str)
+        last_game_date = self._last_game_date
         for (player_id, role) in self._day_open:
+            prev = last_game_date.get(player_id)
+            if prev is None or game_date_val > prev:
+                last_game_date[player_id] = game_date_val
             player = self._get_player(player_id)
             close_elo = player.batting_elo if role == 'BATTING' else player.pitching_elo
             self.daily_ohlc.append(DailyOhlc(
@@ -116,6 +173,48 @@ class EloBatch:
         self._day_high.clear()
         self._day_low.clear()
         self._day_pa.clear()
+        if self.snapshot_store is not None:
+            self.snapshot_store.save('elo', game_date_val, self.snapshot_state())
+
+    def reset_outputs(self) -> None:
+        """업로드가 끝난 출력 버퍼(pa_details, daily_ohlc, 활동 선수) 비우기 — 선수 상태는 유지."""
+        self.pa_details = DetailBuffer(PA_DETAIL_SCHEMA)
+        self.daily_ohlc = []
+        self._active_player_ids = set()
+
+    def snapshot_state(self) -> dict[str, np.ndarray]:
+        """전체 선수 상태 → compact 배열 dict (last_game_date는 ordinal, 없으면 0)."""
+        arrays = EloArrayState.from_player_states(self.players)
+        ids = arrays.index.ids
+        last = self._last_game_date
+        return {
+            'player_id': ids,
+            'batting_elo': arrays.batting_elo,
+            'pitching_elo': arrays.pitching_elo,
+            'batting_pa': arrays.batting_pa,
+            'pitching_pa': arrays.pitching_pa,
+            'cumulative_rv': arrays.cumulative_rv,
+            'last_game_date': np.array(
+                [last[pid].toordinal() if pid in last else 0 for pid in ids.tolist()],
+                dtype=np.int64,
+            ),
+        }
+
+    def restore_snapshot(self, snapshot: dict[str, np.ndarray]) -> None:
+        """snapshot_state() 결과로 선수 상태 / last_game_date 교체."""
+        arrays = EloArrayState(PlayerIndex(snapshot['player_id'].tolist()))
+        arrays.batting_elo = snapshot['batting_elo'].astype(np.float64)
+        arrays.pitching_elo = snapshot['pitching_elo'].astype(np.float64)
+        arrays.batting_pa = snapshot['batting_pa'].astype(np.int64)
+        arrays.pitching_pa = snapshot['pitching_pa'].astype(np.int64)
+        arrays.cumulative_rv = snapshot['cumulative_rv'].astype(np.float64)
+        self.players = {}
+        arrays.to_player_states(self.players)
+        self._last_game_date = {
+            pid: date.fromordinal(ordinal)
+            for pid, ordinal in zip(snapshot['player_id'].tolist(), snapshot['last_game_date'].tolist())
+            if ordinal > 0
+        }
 
     def process(self, pa_df: pd.DataFrame):
         """
@@ -124,6 +223,15 @@ class EloBatch:
         pa_df 컬럼: pa_id, game_pk, game_date, batter_id, pitcher_id,
                     result_type, delta_run_exp
         """
+        if self.engine in ('array', 'wavefront'):
+            if self.snapshot_store is None:
+                self._process_arrays(pa_df)
+                return
+            for game_date_str, rows in day_slices(game_date_strings(pa_df)):
+                self._process_arrays(pa_df.iloc[rows])
+                self.snapshot_store.save('elo', game_date_str, self.snapshot_state())
+            return
+
         total = len(pa_df)
 
         for idx, row in pa_df.iterrows():
@@ -178,20 +286,20 @@ class EloBatch:
             self._update_ohlc(pitcher_id, 'PITCHING', pitcher.pitching_elo)
 
             # PA detail 기록
-            self.pa_details.append({
-                'pa_id': int(row['pa_id']),
-                'batter_id': batter_id,
-                'pitcher_id': pitcher_id,
-                'result_type': row['result_type'],
-                'batter_elo_before': result.batter_elo_before,
-                'batter_elo_after': result.batter_elo_after,
-                'pitcher_elo_before': result.pitcher_elo_before,
-                'pitcher_elo_after': result.pitcher_elo_after,
-                'elo_delta': result.batter_delta,
-                'k_base': result.k_base,
-                'physics_mod': result.physics_mod,
-                'k_effective': result.k_effective,
-            })
+            self.pa_details.append(
+                pa_id=int(row['pa_id']),
+                batter_id=batter_id,
+                pitcher_id=pitcher_id,
+                result_type=row['result_type'],
+                batter_elo_before=result.batter_elo_before,
+                batter_elo_after=result.batter_elo_after,
+                pitcher_elo_before=result.pitcher_elo_before,
+                pitcher_elo_after=result.pitcher_elo_after,
+                elo_delta=result.batter_delta,
+                k_base=result.k_base,
+                physics_mod=result.physics_mod,
+                k_effective=result.k_effective,
+            )
 
             if (idx + 1) % 50000 == 0:
                 logger.info(f"  Processed {idx + 1:,} / {total:,} PAs")
@@ -202,8 +310,227 @@ class EloBatch:
 
         logger.info(f"  Completed {total:,} PAs, {len(self.daily_ohlc):,} OHLC records")
 
+    def compute_features(self, pa_df: pd.DataFrame) -> pd.DataFrame:
+        """선수 상태와 무관한 타석별 ELO factor 프레임 (see elo_features)."""
+        return compute_elo_features(
+            pa_df,
+            k_factor=self.calc.k_factor,
+            re24_baseline=self.calc.re24_baseline,
+            park_factor=self.calc.park_factor,
+            event_k_factors=self.calc.event_k_factors,
+            physics_alpha=self.calc.physics_alpha,
+        )
+
+    def _process_arrays(self, pa_df: pd.DataFrame):
+        """Array 엔진: 인터닝된 인덱스 + 타입 고정 컬럼으로 전체 PA 처리."""
+        total = len(pa_df)
+        if total == 0:
+            logger.info(f"  Completed 0 PAs, {len(self.daily_ohlc):,} OHLC records")
+            return
+
+        dates = game_date_strings(pa_df)
+        runs = day_run_ids(dates)
+        batter_ids = pa_df['batter_id'].to_numpy().astype(np.int64)
+        pitcher_ids = pa_df['pitcher_id'].to_numpy().astype(np.int64)
+
+        # 신규 선수 등록 순서를 python 모드(타석마다 batter → pitcher)와 맞춤
+        interleaved = np.empty(2 * total, dtype=np.int64)
+        interleaved[0::2] = batter_ids
+        interleaved[1::2] = pitcher_ids
+        arrays = EloArrayState.from_player_states(self.players)
+        all_idx = arrays.index.intern_many(interleaved)
+        b_idx = all_idx[0::2]
+        p_idx = all_idx[1::2]
+        arrays.sync_size()
+
+        features = self.compute_features(pa_df)
+        if self.engine == 'wavefront':
+            schedule = build_wavefront(runs, b_idx, p_idx)
+            b_before, b_after, p_before, p_after = self._run_waves(
+                arrays, schedule, b_idx, p_idx, features)
+            self.wave_stats.extend(wavefront_day_stats(schedule, dates))
+        else:
+            b_before, b_after, p_before, p_after = self._run_sequential(
+                arrays, b_idx.tolist(), p_idx.tolist(), features)
+        arrays.to_player_states(self.players)
+        self._active_player_ids.update(batter_ids.tolist())
+        self._active_player_ids.update(pitcher_ids.tolist())
+
+        self._append_daily_ohlc_arrays(
+            dates, runs, batter_ids, pitcher_ids,
+            b_before, b_after, p_before, p_after,
+        )
+        self._current_date = dates[-1]
+
+        self.pa_details.extend({
+            'pa_id': pa_df['pa_id'].to_numpy(),
+            'batter_id': batter_ids,
+            'pitcher_id': pitcher_ids,
+            'result_type': object_column(pa_df, 'result_type'),
+            'batter_elo_before': b_before,
+            'batter_elo_after': b_after,
+            'pitcher_elo_before': p_before,
+            'pitcher_elo_after': p_after,
+            'elo_delta': features['batter_delta'].to_numpy(),
+            'k_base': features['k_base'].to_numpy(),
+            'physics_mod': features['physics_mod'].to_numpy(),
+            'k_effective': features['k_effective'].to_numpy(),
+        })
+
+        logger.info(f"  Completed {total:,} PAs, {len(self.daily_ohlc):,} OHLC records")
+
+    @staticmethod
+    def _run_sequential(arrays: EloArrayState, b_idx: list, p_idx: list, features: pd.DataFrame):
+        """PA 순서대로 MIN_ELO clamp 적용 → (b_before, b_after, p_before, p_after)."""
+        total = len(b_idx)
+        has_rv = features['has_rv'].tolist()
+        rvs = features['delta_run_exp'].tolist()
+        batter_deltas = features['batter_delta'].tolist()
+        pitcher_deltas = features['pitcher_delta'].tolist()
+
+        # Hot loop 상태: Python list 미러 (스칼라 접근 비용 최소화)
+        bat = arrays.batting_elo.tolist()
+        pit = arrays.pitching_elo.tolist()
+        bat_pa = arrays.batting_pa.tolist()
+        pit_pa = arrays.pitching_pa.tolist()
+        cum_rv = arrays.cumulative_rv.tolist()
+
+        b_before = [0.0] * total
+        b_after = [0.0] * total
+        p_before = [0.0] * total
+        p_after = [0.0] * total
+
+        # 순차 루프: MIN_ELO clamp 적용만 남음
+        for i in range(total):
+            b = b_idx[i]
+            p = p_idx[i]
+            b_before[i] = bat[b]
+            p_before[i] = pit[p]
+            if has_rv[i]:
+                rv = rvs[i]
+                bat[b] = max(MIN_ELO, bat[b] + batter_deltas[i])
+                pit[p] = max(MIN_ELO, pit[p] + pitcher_deltas[i])
+                cum_rv[b] += rv
+                cum_rv[p] -= rv
+            bat_pa[b] += 1
+            pit_pa[p] += 1
+            b_after[i] = bat[b]
+            p_after[i] = pit[p]
+
+        arrays.batting_elo = np.array(bat, dtype=np.float64)
+        arrays.pitching_elo = np.array(pit, dtype=np.float64)
+        arrays.batting_pa = np.array(bat_pa, dtype=np.int64)
+        arrays.pitching_pa = np.array(pit_pa, dtype=np.int64)
+        arrays.cumulative_rv = np.array(cum_rv, dtype=np.float64)
+        return np.array(b_before), np.array(b_after), np.array(p_before), np.array(p_after)
+
+    @staticmethod
+    def _run_waves(arrays: EloArrayState, schedule, b_idx: np.ndarray, p_idx: np.ndarray,
+                   features: pd.DataFrame):
+        """Wave별 scatter update (wave 내 선수 중복 없음 → 순차 루프와 동일한 값)."""
+        total = len(b_idx)
+        has_rv = features['has_rv'].to_numpy()
+        rvs = features['delta_run_exp'].to_numpy()
+        batter_deltas = features['batter_delta'].to_numpy()
+        pitcher_deltas = features['pitcher_delta'].to_numpy()
+        bat, pit = arrays.batting_elo, arrays.pitching_elo
+        bat_pa, pit_pa = arrays.batting_pa, arrays.pitching_pa
+        cum_rv = arrays.cumulative_rv
+
+        b_before = np.empty(total)
+        b_after = np.empty(total)
+        p_before = np.empty(total)
+        p_after = np.empty(total)
+        for wave in schedule.waves():
+            b = b_idx[wave]
+            p = p_idx[wave]
+            b_before[wave] = bat[b]
+            p_before[wave] = pit[p]
+            rv_pa = wave[has_rv[wave]]
+            if len(rv_pa):
+                rb, rp = b_idx[rv_pa], p_idx[rv_pa]
+                # max(MIN_ELO, x)와 동일 (x > MIN_ELO일 때만 x)
+                new_b = bat[rb] + batter_deltas[rv_pa]
+                bat[rb] = np.where(new_b > MIN_ELO, new_b, MIN_ELO)
+                new_p = pit[rp] + pitcher_deltas[rv_pa]
+                pit[rp] = np.where(new_p > MIN_ELO, new_p, MIN_ELO)
+                cum_rv[rb] += rvs[rv_pa]
+                cum_rv[rp] -= rvs[rv_pa]
+            bat_pa[b] += 1
+            pit_pa[p] += 1
+            b_after[wave] = bat[b]
+            p_after[wave] = pit[p]
+        return b_before, b_after, p_before, p_after
+
+    def _append_daily_ohlc_arrays(self, dates, runs, batter_ids, pitcher_ids,
+                                  b_before, b_after, p_before, p_after):
+        """PA별 before/after ELO → 일별 OHLC (python 모드와 동일한 순서/값)."""
+        n = len(runs)
+        # 타석마다 (batter, BATTING), (pitcher, PITCHING) 순서로 interleave
+        player_ids = np.empty(2 * n, dtype=np.int64)
+        player_ids[0::2] = batter_ids
+        player_ids[1::2] = pitcher_ids
+        before = np.empty(2 * n)
+        before[0::2] = b_before
+        before[1::2] = p_before
+        after = np.empty(2 * n)
+        after[0::2] = b_after
+        after[1::2] = p_after
+
+        frame = pd.DataFrame({
+            'run': np.repeat(runs, 2),
+            'player_id': player_ids,
+            'role': np.tile(np.array([0, 1], dtype=np.int8), n),
+            'before': before,
+            'after': after,
+        })
+        agg = frame.groupby(['run', 'player_id', 'role'], sort=False).agg(
+            open=('before', 'first'),
+            close=('after', 'last'),
+            high=('after', 'max'),
+            low=('after', 'min'),
+            total_pa=('after', 'size'),
+        ).reset_index()
+
+        run_starts = np.flatnonzero(np.r_[True, runs[1:] != runs[:-1]])
+        run_dates = [date.fromisoformat(d) for d in dates[run_starts]]
+
+        # player별 마지막 날짜 인덱스 (python 모드 _finalize_day와 동일)
+        run_date_ords = np.array([d.toordinal() for d in run_dates], dtype=np.int64)
+        last_ord = pd.Series(run_date_ords[agg['run'].to_numpy()]).groupby(
+            agg['player_id'].to_numpy(), sort=False).max()
+        last_game_date = self._last_game_date
+        for pid, ordinal in zip(last_ord.index.tolist(), last_ord.tolist()):
+            prev = last_game_date.get(pid)
+            if prev is None or ordinal > prev.toordinal():
+                last_game_date[pid] = date.fromordinal(ordinal)
+        open_elo = agg['open'].to_numpy()
+        self.daily_ohlc.extend(
+            DailyOhlc(
+                player_id=pid,
+                game_date=run_dates[run],
+                elo_type='SEASON',
+                open_elo=o,
+                high_elo=h,
+                low_elo=lo,
+                close_elo=c,
+                total_pa=cnt,
+                role='PITCHING' if role else 'BATTING',
+            )
+            for run, pid, role, o, h, lo, c, cnt in zip(
+                agg['run'].tolist(),
+                agg['player_id'].tolist(),
+                agg['role'].tolist(),
+                open_elo.tolist(),
+                np.maximum(open_elo, agg['high'].to_numpy()).tolist(),
+                np.minimum(open_elo, agg['low'].to_numpy()).tolist(),
+                agg['close'].tolist(),
+                agg['total_pa'].tolist(),
+            )
+        )
+
     def get_player_elo_records(self, active_only: bool = False) -> list[dict]:
-        """player_elo 테이블용 레코드 생성.
+        """player_elo 테이블용 레코드 생성 (O(players), last_game_date는 인덱스 조회).
 
         Args:
             active_only: True면 이번 실행에 활동한 선수만 반환 (daily pipeline용)
@@ -213,18 +540,7 @@ class EloBatch:
         for pid, state in self.players.items():
             if pid not in target_ids:
                 continue
-            # 마지막 PA에서 last_game_date 추출
-            last_date = None
-            for detail in reversed(self.pa_details):
-                if detail['batter_id'] == pid or detail['pitcher_id'] == pid:
-                    # PA에서 game_date를 직접 가져올 수 없으므로 OHLC에서 추출
-                    break
-
-            # OHLC에서 마지막 날짜 찾기
-            player_ohlc = [o for o in self.daily_ohlc if o.player_id == pid]
-            if player_ohlc:
-                last_date = max(o.game_date for o in player_ohlc).isoformat()
-
+            last_date = self._last_game_date.get(pid)
             records.append({
                 'player_id': pid,
                 'on_base_elo': state.elo,
@@ -235,6 +551,6 @@ class EloBatch:
                 'pa_count': state.pa_count,
                 'batting_pa': state.batting_pa,
                 'pitching_pa': state.pitching_pa,
-                'last_game_date': last_date,
+                'last_game_date': last_date.isoformat() if last_date else None,
             })
         return records
@@ -75,11 +75,13 @@ class PlayerEloState:
 def calculate_physics_modifier(
     result_type: Optional[str],
     xwoba: Optional[float],
+    alpha: float = PHYSICS_ALPHA,
 ) -> float:
     """BIP 이벤트의 물리 품질에 따라 K-factor modifier 반환.
 
     - Non-BIP (K, BB, HBP 등): modifier = 1.0
     - BIP (hit, out, etc.): xwOBA 기반 modifier [0.7, 1.3]
+    - alpha: physics layer weight (기본 PHYSICS_ALPHA)
     """
     if result_type is None or result_type in NON_BIP_TYPES:
         return 1.0
@@ -88,7 +90,7 @@ def calculate_physics_modifier(
         return 1.0
 
     deviation = xwoba - LEAGUE_AVG_XWOBA
-    modifier = 1.0 + PHYSICS_ALPHA * (deviation / LEAGUE_AVG_XWOBA)
+    modifier = 1.0 + alpha * (deviation / LEAGUE_AVG_XWOBA)
     return max(PHYSICS_MOD_MIN, min(PHYSICS_MOD_MAX, modifier))
 
 
@@ -110,10 +112,61 @@ class EloCalculator:
     """V5.3 ELO 계산기."""
 
     def __init__(self, k_factor: float = K_FACTOR,
-                 re24_baseline=None, park_factor_obj=None):
+                 re24_baseline=None, park_factor_obj=None,
+                 event_k_factors: Optional[dict[str, float]] = None,
+                 physics_alpha: float = PHYSICS_ALPHA):
         self.k_factor = k_factor
         self.re24_baseline = re24_baseline      # RE24Baseline or None
         self.park_factor = park_factor_obj      # ParkFactor or None
+        self.event_k_factors = EVENT_K_FACTORS if event_k_factors is None else event_k_factors
+        self.physics_alpha = physics_alpha
+
+    def compute_deltas(
+        self,
+        delta_run_exp: Optional[float],
+        state: int = 0,
+        home_team: Optional[str] = None,
+        result_type: Optional[str] = None,
+        xwoba: Optional[float] = None,
+    ) -> tuple[float, float, float, float, float]:
+        """선수 상태와 무관한 타석 ELO 변화량 계산 (상태 변경 없음).
+
+        Returns:
+            (batter_delta, pitcher_delta, k_base, physics_mod, k_effective)
+        """
+        # K-Modulation: Layer 1 (event K) × Layer 2 (physics modifier)
+        k_base = self.event_k_factors.get(result_type, self.k_factor) if result_type else self.k_factor
+        physics_mod = calculate_physics_modifier(result_type, xwoba, alpha=self.physics_alpha)
+        k_effective = k_base * physics_mod
+
+        if delta_run_exp is None:
+            return 0.0, 0.0, k_base, physics_mod, k_effective
+
+        # Step 1: Park factor adjustment
+        if self.park_factor and home_team:
+            adjusted_rv = self.park_factor.adjust_rv(delta_run_exp, home_team)
+        else:
+            adjusted_rv = delta_run_exp
+
+        # Step 2: State normalization
+        if self.re24_baseline:
+            expected_rv = self.re24_baseline.get_expected_rv(state)
+            rv_diff = adjusted_rv - expected_rv
+        else:
+            rv_diff = adjusted_rv
+
+        # Step 3: ELO delta (K-Modulation)
+        batter_delta = k_effective * rv_diff
+        pitcher_delta = -batter_delta
+
+        # Step 4: Field error handling
+        if result_type and result_type.upper() in ('E', 'FIELD_ERROR'):
+            if batter_delta > 0:
+                batter_delta = 0.0
+            if pitcher_delta < 0:
+                pitcher_delta = 0.0
+
+        return batter_delta, pitcher_delta, k_base, physics_mod, k_effective
 
     def process_plate_appearance(
         self,
@@ -143,44 +196,17 @@ class EloCalculator:
         batter_elo_before = batter.batting_elo
         pitcher_elo_before = pitcher.pitching_elo
 
-        # K-Modulation: Layer 1 (event K) × Layer 2 (physics modifier)
-        k_base = EVENT_K_FACTORS.get(result_type, self.k_factor) if result_type else self.k_factor
-        physics_mod = calculate_physics_modifier(result_type, xwoba)
-        k_effective = k_base * physics_mod
+        batter_delta, pitcher_delta, k_base, physics_mod, k_effective = self.compute_deltas(
+            delta_run_exp, state=state, home_team=home_team,
+            result_type=result_type, xwoba=xwoba,
+        )
 
         if delta_run_exp is not None:
-            # Step 1: Park factor adjustment
-            if self.park_factor and home_team:
-                adjusted_rv = self.park_factor.adjust_rv(delta_run_exp, home_team)
-            else:
-                adjusted_rv = delta_run_exp
-
-            # Step 2: State normalization
-            if self.re24_baseline:
-                expected_rv = self.re24_baseline.get_expected_rv(state)
-                rv_diff = adjusted_rv - expected_rv
-            else:
-                rv_diff = adjusted_rv
-
-            # Step 3: ELO delta (K-Modulation)
-            batter_delta = k_effective * rv_diff
-            pitcher_delta = -batter_delta
-
-            # Step 4: Field error handling
-            if result_type and result_type.upper() in ('E', 'FIELD_ERROR'):
-                if batter_delta > 0:
-                    batter_delta = 0.0
-                if pitcher_delta < 0:
-                    pitcher_delta = 0.0
-
             batter.apply_batting_delta(batter_delta)
             pitcher.apply_pitching_delta(pitcher_delta)
 
             batter.cumulative_rv += delta_run_exp
             pitcher.cumulative_rv -= delta_run_exp
-        else:
-            batter_delta = 0.0
-            pitcher_delta = 0.0
 
         batter.batting_pa += 1
         pitcher.pitching_pa += 1
@@ -0,0 +1,167 @@
+"""ELO Feature Pre-pass — 선수 상태와 무관한 타석 factor 일괄 계산.
+
+EloCalculator.compute_deltas의 모든 단계(park 보정, RE24 state normalization,
+EVENT_K_FACTORS, physics modifier, field error 마스크)를 NumPy 컬럼 연산으로 수행.
+순차 루프에는 MIN_ELO clamp 적용만 남음.
+
+각 컬럼은 EloCalculator.compute_deltas의 PA별 결과와 bit 단위로 동일.
+
+Usage:
+    features = compute_elo_features(pa_df, re24_baseline=RE24Baseline(), park_factor=ParkFactor())
+    features[['rv_diff', 'k_base', 'physics_mod', 'k_effective']]
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.engine.elo_arrays import base_out_states, float_column, object_column
+from src.engine.elo_config import (
+    EVENT_K_FACTORS,
+    K_FACTOR,
+    LEAGUE_AVG_XWOBA,
+    NON_BIP_TYPES,
+    PHYSICS_ALPHA,
+    PHYSICS_MOD_MAX,
+    PHYSICS_MOD_MIN,
+)
+
+FEATURE_COLUMNS = [
+    'state', 'delta_run_exp', 'has_rv', 'rv_diff',
+    'k_base', 'physics_mod', 'k_effective',
+    'batter_delta', 'pitcher_delta',
+]
+
+
+def _per_unique(values: list, fn, dtype) -> np.ndarray:
+    """고유값마다 fn을 한 번만 호출하고 전체 배열로 펼침.
+
+    None/NaN은 factorize에서 하나로 합쳐지므로 원소별로 fn을 호출 (None ≠ NaN 의미 보존).
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    table = np.array([fn(u) for u in uniques] or [fn(None)], dtype=dtype)
+    out = table[np.maximum(codes, 0)]
+    for i in np.flatnonzero(codes < 0):
+        out[i] = fn(values[i])
+    return out
+
+
+def _is_field_error(result_type) -> bool:
+    return bool(result_type) and isinstance(result_type, str) and \
+        result_type.upper() in ('E', 'FIELD_ERROR')
+
+
+def event_k_base(result_types: list, k_factor: float = K_FACTOR,
+                 event_k_factors: dict[str, float] = None) -> np.ndarray:
+    """Layer 1: EVENT_K_FACTORS[result_type] (미등록/None → k_factor)."""
+    event_k = EVENT_K_FACTORS if event_k_factors is None else event_k_factors
+    return _per_unique(
+        result_types,
+        lambda rt: event_k.get(rt, k_factor) if rt else k_factor,
+        np.float64,
+    )
+
+
+def bip_mask(result_types: list) -> np.ndarray:
+    """BIP 여부 (None / NON_BIP_TYPES → False)."""
+    return _per_unique(
+        result_types,
+        lambda rt: rt is not None and rt not in NON_BIP_TYPES,
+        bool,
+    )
+
+
+def field_error_mask(result_types: list) -> np.ndarray:
+    """Field error 여부 ('E' / 'FIELD_ERROR')."""
+    return _per_unique(result_types, _is_field_error, bool)
+
+
+def physics_modifiers(is_bip: np.ndarray, xwoba: np.ndarray,
+                      physics_alpha: float = PHYSICS_ALPHA) -> np.ndarray:
+    """Layer 2: xwOBA 기반 modifier [0.7, 1.3] (BIP + xwoba 있을 때만, 아니면 1.0)."""
+    deviation = xwoba - LEAGUE_AVG_XWOBA
+    modifier = 1.0 + physics_alpha * (deviation / LEAGUE_AVG_XWOBA)
+    modifier = np.maximum(PHYSICS_MOD_MIN, np.minimum(PHYSICS_MOD_MAX, modifier))
+    return np.where(is_bip & ~np.isnan(xwoba), modifier, 1.0)
+
+
+def elo_deltas(k_effective: np.ndarray, rv_diff: np.ndarray,
+               is_error: np.ndarray, has_rv: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """clamp 전 (batter_delta, pitcher_delta) — field error / RV 없음 마스크 적용.
+
+    k_effective는 (n,) 또는 선행 축이 있는 (..., n) 배열 (config sweep).
+    """
+    batter_delta = k_effective * rv_diff
+    pitcher_delta = -batter_delta
+    batter_delta = np.where(is_error & (batter_delta > 0), 0.0, batter_delta)
+    pitcher_delta = np.where(is_error & (pitcher_delta < 0), 0.0, pitcher_delta)
+    return np.where(has_rv, batter_delta, 0.0), np.where(has_rv, pitcher_delta, 0.0)
+
+
+def compute_elo_features(pa_df: pd.DataFrame, k_factor: float = K_FACTOR,
+                         re24_baseline=None, park_factor=None,
+                         event_k_factors: dict[str, float] = None,
+                         physics_alpha: float = PHYSICS_ALPHA) -> pd.DataFrame:
+    """PA DataFrame → 타석별 ELO factor 프레임 (pa_df와 같은 index).
+
+    event_k_factors / physics_alpha: EloCalculator와 같은 override (기본 elo_config 값).
+
+    Columns:
+        state         base-out state (0~23)
+        delta_run_exp 원본 RV (None → NaN)
+        has_rv        RV 존재 여부 (False면 ELO 변화 없음)
+        rv_diff       park 보정 + state normalization 후 RV
+        k_base        EVENT_K_FACTORS[result_type]
+        physics_mod   xwOBA 기반 modifier [0.7, 1.3]
+        k_effective   k_base × physics_mod
+        batter_delta  clamp 전 타자 ELO 변화 (field error 마스크 적용)
+        pitcher_delta clamp 전 투수 ELO 변화
+    """
+    rv = float_column(pa_df, 'delta_run_exp')
+    has_rv = ~np.isnan(rv)
+    xwoba = float_column(pa_df, 'xwoba')
+    states = base_out_states(pa_df)
+    result_types = object_column(pa_df, 'result_type')
+    home_teams = object_column(pa_df, 'home_team')
+
+    # Layer 1 (event K) × Layer 2 (physics modifier, BIP + xwoba 있을 때만)
+    k_base = event_k_base(result_types, k_factor, event_k_factors)
+    physics_mod = physics_modifiers(bip_mask(result_types), xwoba, physics_alpha)
+    k_effective = k_base * physics_mod
+
+    # Step 1: park factor adjustment
+    if park_factor:
+        adjustment = _per_unique(
+            home_teams,
+            lambda team: park_factor.get_adjustment(team) if team else 0.0,
+            np.float64,
+        )
+        adjusted_rv = rv - adjustment
+    else:
+        adjusted_rv = rv
+
+    # Step 2: state normalization
+    if re24_baseline:
+        unique_states, inverse = np.unique(states, return_inverse=True)
+        expected = np.array([re24_baseline.get_expected_rv(int(st)) for st in unique_states])
+        expected_rv = expected[inverse.reshape(-1)] if len(states) else np.zeros(0)
+        rv_diff = adjusted_rv - expected_rv
+    else:
+        rv_diff = adjusted_rv
+
+    # Step 3: ELO delta + Step 4: field error mask
+    batter_delta, pitcher_delta = elo_deltas(
+        k_effective, rv_diff, field_error_mask(result_types), has_rv,
+    )
+    rv_diff = np.where(has_rv, rv_diff, np.nan)
+
+    return pd.DataFrame({
+        'state': states,
+        'delta_run_exp': rv,
+        'has_rv': has_rv,
+        'rv_diff': rv_diff,
+        'k_base': k_base,
+        'physics_mod': physics_mod,
+        'k_effective': k_effective,
+        'batter_delta': batter_delta,
+        'pitcher_delta': pitcher_delta,
+    }, index=pa_df.index)
@@ -1,7 +1,96 @@
-"""Multi-ELO Config Loader (9D Talent System)."""
+"""Multi-ELO Config Loader (9D Talent System).
+
+YAML은 로드 시 한 번 CompiledTalentTables(dense NumPy 텐서)로 컴파일되어
+MultiEloEngine이 PA마다 dict 조회 없이 벡터 연산으로 9D 업데이트를 수행.
+"""
+import copy
+from dataclasses import dataclass
 from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
 import yaml
 
+from src.engine.multi_elo_types import BATTER_DIM_NAMES, PITCHER_DIM_NAMES
+
+# 타자 차원 ↔ 투수 차원 매칭 (None = 상대 차원 없음, expected 0.5)
+BATTER_TO_PITCHER = {
+    "contact": "stuff",
+    "power": "bip_suppression",
+    "discipline": "command",
+    "speed": None,
+    "clutch": "clutch",
+}
+
+PITCHER_TO_BATTER = {
+    "stuff": "contact",
+    "bip_suppression": "contact",
+    "command": "discipline",
+    "clutch": "clutch",
+}
+
+
+@dataclass(frozen=True)
+class CompiledTalentTables:
+    """이벤트 코드 × 차원 dense 텐서.
+
+    weights의 clutch 열은 clutch_base (PA마다 clutch multiplier 적용 전 값).
+    미등록 이벤트는 마지막 행(unknown_code, 전부 0)으로 매핑.
+    opp_idx = -1이면 상대 차원 없음 (divisor 미사용, expected 0.5).
+    """
+    event_codes: dict[str, int]
+    unknown_code: int
+    batter_weights: np.ndarray       # (events + 1, 5)
+    pitcher_weights: np.ndarray      # (events + 1, 4)
+    clutch_multiplier: np.ndarray    # (events + 1,) clutch 배수 (GIDP만, 나머지 1.0)
+    batter_k_scale: np.ndarray       # (5,) k_factor × scale
+    pitcher_k_scale: np.ndarray      # (4,)
+    batter_threshold: np.ndarray     # (5,) reliability_threshold
+    pitcher_threshold: np.ndarray    # (4,)
+    batter_opp_idx: np.ndarray       # (5,) 상대 투수 차원 index
+    pitcher_opp_idx: np.ndarray      # (4,) 상대 타자 차원 index
+    batter_divisor: np.ndarray       # (5,) (batter + pitcher expected_divisor) / 2
+    pitcher_divisor: np.ndarray      # (4,)
+    batter_clutch_idx: int
+    pitcher_clutch_idx: int
+
+    def event_code(self, event_type) -> int:
+        return self.event_codes.get(event_type, self.unknown_code)
+
+
+class StackedTalentTables(NamedTuple):
+    """Batter 5D + pitcher 4D tables stacked into one 9-wide row per event.
+
+    Columns 0-4 are batter dims, 5-8 pitcher dims. opp_idx indexes the
+    concatenated [batter, pitcher] ELO vector; dims without an opponent point
+    at themselves (divisor 1.0) so the expected score is exactly 0.5.
+    """
+    weights: np.ndarray      # (events + 1, 9)
+    actual: np.ndarray       # (events + 1, 9) 1.0 if weight > 0 else 0.0
+    k_scale: np.ndarray      # (9,)
+    threshold: np.ndarray    # (9,)
+    opp_idx: np.ndarray      # (9,)
+    divisor: np.ndarray      # (9,)
+    clutch_cols: np.ndarray  # (2,) batter / pitcher clutch columns
+    n_batter: int
+
+
+def stack_talent_tables(tables: CompiledTalentTables) -> StackedTalentTables:
+    n_b = len(tables.batter_k_scale)
+    weights = np.hstack([tables.batter_weights, tables.pitcher_weights])
+    b_opp = np.where(tables.batter_opp_idx >= 0, n_b + tables.batter_opp_idx, np.arange(n_b))
+    divisor = np.concatenate([tables.batter_divisor, tables.pitcher_divisor])
+    return StackedTalentTables(
+        weights=weights,
+        actual=np.where(weights > 0, 1.0, 0.0),
+        k_scale=np.concatenate([tables.batter_k_scale, tables.pitcher_k_scale]),
+        threshold=np.concatenate([tables.batter_threshold, tables.pitcher_threshold]),
+        opp_idx=np.concatenate([b_opp, tables.pitcher_opp_idx]),
+        divisor=np.where(np.isnan(divisor), 1.0, divisor),
+        clutch_cols=np.array([tables.batter_clutch_idx, n_b + tables.pitcher_clutch_idx]),
+        n_batter=n_b,
+    )
+
 
 class MultiEloConfig:
     """YAML-based Multi-ELO configuration."""
@@ -17,6 +106,93 @@ class MultiEloConfig:
     def _build_indices(self) -> None:
         self._batter_dim_map = {d["name"]: d for d in self._config["batter_dimensions"]}
         self._pitcher_dim_map = {d["name"]: d for d in self._config["pitcher_dimensions"]}
+        self.tables = self._compile()
+        self.stacked = stack_talent_tables(self.tables)
+
+    def _compile(self) -> CompiledTalentTables:
+        """YAML → CompiledTalentTables (getter와 동일한 기본값 적용)."""
+        batter_events = self._config["event_weights"]
+        pitcher_events = self._config.get("pitcher_event_weights", {})
+        events = list(dict.fromkeys([*batter_events, *pitcher_events]))
+        event_codes = {name: code for code, name in enumerate(events)}
+        n_rows = len(events) + 1  # + unknown
+
+        batter_weights = np.zeros((n_rows, len(BATTER_DIM_NAMES)))
+        pitcher_weights = np.zeros((n_rows, len(PITCHER_DIM_NAMES)))
+        clutch_multiplier = np.ones(n_rows)
+        for name, code in event_codes.items():
+            bw = self.get_event_weights(name)
+            pw = self.get_pitcher_event_weights(name)
+            batter_weights[code] = [
+                bw["clutch_base"] if dim == "clutch" else bw.get(dim, 0.0)
+                for dim in BATTER_DIM_NAMES
+            ]
+            pitcher_weights[code] = [
+                pw["clutch_base"] if dim == "clutch" else pw.get(dim, 0.0)
+                for dim in PITCHER_DIM_NAMES
+            ]
+            if name == "GIDP":
+                clutch_multiplier[code] = bw.get("clutch_multiplier", 1.0)
+
+        def pair_divisor(b_dim, p_dim):
+            if b_dim is None or p_dim is None:
+                return np.nan
+            return (self.get_expected_divisor(b_dim, is_pitcher=False)
+                    + self.get_expected_divisor(p_dim, is_pitcher=True)) / 2
+
+        def dim_index(names, dim):
+            return names.index(dim) if dim is not None else -1
+
+        return CompiledTalentTables(
+            event_codes=event_codes,
+            unknown_code=len(events),
+            batter_weights=batter_weights,
+            pitcher_weights=pitcher_weights,
+            clutch_multiplier=clutch_multiplier,
+            batter_k_scale=np.array([
+                self.get_batter_k_factor(d) * self.get_batter_scale(d) for d in BATTER_DIM_NAMES
+            ]),
+            pitcher_k_scale=np.array([
+                self.get_pitcher_k_factor(d) * self.get_pitcher_scale(d) for d in PITCHER_DIM_NAMES
+            ]),
+            batter_threshold=np.array([
+                self.get_reliability_threshold(d) for d in BATTER_DIM_NAMES
+            ], dtype=np.float64),
+            pitcher_threshold=np.array([
+                self.get_reliability_threshold(d, is_pitcher=True) for d in PITCHER_DIM_NAMES
+            ], dtype=np.float64),
+            batter_opp_idx=np.array([
+                dim_index(PITCHER_DIM_NAMES, BATTER_TO_PITCHER.get(d)) for d in BATTER_DIM_NAMES
+            ]),
+            pitcher_opp_idx=np.array([
+                dim_index(BATTER_DIM_NAMES, PITCHER_TO_BATTER.get(d)) for d in PITCHER_DIM_NAMES
+            ]),
+            batter_divisor=np.array([
+                pair_divisor(d, BATTER_TO_PITCHER.get(d)) for d in BATTER_DIM_NAMES
+            ]),
+            pitcher_divisor=np.array([
+                pair_divisor(PITCHER_TO_BATTER.get(d), d) for d in PITCHER_DIM_NAMES
+            ]),
+            batter_clutch_idx=BATTER_DIM_NAMES.index("clutch"),
+            pitcher_clutch_idx=PITCHER_DIM_NAMES.index("clutch"),
+        )
+
+    def with_expected_divisors(
+        self,
+        batter: dict[str, float] | None = None,
+        pitcher: dict[str, float] | None = None,
+    ) -> "MultiEloConfig":
+        """expected_divisor만 바꾼 변형 config (YAML 재로드 없음, 원본 불변)."""
+        variant = copy.copy(self)
+        variant._config = copy.deepcopy(self._config)
+        for role, overrides in (("batter", batter), ("pitcher", pitcher)):
+            dims = {d["name"]: d for d in variant._config[f"{role}_dimensions"]}
+            for name, divisor in (overrides or {}).items():
+                if name not in dims:
+                    raise ValueError(f"Unknown {role} dimension: {name!r}")
+                dims[name]["expected_divisor"] = float(divisor)
+        variant._build_indices()
+        return variant
 
     @property
     def version(self) -> str:
@@ -5,18 +5,20 @@ Pitcher 4D: Stuff, BIP_Suppression, Command, Clutch
 
 Binary matchup model: delta = K * scale * |weight| * (actual - expected) * reliability
 DIPS-based asymmetric pitcher weights (V2).
+
+Per-PA updates read MultiEloConfig.tables (compiled event × dimension tensors),
+so all 9 dimensions are updated with a few vector ops and no dict lookups.
 """
 from dataclasses import dataclass
 
 import numpy as np
 
-from src.engine.multi_elo_config import MultiEloConfig
+from src.engine.multi_elo_config import BATTER_TO_PITCHER, PITCHER_TO_BATTER, MultiEloConfig
 from src.engine.multi_elo_types import (
     BatterTalentState,
     PitcherTalentState,
-    BATTER_DIM_NAMES,
-    PITCHER_DIM_NAMES,
     MIN_RELIABILITY,
+    reliability_ramp,
 )
 
 
@@ -34,20 +36,8 @@ class TalentUpdateResult:
 class MultiEloEngine:
     """9-Dimensional Talent ELO Engine."""
 
-    BATTER_TO_PITCHER = {
-        "contact": "stuff",
-        "power": "bip_suppression",
-        "discipline": "command",
-        "speed": None,
-        "clutch": "clutch",
-    }
-
-    PITCHER_TO_BATTER = {
-        "stuff": "contact",
-        "bip_suppression": "contact",
-        "command": "discipline",
-        "clutch": "clutch",
-    }
+    BATTER_TO_PITCHER = BATTER_TO_PITCHER
+    PITCHER_TO_BATTER = PITCHER_TO_BATTER
 
     def __init__(self, config: MultiEloConfig | None = None):
         self.config = config or MultiEloConfig()
@@ -97,8 +87,8 @@ class MultiEloEngine:
         Returns:
             TalentUpdateResult with per-dimension deltas and updated ELO arrays.
         """
-        batter_weights = self.config.get_event_weights(result_type)
-        pitcher_weights = self.config.get_pitcher_event_weights(result_type)
+        tables = self.config.tables
+        code = tables.event_code(result_type)
         clutch_mult = self.get_clutch_multiplier(leverage_index)
         is_clutch = leverage_index > self.config.leverage_threshold or is_risp
 
@@ -106,105 +96,30 @@ class MultiEloEngine:
         if is_risp and clutch_mult == 0.0:
             clutch_mult = 0.5
 
-        # GIDP clutch multiplier
-        if result_type == "GIDP":
-            gidp_mult = batter_weights.get("clutch_multiplier", 1.0)
-            clutch_mult *= gidp_mult
-
-        batter_deltas = np.zeros(5)
-        pitcher_deltas = np.zeros(4)
-
-        # === Batter loop (5D) ===
-        for b_idx, b_dim in enumerate(BATTER_DIM_NAMES):
-            weight = batter_weights.get(b_dim, 0.0)
-
-            if b_dim == "clutch":
-                base_weight = batter_weights.get("clutch_base", 0.0)
-                if clutch_mult > 0:
-                    weight = base_weight * (1.0 + clutch_mult)
-                else:
-                    weight = base_weight * 0.5
-
-            if weight == 0.0:
-                continue
-
-            p_dim = self.BATTER_TO_PITCHER.get(b_dim)
-            k = self.config.get_batter_k_factor(b_dim)
-            scale = self.config.get_batter_scale(b_dim)
-            reliability = self.calculate_reliability(
-                int(batter.event_counts[b_idx]), b_dim
-            )
-
-            if p_dim is None:
-                # Speed: no pitcher matchup, use 0.5 baseline
-                actual = 1.0 if weight > 0 else 0.0
-                expected = 0.5
-            else:
-                p_idx = PITCHER_DIM_NAMES.index(p_dim)
-                b_divisor = self.config.get_expected_divisor(b_dim, is_pitcher=False)
-                p_divisor = self.config.get_expected_divisor(p_dim, is_pitcher=True)
-                divisor = (b_divisor + p_divisor) / 2
-
-                expected = self.calculate_expected_score(
-                    batter.elo_dimensions[b_idx],
-                    pitcher.elo_dimensions[p_idx],
-                    divisor=divisor,
-                )
-                actual = 1.0 if weight > 0 else 0.0
-
-            delta = k * scale * abs(weight) * (actual - expected) * reliability
-            batter_deltas[b_idx] = delta
-
-        # === Pitcher loop (4D, V2: independent asymmetric weights) ===
-        for p_idx, p_dim in enumerate(PITCHER_DIM_NAMES):
-            weight = pitcher_weights.get(p_dim, 0.0)
-
-            if p_dim == "clutch":
-                base_weight = pitcher_weights.get("clutch_base", 0.0)
-                if clutch_mult > 0:
-                    weight = base_weight * (1.0 + clutch_mult)
-                else:
-                    weight = base_weight * 0.5
-
-            if weight == 0.0:
-                continue
-
-            b_dim = self.PITCHER_TO_BATTER.get(p_dim)
-            b_idx = BATTER_DIM_NAMES.index(b_dim) if b_dim else None
-
-            k = self.config.get_pitcher_k_factor(p_dim)
-            scale = self.config.get_pitcher_scale(p_dim)
-            reliability = self.calculate_reliability(
-                int(pitcher.event_counts[p_idx]), p_dim, is_pitcher=True
-            )
-
-            if b_idx is not None:
-                b_divisor = self.config.get_expected_divisor(b_dim, is_pitcher=False)
-                p_divisor = self.config.get_expected_divisor(p_dim, is_pitcher=True)
-                divisor = (b_divisor + p_divisor) / 2
-                expected = self.calculate_expected_score(
-                    pitcher.elo_dimensions[p_idx],
-                    batter.elo_dimensions[b_idx],
-                    divisor=divisor,
-                )
-            else:
-                expected = 0.5
-
-            actual = 1.0 if weight > 0 else 0.0
-            delta = k * scale * abs(weight) * (actual - expected) * reliability
-            pitcher_deltas[p_idx] += delta
+        # Event clutch multiplier (GIDP)
+        clutch_mult *= tables.clutch_multiplier[code]
+        clutch_scale = (1.0 + clutch_mult) if clutch_mult > 0 else 0.5
+
+        # === All 9 dims: K * scale * |weight| * (actual - expected) * reliability ===
+        stacked = self.config.stacked
+        weights = stacked.weights[code].copy()
+        weights[stacked.clutch_cols] *= clutch_scale
+        elo = np.concatenate((batter.elo_dimensions, pitcher.elo_dimensions))
+        expected = 1.0 / (1.0 + 10.0 ** ((elo[stacked.opp_idx] - elo) / stacked.divisor))
+        counts = np.concatenate((batter.event_counts, pitcher.event_counts))
+        reliability = reliability_ramp(counts, stacked.threshold)
+        deltas = (stacked.k_scale * np.abs(weights)
+                  * (stacked.actual[code] - expected) * reliability)
+        batter_deltas = deltas[:stacked.n_batter]
+        pitcher_deltas = deltas[stacked.n_batter:]
 
         # Update states
         batter.apply_deltas(batter_deltas)
         pitcher.apply_deltas(pitcher_deltas)
 
         # Increment event counts for dimensions with non-zero deltas
-        for b_idx in range(5):
-            if batter_deltas[b_idx] != 0:
-                batter.event_counts[b_idx] += 1
-        for p_idx in range(4):
-            if pitcher_deltas[p_idx] != 0:
-                pitcher.event_counts[p_idx] += 1
+        batter.event_counts += batter_deltas != 0
+        pitcher.event_counts += pitcher_deltas != 0
 
         batter.increment_pa()
         pitcher.increment_bfp()
@@ -29,6 +29,18 @@ PITCHER_ROLE_WEIGHTS = {
 }
 
 
+def reliability_ramp(counts: np.ndarray, threshold: np.ndarray) -> np.ndarray:
+    """Vectorized MultiEloEngine.calculate_reliability (broadcasts counts against threshold).
+
+    count >= threshold → 1.0, so a threshold of 0 means full reliability from the first event.
+    """
+    safe_threshold = np.where(threshold > 0, threshold, 1.0)
+    return np.where(
+        counts >= threshold,
+        1.0, MIN_RELIABILITY + (1 - MIN_RELIABILITY) * (counts / safe_threshold),
+    )
+
+
 @dataclass
 class BatterTalentState:
     """Batter 5D talent ELO state."""
@@ -48,7 +60,7 @@ class BatterTalentState:
         return float(np.dot(self.elo_dimensions, BATTER_DEFAULT_WEIGHTS))
 
     def apply_deltas(self, deltas: np.ndarray) -> None:
-        self.elo_dimensions = np.clip(self.elo_dimensions + deltas, ELO_MIN, ELO_MAX)
+        self.elo_dimensions = np.minimum(np.maximum(self.elo_dimensions + deltas, ELO_MIN), ELO_MAX)
 
     def increment_pa(self) -> None:
         self.pa_count += 1
@@ -74,7 +86,7 @@ class PitcherTalentState:
         return float(np.dot(self.elo_dimensions, weights))
 
     def apply_deltas(self, deltas: np.ndarray) -> None:
-        self.elo_dimensions = np.clip(self.elo_dimensions + deltas, ELO_MIN, ELO_MAX)
+        self.elo_dimensions = np.minimum(np.maximum(self.elo_dimensions + deltas, ELO_MIN), ELO_MAX)
 
     def increment_bfp(self) -> None:
         self.bfp_count += 1
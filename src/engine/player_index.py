@@ -0,0 +1,56 @@
+"""Player ID Interning — MLB player_id ↔ dense index 매핑.
+
+Array 기반 엔진에서 player_id(6자리 MLB ID)를 0부터 시작하는 연속 인덱스로 변환하여
+NumPy 배열의 행 번호로 사용.
+
+Usage:
+    index = PlayerIndex()
+    idx = index.intern(660271)                  # → 0
+    idxs = index.intern_many(pa_df['batter_id'])  # → np.ndarray[int64]
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class PlayerIndex:
+    """player_id → dense index 인터닝 테이블 (등록 순서 유지)."""
+
+    def __init__(self, player_ids=None):
+        self._index: dict[int, int] = {}
+        self._ids: list[int] = []
+        if player_ids is not None:
+            for pid in player_ids:
+                self.intern(int(pid))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._index
+
+    def get(self, player_id: int, default: int = -1) -> int:
+        """등록된 인덱스 반환. 없으면 default."""
+        return self._index.get(player_id, default)
+
+    def intern(self, player_id: int) -> int:
+        """player_id의 인덱스 반환 (없으면 신규 등록)."""
+        idx = self._index.get(player_id)
+        if idx is None:
+            idx = len(self._ids)
+            self._index[player_id] = idx
+            self._ids.append(player_id)
+        return idx
+
+    def intern_many(self, player_ids) -> np.ndarray:
+        """ID 배열 → 인덱스 배열 (신규 ID는 첫 등장 순서대로 등록)."""
+        values = np.asarray(player_ids, dtype=np.int64)
+        for pid in pd.unique(values):
+            if int(pid) not in self._index:
+                self.intern(int(pid))
+        return pd.Index(self.ids).get_indexer(values).astype(np.int64)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """인덱스 순서의 player_id 배열."""
+        return np.asarray(self._ids, dtype=np.int64)
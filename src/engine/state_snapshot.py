@@ -0,0 +1,121 @@
+"""Day-boundary State Snapshots — 날짜 종료 시점 ELO / talent 상태를 로컬 npz로 보관.
+
+EloBatch / TalentBatch(snapshot_store=...)는 _finalize_day마다 그 날짜 종료 시점의
+전체 상태(compact 배열)를 저장. 날짜 D를 재처리할 때는 D 이전 마지막 snapshot을
+복원하고 그 이후 날짜 전체를 replay (run_daily_pipeline force 모드).
+
+snapshot은 로컬에서 계산한 상태라 remote(Supabase)와 어긋날 수 있음 (run_elo.py 전체 재계산,
+다른 머신의 실행). 파이프라인은 성공한 실행 끝에 remote watermark(checksum 포함)를
+watermark.json에 기록하고, replay 전에 현재 remote watermark와 같은지 확인 (matches).
+
+Layout:
+    <root>/<kind>/<YYYY-MM-DD>.npz      kind: 'elo' | 'talent'
+    <root>/watermark.json               snapshot이 따르는 remote 상태
+
+Usage:
+    store = SnapshotStore('data/snapshots')
+    batch = EloBatch(snapshot_store=store)
+    batch.process(pa_df)                          # 날짜마다 elo/<date>.npz 저장
+    prev = store.latest_before('elo', date(2025, 6, 1))
+    batch.restore_snapshot(store.load('elo', prev))
+"""
+
+import json
+import os
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+SNAPSHOT_KINDS = ('elo', 'talent')
+WATERMARK_FILE = 'watermark.json'
+DEFAULT_SNAPSHOT_DIR = Path(__file__).parent.parent.parent / 'data' / 'snapshots'
+
+DateLike = Union[date, str]
+
+
+def _as_date(value: DateLike) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(str(value)[:10])
+
+
+class SnapshotStore:
+    """날짜별 상태 snapshot 디렉토리 (npz, 날짜당 kind별 1파일)."""
+
+    def __init__(self, root: Union[Path, str, None] = None):
+        self.root = Path(root) if root else Path(os.environ.get('ELO_SNAPSHOT_DIR', DEFAULT_SNAPSHOT_DIR))
+
+    def _dir(self, kind: str) -> Path:
+        if kind not in SNAPSHOT_KINDS:
+            raise ValueError(f"Unknown snapshot kind: {kind!r} (expected one of {SNAPSHOT_KINDS})")
+        return self.root / kind
+
+    def path(self, kind: str, game_date: DateLike) -> Path:
+        return self._dir(kind) / f"{_as_date(game_date).isoformat()}.npz"
+
+    def save(self, kind: str, game_date: DateLike, arrays: dict[str, np.ndarray]) -> Path:
+        """snapshot 저장 (임시 파일 → rename, 같은 날짜는 덮어씀)."""
+        path = self.path(kind, game_date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp, path)
+        return path
+
+    def load(self, kind: str, game_date: DateLike) -> dict[str, np.ndarray]:
+        with np.load(self.path(kind, game_date), allow_pickle=False) as data:
+            return {name: data[name] for name in data.files}
+
+    def dates(self, kind: str) -> list[date]:
+        """저장된 snapshot 날짜 (오름차순)."""
+        directory = self._dir(kind)
+        if not directory.exists():
+            return []
+        return sorted(date.fromisoformat(p.stem) for p in directory.glob('*.npz'))
+
+    def latest_before(self, kind: str, game_date: DateLike) -> Optional[date]:
+        """game_date 이전(미포함) 마지막 snapshot 날짜 (없으면 None)."""
+        target = _as_date(game_date)
+        earlier = [d for d in self.dates(kind) if d < target]
+        return earlier[-1] if earlier else None
+
+    def discard_from(self, kind: str, game_date: DateLike, keep: Iterable[DateLike] = ()) -> int:
+        """game_date 이후(포함) snapshot 중 keep에 없는 날짜 삭제 → 삭제 수."""
+        target = _as_date(game_date)
+        kept = {_as_date(d) for d in keep}
+        removed = 0
+        for d in self.dates(kind):
+            if d >= target and d not in kept:
+                self.path(kind, d).unlink()
+                removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """모든 snapshot + watermark 삭제 (전체 재계산 후) → 삭제한 snapshot 수."""
+        removed = sum(self.discard_from(kind, date.min) for kind in SNAPSHOT_KINDS)
+        (self.root / WATERMARK_FILE).unlink(missing_ok=True)
+        return removed
+
+    def save_watermark(self, watermark: dict) -> Path:
+        """snapshot이 따르는 remote watermark 기록 (임시 파일 → rename)."""
+        path = self.root / WATERMARK_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(watermark, sort_keys=True, default=str))
+        os.replace(tmp, path)
+        return path
+
+    def load_watermark(self) -> Optional[dict]:
+        path = self.root / WATERMARK_FILE
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except ValueError:
+            return None
+
+    def matches(self, watermark: dict) -> bool:
+        """기록된 watermark == 현재 remote watermark (기록 없으면 False)."""
+        recorded = self.load_watermark()
+        return recorded is not None and recorded == json.loads(json.dumps(watermark, default=str))
@@ -1,9 +1,24 @@
 """Talent Batch Processor — 9D talent ELO batch computation.
 
 Processes PA DataFrame to produce:
-- talent_pa_details: per-PA per-dimension ELO changes
+- talent_pa_details: per-PA per-dimension ELO changes (columnar DetailBuffer)
 - talent_daily_ohlc: daily OHLC per dimension
 - talent_player_records: current snapshot per dimension
+
+storage="matrix" keeps all talent states in player × dimension matrices
+(TalentStateManager matrix mode); results are identical to the default "dict".
+
+jit=True (implies storage="matrix") runs the whole PA frame through the
+Numba-compiled talent_kernel in one call and builds details / OHLC with
+column ops. Without Numba it falls back to the MultiEloEngine per-PA path.
+
+wavefront=True (implies storage="matrix") splits each game_date into waves of
+PAs that share no player (see wavefront) and applies every wave as one NumPy
+scatter update; per-day parallelism is recorded in batch.wave_stats.
+
+snapshot_store=SnapshotStore(...) saves the full talent state as
+'talent/<date>.npz' at every _finalize_day (kernel / wavefront paths process
+one date at a time); restore_snapshot() restores it.
 """
 import logging
 from datetime import date
@@ -12,6 +27,8 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from src.engine.detail_buffer import CATEGORY, DetailBuffer
+from src.engine.elo_arrays import day_run_ids, day_slices, game_date_strings, object_column, truthy_column
 from src.engine.multi_elo_config import MultiEloConfig
 from src.engine.multi_elo_engine import MultiEloEngine
 from src.engine.multi_elo_types import (
@@ -21,10 +38,26 @@ from src.engine.multi_elo_types import (
     PITCHER_DIM_NAMES,
     DEFAULT_ELO,
 )
+from src.engine.talent_kernel import HAVE_NUMBA, clutch_scales, run_talent_kernel, run_talent_waves
 from src.engine.talent_state_manager import TalentStateManager, DualBatterState, DualPitcherState
+from src.engine.state_snapshot import SnapshotStore
+from src.engine.wavefront import build_wavefront, wavefront_day_stats
 
 logger = logging.getLogger(__name__)
 
+TALENT_PA_DETAIL_SCHEMA = {
+    'pa_id': 'int64',
+    'player_id': 'int64',
+    'player_role': CATEGORY,
+    'talent_type': CATEGORY,
+    'elo_before': 'float64',
+    'elo_after': 'float64',
+    'delta': 'float64',
+}
+
+# Kernel column order: batter dims 0-4, pitcher dims 5-8
+_KERNEL_DIM_NAMES = np.array(BATTER_DIM_NAMES + PITCHER_DIM_NAMES, dtype=object)
+
 
 class TalentBatch:
     """9D Talent ELO batch processor."""
@@ -34,17 +67,33 @@ class TalentBatch:
         config: MultiEloConfig | None = None,
         initial_batters: dict[int, DualBatterState] | None = None,
         initial_pitchers: dict[int, DualPitcherState] | None = None,
+        storage: str = "dict",
+        jit: bool = False,
+        wavefront: bool = False,
+        snapshot_store: Optional[SnapshotStore] = None,
     ):
+        if jit and wavefront:
+            raise ValueError("jit and wavefront are mutually exclusive")
         self.config = config or MultiEloConfig()
         self.engine = MultiEloEngine(config=self.config)
+        if jit and not HAVE_NUMBA:
+            logger.info("  Talent: numba not installed, using MultiEloEngine path")
+            jit = False
+        self.jit = jit
+        self.wavefront = wavefront
+        if jit or wavefront:
+            storage = "matrix"
         self.state_mgr = TalentStateManager(
             initial_batters=initial_batters,
             initial_pitchers=initial_pitchers,
+            storage=storage,
         )
 
-        self.talent_pa_details: list[dict] = []
+        self.talent_pa_details = DetailBuffer(TALENT_PA_DETAIL_SCHEMA)
         self.talent_daily_ohlc: list[dict] = []
         self._active_player_ids: set[int] = set()
+        self.wave_stats: list[dict] = []  # wavefront: per-day parallelism
+        self.snapshot_store = snapshot_store
 
         # OHLC tracking: key = (player_id, talent_type)
         self._current_date: Optional[str] = None
@@ -90,6 +139,22 @@ class TalentBatch:
         self._day_high.clear()
         self._day_low.clear()
         self._day_pa_count.clear()
+        if self.snapshot_store is not None:
+            self.snapshot_store.save('talent', game_date_val, self.snapshot_state())
+
+    def reset_outputs(self) -> None:
+        """Clear uploaded output buffers (PA details, daily OHLC, active players); states are kept."""
+        self.talent_pa_details = DetailBuffer(TALENT_PA_DETAIL_SCHEMA)
+        self.talent_daily_ohlc = []
+        self._active_player_ids = set()
+
+    def snapshot_state(self) -> dict[str, np.ndarray]:
+        """Full talent state as compact arrays (TalentStateManager.to_arrays)."""
+        return self.state_mgr.to_arrays()
+
+    def restore_snapshot(self, snapshot: dict[str, np.ndarray]) -> None:
+        """Replace all talent states with a snapshot_state() result."""
+        self.state_mgr = TalentStateManager.from_arrays(snapshot, storage=self.state_mgr.storage)
 
     def _get_current_elo(self, player_id: int, talent_type: str) -> float:
         """Get current ELO for a player's talent dimension."""
@@ -105,6 +170,14 @@ class TalentBatch:
 
     def process(self, pa_df: pd.DataFrame):
         """Process PA DataFrame for 9D talent ELO."""
+        if self.jit or self.wavefront:
+            if self.snapshot_store is None:
+                self._process_kernel(pa_df)
+                return
+            for game_date_str, rows in day_slices(game_date_strings(pa_df)):
+                self._process_kernel(pa_df.iloc[rows])
+                self.snapshot_store.save('talent', game_date_str, self.snapshot_state())
+            return
         total = len(pa_df)
 
         for idx, row in pa_df.iterrows():
@@ -153,12 +226,8 @@ class TalentBatch:
             pitcher_dual.career.apply_deltas(result.pitcher_deltas)
             pitcher_dual.career.increment_bfp()
             # Career event counts
-            for b_idx in range(5):
-                if result.batter_deltas[b_idx] != 0:
-                    batter_dual.career.event_counts[b_idx] += 1
-            for p_idx in range(4):
-                if result.pitcher_deltas[p_idx] != 0:
-                    pitcher_dual.career.event_counts[p_idx] += 1
+            batter_dual.career.event_counts += result.batter_deltas != 0
+            pitcher_dual.career.event_counts += result.pitcher_deltas != 0
 
             # Record OHLC updates (after PA)
             for b_idx, dim_name in enumerate(BATTER_DIM_NAMES):
@@ -170,26 +239,26 @@ class TalentBatch:
             pa_id = int(row['pa_id'])
             for b_idx, dim_name in enumerate(BATTER_DIM_NAMES):
                 if result.batter_deltas[b_idx] != 0:
-                    self.talent_pa_details.append({
-                        'pa_id': pa_id,
-                        'player_id': batter_id,
-                        'player_role': 'batter',
-                        'talent_type': dim_name,
-                        'elo_before': float(batter_before[b_idx]),
-                        'elo_after': float(batter.elo_dimensions[b_idx]),
-                        'delta': float(result.batter_deltas[b_idx]),
-                    })
+                    self.talent_pa_details.append(
+                        pa_id=pa_id,
+                        player_id=batter_id,
+                        player_role='batter',
+                        talent_type=dim_name,
+                        elo_before=batter_before[b_idx],
+                        elo_after=batter.elo_dimensions[b_idx],
+                        delta=result.batter_deltas[b_idx],
+                    )
             for p_idx, dim_name in enumerate(PITCHER_DIM_NAMES):
                 if result.pitcher_deltas[p_idx] != 0:
-                    self.talent_pa_details.append({
-                        'pa_id': pa_id,
-                        'player_id': pitcher_id,
-                        'player_role': 'pitcher',
-                        'talent_type': dim_name,
-                        'elo_before': float(pitcher_before[p_idx]),
-                        'elo_after': float(pitcher.elo_dimensions[p_idx]),
-                        'delta': float(result.pitcher_deltas[p_idx]),
-                    })
+                    self.talent_pa_details.append(
+                        pa_id=pa_id,
+                        player_id=pitcher_id,
+                        player_role='pitcher',
+                        talent_type=dim_name,
+                        elo_before=pitcher_before[p_idx],
+                        elo_after=pitcher.elo_dimensions[p_idx],
+                        delta=result.pitcher_deltas[p_idx],
+                    )
 
             if (idx + 1) % 50000 == 0:
                 logger.info(f"  Talent: Processed {idx + 1:,} / {total:,} PAs")
@@ -204,6 +273,149 @@ class TalentBatch:
             f"{len(self.talent_daily_ohlc):,} OHLC records"
         )
 
+    def _process_kernel(self, pa_df: pd.DataFrame):
+        """Kernel / wavefront path: matrix update over the whole frame + column-wise details/OHLC."""
+        total = len(pa_df)
+        if total == 0:
+            return
+        dates = game_date_strings(pa_df)
+        runs = day_run_ids(dates)
+        batter_ids = pa_df['batter_id'].to_numpy().astype(np.int64)
+        pitcher_ids = pa_df['pitcher_id'].to_numpy().astype(np.int64)
+        if 'result_type' in pa_df.columns:
+            result_types = pd.Series(object_column(pa_df, 'result_type'), dtype=object)
+        else:
+            result_types = pd.Series(['OUT'] * total, dtype=object)
+        tables = self.config.tables
+        codes = result_types.map(tables.event_code).to_numpy().astype(np.int64)
+        is_risp = truthy_column(pa_df, 'on_2b') | truthy_column(pa_df, 'on_3b')
+
+        mgr = self.state_mgr
+        known_batters = set(mgr.all_batters)
+        for pid in pd.unique(batter_ids).tolist():
+            mgr.get_or_create_batter(pid)
+        for pid in pd.unique(pitcher_ids).tolist():
+            mgr.get_or_create_pitcher(pid)
+        b_rows = mgr.batter_matrix.index.intern_many(batter_ids)
+        p_rows = mgr.pitcher_matrix.index.intern_many(pitcher_ids)
+        clutch_col = BATTER_DIM_NAMES.index('clutch')
+        batter_clutch_start = mgr.batter_matrix.season_elo[:, clutch_col].copy()
+        self._active_player_ids.update(batter_ids.tolist())
+        self._active_player_ids.update(pitcher_ids.tolist())
+
+        scales = clutch_scales(self.config, codes, is_risp)
+        if self.wavefront:
+            schedule = build_wavefront(runs, batter_ids, pitcher_ids)
+            before, deltas, after = run_talent_waves(
+                self.config, mgr, codes, b_rows, p_rows, scales, schedule)
+            self.wave_stats.extend(wavefront_day_stats(schedule, dates))
+        else:
+            before, deltas, after = run_talent_kernel(
+                self.config, mgr, codes, b_rows, p_rows, scales)
+
+        n_b = len(BATTER_DIM_NAMES)
+        player_ids = np.empty((total, len(_KERNEL_DIM_NAMES)), dtype=np.int64)
+        player_ids[:, :n_b] = batter_ids[:, None]
+        player_ids[:, n_b:] = pitcher_ids[:, None]
+
+        # PA details: affected dimensions, row-major (batter dims then pitcher dims)
+        rows, cols = np.nonzero(deltas != 0)
+        self.talent_pa_details.extend({
+            'pa_id': pa_df['pa_id'].to_numpy()[rows],
+            'player_id': player_ids[rows, cols],
+            'player_role': np.where(cols < n_b, 'batter', 'pitcher').astype(object),
+            'talent_type': _KERNEL_DIM_NAMES[cols],
+            'elo_before': before[rows, cols],
+            'elo_after': after[rows, cols],
+            'delta': deltas[rows, cols],
+        })
+
+        self._append_daily_ohlc_kernel(
+            dates, runs, batter_ids, player_ids, before, after,
+            known_batters, batter_clutch_start,
+        )
+        self._current_date = dates[-1]
+
+        logger.info(
+            f"  Talent: Completed {total:,} PAs, "
+            f"{len(self.talent_pa_details):,} detail records, "
+            f"{len(self.talent_daily_ohlc):,} OHLC records"
+        )
+
+    def _append_daily_ohlc_kernel(self, dates, runs, batter_ids, player_ids, before, after,
+                                  known_batters, batter_clutch_start):
+        """Kernel before/after (n_pa × 9) → daily OHLC, same keys/order/values as process().
+
+        OHLC keys are (player_id, talent_type), so a two-way player's batter and
+        pitcher 'clutch' share one key; its close is the batter clutch whenever the
+        player is a known batter at day end (see _get_current_elo).
+        """
+        n, n_dims = before.shape
+        n_b = len(BATTER_DIM_NAMES)
+        frame = pd.DataFrame({
+            'run': np.repeat(runs, n_dims),
+            'player_id': player_ids.ravel(),
+            'talent_type': np.tile(_KERNEL_DIM_NAMES, n),
+            'before': before.ravel(),
+            'after': after.ravel(),
+            'is_batter': np.tile(np.arange(n_dims) < n_b, n),
+        })
+        grouped = frame.groupby(['run', 'player_id', 'talent_type'], sort=False)
+        agg = grouped.agg(
+            open=('before', 'first'),
+            close=('after', 'last'),
+            high=('after', 'max'),
+            low=('after', 'min'),
+            total_pa=('after', 'size'),
+            has_batter=('is_batter', 'max'),
+            all_batter=('is_batter', 'min'),
+        ).reset_index()
+        close = agg['close'].to_numpy().copy()
+
+        # Shared 'clutch' key: pitcher rows for a player who is (also) a known batter
+        shared = ((agg['talent_type'] == 'clutch') & ~agg['all_batter']).to_numpy()
+        if shared.any():
+            b_clutch_after = after[:, BATTER_DIM_NAMES.index('clutch')]
+            run_end = np.r_[np.flatnonzero(runs[1:] != runs[:-1]), n - 1]
+            batter_pos: dict[int, np.ndarray] = {}
+            for i in np.flatnonzero(shared).tolist():
+                pid = int(agg.at[i, 'player_id'])
+                if pid not in batter_pos:
+                    batter_pos[pid] = np.flatnonzero(batter_ids == pid)
+                pos = batter_pos[pid]
+                last = np.searchsorted(pos, run_end[agg.at[i, 'run']], side='right') - 1
+                if last >= 0:
+                    close[i] = b_clutch_after[pos[last]]
+                elif pid in known_batters:
+                    close[i] = batter_clutch_start[self.state_mgr.batter_matrix.index.get(pid)]
+
+        run_starts = np.flatnonzero(np.r_[True, runs[1:] != runs[:-1]])
+        run_dates = dates[run_starts]
+        open_elo = agg['open'].to_numpy()
+        self.talent_daily_ohlc.extend(
+            {
+                'player_id': pid,
+                'game_date': run_dates[run],
+                'talent_type': talent_type,
+                'elo_type': 'SEASON',
+                'open': o,
+                'high': h,
+                'low': lo,
+                'close': c,
+                'total_pa': cnt,
+            }
+            for run, pid, talent_type, o, h, lo, c, cnt in zip(
+                agg['run'].tolist(),
+                agg['player_id'].tolist(),
+                agg['talent_type'].tolist(),
+                open_elo.tolist(),
+                np.maximum(open_elo, agg['high'].to_numpy()).tolist(),
+                np.minimum(open_elo, agg['low'].to_numpy()).tolist(),
+                close.tolist(),
+                agg['total_pa'].tolist(),
+            )
+        )
+
     def get_talent_player_records(self, active_only: bool = False) -> list[dict]:
         """Generate talent_player_current table records."""
         records = []
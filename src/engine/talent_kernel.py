@@ -0,0 +1,200 @@
+"""Talent Season Kernel — whole-season 9D talent ELO in one call.
+
+Takes the stacked event × dimension tables (MultiEloConfig.stacked), the
+talent state matrices (TalentMatrix, season + career) and interned PA columns,
+and runs every PA sequentially in a single loop. With Numba installed the loop
+is JIT-compiled (nopython); without it TalentBatch falls back to the
+MultiEloEngine per-PA path.
+
+Per PA the kernel matches MultiEloEngine.process_plate_appearance + the career
+mirroring in TalentBatch.process:
+    season/career ELO  += delta (clipped to [ELO_MIN, ELO_MAX])
+    season/career counts += (delta != 0)
+    season/career PA   += 1
+
+run_talent_waves applies the same update one wavefront wave at a time (PAs in a
+wave share no player), as NumPy scatter updates with MultiEloEngine's exact
+vector ops — no Numba needed.
+
+Usage:
+    before, deltas, after = run_talent_kernel(config, state_mgr, codes, b_rows, p_rows, scales)
+    before, deltas, after = run_talent_waves(config, state_mgr, codes, b_rows, p_rows, scales, schedule)
+"""
+import logging
+
+import numpy as np
+
+from src.engine.multi_elo_config import MultiEloConfig
+from src.engine.multi_elo_types import ELO_MAX, ELO_MIN, MIN_RELIABILITY, reliability_ramp
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numba
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on environment
+    numba = None
+    HAVE_NUMBA = False
+
+RISP_CLUTCH_MULTIPLIER = 0.5  # MultiEloEngine: RISP triggers minimum clutch activation
+
+
+def clutch_scales(config: MultiEloConfig, codes: np.ndarray, is_risp: np.ndarray) -> np.ndarray:
+    """Per-PA clutch weight scale at leverage 1.0 (TalentBatch default).
+
+    clutch_mult = 0.5 if RISP else 0.0, times the event clutch multiplier;
+    scale = 1 + clutch_mult if clutch_mult > 0 else 0.5.
+    """
+    clutch_mult = np.where(is_risp, RISP_CLUTCH_MULTIPLIER, 0.0) * config.tables.clutch_multiplier[codes]
+    return np.where(clutch_mult > 0, 1.0 + clutch_mult, 0.5)
+
+
+def talent_season_kernel(
+    codes, b_rows, p_rows, clutch_scale,
+    weights, actual, k_scale, threshold, opp_idx, divisor, clutch_cols, n_batter,
+    b_season, b_career, b_season_cnt, b_career_cnt, b_season_pa, b_career_pa,
+    p_season, p_career, p_season_cnt, p_career_cnt, p_season_pa, p_career_pa,
+    elo_min, elo_max, min_reliability,
+    before_out, delta_out, after_out,
+):
+    """Sequential 9D update over all PAs (state matrices updated in place).
+
+    before_out / delta_out / after_out: (n_pa, 9) season ELO before, delta, after.
+    Plain Python/NumPy code so it runs both JIT-compiled and interpreted.
+    """
+    n_dims = weights.shape[1]
+    elo = np.empty(n_dims)
+    counts = np.empty(n_dims)
+    for i in range(len(codes)):
+        b = b_rows[i]
+        p = p_rows[i]
+        code = codes[i]
+        for d in range(n_dims):
+            if d < n_batter:
+                elo[d] = b_season[b, d]
+                counts[d] = b_season_cnt[b, d]
+            else:
+                elo[d] = p_season[p, d - n_batter]
+                counts[d] = p_season_cnt[p, d - n_batter]
+
+        for d in range(n_dims):
+            weight = weights[code, d]
+            if d == clutch_cols[0] or d == clutch_cols[1]:
+                weight = weight * clutch_scale[i]
+            before_out[i, d] = elo[d]
+            if weight == 0.0:
+                delta_out[i, d] = 0.0
+                continue
+            expected = 1.0 / (1.0 + 10.0 ** ((elo[opp_idx[d]] - elo[d]) / divisor[d]))
+            if counts[d] >= threshold[d]:
+                reliability = 1.0
+            else:
+                reliability = min_reliability + (1 - min_reliability) * (counts[d] / threshold[d])
+            delta_out[i, d] = k_scale[d] * abs(weight) * (actual[code, d] - expected) * reliability
+
+        for d in range(n_dims):
+            delta = delta_out[i, d]
+            hit = 1.0 if delta != 0.0 else 0.0
+            if d < n_batter:
+                season, career, s_cnt, c_cnt, row, j = b_season, b_career, b_season_cnt, b_career_cnt, b, d
+            else:
+                season, career, s_cnt, c_cnt, row, j = p_season, p_career, p_season_cnt, p_career_cnt, p, d - n_batter
+            season[row, j] = min(max(season[row, j] + delta, elo_min), elo_max)
+            career[row, j] = min(max(career[row, j] + delta, elo_min), elo_max)
+            s_cnt[row, j] += hit
+            c_cnt[row, j] += hit
+            after_out[i, d] = season[row, j]
+
+        b_season_pa[b] += 1
+        b_career_pa[b] += 1
+        p_season_pa[p] += 1
+        p_career_pa[p] += 1
+
+
+_jit_kernel = None
+
+
+def _compiled_kernel():
+    global _jit_kernel
+    if _jit_kernel is None:
+        _jit_kernel = numba.njit(cache=True)(talent_season_kernel)
+    return _jit_kernel
+
+
+def run_talent_kernel(config: MultiEloConfig, state_mgr, codes, b_rows, p_rows, scales,
+                      jit: bool = True):
+    """Run the season kernel on a matrix-storage TalentStateManager.
+
+    Returns (before, deltas, after), each (n_pa, 9): batter dims 0-4, pitcher dims 5-8.
+    jit=False runs the same loop interpreted (slow; for tests / no Numba).
+    """
+    if jit and not HAVE_NUMBA:
+        raise RuntimeError("numba is not installed")
+    st = config.stacked
+    n = len(codes)
+    n_dims = st.weights.shape[1]
+    before = np.empty((n, n_dims))
+    deltas = np.empty((n, n_dims))
+    after = np.empty((n, n_dims))
+    bm, pm = state_mgr.batter_matrix, state_mgr.pitcher_matrix
+    kernel = _compiled_kernel() if jit else talent_season_kernel
+    kernel(
+        np.ascontiguousarray(codes, dtype=np.int64),
+        np.ascontiguousarray(b_rows, dtype=np.int64),
+        np.ascontiguousarray(p_rows, dtype=np.int64),
+        np.ascontiguousarray(scales, dtype=np.float64),
+        st.weights, st.actual, st.k_scale, st.threshold,
+        st.opp_idx.astype(np.int64), st.divisor, st.clutch_cols.astype(np.int64), st.n_batter,
+        bm.season_elo, bm.career_elo, bm.season_counts, bm.career_counts, bm.season_pa, bm.career_pa,
+        pm.season_elo, pm.career_elo, pm.season_counts, pm.career_counts, pm.season_pa, pm.career_pa,
+        ELO_MIN, ELO_MAX, MIN_RELIABILITY,
+        before, deltas, after,
+    )
+    return before, deltas, after
+
+
+def run_talent_waves(config: MultiEloConfig, state_mgr, codes, b_rows, p_rows, scales, schedule):
+    """Wave-by-wave scatter update on a matrix-storage TalentStateManager.
+
+    schedule: wavefront.WaveSchedule over the same PAs. Same return value as
+    run_talent_kernel; per-PA values equal MultiEloEngine.process_plate_appearance.
+    """
+    st = config.stacked
+    n_b = st.n_batter
+    n = len(codes)
+    n_dims = st.weights.shape[1]
+    before = np.empty((n, n_dims))
+    deltas = np.empty((n, n_dims))
+    after = np.empty((n, n_dims))
+    bm, pm = state_mgr.batter_matrix, state_mgr.pitcher_matrix
+    codes = np.asarray(codes, dtype=np.int64)
+    b_rows = np.asarray(b_rows, dtype=np.int64)
+    p_rows = np.asarray(p_rows, dtype=np.int64)
+    scales = np.asarray(scales, dtype=np.float64)
+
+    for wave in schedule.waves():
+        b, p, code = b_rows[wave], p_rows[wave], codes[wave]
+        weights = st.weights[code]
+        weights[:, st.clutch_cols] *= scales[wave][:, None]
+        elo = np.concatenate((bm.season_elo[b], pm.season_elo[p]), axis=1)
+        expected = 1.0 / (1.0 + 10.0 ** ((elo[:, st.opp_idx] - elo) / st.divisor))
+        counts = np.concatenate((bm.season_counts[b], pm.season_counts[p]), axis=1)
+        reliability = reliability_ramp(counts, st.threshold)
+        delta = st.k_scale * np.abs(weights) * (st.actual[code] - expected) * reliability
+        hit = delta != 0
+        before[wave] = elo
+        deltas[wave] = delta
+
+        for store, rows, cols in ((bm, b, slice(None, n_b)), (pm, p, slice(n_b, None))):
+            d = delta[:, cols]
+            for elo_mat, cnt_mat in ((store.season_elo, store.season_counts),
+                                     (store.career_elo, store.career_counts)):
+                updated = elo_mat[rows] + d
+                np.maximum(updated, ELO_MIN, out=updated)
+                np.minimum(updated, ELO_MAX, out=updated)
+                elo_mat[rows] = updated
+                cnt_mat[rows] += hit[:, cols]
+            store.season_pa[rows] += 1
+            store.career_pa[rows] += 1
+        after[wave] = np.concatenate((bm.season_elo[b], pm.season_elo[p]), axis=1)
+    return before, deltas, after
@@ -0,0 +1,186 @@
+"""Talent State Matrices — player × dimension storage for 9D talent.
+
+All batters live in N×5 matrices and all pitchers in M×4 matrices, with
+separate season and career ELO / event-count matrices plus PA counters.
+Rows are addressed through a PlayerIndex; updates happen in place on row views.
+
+BatterRowView / PitcherRowView expose the BatterTalentState / PitcherTalentState
+interface on top of a matrix row, so MultiEloEngine and DualBatterState /
+DualPitcherState work unchanged. Views cache their row slices and
+re-slice them after the matrices grow.
+
+Usage:
+    store = TalentMatrix(BATTER_DIM_COUNT)
+    row = store.add(660271)
+    season = BatterRowView(store, row, 'season')
+    season.apply_deltas(deltas)        # writes store.season_elo[row] in place
+"""
+import numpy as np
+
+from src.engine.multi_elo_types import (
+    DEFAULT_ELO, ELO_MAX, ELO_MIN, BatterTalentState, PitcherTalentState,
+)
+from src.engine.player_index import PlayerIndex
+
+SCOPES = ("season", "career")
+
+
+class TalentMatrix:
+    """Player × dimension talent matrices for one role (batter or pitcher)."""
+
+    def __init__(self, n_dims: int, capacity: int = 256):
+        self.n_dims = n_dims
+        self.index = PlayerIndex()
+        self._capacity = max(int(capacity), 1)
+        self.season_elo = np.full((self._capacity, n_dims), DEFAULT_ELO)
+        self.career_elo = np.full((self._capacity, n_dims), DEFAULT_ELO)
+        self.season_counts = np.zeros((self._capacity, n_dims))
+        self.career_counts = np.zeros((self._capacity, n_dims))
+        self.season_pa = np.zeros(self._capacity, dtype=np.int64)
+        self.career_pa = np.zeros(self._capacity, dtype=np.int64)
+        self.generation = 0  # reallocation 횟수 (row view 캐시 무효화용)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self.index
+
+    def _grow(self, needed: int) -> None:
+        if needed <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        n = len(self.index)
+        for name, fill in (("season_elo", DEFAULT_ELO), ("career_elo", DEFAULT_ELO),
+                           ("season_counts", 0), ("career_counts", 0),
+                           ("season_pa", 0), ("career_pa", 0)):
+            old = getattr(self, name)
+            grown = np.full((capacity,) + old.shape[1:], fill, dtype=old.dtype)
+            grown[:n] = old[:n]
+            setattr(self, name, grown)
+        self._capacity = capacity
+        self.generation += 1
+
+    def add(self, player_id: int) -> int:
+        """Row for player_id (new players get default rows)."""
+        row = self.index.get(player_id)
+        if row < 0:
+            self._grow(len(self.index) + 1)
+            row = self.index.intern(player_id)
+        return row
+
+    def add_many(self, player_ids) -> np.ndarray:
+        """Rows for an array of player_ids (new ids registered in first-seen order)."""
+        values = np.asarray(player_ids, dtype=np.int64)
+        self._grow(len(self.index) + len(values))
+        return self.index.intern_many(values)
+
+    def elo(self, scope: str) -> np.ndarray:
+        """Active-row ELO matrix view (len × n_dims)."""
+        return getattr(self, f"{scope}_elo")[:len(self)]
+
+    def counts(self, scope: str) -> np.ndarray:
+        """Active-row event-count matrix view (len × n_dims)."""
+        return getattr(self, f"{scope}_counts")[:len(self)]
+
+    def reset_season(self, rows=None) -> None:
+        """Reset season ELO / counts / PA (all rows, or the given rows)."""
+        rows = slice(0, len(self)) if rows is None else rows
+        self.season_elo[rows] = DEFAULT_ELO
+        self.season_counts[rows] = 0
+        self.season_pa[rows] = 0
+
+
+class _TalentRowView:
+    """Common row-view plumbing: (matrix, row, scope) → in-place row views."""
+
+    def __init__(self, store: TalentMatrix, row: int, scope: str):
+        if scope not in SCOPES:
+            raise ValueError(f"Unknown scope: {scope!r} (expected one of {SCOPES})")
+        self._store = store
+        self._row = row
+        self._scope = scope
+        self._pa_attr = f"{scope}_pa"
+        self._refresh()
+
+    def _refresh(self) -> None:
+        store, row = self._store, self._row
+        self._generation = store.generation
+        self._elo = getattr(store, f"{self._scope}_elo")[row]
+        self._counts = getattr(store, f"{self._scope}_counts")[row]
+
+    @property
+    def player_id(self) -> int:
+        return int(self._store.index.ids[self._row])
+
+    @property
+    def elo_dimensions(self) -> np.ndarray:
+        if self._generation != self._store.generation:
+            self._refresh()
+        return self._elo
+
+    @elo_dimensions.setter
+    def elo_dimensions(self, values) -> None:
+        self.elo_dimensions[:] = values
+
+    @property
+    def event_counts(self) -> np.ndarray:
+        if self._generation != self._store.generation:
+            self._refresh()
+        return self._counts
+
+    @event_counts.setter
+    def event_counts(self, values) -> None:
+        self.event_counts[:] = values
+
+    def apply_deltas(self, deltas: np.ndarray) -> None:
+        """In-place: row = clip(row + deltas, ELO_MIN, ELO_MAX) (no new array)."""
+        elo = self.elo_dimensions
+        np.add(elo, deltas, out=elo)
+        np.maximum(elo, ELO_MIN, out=elo)
+        np.minimum(elo, ELO_MAX, out=elo)
+
+    def _get_pa(self) -> int:
+        return int(getattr(self._store, self._pa_attr)[self._row])
+
+    def _set_pa(self, value: int) -> None:
+        getattr(self._store, self._pa_attr)[self._row] = value
+
+    def reset(self) -> None:
+        """Reset this row to defaults (season reset for a single player)."""
+        self.elo_dimensions = DEFAULT_ELO
+        self.event_counts = 0
+        self._set_pa(0)
+
+
+class BatterRowView(_TalentRowView):
+    """BatterTalentState interface over a TalentMatrix row."""
+
+    CONTACT = BatterTalentState.CONTACT
+    POWER = BatterTalentState.POWER
+    DISCIPLINE = BatterTalentState.DISCIPLINE
+    SPEED = BatterTalentState.SPEED
+    CLUTCH = BatterTalentState.CLUTCH
+
+    pa_count = property(_TalentRowView._get_pa, _TalentRowView._set_pa)
+    composite_elo = BatterTalentState.composite_elo
+    increment_pa = BatterTalentState.increment_pa
+
+
+class PitcherRowView(_TalentRowView):
+    """PitcherTalentState interface over a TalentMatrix row."""
+
+    STUFF = PitcherTalentState.STUFF
+    BIP_SUPPRESSION = PitcherTalentState.BIP_SUPPRESSION
+    COMMAND = PitcherTalentState.COMMAND
+    CLUTCH = PitcherTalentState.CLUTCH
+
+    def __init__(self, store: TalentMatrix, row: int, scope: str, role: str = "starter"):
+        super().__init__(store, row, scope)
+        self.role = role
+
+    bfp_count = property(_TalentRowView._get_pa, _TalentRowView._set_pa)
+    composite_elo = PitcherTalentState.composite_elo
+    increment_bfp = PitcherTalentState.increment_bfp
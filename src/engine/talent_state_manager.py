@@ -1,10 +1,27 @@
-"""Talent State Manager — Season/Career dual tracking for 9D talent."""
+"""Talent State Manager — Season/Career dual tracking for 9D talent.
+
+Storage modes:
+    'dict'   — one BatterTalentState / PitcherTalentState object per player (default)
+    'matrix' — all batters in N×5 and all pitchers in M×4 matrices (season and
+               career ELO, event counts, PA counts; see talent_matrix). The
+               DualBatterState / DualPitcherState objects hold row views, so
+               updates write the matrices in place.
+"""
 from dataclasses import dataclass, field
 from typing import Optional
 
 import numpy as np
 
-from src.engine.multi_elo_types import BatterTalentState, PitcherTalentState, DEFAULT_ELO
+from src.engine.multi_elo_types import (
+    BatterTalentState,
+    PitcherTalentState,
+    DEFAULT_ELO,
+    BATTER_DIM_COUNT,
+    PITCHER_DIM_COUNT,
+)
+from src.engine.talent_matrix import SCOPES, BatterRowView, PitcherRowView, TalentMatrix
+
+STORAGE_MODES = ("dict", "matrix")
 
 
 @dataclass
@@ -27,7 +44,10 @@ class DualBatterState:
         self.career.increment_pa()
 
     def reset_season(self) -> None:
-        self.season = BatterTalentState(player_id=self.player_id)
+        if isinstance(self.season, BatterRowView):
+            self.season.reset()
+        else:
+            self.season = BatterTalentState(player_id=self.player_id)
 
 
 @dataclass
@@ -50,7 +70,16 @@ class DualPitcherState:
         self.career.increment_bfp()
 
     def reset_season(self) -> None:
-        self.season = PitcherTalentState(player_id=self.player_id)
+        if isinstance(self.season, PitcherRowView):
+            self.season.reset()
+        else:
+            self.season = PitcherTalentState(player_id=self.player_id)
+
+
+def _copy_into_row(view, state, pa_attr: str) -> None:
+    view.elo_dimensions = state.elo_dimensions
+    view.event_counts = state.event_counts
+    setattr(view, pa_attr, getattr(state, pa_attr))
 
 
 class TalentStateManager:
@@ -60,28 +89,150 @@ class TalentStateManager:
         self,
         initial_batters: dict[int, DualBatterState] | None = None,
         initial_pitchers: dict[int, DualPitcherState] | None = None,
+        storage: str = "dict",
     ):
-        self._batters: dict[int, DualBatterState] = dict(initial_batters) if initial_batters else {}
-        self._pitchers: dict[int, DualPitcherState] = dict(initial_pitchers) if initial_pitchers else {}
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"Unknown storage mode: {storage!r} (expected one of {STORAGE_MODES})")
+        self.storage = storage
         self._current_season: Optional[int] = None
+        if storage == "dict":
+            self.batter_matrix = self.pitcher_matrix = None
+            self._batters: dict[int, DualBatterState] = dict(initial_batters) if initial_batters else {}
+            self._pitchers: dict[int, DualPitcherState] = dict(initial_pitchers) if initial_pitchers else {}
+            return
+
+        # matrix mode: initial states are copied into matrix rows
+        self.batter_matrix = TalentMatrix(BATTER_DIM_COUNT, capacity=max(256, len(initial_batters or ())))
+        self.pitcher_matrix = TalentMatrix(PITCHER_DIM_COUNT, capacity=max(256, len(initial_pitchers or ())))
+        self._batters = {}
+        self._pitchers = {}
+        for pid, dual in (initial_batters or {}).items():
+            view = self.get_or_create_batter(pid)
+            _copy_into_row(view.season, dual.season, "pa_count")
+            _copy_into_row(view.career, dual.career, "pa_count")
+        for pid, dual in (initial_pitchers or {}).items():
+            view = self.get_or_create_pitcher(pid)
+            _copy_into_row(view.season, dual.season, "bfp_count")
+            _copy_into_row(view.career, dual.career, "bfp_count")
+            view.season.role = dual.season.role
+            view.career.role = dual.career.role
 
     def get_or_create_batter(self, player_id: int) -> DualBatterState:
         if player_id not in self._batters:
-            self._batters[player_id] = DualBatterState(player_id=player_id)
+            if self.batter_matrix is None:
+                self._batters[player_id] = DualBatterState(player_id=player_id)
+            else:
+                row = self.batter_matrix.add(player_id)
+                self._batters[player_id] = DualBatterState(
+                    player_id=player_id,
+                    season=BatterRowView(self.batter_matrix, row, "season"),
+                    career=BatterRowView(self.batter_matrix, row, "career"),
+                )
         return self._batters[player_id]
 
     def get_or_create_pitcher(self, player_id: int) -> DualPitcherState:
         if player_id not in self._pitchers:
-            self._pitchers[player_id] = DualPitcherState(player_id=player_id)
+            if self.pitcher_matrix is None:
+                self._pitchers[player_id] = DualPitcherState(player_id=player_id)
+            else:
+                row = self.pitcher_matrix.add(player_id)
+                self._pitchers[player_id] = DualPitcherState(
+                    player_id=player_id,
+                    season=PitcherRowView(self.pitcher_matrix, row, "season"),
+                    career=PitcherRowView(self.pitcher_matrix, row, "career"),
+                )
         return self._pitchers[player_id]
 
     def reset_season(self, new_season: int) -> None:
-        for b in self._batters.values():
-            b.reset_season()
-        for p in self._pitchers.values():
-            p.reset_season()
+        if self.storage == "matrix":
+            self.batter_matrix.reset_season()
+            self.pitcher_matrix.reset_season()
+        else:
+            for b in self._batters.values():
+                b.reset_season()
+            for p in self._pitchers.values():
+                p.reset_season()
         self._current_season = new_season
 
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """All states → compact arrays (state snapshot; see state_snapshot)."""
+        if self.storage == "matrix":
+            return self._matrix_to_arrays()
+        arrays: dict[str, np.ndarray] = {}
+        for prefix, states, pa_attr in (("batter", self._batters, "pa_count"),
+                                        ("pitcher", self._pitchers, "bfp_count")):
+            duals = list(states.values())
+            arrays[f"{prefix}_id"] = np.array(list(states), dtype=np.int64)
+            for scope in ("season", "career"):
+                dims = BATTER_DIM_COUNT if prefix == "batter" else PITCHER_DIM_COUNT
+                arrays[f"{prefix}_{scope}_elo"] = np.array(
+                    [getattr(d, scope).elo_dimensions for d in duals], dtype=np.float64).reshape(-1, dims)
+                arrays[f"{prefix}_{scope}_counts"] = np.array(
+                    [getattr(d, scope).event_counts for d in duals], dtype=np.float64).reshape(-1, dims)
+                arrays[f"{prefix}_{scope}_pa"] = np.array(
+                    [getattr(getattr(d, scope), pa_attr) for d in duals], dtype=np.int64)
+        arrays["pitcher_role"] = np.array([d.season.role for d in self._pitchers.values()], dtype=str)
+        return arrays
+
+    def _matrix_to_arrays(self) -> dict[str, np.ndarray]:
+        """matrix mode: active rows are copied out directly (rows are in player insertion order)."""
+        arrays: dict[str, np.ndarray] = {}
+        for prefix, store in (("batter", self.batter_matrix), ("pitcher", self.pitcher_matrix)):
+            n = len(store)
+            arrays[f"{prefix}_id"] = store.index.ids[:n].astype(np.int64)
+            for scope in SCOPES:
+                arrays[f"{prefix}_{scope}_elo"] = store.elo(scope).copy()
+                arrays[f"{prefix}_{scope}_counts"] = store.counts(scope).copy()
+                arrays[f"{prefix}_{scope}_pa"] = getattr(store, f"{scope}_pa")[:n].copy()
+        arrays["pitcher_role"] = np.array([d.season.role for d in self._pitchers.values()], dtype=str)
+        return arrays
+
+    def _hydrate_matrix(self, prefix: str, arrays: dict[str, np.ndarray]) -> None:
+        """matrix mode: arrays are written into the matrices in one slice assignment per field."""
+        store = self.batter_matrix if prefix == "batter" else self.pitcher_matrix
+        ids = arrays[f"{prefix}_id"]
+        rows = store.add_many(ids)
+        for scope in SCOPES:
+            getattr(store, f"{scope}_elo")[rows] = arrays[f"{prefix}_{scope}_elo"]
+            getattr(store, f"{scope}_counts")[rows] = arrays[f"{prefix}_{scope}_counts"]
+            getattr(store, f"{scope}_pa")[rows] = arrays[f"{prefix}_{scope}_pa"]
+        if prefix == "batter":
+            for pid in ids.tolist():
+                self.get_or_create_batter(pid)
+            return
+        for pid, role in zip(ids.tolist(), arrays["pitcher_role"].tolist()):
+            dual = self.get_or_create_pitcher(pid)
+            dual.season.role = dual.career.role = role
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray], storage: str = "dict") -> "TalentStateManager":
+        """Inverse of to_arrays()."""
+        if storage == "matrix":
+            mgr = cls(storage=storage)
+            mgr._hydrate_matrix("batter", arrays)
+            mgr._hydrate_matrix("pitcher", arrays)
+            return mgr
+        batters: dict[int, DualBatterState] = {}
+        for i, pid in enumerate(arrays["batter_id"].tolist()):
+            dual = DualBatterState(player_id=pid)
+            for scope in ("season", "career"):
+                state = getattr(dual, scope)
+                state.elo_dimensions = arrays[f"batter_{scope}_elo"][i].copy()
+                state.event_counts = arrays[f"batter_{scope}_counts"][i].copy()
+                state.pa_count = int(arrays[f"batter_{scope}_pa"][i])
+            batters[pid] = dual
+        pitchers: dict[int, DualPitcherState] = {}
+        for i, pid in enumerate(arrays["pitcher_id"].tolist()):
+            dual = DualPitcherState(player_id=pid)
+            for scope in ("season", "career"):
+                state = getattr(dual, scope)
+                state.elo_dimensions = arrays[f"pitcher_{scope}_elo"][i].copy()
+                state.event_counts = arrays[f"pitcher_{scope}_counts"][i].copy()
+                state.bfp_count = int(arrays[f"pitcher_{scope}_pa"][i])
+                state.role = str(arrays["pitcher_role"][i])
+            pitchers[pid] = dual
+        return cls(initial_batters=batters, initial_pitchers=pitchers, storage=storage)
+
     @property
     def all_batters(self) -> dict[int, DualBatterState]:
         return self._batters
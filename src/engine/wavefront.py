@@ -0,0 +1,108 @@
+"""Wavefront Scheduler — game_date별 PA를 선수 충돌 없는 wave로 분할.
+
+하루 ~15경기의 PA는 대부분 서로 다른 타자/투수를 다루고, 순서가 중요한 것은
+같은 선수를 공유하는 PA뿐. 각 PA를 그 선수들의 직전 PA 바로 다음 wave에 배치:
+
+    wave[i] = max(last_wave[player] for player in PA i) + 1   (날짜마다 0부터)
+
+같은 wave의 PA는 선수를 공유하지 않고, 선수별 PA 순서는 wave 순서로 보존됨.
+따라서 wave 단위 scatter update(arr[idx] = f(arr[idx]))는 순차 처리와 결과가 동일.
+
+Usage:
+    schedule = build_wavefront(runs, batter_ids, pitcher_ids)
+    for wave in schedule.waves():
+        ...  # wave: PA 위치 배열 (원래 순서 유지)
+    stats = wavefront_day_stats(schedule, dates)
+"""
+
+from typing import Iterator, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from src.engine.player_index import PlayerIndex
+
+
+class WaveSchedule(NamedTuple):
+    """PA 위치를 (run, wave, 원래 위치) 순으로 정렬한 실행 계획."""
+    runs: np.ndarray    # PA별 날짜 run ID
+    wave: np.ndarray    # PA별 날짜 내 wave 번호
+    order: np.ndarray   # wave 순으로 정렬된 PA 위치
+    bounds: np.ndarray  # order 내 wave 경계 (len = wave 수 + 1)
+
+    @property
+    def n_waves(self) -> int:
+        return len(self.bounds) - 1
+
+    def waves(self) -> Iterator[np.ndarray]:
+        """wave별 PA 위치 배열 (wave 내부는 원래 순서)."""
+        order, bounds = self.order, self.bounds
+        for k in range(len(bounds) - 1):
+            yield order[bounds[k]:bounds[k + 1]]
+
+
+def wavefront_levels(runs: np.ndarray, *player_ids) -> np.ndarray:
+    """PA별 wave 번호 (같은 run 안에서 선수별 직전 wave + 1, run마다 0부터).
+
+    player_ids: PA별 선수 ID 배열들 (batter_ids, pitcher_ids, ...).
+    """
+    n = len(runs)
+    index = PlayerIndex()
+    cols = [index.intern_many(ids).tolist() for ids in player_ids]
+    last_wave = [-1] * len(index)
+    last_run = [-1] * len(index)
+    wave = [0] * n
+    for i, run in enumerate(runs.tolist()):
+        level = 0
+        for col in cols:
+            j = col[i]
+            if last_run[j] == run and last_wave[j] >= level:
+                level = last_wave[j] + 1
+        for col in cols:
+            j = col[i]
+            last_wave[j] = level
+            last_run[j] = run
+        wave[i] = level
+    return np.array(wave, dtype=np.int64)
+
+
+def build_wavefront(runs: np.ndarray, *player_ids) -> WaveSchedule:
+    """날짜 run + 선수 ID 배열 → WaveSchedule."""
+    runs = np.asarray(runs, dtype=np.int64)
+    wave = wavefront_levels(runs, *player_ids)
+    order = np.lexsort((wave, runs))  # stable: wave 내부는 원래 위치 순
+    if len(order) == 0:
+        return WaveSchedule(runs, wave, order, np.zeros(1, dtype=np.int64))
+    sorted_runs, sorted_wave = runs[order], wave[order]
+    starts = np.flatnonzero(np.r_[True, (sorted_runs[1:] != sorted_runs[:-1])
+                                  | (sorted_wave[1:] != sorted_wave[:-1])])
+    return WaveSchedule(runs, wave, order, np.r_[starts, len(order)].astype(np.int64))
+
+
+def wavefront_day_stats(schedule: WaveSchedule, dates: np.ndarray) -> list[dict]:
+    """날짜별 병렬도 지표.
+
+    Returns:
+        [{'game_date', 'pa', 'waves', 'max_width', 'parallelism'}, ...]
+        parallelism = pa / waves (wave당 평균 동시 처리 PA 수)
+    """
+    if len(schedule.runs) == 0:
+        return []
+    frame = pd.DataFrame({'run': schedule.runs, 'wave': schedule.wave})
+    widths = frame.groupby(['run', 'wave'], sort=True).size()
+    per_day = widths.groupby(level='run').agg(['sum', 'size', 'max'])
+    run_starts = np.flatnonzero(np.r_[True, schedule.runs[1:] != schedule.runs[:-1]])
+    run_dates = dates[run_starts]
+    return [
+        {
+            'game_date': run_dates[run],
+            'pa': pa,
+            'waves': waves,
+            'max_width': width,
+            'parallelism': pa / waves,
+        }
+        for run, pa, waves, width in zip(
+            per_day.index.tolist(), per_day['sum'].tolist(),
+            per_day['size'].tolist(), per_day['max'].tolist(),
+        )
+    ]
@@ -0,0 +1,122 @@
+"""Chunked Parallel Statcast Backfill — 시즌 단위 수집 → 날짜별 Parquet 캐시.
+
+fetch_statcast_range는 구간 전체를 statcast() 한 번으로 받아 90+ 컬럼 원본을
+메모리에 올린 뒤 필터링. backfill_statcast는 구간을 chunk_days(기본 7일) 단위로
+나누어 bounded worker pool에서 수집하고, 각 chunk가 도착하는 즉시
+컬럼 projection + Regular Season 필터 후 StatcastCache에 기록하고 버림.
+
+    peak memory ≈ workers × chunk 1개 (원본)
+    wall time   ≈ chunk 수 / workers × chunk당 fetch 시간
+
+fetch_fn(start_dt: str, end_dt: str) -> DataFrame 으로 수집 함수를 주입 가능
+(기본 pybaseball.statcast, 테스트는 로컬 stand-in).
+
+Usage:
+    result = backfill_statcast(date(2024, 3, 20), date(2025, 9, 30), workers=4)
+    result['days']     # {'2024-03-20': 4213, ...}
+    result['failed']   # [(chunk_start, chunk_end, error), ...]
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Callable, Optional
+
+import pandas as pd
+
+from src.etl.statcast_cache import StatcastCache, project_statcast_columns
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_CHUNK_DAYS = 7
+BACKFILL_WORKERS = 4
+
+FetchFn = Callable[[str, str], Optional[pd.DataFrame]]
+
+
+def _pybaseball_fetch(start_dt: str, end_dt: str) -> Optional[pd.DataFrame]:
+    from pybaseball import statcast
+    return statcast(start_dt=start_dt, end_dt=end_dt)
+
+
+def date_chunks(start_date: date, end_date: date, chunk_days: int = BACKFILL_CHUNK_DAYS) -> list[tuple[date, date]]:
+    """[start_date, end_date]를 chunk_days일 구간으로 분할 (마지막 구간은 짧을 수 있음)."""
+    if chunk_days < 1:
+        raise ValueError(f"chunk_days must be >= 1, got {chunk_days}")
+    chunks = []
+    current = start_date
+    while current <= end_date:
+        chunk_end = min(current + timedelta(days=chunk_days - 1), end_date)
+        chunks.append((current, chunk_end))
+        current = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def _fetch_chunk(fetch_fn: FetchFn, cache: StatcastCache, chunk_start: date, chunk_end: date,
+                 complete: bool) -> dict[str, int]:
+    """chunk 1개 수집 → projection + 'R' 필터 → 캐시 기록 → 날짜별 row 수."""
+    raw = fetch_fn(chunk_start.isoformat(), chunk_end.isoformat())
+    if raw is None:
+        raw = pd.DataFrame()
+    df = project_statcast_columns(raw)
+    del raw
+    if 'game_type' in df.columns:
+        df = df[df['game_type'] == 'R']
+    return cache.write_frame(df, chunk_start, chunk_end, complete=complete)
+
+
+def backfill_statcast(start_date: date, end_date: date,
+                      cache: Optional[StatcastCache] = None,
+                      workers: int = BACKFILL_WORKERS,
+                      chunk_days: int = BACKFILL_CHUNK_DAYS,
+                      fetch_fn: Optional[FetchFn] = None,
+                      refresh: bool = False) -> dict:
+    """구간 Statcast를 chunk 단위 병렬 수집해 캐시에 기록.
+
+    Args:
+        start_date, end_date: 수집 범위 (inclusive)
+        cache: 기록할 StatcastCache (None이면 기본 경로)
+        workers: 동시 fetch 수 (메모리 상한 = workers × chunk)
+        chunk_days: chunk 길이 (일)
+        fetch_fn: (start_dt, end_dt) → DataFrame (None이면 pybaseball.statcast)
+        refresh: False면 이미 캐시된 날짜만으로 된 chunk는 건너뜀
+
+    Returns:
+        {'days': {날짜: row 수}, 'chunks': 수집 chunk 수, 'skipped': 건너뛴 chunk 수,
+         'failed': [(chunk_start, chunk_end, error), ...]}
+    """
+    cache = cache or StatcastCache()
+    fetch_fn = fetch_fn or _pybaseball_fetch
+    # 이틀 이상 지난 구간은 공개 완료로 보고 빈 날짜도 기록 (경기 없는 날)
+    published_until = date.today() - timedelta(days=2)
+
+    chunks = date_chunks(start_date, end_date, chunk_days)
+    pending = chunks if refresh else [c for c in chunks if cache.missing(*c)]
+    logger.info(f"Backfill {start_date} ~ {end_date}: {len(pending)} / {len(chunks)} chunks "
+                f"({chunk_days}d) on {workers} workers")
+
+    days: dict[str, int] = {}
+    failed: list[tuple[date, date, str]] = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(_fetch_chunk, fetch_fn, cache, s, e, e <= published_until): (s, e)
+            for s, e in pending
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            chunk_start, chunk_end = futures[future]
+            try:
+                written = future.result()
+            except Exception as e:
+                logger.warning(f"  Chunk {chunk_start} ~ {chunk_end} failed: {e}")
+                failed.append((chunk_start, chunk_end, str(e)))
+                continue
+            days.update(written)
+            logger.info(f"  [{done}/{len(pending)}] {chunk_start} ~ {chunk_end}: "
+                        f"{sum(written.values()):,} pitches")
+
+    return {
+        'days': dict(sorted(days.items())),
+        'chunks': len(pending),
+        'skipped': len(chunks) - len(pending),
+        'failed': sorted(failed),
+    }
@@ -0,0 +1,248 @@
+"""Concurrent Adaptive-Batch Uploader — bounded thread pool + retry + 배치 크기 자동 조정.
+
+upload_table의 순차 1,000행 upsert는 대부분의 시간을 round trip 대기에 씀.
+BatchUploader는 workers개 스레드가 동시에 upsert하고, 각 배치의 응답 시간과
+JSON payload 크기로 다음 배치 크기를 조정:
+
+    next = size × clamp(target_latency / latency, ½, 2)     (min_batch ~ max_batch)
+    next ≤ max_payload_bytes / (payload bytes per row)
+    실패 → 배치 크기 ½ 후 backoff × 2^attempt 대기하고 재시도 (max_retries회)
+
+순서 보장:
+    충돌 키 = on_conflict, 없으면 key 인자, 없으면 TABLE_PRIMARY_KEYS의 테이블 PK
+    (PK upsert도 같은 키가 두 번 오면 나중 레코드가 이겨야 함).
+    충돌 키가 레코드 간 중복되지 않으면 배치 간 순서 무관 → 공유 cursor에서
+    모든 worker가 자유롭게 배치를 가져감.
+    중복 키가 있으면 (나중 레코드가 이겨야 함) 키 hash로 worker별 lane에 분배하고
+    lane 안에서는 원래 순서대로 순차 upsert. 한 배치에 같은 키가 두 번 들어가지
+    않도록 중복 키 앞에서 배치를 자름 (ON CONFLICT DO UPDATE 같은 행 2회 갱신 방지).
+
+payload 크기는 업로드마다 한 번 표본(PAYLOAD_SAMPLE_ROWS행)을 직렬화해 row당 bytes로
+추정 (성공한 배치를 매번 다시 직렬화하지 않음).
+
+client는 client.table(name).upsert(records[, on_conflict=...]).execute() 인터페이스만
+사용하므로 테스트는 지연을 주입한 로컬 fake client로 대체 가능.
+
+Usage:
+    uploader = BatchUploader(client, workers=4)
+    n = uploader.upload('daily_ohlc', records, on_conflict='player_id,game_date,elo_type,role')
+    uploader.stats   # {'batches', 'retries', 'batch_size', ...}
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from src.etl.record_serializer import dumps
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_WORKERS = 4
+MIN_BATCH_SIZE = 100
+MAX_BATCH_SIZE = 5000
+TARGET_LATENCY = 1.0        # seconds per upsert round trip
+MAX_PAYLOAD_BYTES = 2_000_000
+MAX_RETRIES = 3
+BACKOFF_SECONDS = 0.5
+PAYLOAD_SAMPLE_ROWS = 256
+
+# on_conflict 없이 upsert하는 테이블의 PK (scripts/migrations). SERIAL id + UNIQUE 제약 테이블은
+# 호출자가 on_conflict를 넘김.
+TABLE_PRIMARY_KEYS = {
+    'players': 'player_id',
+    'plate_appearances': 'pa_id',
+    'player_elo': 'player_id',
+    'elo_pa_detail': 'pa_id',
+    'talent_player_current': 'player_id,talent_type,player_role',
+}
+
+
+class BatchSizer:
+    """응답 시간 / payload 크기 기반 배치 크기 조정 (thread-safe)."""
+
+    def __init__(self, initial: int, min_size: int = MIN_BATCH_SIZE, max_size: int = MAX_BATCH_SIZE,
+                 target_latency: float = TARGET_LATENCY, max_payload_bytes: int = MAX_PAYLOAD_BYTES):
+        self.min_size = max(1, min(min_size, initial))
+        self.max_size = max(max_size, initial)
+        self.target_latency = target_latency
+        self.max_payload_bytes = max_payload_bytes
+        self._size = int(initial)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def observe(self, rows: int, latency: float, payload_bytes: int) -> int:
+        """성공한 배치 1개 반영 → 새 배치 크기."""
+        ratio = min(2.0, max(0.5, self.target_latency / max(latency, 1e-3)))
+        proposed = rows * ratio
+        if payload_bytes > 0:
+            proposed = min(proposed, self.max_payload_bytes * rows / payload_bytes)
+        with self._lock:
+            self._size = int(min(self.max_size, max(self.min_size, proposed)))
+            return self._size
+
+    def shrink(self) -> int:
+        """실패한 배치 반영 (½)."""
+        with self._lock:
+            self._size = max(self.min_size, self._size // 2)
+            return self._size
+
+
+class _Lane:
+    """순차 소비되는 레코드 구간 (take는 lock 아래에서 다음 배치를 잘라냄)."""
+
+    def __init__(self, records: list[dict], keys: Optional[list[tuple]] = None):
+        self.records = records
+        self.keys = keys
+        self.cursor = 0
+        self.lock = threading.Lock()
+
+    def take(self, size: int) -> list[dict]:
+        with self.lock:
+            start = self.cursor
+            stop = min(start + size, len(self.records))
+            if self.keys is not None:
+                seen = set()
+                for i in range(start, stop):
+                    if self.keys[i] in seen:
+                        stop = i
+                        break
+                    seen.add(self.keys[i])
+            self.cursor = stop
+            return self.records[start:stop]
+
+
+def conflict_keys(records: list[dict], on_conflict: str) -> list[tuple]:
+    """on_conflict 컬럼 값 tuple (레코드 순)."""
+    columns = [c.strip() for c in on_conflict.split(',')]
+    return [tuple(r.get(c) for c in columns) for r in records]
+
+
+def estimate_row_bytes(records: list[dict], sample_rows: int = PAYLOAD_SAMPLE_ROWS) -> float:
+    """JSON payload row당 bytes 추정 (고르게 뽑은 최대 sample_rows행 직렬화 1회)."""
+    if not records:
+        return 0.0
+    step = max(1, len(records) // sample_rows)
+    sample = records[::step][:sample_rows]
+    return len(dumps(sample)) / len(sample)
+
+
+class BatchUploader:
+    """Supabase 테이블 concurrent upsert (bounded pool, 배치별 retry, adaptive batch)."""
+
+    def __init__(self, client, workers: int = UPLOAD_WORKERS, batch_size: int = 1000,
+                 min_batch_size: int = MIN_BATCH_SIZE, max_batch_size: int = MAX_BATCH_SIZE,
+                 target_latency: float = TARGET_LATENCY, max_payload_bytes: int = MAX_PAYLOAD_BYTES,
+                 max_retries: int = MAX_RETRIES, backoff: float = BACKOFF_SECONDS,
+                 adaptive: bool = True, sleep: Callable[[float], None] = time.sleep):
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self.client = client
+        self.workers = workers
+        self.batch_size = batch_size
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.target_latency = target_latency
+        self.max_payload_bytes = max_payload_bytes
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.adaptive = adaptive
+        self.sleep = sleep
+        self.stats: dict = {}
+        self._stats_lock = threading.Lock()
+
+    def upload(self, table_name: str, records: list[dict], on_conflict: Optional[str] = None,
+               key: Optional[str] = None) -> int:
+        """records upsert → 업로드된 행 수 (배치가 재시도 후에도 실패하면 예외 전파).
+
+        key: on_conflict 없이 PK로 upsert할 때 중복 판정 컬럼 ('a,b', 기본 TABLE_PRIMARY_KEYS)
+        """
+        total = len(records)
+        sizer = BatchSizer(self.batch_size, self.min_batch_size, self.max_batch_size,
+                           self.target_latency, self.max_payload_bytes)
+        conflict = on_conflict or key or TABLE_PRIMARY_KEYS.get(table_name)
+        lanes, ordered = self._plan_lanes(records, conflict)
+        row_bytes = estimate_row_bytes(records) if self.adaptive else 0.0
+        self.stats = {'rows': 0, 'batches': 0, 'retries': 0, 'ordered': ordered,
+                      'workers': self.workers, 'batch_size': sizer.size, 'seconds': 0.0}
+        if not total:
+            return 0
+
+        progress = {'uploaded': 0, 'logged': 0}
+        failed = threading.Event()
+        started = time.perf_counter()
+
+        def run_lane(lane: _Lane):
+            while not failed.is_set():
+                batch = lane.take(sizer.size if self.adaptive else self.batch_size)
+                if not batch:
+                    return
+                try:
+                    self._send(table_name, batch, on_conflict, sizer, row_bytes)
+                except Exception:
+                    failed.set()
+                    raise
+                with self._stats_lock:
+                    progress['uploaded'] += len(batch)
+                    self.stats['batches'] += 1
+                    uploaded = progress['uploaded']
+                    if uploaded - progress['logged'] >= 5000 or uploaded == total:
+                        progress['logged'] = uploaded
+                        logger.info(f"  {table_name}: {uploaded:,} / {total:,}")
+
+        assignments = lanes if ordered else lanes * self.workers
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(run_lane, lane) for lane in assignments]
+        errors = [f.exception() for f in futures if f.exception() is not None]
+
+        self.stats.update(rows=progress['uploaded'], batch_size=sizer.size,
+                          seconds=time.perf_counter() - started)
+        if errors:
+            raise errors[0]
+        return progress['uploaded']
+
+    def _plan_lanes(self, records: list[dict], conflict: Optional[str]) -> tuple[list[_Lane], bool]:
+        """중복 충돌 키가 있으면 키 hash별 순차 lane, 없으면 공유 lane 1개."""
+        if not conflict or not records:
+            return [_Lane(records)], False
+        keys = conflict_keys(records, conflict)
+        if len(set(keys)) == len(keys):
+            return [_Lane(records)], False
+        shards: list[tuple[list, list]] = [([], []) for _ in range(self.workers)]
+        for record, key in zip(records, keys):
+            lane_records, lane_keys = shards[hash(key) % self.workers]
+            lane_records.append(record)
+            lane_keys.append(key)
+        return [_Lane(r, k) for r, k in shards if r], True
+
+    def _send(self, table_name: str, batch: list[dict], on_conflict: Optional[str], sizer: BatchSizer,
+              row_bytes: float = 0.0):
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            try:
+                table = self.client.table(table_name)
+                q = table.upsert(batch, on_conflict=on_conflict) if on_conflict else table.upsert(batch)
+                q.execute()
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error(f"  {table_name}: batch of {len(batch):,} failed after "
+                                 f"{attempt + 1} attempts: {e}")
+                    raise
+                delay = self.backoff * (2 ** attempt) * (1 + random.random() * 0.25)
+                logger.warning(f"  {table_name}: batch of {len(batch):,} failed ({e}); "
+                               f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+                with self._stats_lock:
+                    self.stats['retries'] += 1
+                sizer.shrink()
+                self.sleep(delay)
+                continue
+            if self.adaptive:
+                sizer.observe(len(batch), time.perf_counter() - started, int(len(batch) * row_bytes))
+            return
@@ -2,6 +2,9 @@
 
 import logging
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 VALID_RESULT_TYPES = {
@@ -44,3 +47,22 @@ def map_event(event: str) -> str:
         logger.warning(f"Unknown Statcast event: '{event}' → defaulting to 'OUT'")
         return 'OUT'
     return result
+
+
+# Categorical lookup: EVENT_MAP 키 순서 = event code, 마지막 칸 = 미등록 event (→ 'OUT')
+RESULT_TYPES = list(dict.fromkeys(EVENT_MAP.values()))
+_EVENT_INDEX = pd.Index(list(EVENT_MAP))
+_EVENT_RESULT_CODES = np.array(
+    [RESULT_TYPES.index(EVENT_MAP[e]) for e in _EVENT_INDEX] + [RESULT_TYPES.index('OUT')],
+    dtype=np.int8,
+)
+
+
+def map_events(events: pd.Series) -> pd.Categorical:
+    """events 컬럼 → result_type Categorical (map_event와 같은 결과, 미등록 event는 종류별 1회 경고)."""
+    codes = _EVENT_INDEX.get_indexer(np.asarray(events, dtype=object))
+    unknown = codes < 0
+    if unknown.any():
+        for event, count in pd.Series(np.asarray(events, dtype=object)[unknown]).value_counts(dropna=False).items():
+            logger.warning(f"Unknown Statcast event: '{event}' × {count} → defaulting to 'OUT'")
+    return pd.Categorical.from_codes(_EVENT_RESULT_CODES[codes], categories=RESULT_TYPES)
@@ -1,15 +1,20 @@
 """pybaseball Statcast wrapper for daily ELO pipeline.
 
 Regular Season (game_type == 'R') 데이터만 수집.
+Cache-first: game_date별 로컬 Parquet 캐시(see statcast_cache)에 있는 날짜는
+네트워크 없이 읽고, 없는 날짜만 가져와 저장. refresh=True면 항상 재수집.
 """
 
 import logging
 import time
 from datetime import date, timedelta
+from typing import Optional
 
 import pandas as pd
 from pybaseball import statcast
 
+from src.etl.statcast_cache import StatcastCache, date_range
+
 logger = logging.getLogger(__name__)
 
 FETCH_MAX_RETRIES = 3
@@ -44,15 +49,32 @@ def _fetch_with_retry(date_str: str, max_retries: int = FETCH_MAX_RETRIES) -> pd
     return pd.DataFrame()
 
 
-def fetch_statcast_date(target_date: date) -> pd.DataFrame:
-    """특정 날짜의 Statcast 데이터를 가져와 Regular Season만 필터링.
+def fetch_statcast_date(target_date: date, refresh: bool = False,
+                        cache: Optional[StatcastCache] = None) -> pd.DataFrame:
+    """특정 날짜의 Statcast 데이터를 가져와 Regular Season만 필터링 (cache-first).
 
     Args:
         target_date: 수집할 날짜
+        refresh: True면 캐시를 무시하고 재수집 (결과로 캐시 덮어씀)
+        cache: Statcast 캐시 (None이면 StatcastCache() 기본 경로)
 
     Returns:
         Regular Season 투구 데이터 DataFrame. 데이터 없으면 empty DataFrame.
     """
+    cache = cache or StatcastCache()
+    if not refresh and cache.has(target_date):
+        df = cache.read(target_date)
+        logger.info(f"Statcast cache hit for {target_date.isoformat()}: {len(df):,} pitches")
+        return df
+
+    df = _fetch_statcast_date_remote(target_date)
+    if not df.empty:
+        cache.write(target_date, df)
+    return df
+
+
+def _fetch_statcast_date_remote(target_date: date) -> pd.DataFrame:
+    """pybaseball 하루 수집 + Regular Season 필터."""
     date_str = target_date.strftime('%Y-%m-%d')
     logger.info(f"Fetching Statcast data for {date_str}...")
 
@@ -79,16 +101,42 @@ def fetch_statcast_date(target_date: date) -> pd.DataFrame:
     return df.reset_index(drop=True)
 
 
-def fetch_statcast_range(start_date: date, end_date: date) -> pd.DataFrame:
-    """날짜 범위의 Statcast 데이터를 가져와 Regular Season만 필터링.
+def fetch_statcast_range(start_date: date, end_date: date, refresh: bool = False,
+                         cache: Optional[StatcastCache] = None) -> pd.DataFrame:
+    """날짜 범위의 Statcast 데이터를 가져와 Regular Season만 필터링 (cache-first).
+
+    캐시에 없는 날짜를 포함하는 최소 구간만 한 번에 수집하고 game_date별로 저장.
 
     Args:
         start_date: 시작 날짜 (inclusive)
         end_date: 종료 날짜 (inclusive)
+        refresh: True면 범위 전체 재수집
+        cache: Statcast 캐시 (None이면 StatcastCache() 기본 경로)
 
     Returns:
         Regular Season 투구 데이터 DataFrame. 데이터 없으면 empty DataFrame.
     """
+    cache = cache or StatcastCache()
+    missing = date_range(start_date, end_date) if refresh else cache.missing(start_date, end_date)
+    if not missing:
+        df = cache.read_range(start_date, end_date)
+        logger.info(f"Statcast cache hit for {start_date.isoformat()} ~ {end_date.isoformat()}: {len(df):,} pitches")
+        return df
+
+    first, last = missing[0], missing[-1]
+    fetched = _fetch_statcast_range_remote(first, last)
+    cache.write_frame(fetched, first, last)
+    frames = [
+        cache.read_range(start_date, first - timedelta(days=1)),
+        fetched,
+        cache.read_range(last + timedelta(days=1), end_date),
+    ]
+    frames = [f for f in frames if not f.empty]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def _fetch_statcast_range_remote(start_date: date, end_date: date) -> pd.DataFrame:
+    """pybaseball 범위 수집 + Regular Season 필터."""
     start_str = start_date.strftime('%Y-%m-%d')
     end_str = end_date.strftime('%Y-%m-%d')
     logger.info(f"Fetching Statcast data for {start_str} ~ {end_str}...")
@@ -0,0 +1,122 @@
+"""Known Player Index — Supabase players에 등록된 player_id의 local 사본.
+
+detect_new_player_ids_batch는 매 실행마다 PA의 모든 선수 ID를 100개씩 players 테이블에
+in_ 조회. 등록된 ID는 거의 바뀌지 않으므로 정렬된 int64 배열 하나를 state cache 옆에
+저장해두고, 여기 없는 ID만 Supabase에 확인 (보통 0건 → network 호출 0회).
+
+    - 등록 / 원격 확인한 ID는 add()로 증분 반영
+    - reconcile_days마다 players.player_id 전체를 다시 읽어 교체 (원격 삭제 / 수동 등록 반영)
+
+파일 구성 (data/cache/known_player_ids.npz, KNOWN_PLAYER_INDEX로 변경 가능):
+    _version        KNOWN_PLAYER_INDEX_VERSION (다르면 빈 index)
+    reconciled_at   마지막 전체 reconcile 시각 (epoch)
+    ids             정렬된 unique int64 player_id
+
+Usage:
+    index = KnownPlayerIndex()
+    if index.needs_reconcile():
+        index.reconcile(client)
+    candidates = index.unknown(pa_ids)     # 여기 없는 ID만 원격 확인
+    ...
+    index.add(registered_ids)
+    index.save()
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Iterable, Union
+
+import numpy as np
+
+from src.etl.table_reader import read_table
+
+logger = logging.getLogger(__name__)
+
+KNOWN_PLAYER_INDEX_VERSION = 1
+DEFAULT_KNOWN_PLAYER_INDEX_PATH = Path(__file__).parent.parent.parent / 'data' / 'cache' / 'known_player_ids.npz'
+RECONCILE_DAYS = 7
+
+
+def _as_ids(ids: Iterable[int]) -> np.ndarray:
+    if isinstance(ids, np.ndarray):
+        arr = ids
+    else:
+        arr = np.fromiter((int(x) for x in ids), dtype=np.int64)
+    return np.unique(arr.astype(np.int64, copy=False))
+
+
+class KnownPlayerIndex:
+    """등록된 player_id 정렬 배열 (npz 파일, 임시 파일 → rename)."""
+
+    def __init__(self, path: Union[Path, str, None] = None, reconcile_days: float = RECONCILE_DAYS):
+        self.path = Path(path) if path else Path(os.environ.get('KNOWN_PLAYER_INDEX',
+                                                                DEFAULT_KNOWN_PLAYER_INDEX_PATH))
+        self.reconcile_days = reconcile_days
+        self.ids = np.empty(0, dtype=np.int64)
+        self.reconciled_at = 0.0
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def load(self) -> None:
+        """파일에서 복원. 없음 / 읽기 실패 / 버전 불일치면 빈 index (다음 조회 때 reconcile)."""
+        if not self.path.exists():
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                if int(data['_version']) != KNOWN_PLAYER_INDEX_VERSION:
+                    logger.info("  Known player index version mismatch; ignoring")
+                    return
+                self.ids = data['ids'].astype(np.int64)
+                self.reconciled_at = float(data['reconciled_at'])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"  Known player index unreadable ({e}); ignoring")
+
+    def save(self) -> Path:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            np.savez(f, _version=np.array(KNOWN_PLAYER_INDEX_VERSION),
+                     reconciled_at=np.array(self.reconciled_at), ids=self.ids)
+        os.replace(tmp, self.path)
+        return self.path
+
+    def contains(self, ids: Iterable[int]) -> np.ndarray:
+        """ids 각각의 등록 여부 (bool 배열, 입력 순서)."""
+        arr = np.asarray(ids if isinstance(ids, np.ndarray) else list(ids), dtype=np.int64)
+        pos = np.searchsorted(self.ids, arr)
+        found = np.zeros(len(arr), dtype=bool)
+        inside = pos < len(self.ids)
+        found[inside] = self.ids[pos[inside]] == arr[inside]
+        return found
+
+    def unknown(self, ids: Iterable[int]) -> set[int]:
+        """index에 없는 ID."""
+        arr = _as_ids(ids)
+        return {int(x) for x in arr[~self.contains(arr)]}
+
+    def add(self, ids: Iterable[int]) -> None:
+        new = _as_ids(ids)
+        if len(new):
+            self.ids = np.union1d(self.ids, new)
+
+    def needs_reconcile(self) -> bool:
+        return len(self.ids) == 0 or time.time() - self.reconciled_at >= self.reconcile_days * 86400
+
+    def reconcile(self, client) -> int:
+        """players.player_id 전체를 읽어 index 교체 후 저장. 반환: 등록 선수 수."""
+        frame = read_table(client, 'players', 'player_id', key='player_id')
+        self.ids = _as_ids(frame['player_id'].to_numpy()) if len(frame) else np.empty(0, dtype=np.int64)
+        self.reconciled_at = time.time()
+        self.save()
+        logger.info(f"  Known player index reconciled: {len(self.ids):,} players")
+        return len(self.ids)
+
+    def invalidate(self) -> None:
+        self.ids = np.empty(0, dtype=np.int64)
+        self.reconciled_at = 0.0
+        if self.path.exists():
+            self.path.unlink()
@@ -0,0 +1,186 @@
+"""Player Maintenance Engine — players 테이블 일괄 정리 작업 (team backfill / team 이름 정규화).
+
+scripts/backfill_player_teams.py, scripts/normalize_team_names.py가 공유하는 엔진.
+예전 스크립트는 선수마다 MLB API 1회 + REST PATCH 1회를 순차로 (0.1초 sleep) 보냈고,
+backfill은 limit=200으로 첫 200명만 처리했음. 여기서는
+
+    - players는 table_reader.read_table로 player_id keyset 페이징 (행 수 제한 없음)
+    - MLB API는 MlbApiClient (/people?personIds= chunk 동시 조회) + TokenBucket 속도 제한
+    - 팀 이름 → 약어는 TeamResolver 한 dict (MLB 팀 ID / 정식 이름 / 약어 + MINOR_LEAGUE_MAP)
+    - 갱신은 BatchUploader로 players에 batch upsert (on_conflict=player_id)
+
+upsert 레코드에는 항상 full_name을 포함 (players.full_name NOT NULL → INSERT 후보 행 검증).
+
+Usage:
+    api = maintenance_api_client()
+    stats = normalize_team_names(client, TeamResolver.from_api(api))
+    stats = backfill_player_teams(client, api)
+"""
+
+import logging
+from typing import Iterable, Optional
+
+import pandas as pd
+
+from src.etl.batch_uploader import UPLOAD_WORKERS, BatchUploader
+from src.etl.player_metadata_cache import PlayerMetadataCache
+from src.etl.player_registry import MLB_API_WORKERS, MlbApiClient
+from src.etl.rate_limiter import TokenBucket
+from src.etl.record_serializer import records_from_columns
+from src.etl.table_reader import read_table
+
+logger = logging.getLogger(__name__)
+
+MLB_API_RATE = 10.0         # MLB Stats API 초당 요청 수 상한 (전체 worker 합계)
+UPSERT_BATCH_SIZE = 500
+
+# Minor league affiliate → MLB parent abbreviation
+MINOR_LEAGUE_MAP = {
+    "Worcester Red Sox": "BOS",
+    "Louisville Bats": "CIN",
+    "Las Vegas Aviators": "ATH",
+    "Indianapolis Indians": "PIT",
+    "Rochester Red Wings": "WSH",
+    "Nashville Sounds": "MIL",
+    "Charlotte Knights": "CWS",
+    "Jacksonville Jumbo Shrimp": "MIA",
+    "Reno Aces": "AZ",
+    "Norfolk Tides": "BAL",
+    "Tacoma Rainiers": "SEA",
+    "St. Paul Saints": "MIN",
+    "Durham Bulls": "TB",
+    "Memphis Redbirds": "STL",
+    "Scranton/Wilkes-Barre RailRiders": "NYY",
+    "Albuquerque Isotopes": "COL",
+    "Sacramento River Cats": "SF",
+    "Sugar Land Space Cowboys": "HOU",
+    "Lehigh Valley IronPigs": "PHI",
+    "Oklahoma City Comets": "LAD",
+    "Columbus Clippers": "CLE",
+    "Omaha Storm Chasers": "KC",
+    "Corpus Christi Hooks": "HOU",
+    "Salt Lake Bees": "LAA",
+    "Toledo Mud Hens": "DET",
+    "FCL Blue Jays": "TOR",
+    "Syracuse Mets": "NYM",
+    "Springfield Cardinals": "STL",
+    "ACL Cubs": "CHC",
+    "Round Rock Express": "TEX",
+    "Iowa Cubs": "CHC",
+    "San Antonio Missions": "SD",
+    "Gwinnett Stripers": "ATL",
+    "Wisconsin Timber Rattlers": "MIL",
+    "ACL Mariners": "SEA",
+    "ACL Angels": "LAA",
+    "ACL Athletics": "ATH",
+    "Hartford Yard Goats": "COL",
+    "Birmingham Barons": "CWS",
+    "Buffalo Bisons": "TOR",
+    "ACL Rangers": "TEX",
+}
+
+
+class TeamResolver:
+    """팀 ID / 정식 이름 / 약어 / MiLB 구단 이름 → MLB 약어 (in-memory dict 하나)."""
+
+    def __init__(self, teams: Iterable[dict] = (), minor_league_map: Optional[dict[str, str]] = None):
+        self.abbreviations: dict = dict(MINOR_LEAGUE_MAP if minor_league_map is None else minor_league_map)
+        for team in teams:
+            abbrev = team.get('abbreviation', '')
+            if not abbrev:
+                continue
+            self.abbreviations[int(team['id'])] = abbrev
+            if team.get('name'):
+                self.abbreviations[team['name']] = abbrev
+            self.abbreviations[abbrev] = abbrev
+
+    @classmethod
+    def from_api(cls, api: MlbApiClient, minor_league_map: Optional[dict[str, str]] = None) -> 'TeamResolver':
+        return cls(api.teams(), minor_league_map)
+
+    def resolve(self, team) -> Optional[str]:
+        """MLB 약어 (모르는 팀 → None)."""
+        return self.abbreviations.get(team)
+
+
+def maintenance_api_client(rate: float = MLB_API_RATE, workers: int = MLB_API_WORKERS,
+                           refresh: bool = True) -> MlbApiClient:
+    """정리 작업용 MlbApiClient (TokenBucket 속도 제한, refresh면 선수 캐시 무시)."""
+    cache = PlayerMetadataCache(player_ttl=0) if refresh else PlayerMetadataCache()
+    return MlbApiClient(workers=workers, cache=cache, rate_limiter=TokenBucket(rate))
+
+
+def upsert_players(client, records: list[dict], workers: int = UPLOAD_WORKERS) -> int:
+    """players batch upsert. 키 구성이 다른 레코드는 따로 보냄 (PostgREST는 첫 레코드 컬럼 기준)."""
+    groups: dict[tuple, list[dict]] = {}
+    for record in records:
+        groups.setdefault(tuple(record), []).append(record)
+    uploader = BatchUploader(client, workers=workers, batch_size=UPSERT_BATCH_SIZE)
+    return sum(uploader.upload('players', group, on_conflict='player_id') for group in groups.values())
+
+
+def plan_team_normalization(players: pd.DataFrame,
+                            resolver: TeamResolver) -> tuple[list[dict], pd.DataFrame]:
+    """(갱신 레코드, 모르는 팀 행). 3자 이하 team은 이미 약어로 보고 건너뜀."""
+    teams = players['team'].astype(str)
+    pending = teams.str.len() > 3
+    resolved = teams[pending].map({name: resolver.resolve(name) for name in teams[pending].unique()})
+    known = resolved.notna()
+    changed = players.loc[resolved.index[known]]
+    records = records_from_columns({
+        'player_id': changed['player_id'],
+        'full_name': changed['full_name'],
+        'team': resolved[known],
+    }, int_columns=['player_id'])
+    return records, players.loc[resolved.index[~known]]
+
+
+def normalize_team_names(client, resolver: TeamResolver, workers: int = UPLOAD_WORKERS) -> dict:
+    """players.team 정식 / MiLB 이름 → MLB 약어 일괄 변환."""
+    players = read_table(client, 'players', 'player_id, full_name, team', key='player_id',
+                         filters=[('neq', 'team', '')])
+    if players.empty:
+        return {'total': 0, 'updated': 0, 'skipped': 0, 'unknown': players}
+    records, unknown = plan_team_normalization(players, resolver)
+    updated = upsert_players(client, records, workers)
+    skipped = len(players) - len(records) - len(unknown)
+    logger.info(f"  Team names: {updated:,} normalized, {skipped:,} already abbreviated, "
+                f"{len(unknown):,} unknown")
+    return {'total': len(players), 'updated': updated, 'skipped': skipped, 'unknown': unknown}
+
+
+def plan_team_backfill(players: pd.DataFrame, fetched: dict[int, dict]) -> tuple[list[dict], list[int]]:
+    """(갱신 레코드, API에도 팀이 없는 player_id). 'Player <id>' fallback 이름도 함께 교체."""
+    records, still_empty = [], []
+    for row in players.itertuples(index=False):
+        pid = int(row.player_id)
+        info = fetched.get(pid)
+        if not info or not info['team']:
+            still_empty.append(pid)
+            continue
+        record = {
+            'player_id': pid,
+            'first_name': row.first_name,
+            'last_name': row.last_name,
+            'full_name': row.full_name,
+            'team': info['team'],
+            'position': info['position'],
+        }
+        if str(row.full_name).startswith('Player ') and info['full_name']:
+            record.update(first_name=info['first_name'], last_name=info['last_name'],
+                          full_name=info['full_name'])
+        records.append(record)
+    return records, still_empty
+
+
+def backfill_player_teams(client, api: MlbApiClient, workers: int = UPLOAD_WORKERS) -> dict:
+    """team이 빈 선수 전체를 MLB API로 조회해 team / position (및 fallback 이름) 일괄 갱신."""
+    players = read_table(client, 'players', 'player_id, first_name, last_name, full_name, position',
+                         key='player_id', filters=[('eq', 'team', '')])
+    if players.empty:
+        return {'total': 0, 'updated': 0, 'still_empty': []}
+    fetched = api.fetch_players(players['player_id'].tolist())
+    records, still_empty = plan_team_backfill(players, fetched)
+    updated = upsert_players(client, records, workers)
+    logger.info(f"  Team backfill: {updated:,} updated, {len(still_empty):,} still empty (FA/retired)")
+    return {'total': len(players), 'updated': updated, 'still_empty': still_empty}
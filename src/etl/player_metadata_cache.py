@@ -0,0 +1,113 @@
+"""Player / Team Metadata Cache — MLB Stats API 응답의 on-disk TTL 캐시.
+
+register_new_players가 MLB Stats API에서 가져온 선수 메타데이터와 team ID →
+약어 매핑을 JSON 파일 하나에 저장해 다음 실행에서 재사용 (프로세스 간 공유).
+TTL이 지난 항목은 없는 것으로 취급하고 다음 조회 때 다시 가져옴.
+
+Layout (data/cache/player_metadata.json, PLAYER_METADATA_CACHE로 변경 가능):
+    {"version": 1,
+     "teams":   {"fetched_at": <epoch>, "map": {"<team_id>": "<abbr>"}},
+     "players": {"<player_id>": {"fetched_at": <epoch>, "record": {...}}}}
+
+Usage:
+    cache = PlayerMetadataCache()
+    team_map = cache.get_teams()               # None이면 만료 / 없음
+    cached = cache.get_players([660271, 1])    # {660271: {...}} (fresh만)
+    cache.put_players({1: record})
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+METADATA_CACHE_VERSION = 1
+DEFAULT_METADATA_CACHE_PATH = Path(__file__).parent.parent.parent / 'data' / 'cache' / 'player_metadata.json'
+TEAM_TTL_SECONDS = 7 * 24 * 3600
+PLAYER_TTL_SECONDS = 7 * 24 * 3600
+
+
+class PlayerMetadataCache:
+    """선수 / 팀 메타데이터 JSON 캐시 (TTL, thread-safe, 임시 파일 → rename)."""
+
+    def __init__(self, path: Union[Path, str, None] = None,
+                 team_ttl: float = TEAM_TTL_SECONDS, player_ttl: float = PLAYER_TTL_SECONDS):
+        self.path = Path(path) if path else Path(os.environ.get('PLAYER_METADATA_CACHE',
+                                                                DEFAULT_METADATA_CACHE_PATH))
+        self.team_ttl = team_ttl
+        self.player_ttl = player_ttl
+        self._lock = threading.Lock()
+        self._data: Optional[dict] = None
+
+    def _load(self) -> dict:
+        if self._data is None:
+            data = {}
+            if self.path.exists():
+                try:
+                    with open(self.path) as f:
+                        data = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"  Player metadata cache unreadable ({e}); ignoring")
+            if data.get('version') != METADATA_CACHE_VERSION:
+                data = {'version': METADATA_CACHE_VERSION, 'teams': {}, 'players': {}}
+            self._data = data
+        return self._data
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(self._data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"  Player metadata cache not saved ({e})")
+
+    def _fresh(self, fetched_at: Optional[float], ttl: float) -> bool:
+        return fetched_at is not None and time.time() - fetched_at < ttl
+
+    def get_teams(self) -> Optional[dict[int, str]]:
+        """team ID → 약어 (만료 / 없음 → None)."""
+        with self._lock:
+            teams = self._load().get('teams', {})
+            if not teams.get('map') or not self._fresh(teams.get('fetched_at'), self.team_ttl):
+                return None
+            return {int(team_id): abbr for team_id, abbr in teams['map'].items()}
+
+    def put_teams(self, team_map: dict[int, str]) -> None:
+        with self._lock:
+            self._load()['teams'] = {'fetched_at': time.time(),
+                                     'map': {str(k): v for k, v in team_map.items()}}
+            self._save()
+
+    def get_players(self, player_ids: Iterable[int]) -> dict[int, dict]:
+        """TTL 내 캐시된 선수 레코드 (없는 / 만료된 ID는 제외)."""
+        with self._lock:
+            players = self._load().get('players', {})
+            found = {}
+            for pid in player_ids:
+                entry = players.get(str(int(pid)))
+                if entry and self._fresh(entry.get('fetched_at'), self.player_ttl):
+                    found[int(pid)] = dict(entry['record'])
+            return found
+
+    def put_players(self, records: dict[int, dict]) -> None:
+        if not records:
+            return
+        now = time.time()
+        with self._lock:
+            players = self._load().setdefault('players', {})
+            for pid, record in records.items():
+                players[str(int(pid))] = {'fetched_at': now, 'record': record}
+            self._save()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._data = None
+            if self.path.exists():
+                self.path.unlink()
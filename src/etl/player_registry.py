@@ -2,41 +2,165 @@
 
 PA 데이터에서 Supabase players 테이블에 없는 선수를 감지하고,
 MLB Stats API로 메타데이터를 가져와 자동 등록.
+
+register_new_players는 MlbApiClient(pooled requests.Session)로
+/people?personIds=... 를 PEOPLE_CHUNK_SIZE명씩 묶어 동시에 조회하고, 결과와 team 매핑을
+PlayerMetadataCache(on-disk TTL 캐시)에 저장해 다음 실행에서 재사용.
+신규 선수 수와 관계없이 보통 round trip 1회 (캐시 hit이면 0회).
+
+detect_new_player_ids_batch는 KnownPlayerIndex(등록 player_id local 사본)를 받으면
+index에 없는 ID만 players 테이블에 확인 → 신규 선수가 없는 날은 Supabase 조회 0회.
 """
 
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.etl.known_player_index import KnownPlayerIndex
+from src.etl.player_metadata_cache import PlayerMetadataCache
+from src.etl.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
 MLB_API_BASE = "https://statsapi.mlb.com/api/v1"
+PEOPLE_CHUNK_SIZE = 50
+MLB_API_WORKERS = 4
 
-# Team ID → abbreviation cache (loaded once per pipeline run)
+# Team ID → abbreviation cache (process memo over PlayerMetadataCache)
 _TEAM_MAP: dict[int, str] = {}
 
 
-def _get_team_map() -> dict[int, str]:
-    """Load MLB team ID → abbreviation mapping (cached)."""
+def _get_team_map(cache: Optional[PlayerMetadataCache] = None) -> dict[int, str]:
+    """Load MLB team ID → abbreviation mapping (process memo → on-disk cache → API)."""
     global _TEAM_MAP
     if not _TEAM_MAP:
+        _TEAM_MAP = MlbApiClient(cache=cache).team_map()
+    return _TEAM_MAP
+
+
+def _player_record(player_id: int, p: dict, team_map: dict[int, str]) -> dict:
+    """MLB API person → players 테이블 레코드."""
+    team_id = p.get('currentTeam', {}).get('id', 0)
+    return {
+        'player_id': player_id,
+        'first_name': p.get('firstName', ''),
+        'last_name': p.get('lastName', ''),
+        'full_name': p.get('fullName', f'Player {player_id}'),
+        'team': team_map.get(team_id, ''),
+        'position': p.get('primaryPosition', {}).get('abbreviation', ''),
+    }
+
+
+def _fallback_record(player_id: int) -> dict:
+    return {
+        'player_id': player_id,
+        'first_name': '',
+        'last_name': '',
+        'full_name': f'Player {player_id}',
+        'team': '',
+        'position': '',
+    }
+
+
+class MlbApiClient:
+    """MLB Stats API client (connection-pooled Session, people 일괄 조회를 bounded 동시 실행)."""
+
+    def __init__(self, base_url: str = MLB_API_BASE, session: Optional[requests.Session] = None,
+                 workers: int = MLB_API_WORKERS, chunk_size: int = PEOPLE_CHUNK_SIZE,
+                 timeout: float = 10, cache: Optional[PlayerMetadataCache] = None,
+                 rate_limiter: Optional[TokenBucket] = None):
+        self.base_url = base_url.rstrip('/')
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self.timeout = timeout
+        self.cache = cache or PlayerMetadataCache()
+        self.rate_limiter = rate_limiter
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+
+    def _get(self, path: str, params: dict) -> dict:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        resp = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    def teams(self) -> list[dict]:
+        """MLB 팀 목록 (/teams?sportId=1 원본, 캐시 없음; 실패 시 예외)."""
+        return self._get('/teams', {'sportId': 1})['teams']
+
+    def team_map(self) -> dict[int, str]:
+        """team ID → 약어 (on-disk 캐시 TTL 내면 요청 없음, 실패 시 빈 dict)."""
+        cached = self.cache.get_teams()
+        if cached:
+            return cached
         try:
-            resp = requests.get(f"{MLB_API_BASE}/teams", params={"sportId": 1}, timeout=10)
-            resp.raise_for_status()
-            _TEAM_MAP = {t["id"]: t.get("abbreviation", "") for t in resp.json()["teams"]}
-            logger.info(f"  Loaded {len(_TEAM_MAP)} MLB team mappings")
-        except Exception as e:
+            teams = {t['id']: t.get('abbreviation', '') for t in self.teams()}
+        except (requests.RequestException, KeyError, ValueError) as e:
             logger.warning(f"  Failed to load team mappings: {e}")
-    return _TEAM_MAP
+            return {}
+        self.cache.put_teams(teams)
+        logger.info(f"  Loaded {len(teams)} MLB team mappings")
+        return teams
+
+    def _people_chunk(self, ids: list[int]) -> list[dict]:
+        try:
+            data = self._get('/people', {'personIds': ','.join(map(str, ids)), 'hydrate': 'currentTeam'})
+            return data.get('people', [])
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"  MLB API failed for {len(ids)} player(s) {ids[:5]}...: {e}")
+            return []
+
+    def fetch_players(self, player_ids: Iterable[int]) -> dict[int, dict]:
+        """player_id → players 레코드 (캐시 우선, 나머지는 chunk 단위 동시 조회; 실패한 ID는 제외).
+
+        team mapping 로드에 실패하면 조회 결과를 반환만 하고 on-disk 캐시에는 저장하지 않음.
+        """
+        ids = sorted({int(pid) for pid in player_ids})
+        found = self.cache.get_players(ids)
+        missing = [pid for pid in ids if pid not in found]
+        if not missing:
+            return found
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            team_future = pool.submit(self.team_map)
+            chunks = [missing[i:i + self.chunk_size] for i in range(0, len(missing), self.chunk_size)]
+            people = [p for chunk in pool.map(self._people_chunk, chunks) for p in chunk]
+            team_map = team_future.result()
 
+        wanted = set(missing)
+        fetched = {
+            int(p['id']): _player_record(int(p['id']), p, team_map)
+            for p in people if 'id' in p and int(p['id']) in wanted
+        }
+        if team_map:
+            self.cache.put_players(fetched)
+        else:
+            # team 없이 캐시하면 빈 team이 PLAYER_TTL_SECONDS 동안 재사용됨 → 다음 호출에서 재조회
+            logger.warning(f"  Team mappings unavailable; not caching {len(fetched)} player(s)")
+        found.update(fetched)
+        return found
 
-def detect_new_player_ids_batch(pa_df, client) -> set[int]:
+
+def detect_new_player_ids_batch(pa_df, client,
+                                known: Optional[KnownPlayerIndex] = None) -> set[int]:
     """PA DataFrame의 batter/pitcher ID를 Supabase players와 비교하여 신규 ID 반환.
 
+    known이 주어지면 reconcile 주기가 지났을 때만 players 전체를 다시 읽고,
+    index에 없는 ID만 Supabase에 확인 (모두 index에 있으면 network 호출 0회).
+    원격에 이미 있던 ID는 index에 추가해 저장.
+
     Args:
         pa_df: plate_appearances DataFrame (batter_id, pitcher_id 컬럼 필요)
         client: Supabase client
+        known: 등록 player_id local index (None이면 매번 전체 ID를 Supabase에 확인)
 
     Returns:
         Supabase에 등록되지 않은 player_id set
@@ -51,6 +175,13 @@ def detect_new_player_ids_batch(pa_df, client) -> set[int]:
     if not pa_ids:
         return set()
 
+    if known is not None:
+        if known.needs_reconcile():
+            known.reconcile(client)
+        pa_ids = known.unknown(pa_ids)
+        if not pa_ids:
+            return set()
+
     # Supabase에서 기존 선수 ID 조회
     existing_ids = set()
     id_list = list(pa_ids)
@@ -66,6 +197,9 @@ def detect_new_player_ids_batch(pa_df, client) -> set[int]:
         existing_ids.update(row['player_id'] for row in response.data)
 
     new_ids = pa_ids - existing_ids
+    if known is not None and existing_ids:
+        known.add(existing_ids)
+        known.save()
     if new_ids:
         logger.info(f"  Detected {len(new_ids)} new player(s): {sorted(new_ids)[:10]}...")
     return new_ids
@@ -89,30 +223,20 @@ def fetch_player_from_mlb_api(player_id: int) -> Optional[dict]:
         if not people:
             logger.warning(f"  MLB API: no data for player {player_id}")
             return None
-
-        p = people[0]
-        team_map = _get_team_map()
-        team_id = p.get('currentTeam', {}).get('id', 0)
-        return {
-            'player_id': player_id,
-            'first_name': p.get('firstName', ''),
-            'last_name': p.get('lastName', ''),
-            'full_name': p.get('fullName', f'Player {player_id}'),
-            'team': team_map.get(team_id, ''),
-            'position': p.get('primaryPosition', {}).get('abbreviation', ''),
-        }
+        return _player_record(player_id, people[0], _get_team_map())
     except (requests.RequestException, KeyError, ValueError) as e:
         logger.warning(f"  MLB API failed for player {player_id}: {e}")
         return None
 
 
-def register_new_players(new_ids: set[int], pa_df, client) -> int:
+def register_new_players(new_ids: set[int], pa_df, client, api: Optional[MlbApiClient] = None) -> int:
     """신규 선수를 MLB API로 조회하여 Supabase players 테이블에 등록.
 
     Args:
         new_ids: 등록할 player ID set
         pa_df: PA DataFrame (fallback 이름 추출용)
         client: Supabase client
+        api: MlbApiClient (None이면 기본 session / 메타데이터 캐시)
 
     Returns:
         등록된 선수 수
@@ -120,22 +244,17 @@ def register_new_players(new_ids: set[int], pa_df, client) -> int:
     if not new_ids:
         return 0
 
+    api = api or MlbApiClient()
+    fetched = api.fetch_players(new_ids)
     records = []
     for pid in sorted(new_ids):
-        info = fetch_player_from_mlb_api(pid)
+        info = fetched.get(int(pid))
         if info:
             records.append(info)
         else:
             # Fallback: 최소 레코드 생성
             logger.info(f"  Fallback registration for player {pid}")
-            records.append({
-                'player_id': pid,
-                'first_name': '',
-                'last_name': '',
-                'full_name': f'Player {pid}',
-                'team': '',
-                'position': '',
-            })
+            records.append(_fallback_record(int(pid)))
 
     if records:
         # Batch upsert
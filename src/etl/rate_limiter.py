@@ -0,0 +1,51 @@
+"""Token-Bucket Rate Limiter — 여러 worker thread가 공유하는 요청 속도 제한.
+
+MLB Stats API처럼 공개 API를 동시에 두드릴 때 worker 수와 무관하게 초당 요청 수를
+rate 이하로 유지. bucket은 최대 burst개 token을 담고 초당 rate개씩 채워지며,
+요청마다 token 1개를 소비 (없으면 다음 token이 찰 때까지 대기).
+
+Usage:
+    limiter = TokenBucket(rate=10, burst=10)   # 초당 10회, 순간 최대 10회
+    limiter.acquire()                          # 필요하면 대기 후 반환
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+_EPSILON = 1e-9     # refill 부동소수 오차(0.999…)로 극히 짧은 sleep을 반복하지 않도록
+
+
+class TokenBucket:
+    """thread-safe token bucket (clock / sleep 주입 가능)."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        self.rate = rate
+        self.burst = max(1, int(burst if burst is not None else rate))
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """token 1개 소비 → 대기한 시간 (초)."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1 - _EPSILON:
+                    self._tokens = max(0.0, self._tokens - 1)
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            self.sleep(delay)
+            waited += delay
@@ -0,0 +1,217 @@
+"""Columnar Record Serializer — 컬럼 단위 NaN→None / int 변환 / 소수 4자리 반올림.
+
+prepare_pa_records, _prepare_pa_detail_records 등은 레코드마다 math.isnan / int() /
+round(x, 4)를 호출하는 Python 루프였음. 여기서는 컬럼(NumPy 배열) 단위로 한 번에
+변환한 뒤 .tolist()로 Python scalar를 만들고, zip으로 dict를 조립.
+
+    round_column    np.rint(x * 10**d) / 10**d (tie 근처 값만 Python round로 재계산
+                    → round(x, d)와 bit 단위 동일)
+    int_column      결측은 None, 나머지는 Python int
+    date_column     datetime64 / date / Timestamp → 'YYYY-MM-DD'
+
+JSON 인코딩은 orjson이 설치되어 있으면 사용 (선택 의존성, 없으면 표준 json).
+supabase-py upsert는 Python 객체를 받으므로 레코드는 native 타입으로 반환하고,
+dumps / encode_json_batches는 배치 payload 크기 측정 / 파일 출력용.
+
+Usage:
+    records = records_from_columns(
+        {'pa_id': ids, 'elo_after': elo_after},
+        int_columns=['pa_id'], round_columns=['elo_after'],
+    )
+    for payload in encode_json_batches(records, batch_size=1000):
+        ...
+"""
+
+import gc
+import json
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+ROUND_DECIMALS = 4
+
+# tie 판정 여유 (scaled 값 ulp 배수): x * 10**d 곱셈 오차(≤ 0.5 ulp)보다 충분히 큼
+_TIE_ULPS = 4
+# 이 이상은 x * 10**d가 이미 정수 → round(x, d) == x
+_EXACT_LIMIT = 2.0 ** 52
+
+
+def _is_missing(values: np.ndarray) -> np.ndarray:
+    return np.asarray(pd.isna(values), dtype=bool)
+
+
+def _with_none(values: list, missing: np.ndarray) -> list:
+    for i in np.flatnonzero(missing).tolist():
+        values[i] = None
+    return values
+
+
+def round_array(values, decimals: int = ROUND_DECIMALS) -> np.ndarray:
+    """float64 배열을 Python round(x, decimals)와 동일하게 반올림 (NaN / inf 유지)."""
+    x = np.asarray(values, dtype=np.float64)
+    scale = 10.0 ** decimals
+    with np.errstate(invalid='ignore', over='ignore'):
+        scaled = x * scale
+        out = np.rint(scaled) / scale
+        frac = np.abs(scaled - np.floor(scaled) - 0.5)
+        ambiguous = (frac <= _TIE_ULPS * np.spacing(np.abs(scaled))) | (np.abs(scaled) >= _EXACT_LIMIT)
+    ambiguous &= np.isfinite(x)
+    if ambiguous.any():
+        idx = np.flatnonzero(ambiguous)
+        out[idx] = [round(v, decimals) for v in x[idx].tolist()]
+    return out
+
+
+def round_column(values, decimals: int = ROUND_DECIMALS) -> list:
+    """float 컬럼 → 반올림된 Python float list (NaN → None)."""
+    x = np.asarray(values, dtype=np.float64)
+    return _with_none(round_array(x, decimals).tolist(), np.isnan(x))
+
+
+def int_column(values) -> list:
+    """정수 컬럼 → Python int list (NaN / None → None)."""
+    arr = np.asarray(values)
+    if arr.dtype.kind in 'iub':
+        return arr.astype(np.int64, copy=False).tolist()
+    missing = _is_missing(arr)
+    if not missing.any():
+        return arr.astype(np.int64).tolist()
+    filled = np.where(missing, 0, arr).astype(np.int64)
+    return _with_none(filled.tolist(), missing)
+
+
+def date_column(values) -> list:
+    """날짜 컬럼 → 'YYYY-MM-DD' list (NaT / None → None, 문자열은 그대로)."""
+    if isinstance(values, pd.Series):
+        values = values.to_numpy()
+    arr = np.asarray(values)
+    if arr.dtype.kind == 'M':
+        missing = np.isnat(arr)
+        out = np.datetime_as_string(arr.astype('datetime64[D]')).tolist()
+        return _with_none(out, missing)
+    out = arr.tolist()
+    missing = _is_missing(arr)
+    return [
+        None if miss else (v.isoformat()[:10] if hasattr(v, 'isoformat') else v)
+        for v, miss in zip(out, missing.tolist())
+    ]
+
+
+def value_column(values) -> list:
+    """그 외 컬럼 → Python scalar list (float NaN / 결측 category → None)."""
+    if isinstance(values, pd.Categorical):
+        values = np.asarray(values, dtype=object)
+    elif isinstance(values, pd.Series):
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(object)
+        values = values.to_numpy()
+    arr = np.asarray(values)
+    if arr.dtype.kind == 'f':
+        return _with_none(arr.tolist(), np.isnan(arr))
+    if arr.dtype.kind == 'O':
+        return _with_none(arr.tolist(), _is_missing(arr))
+    return arr.tolist()
+
+
+@contextmanager
+def _gc_paused():
+    """수백만 개 dict 생성 중 cyclic GC 반복 실행 방지 (dict는 순환 참조 없음)."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def records_from_columns(columns: dict, int_columns: Iterable[str] = (),
+                         round_columns: Iterable[str] = (), date_columns: Iterable[str] = (),
+                         decimals: int = ROUND_DECIMALS) -> list[dict]:
+    """컬럼 dict → 레코드 dict list (키 순서 = columns 순서).
+
+    값이 scalar(str / int / float / None)인 컬럼은 모든 레코드에 같은 값.
+    """
+    int_columns, round_columns, date_columns = set(int_columns), set(round_columns), set(date_columns)
+    n = next((len(v) for v in columns.values() if not _is_scalar(v)), 0)
+    names = list(columns)
+    lists = []
+    for name in names:
+        values = columns[name]
+        if _is_scalar(values):
+            lists.append([values] * n)
+        elif name in round_columns:
+            lists.append(round_column(values, decimals))
+        elif name in int_columns:
+            lists.append(int_column(values))
+        elif name in date_columns:
+            lists.append(date_column(values))
+        else:
+            lists.append(value_column(values))
+    with _gc_paused():
+        return [dict(zip(names, row)) for row in zip(*lists)]
+
+
+def frame_to_records(df: pd.DataFrame, int_columns: Iterable[str] = (),
+                     round_columns: Iterable[str] = (), date_columns: Iterable[str] = (),
+                     decimals: int = ROUND_DECIMALS) -> list[dict]:
+    """DataFrame → 레코드 dict list (to_dict('records') + 값별 후처리 대체).
+
+    datetime64 컬럼은 date_columns에 없어도 'YYYY-MM-DD'로 변환.
+    """
+    date_columns = set(date_columns) | {c for c in df.columns if df[c].dtype.kind == 'M'}
+    return records_from_columns(
+        {c: df[c] for c in df.columns},
+        int_columns=[c for c in int_columns if c in df.columns],
+        round_columns=[c for c in round_columns if c in df.columns],
+        date_columns=date_columns,
+        decimals=decimals,
+    )
+
+
+def _is_scalar(values) -> bool:
+    return values is None or isinstance(values, (str, bytes, int, float, bool))
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj) -> bytes:
+    """JSON bytes (orjson 있으면 orjson, NaN은 null)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    # 표준 json은 NaN을 그대로 쓰므로 orjson과 맞춰 null로 치환
+    return json.dumps(_nan_to_none(obj), default=_json_default, separators=(',', ':'),
+                      allow_nan=False).encode()
+
+
+def _nan_to_none(obj):
+    if isinstance(obj, float):
+        return None if obj != obj or obj in (float('inf'), float('-inf')) else obj
+    if isinstance(obj, dict):
+        return {k: _nan_to_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_none(v) for v in obj]
+    return obj
+
+
+def encode_json_batches(records: list[dict], batch_size: int = 1000,
+                        encoder: Optional[Callable[[list], bytes]] = None) -> Iterator[bytes]:
+    """레코드를 batch_size개씩 JSON 배열 bytes로 인코딩."""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    encode = encoder or dumps
+    for i in range(0, len(records), batch_size):
+        yield encode(records[i:i + batch_size])
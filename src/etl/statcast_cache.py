@@ -0,0 +1,174 @@
+"""Statcast Pitch Cache — game_date별 Parquet partition + manifest.
+
+fetch_statcast_date / fetch_statcast_range는 이 캐시를 먼저 확인하고, 없는 날짜만
+pybaseball(Baseball Savant)에서 가져와 저장. convert_statcast_to_pa에 필요한
+컬럼(STATCAST_CACHE_COLUMNS)만 보관하므로 재처리 / backfill / 로컬 실험은
+네트워크 없이 디스크에서 읽음.
+
+Layout:
+    <root>/game_date=<YYYY-MM-DD>/pitches.parquet
+    <root>/manifest.json    {"version": 1, "days": {"<date>": {"rows", "fetched_at", "columns"}}}
+
+rows == 0인 날짜는 경기가 없었던 날 (같은 fetch에서 이후 날짜 데이터가 있을 때만 기록).
+
+Usage:
+    cache = StatcastCache()                       # STATCAST_CACHE_DIR 또는 data/statcast
+    df = fetch_statcast_date(day, cache=cache)    # cache-first
+    df = fetch_statcast_date(day, refresh=True)   # 강제 재수집 후 덮어씀
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+DEFAULT_STATCAST_CACHE_DIR = Path(__file__).parent.parent.parent / 'data' / 'statcast'
+
+# convert_statcast_to_pa 입력 컬럼 + Regular Season 필터용 game_type
+STATCAST_CACHE_COLUMNS = [
+    'game_pk', 'game_date', 'game_year', 'game_type',
+    'at_bat_number', 'inning', 'inning_topbot', 'outs_when_up',
+    'batter', 'pitcher', 'events',
+    'on_1b', 'on_2b', 'on_3b',
+    'home_team', 'away_team', 'bat_score', 'fld_score',
+    'launch_speed', 'launch_angle', 'estimated_woba_using_speedangle', 'delta_run_exp',
+]
+
+DateLike = Union[date, str]
+
+
+def _as_date(value: DateLike) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(str(value)[:10])
+
+
+def project_statcast_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """STATCAST_CACHE_COLUMNS 중 존재하는 컬럼만 (원래 순서 유지)."""
+    return df[[c for c in STATCAST_CACHE_COLUMNS if c in df.columns]]
+
+
+def date_range(start_date: date, end_date: date) -> list[date]:
+    """start_date ~ end_date (inclusive) 날짜 목록."""
+    return [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+
+
+class StatcastCache:
+    """game_date별 Statcast Parquet 캐시 (thread-safe manifest 갱신)."""
+
+    def __init__(self, root: Union[Path, str, None] = None):
+        self.root = Path(root) if root else Path(os.environ.get('STATCAST_CACHE_DIR', DEFAULT_STATCAST_CACHE_DIR))
+        self._lock = threading.Lock()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / 'manifest.json'
+
+    def path(self, game_date: DateLike) -> Path:
+        return self.root / f"game_date={_as_date(game_date).isoformat()}" / 'pitches.parquet'
+
+    def manifest(self) -> dict[str, dict]:
+        """날짜 → {'rows', 'fetched_at', 'columns'} (manifest 없음 / 버전 불일치 → 빈 dict)."""
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path) as f:
+            data = json.load(f)
+        if data.get('version') != MANIFEST_VERSION:
+            return {}
+        return data.get('days', {})
+
+    def _write_manifest(self, days: dict[str, dict]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({'version': MANIFEST_VERSION, 'days': dict(sorted(days.items()))}, f, indent=1)
+        os.replace(tmp, self.manifest_path)
+
+    def has(self, game_date: DateLike) -> bool:
+        entry = self.manifest().get(_as_date(game_date).isoformat())
+        return entry is not None and (entry['rows'] == 0 or self.path(game_date).exists())
+
+    def missing(self, start_date: date, end_date: date) -> list[date]:
+        """범위 중 캐시에 없는 날짜."""
+        days = self.manifest()
+        return [
+            d for d in date_range(start_date, end_date)
+            if d.isoformat() not in days
+            or (days[d.isoformat()]['rows'] > 0 and not self.path(d).exists())
+        ]
+
+    def read(self, game_date: DateLike) -> pd.DataFrame:
+        """캐시된 하루 투구 (경기 없는 날은 빈 DataFrame)."""
+        path = self.path(game_date)
+        if not path.exists():
+            return pd.DataFrame()
+        return pd.read_parquet(path)
+
+    def read_range(self, start_date: date, end_date: date) -> pd.DataFrame:
+        """범위 내 캐시된 날짜를 날짜 순으로 이어붙임."""
+        frames = [self.read(d) for d in date_range(start_date, end_date) if self.path(d).exists()]
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def write(self, game_date: DateLike, df: pd.DataFrame) -> int:
+        """하루 투구 저장 (컬럼 projection, 임시 파일 → rename) + manifest 갱신 → row 수."""
+        day = _as_date(game_date)
+        path = self.path(day)
+        projected = project_statcast_columns(df).reset_index(drop=True)
+        if len(projected):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix('.tmp')
+            projected.to_parquet(tmp, index=False)
+            os.replace(tmp, path)
+        elif path.exists():
+            path.unlink()
+        entry = {
+            'rows': len(projected),
+            'fetched_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'columns': list(projected.columns),
+        }
+        with self._lock:
+            days = self.manifest()
+            days[day.isoformat()] = entry
+            self._write_manifest(days)
+        return len(projected)
+
+    def write_frame(self, df: pd.DataFrame, start_date: date, end_date: date,
+                    complete: bool = False) -> dict[str, int]:
+        """범위 fetch 결과를 game_date별로 분할 저장 → 날짜별 row 수.
+
+        마지막으로 데이터가 있는 날짜 이전의 빈 날짜는 rows=0으로 기록 (경기 없는 날).
+        complete=True (이미 공개가 끝난 과거 구간)면 범위 내 빈 날짜를 모두 기록.
+        """
+        if 'game_date' not in df.columns:
+            df = df.iloc[0:0].assign(game_date=pd.Series(dtype='datetime64[ns]'))
+        if df.empty and not complete:
+            return {}
+        dates = pd.to_datetime(df['game_date']).dt.date
+        written = {}
+        for day, part in df.groupby(dates.to_numpy(), sort=True):
+            written[day.isoformat()] = self.write(day, part)
+        last = end_date if complete else max(dates)
+        for day in date_range(start_date, min(end_date, last)):
+            if day.isoformat() not in written:
+                written[day.isoformat()] = self.write(day, df.iloc[0:0])
+        return written
+
+    def invalidate(self, game_date: DateLike) -> None:
+        """하루 캐시 삭제 (다음 fetch에서 재수집)."""
+        day = _as_date(game_date)
+        if self.path(day).exists():
+            self.path(day).unlink()
+        with self._lock:
+            days = self.manifest()
+            if days.pop(day.isoformat(), None) is not None:
+                self._write_manifest(days)
+
@@ -1,39 +1,105 @@
-"""Statcast 투구 데이터 → 타석(PA) 단위 변환."""
+"""Statcast 투구 데이터 → 타석(PA) 단위 변환.
 
+필요한 컬럼만 projection한 뒤 PA 행(events NOT NULL)만 복사하고, 모든 변환은
+컬럼 단위 vectorized 연산. 출력은 compact dtype:
+
+    int64        pa_id (game_pk * 1000 + at_bat_number)
+    int32        game_pk, batter_id, pitcher_id
+    int16        season_year, at_bat_number, bat_score, fld_score
+    int8         inning, outs_when_up
+    bool         on_1b, on_2b, on_3b
+    category     result_type, inning_half, home_team, away_team
+    float32      launch_speed, launch_angle
+    float64      xwoba, delta_run_exp (ELO 계산 입력 — DB 값과 bit 단위로 동일하게 유지)
+
+inning / outs_when_up / bat_score / fld_score에 결측이 있으면 그 컬럼만 같은 폭의
+nullable Int8 / Int16 (<NA>, 업로드 시 NULL). 정수가 아닌 값은 ValueError.
+"""
+
+import logging
+
+import numpy as np
 import pandas as pd
-from src.etl.event_mapper import map_event
+from src.etl.event_mapper import map_events
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_COLUMNS = [
+    'pa_id', 'game_pk', 'game_date', 'season_year',
+    'batter_id', 'pitcher_id', 'result_type',
+    'inning', 'inning_half', 'at_bat_number', 'outs_when_up',
+    'on_1b', 'on_2b', 'on_3b',
+    'home_team', 'away_team', 'bat_score', 'fld_score',
+    'launch_speed', 'launch_angle', 'xwoba', 'delta_run_exp',
+]
+
+_INPUT_COLUMNS = [
+    'game_pk', 'game_date', 'game_year', 'at_bat_number', 'events',
+    'batter', 'pitcher', 'inning', 'inning_topbot', 'outs_when_up',
+    'on_1b', 'on_2b', 'on_3b', 'home_team', 'away_team', 'bat_score', 'fld_score',
+    'launch_speed', 'launch_angle', 'estimated_woba_using_speedangle', 'delta_run_exp',
+]
+
+
+def _float(src: pd.DataFrame, col: str, dtype) -> np.ndarray:
+    if col not in src.columns:
+        return np.full(len(src), np.nan, dtype=dtype)
+    return pd.to_numeric(src[col], errors='coerce').to_numpy(dtype=dtype)
+
+
+_NULLABLE_INT = {np.int8: 'Int8', np.int16: 'Int16'}
+
+
+def _int(src: pd.DataFrame, col: str, dtype):
+    """결측 가능 정수 컬럼 → numpy dtype 배열 (결측이 있으면 nullable Int 배열)."""
+    values = src[col]
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in 'iu':
+        return values.to_numpy(dtype=dtype)
+    nullable = _NULLABLE_INT[dtype]
+    try:
+        converted = values.astype(nullable).array     # float / object / Int64: 정수 여부 검증
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Statcast column {col!r} has non-integer values: {e}") from e
+    missing = converted.isna()
+    if not missing.any():
+        return converted.to_numpy(dtype=dtype)
+    logger.warning(f"  {col}: {int(missing.sum()):,} PA rows missing, kept as <NA> ({nullable})")
+    return converted
 
 
 def convert_statcast_to_pa(statcast_df: pd.DataFrame) -> pd.DataFrame:
-    # 1. PA만 추출 (events가 NOT NULL)
-    pa_df = statcast_df[statcast_df['events'].notna()].copy()
-
-    # 2. result_type 매핑
-    pa_df['result_type'] = pa_df['events'].apply(map_event)
-
-    # 3. 컬럼 변환
-    pa_df['season_year'] = pa_df['game_year'] if 'game_year' in pa_df.columns else pd.to_datetime(pa_df['game_date']).dt.year
-    pa_df['batter_id'] = pa_df['batter'].astype(int)
-    pa_df['pitcher_id'] = pa_df['pitcher'].astype(int)
-    pa_df['inning_half'] = pa_df['inning_topbot']
-    pa_df['on_1b'] = pa_df['on_1b'].notna()
-    pa_df['on_2b'] = pa_df['on_2b'].notna()
-    pa_df['on_3b'] = pa_df['on_3b'].notna()
-    pa_df['xwoba'] = pa_df.get('estimated_woba_using_speedangle')
-
-    # 4. PA ID 생성
-    pa_df['pa_id'] = pa_df['game_pk'].astype(int) * 1000 + pa_df['at_bat_number'].astype(int)
-
-    # 5. 정렬
-    pa_df = pa_df.sort_values(['game_date', 'game_pk', 'at_bat_number']).reset_index(drop=True)
-
-    # 6. 출력 컬럼 선택
-    output_columns = [
-        'pa_id', 'game_pk', 'game_date', 'season_year',
-        'batter_id', 'pitcher_id', 'result_type',
-        'inning', 'inning_half', 'at_bat_number', 'outs_when_up',
-        'on_1b', 'on_2b', 'on_3b',
-        'home_team', 'away_team', 'bat_score', 'fld_score',
-        'launch_speed', 'launch_angle', 'xwoba', 'delta_run_exp',
-    ]
-    return pa_df[output_columns]
+    # 1. PA만 추출 (events가 NOT NULL) — 필요한 컬럼만 복사
+    mask = statcast_df['events'].notna().to_numpy()
+    src = statcast_df.loc[mask, [c for c in _INPUT_COLUMNS if c in statcast_df.columns]]
+
+    # 2. 컬럼 변환 (result_type: EVENT_MAP categorical lookup)
+    game_pk = src['game_pk'].to_numpy(dtype=np.int64)
+    at_bat_number = src['at_bat_number'].to_numpy(dtype=np.int64)
+    season_year = src['game_year'] if 'game_year' in src.columns else pd.to_datetime(src['game_date']).dt.year
+    pa_df = pd.DataFrame({
+        'pa_id': game_pk * 1000 + at_bat_number,
+        'game_pk': game_pk.astype(np.int32),
+        'game_date': src['game_date'].to_numpy(),
+        'season_year': season_year.to_numpy(dtype=np.int16),
+        'batter_id': src['batter'].to_numpy(dtype=np.int32),
+        'pitcher_id': src['pitcher'].to_numpy(dtype=np.int32),
+        'result_type': map_events(src['events']),
+        'inning': _int(src, 'inning', np.int8),
+        'inning_half': pd.Categorical(src['inning_topbot']),
+        'at_bat_number': at_bat_number.astype(np.int16),
+        'outs_when_up': _int(src, 'outs_when_up', np.int8),
+        'on_1b': src['on_1b'].notna().to_numpy(),
+        'on_2b': src['on_2b'].notna().to_numpy(),
+        'on_3b': src['on_3b'].notna().to_numpy(),
+        'home_team': pd.Categorical(src['home_team']),
+        'away_team': pd.Categorical(src['away_team']),
+        'bat_score': _int(src, 'bat_score', np.int16),
+        'fld_score': _int(src, 'fld_score', np.int16),
+        'launch_speed': _float(src, 'launch_speed', np.float32),
+        'launch_angle': _float(src, 'launch_angle', np.float32),
+        'xwoba': _float(src, 'estimated_woba_using_speedangle', np.float64),
+        'delta_run_exp': _float(src, 'delta_run_exp', np.float64),
+    }, columns=OUTPUT_COLUMNS)
+
+    # 3. 정렬
+    return pa_df.sort_values(['game_date', 'game_pk', 'at_bat_number']).reset_index(drop=True)
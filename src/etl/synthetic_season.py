@@ -0,0 +1,365 @@
+"""Synthetic Season Generator — Supabase / 실제 Statcast parquet 없이 쓰는 재현 가능한 합성 데이터.
+
+30팀 × (타자 22 + 투수 27) ≈ 1,470명 리그에서 경기를 시뮬레이션해
+convert_statcast_to_pa 출력과 같은 모양의 PA DataFrame과, 그 PA를 투구 단위로 펼친
+Statcast 모양 DataFrame(STATCAST_CACHE_COLUMNS)을 만든다. 같은 seed → 같은 결과.
+
+    - 매일 30팀을 15경기로 짝지음 (홈 / 원정 → home_team = 구장 분포)
+    - 경기마다 타순 9명 (주전 가중치), 선발 5인 로테이션 + 7회부터 이닝별 불펜
+    - 9이닝 × 초 / 말, 이닝마다 3아웃까지: RESULT_MIX 확률로 결과 추출 후
+      base-out state 전이 (GIDP / SAC / FC는 주자 조건이 안 맞으면 OUT)
+    - delta_run_exp = RE24(이후) − RE24(이전) + 득점 (3아웃이면 RE 0)
+    - 인플레이 타구만 launch_speed / launch_angle / xwoba, 투구 수는 결과별 최소값 + Poisson
+
+규모 (SCALES): 'day' 1일, 'season' 162일 (2,430경기, ~190K PA), 'decade' 10시즌 (~1.9M PA).
+
+Usage:
+    pa_df = synthetic_pa('season')                    # PA frame (convert 출력 모양)
+    pitches = synthetic_statcast('day', seed=7)       # Statcast 투구 frame
+    assert convert_statcast_to_pa(pitches) ≈ synthetic_pa('day', seed=7)
+"""
+
+from datetime import date, timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.etl.event_mapper import RESULT_TYPES
+from src.etl.statcast_cache import STATCAST_CACHE_COLUMNS
+from src.etl.statcast_to_pa import OUTPUT_COLUMNS
+
+TEAMS = ['COL', 'BOS', 'AZ', 'CIN', 'MIN', 'ATL', 'MIA', 'LAA', 'WSH', 'LAD',
+         'KC', 'PHI', 'BAL', 'STL', 'TOR', 'NYY', 'DET', 'HOU', 'CWS', 'PIT',
+         'NYM', 'TEX', 'SF', 'CLE', 'MIL', 'CHC', 'SD', 'SEA', 'TB', 'OAK']
+BATTERS_PER_TEAM = 22
+PITCHERS_PER_TEAM = 27
+ROTATION_SIZE = 5
+STARTER_INNINGS = 6
+SEASON_DAYS = 162                # 매일 15경기 → 팀당 162경기
+LAST_SEASON = 2025
+TWO_WAY_PLAYER_ID = 660271      # LAD 타자 / 선발 겸업
+
+SCALES = {
+    'day': {'seasons': 1, 'days': 1},
+    'season': {'seasons': 1, 'days': SEASON_DAYS},
+    'decade': {'seasons': 10, 'days': SEASON_DAYS},
+}
+
+# PA 결과 비율 (MLB 2024 근사; 조건 불충족 GIDP / SAC / FC는 OUT으로 바뀜)
+RESULT_MIX = {
+    'StrikeOut': 0.225, 'BB': 0.082, 'IBB': 0.004, 'HBP': 0.011,
+    'Single': 0.140, 'Double': 0.044, 'Triple': 0.004, 'HR': 0.031,
+    'GIDP': 0.020, 'SAC': 0.009, 'FC': 0.004, 'E': 0.009, 'OUT': 0.417,
+}
+RESULTS = list(RESULT_MIX)
+_CODE = {name: i for i, name in enumerate(RESULTS)}
+_PROBS = np.array(list(RESULT_MIX.values()))
+_PROBS = _PROBS / _PROBS.sum()
+
+# 결과 → Statcast events (SAC는 3루 주자 있으면 sac_fly)
+EVENTS = {
+    'StrikeOut': 'strikeout', 'BB': 'walk', 'IBB': 'intent_walk', 'HBP': 'hit_by_pitch',
+    'Single': 'single', 'Double': 'double', 'Triple': 'triple', 'HR': 'home_run',
+    'GIDP': 'grounded_into_double_play', 'SAC': 'sac_bunt', 'FC': 'fielders_choice_out',
+    'E': 'field_error', 'OUT': 'field_out',
+}
+_NOT_IN_PLAY = {'StrikeOut', 'BB', 'IBB', 'HBP'}
+_MIN_PITCHES = {'StrikeOut': 3, 'BB': 4, 'IBB': 1}
+_XWOBA_MEAN = {'Single': 0.55, 'Double': 0.95, 'Triple': 1.1, 'HR': 1.6, 'E': 0.25, 'OUT': 0.15,
+               'GIDP': 0.12, 'SAC': 0.1, 'FC': 0.15}
+
+# RE24 (2010s MLB 평균) — [outs][bases], bases bit0 = 1B, bit1 = 2B, bit2 = 3B
+RE24 = np.array([
+    [0.481, 0.859, 1.100, 1.437, 1.350, 1.784, 1.964, 2.292],
+    [0.254, 0.509, 0.664, 0.884, 0.950, 1.130, 1.376, 1.541],
+    [0.098, 0.224, 0.319, 0.429, 0.353, 0.478, 0.580, 0.752],
+])
+
+
+def _runners(bases: int) -> int:
+    return bin(bases).count('1')
+
+
+def _force(bases: int) -> tuple[int, int]:
+    """타자 1루 진루 + 밀어내기 → (bases, runs)."""
+    if not bases & 1:
+        return bases | 1, 0
+    if not bases & 2:
+        return bases | 3, 0
+    if not bases & 4:
+        return 7, 0
+    return 7, 1
+
+
+def _transition(result: str, bases: int, outs: int) -> tuple[str, int, int, int]:
+    """(실제 결과, 이후 bases, 득점, 추가 아웃). 조건이 안 맞는 GIDP / SAC / FC → OUT."""
+    if result == 'GIDP' and not (bases & 1 and outs < 2):
+        result = 'OUT'
+    elif result == 'SAC' and not (bases and outs < 2):
+        result = 'OUT'
+    elif result == 'FC' and not bases & 1:
+        result = 'OUT'
+
+    if result in ('StrikeOut', 'OUT'):
+        return result, bases, 0, 1
+    if result in ('BB', 'IBB', 'HBP'):
+        return (result, *_force(bases), 0)
+    if result == 'Single':
+        return result, 1 | (2 if bases & 1 else 0), _runners(bases & 6), 0
+    if result == 'Double':
+        return result, 2 | (4 if bases & 1 else 0), _runners(bases & 6), 0
+    if result == 'Triple':
+        return result, 4, _runners(bases), 0
+    if result == 'HR':
+        return result, 0, _runners(bases) + 1, 0
+    if result == 'E':
+        return result, 1 | ((bases << 1) & 6), 1 if bases & 4 else 0, 0
+    if result == 'GIDP':
+        return result, bases & 6, 0, 2
+    if result == 'SAC':
+        if bases & 4:
+            return result, bases & 3, 1, 1
+        return result, (bases << 1) & 6, 0, 1
+    # FC: 선행 주자 아웃, 타자 1루 (주자 배치 유지)
+    return result, bases, 0, 1
+
+
+# (result code, bases, outs) → (actual code, new bases, runs, outs added)
+_TRANSITIONS = {
+    (code, bases, outs): (_CODE[actual], new_bases, runs, added)
+    for code, result in enumerate(RESULTS) for bases in range(8) for outs in range(3)
+    for actual, new_bases, runs, added in [_transition(result, bases, outs)]
+}
+
+
+# RESULTS code → event_mapper.RESULT_TYPES code (convert_statcast_to_pa와 같은 categories)
+_RESULT_TYPE_CODES = np.array([RESULT_TYPES.index(r) for r in RESULTS], dtype=np.int8)
+
+
+def scale_params(scale: str) -> dict:
+    if scale not in SCALES:
+        raise ValueError(f"Unknown scale: {scale!r} (expected one of {tuple(SCALES)})")
+    return dict(SCALES[scale])
+
+
+class SyntheticLeague:
+    """팀별 로스터 (player ID, 타순 가중치, 선발 로테이션 / 불펜)."""
+
+    def __init__(self, seed: int = LAST_SEASON):
+        rng = np.random.default_rng(seed)
+        self.batters = np.zeros((len(TEAMS), BATTERS_PER_TEAM), dtype=np.int64)
+        self.pitchers = np.zeros((len(TEAMS), PITCHERS_PER_TEAM), dtype=np.int64)
+        ids = rng.permutation(np.arange(600_000, 700_000))
+        k = 0
+        for t in range(len(TEAMS)):
+            self.batters[t] = ids[k:k + BATTERS_PER_TEAM]
+            k += BATTERS_PER_TEAM
+            self.pitchers[t] = ids[k:k + PITCHERS_PER_TEAM]
+            k += PITCHERS_PER_TEAM
+        self.batters[self.batters == TWO_WAY_PLAYER_ID] = ids[k]
+        self.pitchers[self.pitchers == TWO_WAY_PLAYER_ID] = ids[k + 1]
+        lad = TEAMS.index('LAD')
+        self.batters[lad, 0] = TWO_WAY_PLAYER_ID
+        self.pitchers[lad, 0] = TWO_WAY_PLAYER_ID
+        # 주전 9명이 대부분 출장, 나머지는 벤치 / 마이너 콜업
+        weights = np.r_[np.full(9, 10.0), np.linspace(3.0, 0.3, BATTERS_PER_TEAM - 9)]
+        self.lineup_weights = weights / weights.sum()
+
+    @property
+    def player_ids(self) -> np.ndarray:
+        return np.unique(np.concatenate([self.batters.ravel(), self.pitchers.ravel()]))
+
+
+def _schedule(rng: np.random.Generator, seasons: int, days: int) -> list[tuple[date, int, int]]:
+    """(game_date, home team, away team) — 매일 30팀을 무작위로 15경기 짝지음."""
+    games = []
+    for s in range(seasons):
+        opening = date(LAST_SEASON - seasons + 1 + s, 3, 27)
+        for d in range(days):
+            order = rng.permutation(len(TEAMS))
+            game_date = opening + timedelta(days=d)
+            games.extend((game_date, int(order[i]), int(order[i + 1])) for i in range(0, len(TEAMS), 2))
+    return games
+
+
+def synthetic_pa(scale: str = 'season', seed: int = LAST_SEASON,
+                 league: Optional[SyntheticLeague] = None) -> pd.DataFrame:
+    """합성 PA DataFrame (OUTPUT_COLUMNS, convert_statcast_to_pa와 같은 dtype / 정렬)."""
+    params = scale_params(scale)
+    rng = np.random.default_rng(seed)
+    league = league or SyntheticLeague(seed)
+    games = _schedule(rng, params['seasons'], params['days'])
+
+    cols = {name: [] for name in ('game', 'at_bat_number', 'inning', 'top', 'outs', 'bases',
+                                  'batter', 'pitcher', 'result', 'bat_score', 'fld_score',
+                                  'runs', 'end_outs', 'end_bases')}
+    append = {name: values.append for name, values in cols.items()}
+    transitions = _TRANSITIONS
+    starts = np.zeros(len(TEAMS), dtype=np.int64)
+    draws = rng.choice(len(RESULTS), size=80 * len(games) + 1000, p=_PROBS).tolist()
+    cursor = 0
+
+    for g, (_, home, away) in enumerate(games):
+        lineups, staffs = {}, {}
+        for team in (home, away):
+            lineups[team] = rng.choice(league.batters[team], 9, replace=False,
+                                       p=league.lineup_weights).tolist()
+            starter = league.pitchers[team, starts[team] % ROTATION_SIZE]
+            starts[team] += 1
+            bullpen = rng.choice(league.pitchers[team, ROTATION_SIZE:], 9 - STARTER_INNINGS,
+                                 replace=False).tolist()
+            staffs[team] = [int(starter)] * STARTER_INNINGS + bullpen
+        score = {home: 0, away: 0}
+        slot = {home: 0, away: 0}
+        at_bat = 0
+        for inning in range(1, 10):
+            for top in (True, False):
+                bat, fld = (away, home) if top else (home, away)
+                pitcher = staffs[fld][inning - 1]
+                lineup = lineups[bat]
+                outs = bases = 0
+                while outs < 3:
+                    if cursor == len(draws):
+                        draws.extend(rng.choice(len(RESULTS), size=10_000, p=_PROBS).tolist())
+                    code, bases_after, runs, added = transitions[(draws[cursor], bases, outs)]
+                    cursor += 1
+                    at_bat += 1
+                    end_outs = outs + added
+                    if end_outs >= 3:
+                        runs, bases_after = 0, 0
+                    append['game'](g)
+                    append['at_bat_number'](at_bat)
+                    append['inning'](inning)
+                    append['top'](top)
+                    append['outs'](outs)
+                    append['bases'](bases)
+                    append['batter'](lineup[slot[bat] % 9])
+                    append['pitcher'](pitcher)
+                    append['result'](code)
+                    append['bat_score'](score[bat])
+                    append['fld_score'](score[fld])
+                    append['runs'](runs)
+                    append['end_outs'](min(end_outs, 3))
+                    append['end_bases'](bases_after)
+                    slot[bat] += 1
+                    score[bat] += runs
+                    outs, bases = end_outs, bases_after
+
+    return _pa_frame(cols, games, rng)
+
+
+def _pa_frame(cols: dict, games: list, rng: np.random.Generator) -> pd.DataFrame:
+    n = len(cols['game'])
+    game = np.asarray(cols['game'], dtype=np.int64)
+    game_dates = np.array([d.isoformat() for d, _, _ in games], dtype='datetime64[D]')
+    home = np.array([h for _, h, _ in games], dtype=np.int64)[game]
+    away = np.array([a for _, _, a in games], dtype=np.int64)[game]
+    game_pk = 745_000 + game
+    at_bat_number = np.asarray(cols['at_bat_number'], dtype=np.int64)
+    bases = np.asarray(cols['bases'], dtype=np.int64)
+    outs = np.asarray(cols['outs'], dtype=np.int64)
+    end_outs = np.asarray(cols['end_outs'], dtype=np.int64)
+    end_bases = np.asarray(cols['end_bases'], dtype=np.int64)
+    result = np.asarray(cols['result'], dtype=np.int8)
+
+    re_after = np.where(end_outs >= 3, 0.0, RE24[np.minimum(end_outs, 2), end_bases])
+    delta_run_exp = np.round(re_after - RE24[outs, bases] + np.asarray(cols['runs']), 3)
+
+    in_play = ~np.isin(result, [_CODE[r] for r in _NOT_IN_PLAY])
+    launch_speed = np.where(in_play, rng.normal(89.0, 14.0, n).clip(20, 120), np.nan).astype(np.float32)
+    launch_angle = np.where(in_play, rng.normal(12.0, 26.0, n).clip(-80, 85), np.nan).astype(np.float32)
+    xwoba_mean = np.array([_XWOBA_MEAN.get(r, np.nan) for r in RESULTS])[result]
+    xwoba = np.round((xwoba_mean + rng.normal(0.0, 0.12, n)).clip(0.0, 2.0), 3)
+    xwoba[~in_play] = np.nan
+
+    dates = game_dates[game]
+    pa_df = pd.DataFrame({
+        'pa_id': game_pk * 1000 + at_bat_number,
+        'game_pk': game_pk.astype(np.int32),
+        'game_date': dates.astype('datetime64[ns]'),
+        'season_year': dates.astype('datetime64[Y]').astype(np.int64).astype(np.int16) + np.int16(1970),
+        'batter_id': np.asarray(cols['batter'], dtype=np.int32),
+        'pitcher_id': np.asarray(cols['pitcher'], dtype=np.int32),
+        'result_type': pd.Categorical.from_codes(_RESULT_TYPE_CODES[result], categories=RESULT_TYPES),
+        'inning': np.asarray(cols['inning'], dtype=np.int8),
+        'inning_half': pd.Categorical(np.where(cols['top'], 'Top', 'Bot')),
+        'at_bat_number': at_bat_number.astype(np.int16),
+        'outs_when_up': outs.astype(np.int8),
+        'on_1b': (bases & 1).astype(bool),
+        'on_2b': (bases & 2).astype(bool),
+        'on_3b': (bases & 4).astype(bool),
+        'home_team': pd.Categorical(np.array(TEAMS)[home]),
+        'away_team': pd.Categorical(np.array(TEAMS)[away]),
+        'bat_score': np.asarray(cols['bat_score'], dtype=np.int16),
+        'fld_score': np.asarray(cols['fld_score'], dtype=np.int16),
+        'launch_speed': launch_speed,
+        'launch_angle': launch_angle,
+        'xwoba': xwoba,
+        'delta_run_exp': delta_run_exp,
+    }, columns=OUTPUT_COLUMNS)
+    return pa_df
+
+
+def synthetic_statcast(scale: str = 'season', seed: int = LAST_SEASON,
+                       pa_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Statcast 투구 DataFrame (STATCAST_CACHE_COLUMNS, PA마다 마지막 투구에만 events).
+
+    pa_df를 주면 그 PA를 펼침 (convert_statcast_to_pa(결과)가 pa_df와 같은 PA를 복원).
+    """
+    if pa_df is None:
+        pa_df = synthetic_pa(scale, seed)
+    rng = np.random.default_rng(seed + 1)
+    n = len(pa_df)
+    result = pa_df['result_type'].astype(str).to_numpy()
+    min_pitches = pd.Series(result).map(_MIN_PITCHES).fillna(1).to_numpy(dtype=np.int64)
+    n_pitches = np.minimum(min_pitches + rng.poisson(2.4, n), 12)
+    n_pitches[result == 'IBB'] = 1
+    pa_idx = np.repeat(np.arange(n), n_pitches)
+    last = np.zeros(len(pa_idx), dtype=bool)
+    last[np.cumsum(n_pitches) - 1] = True
+
+    events = pd.Series(result).map(EVENTS).to_numpy(dtype=object)
+    events[(result == 'SAC') & pa_df['on_3b'].to_numpy()] = 'sac_fly'
+    pitch_events = np.full(len(pa_idx), None, dtype=object)
+    pitch_events[last] = events[pa_idx[last]]
+
+    def runner(col: str) -> np.ndarray:
+        # Statcast on_1b 등은 주자 player ID (없으면 NaN) — 직전 타자 ID로 근사
+        prev_batter = np.r_[0, pa_df['batter_id'].to_numpy()[:-1]].astype(np.float64)
+        return np.where(pa_df[col].to_numpy(), prev_batter, np.nan)[pa_idx]
+
+    def at_pitch(values, only_last: bool = False) -> np.ndarray:
+        values = np.asarray(values)[pa_idx]
+        if only_last:
+            values = np.where(last, values, np.nan)
+        return values
+
+    rv = pa_df['delta_run_exp'].to_numpy()
+    pitch_rv = np.where(last, rv[pa_idx], np.round(rng.normal(0.0, 0.03, len(pa_idx)), 3))
+    pitches = pd.DataFrame({
+        'game_pk': at_pitch(pa_df['game_pk'].to_numpy(dtype=np.int64)),
+        'game_date': at_pitch(pa_df['game_date'].to_numpy()),
+        'game_year': at_pitch(pa_df['season_year'].to_numpy(dtype=np.int64)),
+        'game_type': 'R',
+        'at_bat_number': at_pitch(pa_df['at_bat_number'].to_numpy(dtype=np.int64)),
+        'inning': at_pitch(pa_df['inning'].to_numpy(dtype=np.int64)),
+        'inning_topbot': at_pitch(pa_df['inning_half'].astype(str).to_numpy()),
+        'outs_when_up': at_pitch(pa_df['outs_when_up'].to_numpy(dtype=np.int64)),
+        'batter': at_pitch(pa_df['batter_id'].to_numpy(dtype=np.int64)),
+        'pitcher': at_pitch(pa_df['pitcher_id'].to_numpy(dtype=np.int64)),
+        'events': pitch_events,
+        'on_1b': runner('on_1b'),
+        'on_2b': runner('on_2b'),
+        'on_3b': runner('on_3b'),
+        'home_team': at_pitch(pa_df['home_team'].astype(str).to_numpy()),
+        'away_team': at_pitch(pa_df['away_team'].astype(str).to_numpy()),
+        'bat_score': at_pitch(pa_df['bat_score'].to_numpy(dtype=np.int64)),
+        'fld_score': at_pitch(pa_df['fld_score'].to_numpy(dtype=np.int64)),
+        'launch_speed': at_pitch(pa_df['launch_speed'].to_numpy(dtype=np.float64), only_last=True),
+        'launch_angle': at_pitch(pa_df['launch_angle'].to_numpy(dtype=np.float64), only_last=True),
+        'estimated_woba_using_speedangle': at_pitch(pa_df['xwoba'].to_numpy(), only_last=True),
+        'delta_run_exp': pitch_rv,
+    }, columns=STATCAST_CACHE_COLUMNS)
+    # pybaseball / Baseball Savant 응답처럼 최신 투구가 먼저
+    return pitches.iloc[::-1].reset_index(drop=True)
@@ -0,0 +1,160 @@
+"""Keyset-Paginated Table Reader — PK keyset 페이징 + key range 병렬 조회.
+
+.range(offset, offset + 999) 페이징은 offset이 커질수록 느려지고 (서버가 offset만큼
+스캔 후 버림), 조회 중 다른 쓰기가 있으면 행을 건너뛰거나 중복으로 읽음.
+여기서는 key 오름차순으로 정렬해 마지막 key 다음부터 읽고 (key > cursor),
+정수 key는 [min, max]를 여러 구간으로 나눠 worker pool에서 동시에 읽음.
+
+    iter_pages   한 key 구간을 keyset 페이징 → 페이지별 DataFrame (streaming)
+    read_table   key range 분할 + 병렬 iter_pages → key 순 DataFrame 하나
+
+key가 unique하지 않으면 (talent_player_current의 player_id 등) unique=False:
+꽉 찬 페이지의 마지막 key 그룹은 버리고 다음 페이지에서 그룹 전체를 다시 읽음
+(한 key의 행 수 < page_size 전제).
+
+filters는 (postgrest 메서드, 컬럼, 값) tuple: [('eq', 'game_date', '2025-04-01')].
+page_size는 서버 max rows(Supabase 기본 1000) 이하여야 함 (page_size 미만 응답 = 마지막 페이지).
+
+Usage:
+    pa_df = read_table(client, 'plate_appearances', '*', key='pa_id',
+                       filters=[('gt', 'game_date', '2025-04-01')], workers=8)
+    for page in iter_pages(client, 'player_elo', 'player_id, composite_elo', key='player_id'):
+        ...
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 1000        # Supabase PostgREST max rows per request
+READ_WORKERS = 4
+RANGES_PER_WORKER = 4   # key 분포가 고르지 않아도 worker가 놀지 않도록 잘게 분할
+
+Filter = tuple[str, str, Any]
+
+
+def _select_columns(columns: str, key: str) -> str:
+    names = [c.strip() for c in columns.split(',')]
+    if columns.strip() == '*' or key in names:
+        return columns
+    return f"{key}, {columns}"
+
+
+def _column_names(columns: str, key: str) -> Optional[list[str]]:
+    if columns.strip() == '*':
+        return None
+    return [c.strip() for c in _select_columns(columns, key).split(',')]
+
+
+def _query(client, table: str, columns: str, filters: Iterable[Filter]):
+    q = client.table(table).select(columns)
+    for op, column, value in filters:
+        q = getattr(q, op)(column, value)
+    return q
+
+
+def _scalar(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def iter_pages(client, table: str, columns: str, key: str, filters: Iterable[Filter] = (),
+               page_size: int = PAGE_SIZE, lower=None, upper=None,
+               unique: bool = True) -> Iterator[pd.DataFrame]:
+    """key 구간 [lower, upper)를 key 오름차순 keyset 페이징 → 페이지 DataFrame."""
+    filters = list(filters)
+    select = _select_columns(columns, key)
+    cursor = None
+    while True:
+        q = _query(client, table, select, filters)
+        if cursor is not None:
+            q = q.gt(key, cursor)
+        elif lower is not None:
+            q = q.gte(key, lower)
+        if upper is not None:
+            q = q.lt(key, upper)
+        rows = q.order(key).limit(page_size).execute().data
+        if not rows:
+            return
+        page = pd.DataFrame(rows)
+        full = len(rows) >= page_size
+        if full and not unique:
+            # 마지막 key 그룹은 페이지 경계에서 잘렸을 수 있음 → 다음 페이지에서 다시 읽음
+            partial = page[key] == page[key].iloc[-1]
+            if partial.all():
+                raise ValueError(f"{table}.{key} = {page[key].iloc[-1]!r} has >= {page_size} rows; "
+                                 f"cannot keyset-paginate on a non-unique key")
+            page = page[~partial].reset_index(drop=True)
+        yield page
+        if not full:
+            return
+        cursor = _scalar(page[key].iloc[-1])
+
+
+def key_bounds(client, table: str, key: str, filters: Iterable[Filter] = ()) -> Optional[tuple]:
+    """filters 조건 내 (min key, max key) — 행이 없으면 None."""
+    filters = list(filters)
+    bounds = []
+    for desc in (False, True):
+        rows = _query(client, table, key, filters).order(key, desc=desc).limit(1).execute().data
+        if not rows:
+            return None
+        bounds.append(rows[0][key])
+    return tuple(bounds)
+
+
+def split_key_range(lower: int, upper: int, parts: int) -> list[tuple[int, int]]:
+    """정수 key [lower, upper]를 최대 parts개의 반열린 구간 [lo, hi)로 분할."""
+    edges = np.unique(np.linspace(lower, upper + 1, max(1, parts) + 1).astype(np.int64))
+    return [(int(lo), int(hi)) for lo, hi in zip(edges[:-1], edges[1:])]
+
+
+def _empty_frame(columns: str, key: str) -> pd.DataFrame:
+    names = _column_names(columns, key)
+    return pd.DataFrame(columns=names) if names else pd.DataFrame()
+
+
+def _concat(pages: Iterable[pd.DataFrame], columns: str, key: str) -> pd.DataFrame:
+    frames = [p for p in pages if len(p)]
+    if not frames:
+        return _empty_frame(columns, key)
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+
+def read_table(client, table: str, columns: str, key: str, filters: Iterable[Filter] = (),
+               page_size: int = PAGE_SIZE, workers: int = READ_WORKERS,
+               unique: bool = True) -> pd.DataFrame:
+    """테이블 조회 → key 오름차순 DataFrame.
+
+    workers > 1이고 key가 정수면 [min, max]를 workers × RANGES_PER_WORKER 구간으로 나눠
+    동시에 keyset 페이징. 행이 없으면 선택 컬럼만 있는 빈 DataFrame.
+    """
+    filters = list(filters)
+    if workers <= 1:
+        return _concat(iter_pages(client, table, columns, key, filters, page_size, unique=unique),
+                       columns, key)
+
+    bounds = key_bounds(client, table, key, filters)
+    if bounds is None:
+        return _empty_frame(columns, key)
+    lower, upper = bounds
+    if not all(isinstance(b, (int, np.integer)) and not isinstance(b, bool) for b in bounds):
+        return _concat(iter_pages(client, table, columns, key, filters, page_size, unique=unique),
+                       columns, key)
+
+    ranges = split_key_range(lower, upper, workers * RANGES_PER_WORKER)
+
+    def read_range(bounds: tuple[int, int]) -> pd.DataFrame:
+        lo, hi = bounds
+        return _concat(iter_pages(client, table, columns, key, filters, page_size,
+                                  lower=lo, upper=hi, unique=unique), columns, key)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(read_range, ranges))
+    frame = _concat(parts, columns, key)
+    logger.debug(f"  {table}: {len(frame):,} rows in {len(ranges)} key ranges on {workers} workers")
+    return frame
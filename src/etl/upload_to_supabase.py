@@ -1,12 +1,15 @@
 """Plate appearances / Players DataFrame → Supabase 업로드."""
 
 import os
-import math
 import logging
 
+import numpy as np
 import pandas as pd
 from supabase import create_client
 
+from src.etl.batch_uploader import UPLOAD_WORKERS, BatchUploader
+from src.etl.record_serializer import frame_to_records
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,54 +19,57 @@ def get_supabase_client():
     return create_client(url, key)
 
 
+# RPC 미설치: PostgREST schema cache에 없음 / Postgres undefined_function / HTTP 404
+MISSING_FUNCTION_CODES = frozenset({'PGRST202', '42883', '404'})
+
+
+def is_missing_function(error: Exception) -> bool:
+    """RPC가 backend에 없어서 난 오류인지 (timeout / 권한 / 실행 오류는 False)."""
+    code = getattr(error, 'code', None)
+    if code is not None:
+        return str(code) in MISSING_FUNCTION_CODES
+    return 'PGRST202' in str(error)
+
+
+PA_INT_COLUMNS = ['pa_id', 'game_pk', 'season_year', 'batter_id', 'pitcher_id',
+                  'inning', 'at_bat_number', 'outs_when_up', 'bat_score', 'fld_score']
+
+
 def prepare_player_records(players_df: pd.DataFrame) -> list[dict]:
     """Players DataFrame을 Supabase upsert용 dict 리스트로 변환."""
-    records = players_df.to_dict('records')
-    for r in records:
-        for k, v in r.items():
-            if isinstance(v, float) and math.isnan(v):
-                r[k] = None
-    return records
+    return frame_to_records(players_df)
 
 
 def prepare_pa_records(pa_df: pd.DataFrame) -> list[dict]:
-    """Plate appearances DataFrame을 Supabase upsert용 dict 리스트로 변환."""
-    records = pa_df.to_dict('records')
-    for r in records:
-        # game_date → ISO string
-        if hasattr(r.get('game_date'), 'isoformat'):
-            r['game_date'] = r['game_date'].isoformat()[:10]
-        # NaN → None
-        for k, v in r.items():
-            if isinstance(v, float) and math.isnan(v):
-                r[k] = None
-        # numpy int → Python int (JSON 직렬화)
-        for k in ['pa_id', 'game_pk', 'season_year', 'batter_id', 'pitcher_id',
-                   'inning', 'at_bat_number', 'outs_when_up', 'bat_score', 'fld_score']:
-            if r.get(k) is not None:
-                r[k] = int(r[k])
-    return records
+    """Plate appearances DataFrame을 Supabase upsert용 dict 리스트로 변환.
+
+    game_date → ISO string, NaN → None, 정수 컬럼 → Python int.
+    float32 컬럼 (convert_statcast_to_pa compact schema)은 float64 소수 4자리
+    (95.19999694824219 같은 float32 표현 오차 제거).
+    """
+    float32_cols = [c for c in pa_df.columns if pa_df[c].dtype == np.float32]
+    return frame_to_records(pa_df, int_columns=PA_INT_COLUMNS, round_columns=float32_cols,
+                            date_columns=['game_date'])
 
 
 def upload_table(client, table_name: str, records: list[dict], batch_size: int = 1000,
-                 on_conflict: str | None = None) -> int:
-    """Supabase 테이블에 batch upsert.
+                 on_conflict: str | None = None, workers: int | None = None,
+                 key: str | None = None) -> int:
+    """Supabase 테이블에 batch upsert (BatchUploader: concurrent + adaptive batch + retry).
 
     Args:
+        batch_size: 초기 배치 크기 (이후 응답 시간 / payload 크기로 조정)
         on_conflict: UNIQUE constraint columns for conflict resolution
                      (e.g. 'player_id,game_date,elo_type,role').
                      Required for tables with SERIAL PK + separate UNIQUE constraint.
+        workers: 동시 upsert 수 (None이면 SUPABASE_UPLOAD_WORKERS 또는 4, 1이면 순차)
+        key: on_conflict 없는 PK upsert의 중복 키 순서 보장용 컬럼
+             (None이면 batch_uploader.TABLE_PRIMARY_KEYS의 테이블 PK)
     """
-    uploaded = 0
-    total = len(records)
-    for i in range(0, total, batch_size):
-        batch = records[i:i + batch_size]
-        q = client.table(table_name).upsert(batch, on_conflict=on_conflict) if on_conflict else client.table(table_name).upsert(batch)
-        q.execute()
-        uploaded += len(batch)
-        if uploaded % 5000 == 0 or uploaded == total:
-            logger.info(f"  {table_name}: {uploaded:,} / {total:,}")
-    return uploaded
+    if workers is None:
+        workers = int(os.environ.get('SUPABASE_UPLOAD_WORKERS', UPLOAD_WORKERS))
+    uploader = BatchUploader(client, workers=workers, batch_size=batch_size)
+    return uploader.upload(table_name, records, on_conflict=on_conflict, key=key)
 
 
 def upload_players(players_df: pd.DataFrame, batch_size: int = 500) -> int:
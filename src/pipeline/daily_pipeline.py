@@ -4,41 +4,64 @@
 
 Flow:
     1. Idempotency check (이미 처리된 날짜면 skip, force=True면 삭제 후 재처리)
-    2. pybaseball fetch (Regular Season only)
+       force 재처리는 D 이전 마지막 state snapshot을 복원하고 그 이후 날짜 전체를 replay
+       (remote watermark와 일치하는 snapshot이 없으면 삭제 전에 중단 — 현재 player_elo 위에
+       D를 다시 적용하면 이중 반영되므로 reapply_without_snapshot=True일 때만 허용)
+    2. pybaseball fetch (Regular Season only, 로컬 Statcast 캐시 우선)
     3. ETL: statcast_to_pa (기존 모듈 재사용)
     4. 신규 선수 감지 + 등록
     5. plate_appearances upsert
-    6. 기존 ELO 상태 로드
-    7. EloBatch(initial_states=...) → 증분 계산
-    8. 결과 업로드: player_elo (active_only), elo_pa_detail, daily_ohlc
-    9. Talent ELO: 9D 증분 계산 + 업로드
+    6. 기존 ELO / talent 상태 로드 (local state cache가 remote watermark·checksum과 같으면 캐시 사용)
+    7. EloBatch / TalentBatch → 증분 계산
+    8. 결과 업로드: player_elo (active_only), elo_pa_detail, daily_ohlc, talent_*
+
+EloBatch / TalentBatch는 날짜 종료마다 로컬 state snapshot을 저장 (see state_snapshot).
+실행이 끝나면 최종 상태를 local state cache에 저장 (see state_cache).
+
+run_range_pipeline은 같은 단계를 날짜 범위에 한 번씩만 수행 (fetch 1회, 상태 로드 1회,
+checkpoint마다 대량 업로드).
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from typing import Iterable, Optional
 
 import numpy as np
 import pandas as pd
 
+from src.engine.detail_buffer import DetailBuffer
+from src.engine.elo_arrays import game_date_strings
 from src.engine.elo_batch import EloBatch
 from src.engine.elo_calculator import PlayerEloState
 from src.engine.elo_config import INITIAL_ELO
 from src.engine.re24_baseline import RE24Baseline
 from src.engine.park_factor import ParkFactor
+from src.engine.state_snapshot import SNAPSHOT_KINDS, SnapshotStore
 from src.engine.talent_batch import TalentBatch
-from src.engine.talent_state_manager import DualBatterState, DualPitcherState
+from src.engine.talent_state_manager import DualBatterState, DualPitcherState, TalentStateManager
 from src.engine.multi_elo_types import (
     BatterTalentState, PitcherTalentState, DEFAULT_ELO,
     BATTER_DIM_NAMES, BATTER_DIM_COUNT,
     PITCHER_DIM_NAMES, PITCHER_DIM_COUNT,
 )
-from src.etl.fetch_statcast import fetch_statcast_date
+from src.etl.fetch_statcast import fetch_statcast_date, fetch_statcast_range
 from src.etl.statcast_to_pa import convert_statcast_to_pa
+from src.etl.known_player_index import KnownPlayerIndex
 from src.etl.player_registry import detect_new_player_ids_batch, register_new_players
-from src.etl.upload_to_supabase import get_supabase_client, upload_table, prepare_pa_records
+from src.etl.upload_to_supabase import (
+    get_supabase_client, is_missing_function, upload_table, prepare_pa_records,
+)
+from src.etl.record_serializer import records_from_columns
+from src.etl.table_reader import read_table
+from src.pipeline.stage_metrics import StageMetrics
+from src.pipeline.state_cache import StateCache
 
 logger = logging.getLogger(__name__)
 
+# EloBatch engine: array 경로는 python 루프와 bit 단위로 같은 결과 (시즌 규모 ~30x 빠름)
+DEFAULT_ELO_ENGINE = 'array'
+
 
 def load_current_elo_states(client) -> dict[int, PlayerEloState]:
     """Supabase player_elo → PlayerEloState 복원.
@@ -46,34 +69,29 @@ def load_current_elo_states(client) -> dict[int, PlayerEloState]:
     cumulative_rv는 0.0으로 리셋 (DB에 미저장, ELO 계산에 영향 없음).
     """
     logger.info("Loading current ELO states from Supabase...")
-    all_rows = []
-    page_size = 1000
-    offset = 0
-
-    while True:
-        response = (
-            client.table('player_elo')
-            .select('player_id, composite_elo, pa_count, batting_elo, pitching_elo, batting_pa, pitching_pa')
-            .range(offset, offset + page_size - 1)
-            .execute()
-        )
-        rows = response.data
-        if not rows:
-            break
-        all_rows.extend(rows)
-        offset += page_size
-        if len(rows) < page_size:
-            break
+    frame = read_table(
+        client, 'player_elo',
+        'player_id, composite_elo, pa_count, batting_elo, pitching_elo, batting_pa, pitching_pa',
+        key='player_id', workers=1,
+    )
+    for name in ('batting_elo', 'pitching_elo', 'batting_pa', 'pitching_pa'):
+        if name not in frame.columns:
+            frame[name] = None
 
     states = {}
-    for row in all_rows:
-        pid = row['player_id']
+    for pid, batting_elo, pitching_elo, batting_pa, pitching_pa in zip(
+        frame['player_id'].astype(np.int64).tolist(),
+        _or_default_column(frame, 'batting_elo', INITIAL_ELO).tolist(),
+        _or_default_column(frame, 'pitching_elo', INITIAL_ELO).tolist(),
+        _or_default_column(frame, 'batting_pa', 0.0).astype(np.int64).tolist(),
+        _or_default_column(frame, 'pitching_pa', 0.0).astype(np.int64).tolist(),
+    ):
         states[pid] = PlayerEloState(
             player_id=pid,
-            batting_elo=row.get('batting_elo', INITIAL_ELO) or INITIAL_ELO,
-            pitching_elo=row.get('pitching_elo', INITIAL_ELO) or INITIAL_ELO,
-            batting_pa=row.get('batting_pa', 0) or 0,
-            pitching_pa=row.get('pitching_pa', 0) or 0,
+            batting_elo=batting_elo,
+            pitching_elo=pitching_elo,
+            batting_pa=batting_pa,
+            pitching_pa=pitching_pa,
             cumulative_rv=0.0,
         )
 
@@ -81,201 +99,448 @@ def load_current_elo_states(client) -> dict[int, PlayerEloState]:
     return states
 
 
+TALENT_CURRENT_COLUMNS = ['player_id', 'player_role', 'talent_type', 'season_elo', 'career_elo',
+                          'event_count', 'pa_count']
+
+
+def _or_default_column(frame: pd.DataFrame, name: str, default: float) -> np.ndarray:
+    """row.get(name) or default — None / 0 → default."""
+    values = pd.to_numeric(frame[name], errors='coerce').to_numpy(dtype=np.float64)
+    return np.where(np.isnan(values) | (values == 0), default, values)
+
+
+def talent_rows_to_arrays(rows: list[dict] | pd.DataFrame) -> dict[str, np.ndarray]:
+    """talent_player_current rows (dict list 또는 DataFrame) → TalentStateManager.to_arrays() 형식.
+
+    (player_id, talent_type) pivot을 한 번의 scatter로 수행 (선수는 첫 등장 순).
+    없는 차원은 DEFAULT_ELO / 0, 같은 칸이 중복되면 마지막 행 우선.
+    DB에는 season 값만 있으므로 event_count / pa_count는 season·career 공통.
+    """
+    frame = pd.DataFrame(rows, columns=TALENT_CURRENT_COLUMNS)
+    arrays: dict[str, np.ndarray] = {}
+    for role, dim_names in (('batter', BATTER_DIM_NAMES), ('pitcher', PITCHER_DIM_NAMES)):
+        part = frame[(frame['player_role'] == role) & frame['talent_type'].isin(dim_names)]
+        player_codes, player_ids = pd.factorize(part['player_id'], sort=False)
+        dim_codes = pd.Categorical(part['talent_type'], categories=dim_names).codes
+        shape = (len(player_ids), len(dim_names))
+
+        elo = {}
+        for scope in ('season', 'career'):
+            elo[scope] = np.full(shape, DEFAULT_ELO)
+            elo[scope][player_codes, dim_codes] = _or_default_column(part, f'{scope}_elo', DEFAULT_ELO)
+        counts = np.zeros(shape)
+        counts[player_codes, dim_codes] = _or_default_column(part, 'event_count', 0.0)
+        pa = np.zeros(len(player_ids), dtype=np.int64)
+        pa[player_codes] = _or_default_column(part, 'pa_count', 0.0).astype(np.int64)
+
+        arrays[f'{role}_id'] = np.asarray(player_ids, dtype=np.int64)
+        for scope in ('season', 'career'):
+            arrays[f'{role}_{scope}_elo'] = elo[scope]
+            arrays[f'{role}_{scope}_counts'] = counts.copy()
+            arrays[f'{role}_{scope}_pa'] = pa.copy()
+    arrays['pitcher_role'] = np.full(len(arrays['pitcher_id']), 'starter')
+    return arrays
+
+
+def load_current_talent_arrays(client) -> dict[str, np.ndarray]:
+    """Supabase talent_player_current → TalentBatch.restore_snapshot() 입력 배열."""
+    logger.info("Loading current talent ELO states from Supabase...")
+    frame = read_table(client, 'talent_player_current', ', '.join(TALENT_CURRENT_COLUMNS),
+                       key='player_id', unique=False)
+    arrays = talent_rows_to_arrays(frame)
+    logger.info(f"  Loaded {len(arrays['batter_id']):,} talent batter states, "
+                f"{len(arrays['pitcher_id']):,} talent pitcher states")
+    return arrays
+
+
 def load_current_talent_states(client) -> tuple[dict[int, DualBatterState], dict[int, DualPitcherState]]:
     """Supabase talent_player_current → DualBatterState/DualPitcherState dicts."""
-    logger.info("Loading current talent ELO states from Supabase...")
-    all_rows = []
-    page_size = 1000
-    offset = 0
-
-    while True:
-        response = (
-            client.table('talent_player_current')
-            .select('player_id, player_role, talent_type, season_elo, career_elo, event_count, pa_count')
-            .range(offset, offset + page_size - 1)
-            .execute()
-        )
-        rows = response.data
-        if not rows:
-            break
-        all_rows.extend(rows)
-        offset += page_size
-        if len(rows) < page_size:
-            break
-
-    batters: dict[int, DualBatterState] = {}
-    pitchers: dict[int, DualPitcherState] = {}
-
-    for row in all_rows:
-        pid = row['player_id']
-        role = row['player_role']
-        talent_type = row['talent_type']
-        season_elo = row.get('season_elo', DEFAULT_ELO) or DEFAULT_ELO
-        career_elo = row.get('career_elo', DEFAULT_ELO) or DEFAULT_ELO
-        event_count = row.get('event_count', 0) or 0
-        pa_count = row.get('pa_count', 0) or 0
-
-        if role == 'batter' and talent_type in BATTER_DIM_NAMES:
-            if pid not in batters:
-                batters[pid] = DualBatterState(player_id=pid)
-            idx = BATTER_DIM_NAMES.index(talent_type)
-            batters[pid].season.elo_dimensions[idx] = season_elo
-            batters[pid].career.elo_dimensions[idx] = career_elo
-            batters[pid].season.event_counts[idx] = event_count
-            batters[pid].career.event_counts[idx] = event_count
-            batters[pid].season.pa_count = pa_count
-            batters[pid].career.pa_count = pa_count
-
-        elif role == 'pitcher' and talent_type in PITCHER_DIM_NAMES:
-            if pid not in pitchers:
-                pitchers[pid] = DualPitcherState(player_id=pid)
-            idx = PITCHER_DIM_NAMES.index(talent_type)
-            pitchers[pid].season.elo_dimensions[idx] = season_elo
-            pitchers[pid].career.elo_dimensions[idx] = career_elo
-            pitchers[pid].season.event_counts[idx] = event_count
-            pitchers[pid].career.event_counts[idx] = event_count
-            pitchers[pid].season.bfp_count = pa_count
-            pitchers[pid].career.bfp_count = pa_count
-
-    logger.info(f"  Loaded {len(batters):,} talent batter states, {len(pitchers):,} talent pitcher states")
-    return batters, pitchers
-
-
-def _prepare_talent_pa_detail_records(details: list[dict]) -> list[dict]:
-    """talent_pa_detail records for upload."""
-    records = []
-    for d in details:
-        records.append({
-            'pa_id': int(d['pa_id']),
-            'player_id': int(d['player_id']),
-            'player_role': d['player_role'],
-            'talent_type': d['talent_type'],
-            'elo_before': round(float(d['elo_before']), 4),
-            'elo_after': round(float(d['elo_after']), 4),
-        })
-    return records
+    state_mgr = TalentStateManager.from_arrays(load_current_talent_arrays(client))
+    return state_mgr.all_batters, state_mgr.all_pitchers
+
+
+def _prepare_talent_pa_detail_records(details: DetailBuffer) -> list[dict]:
+    """talent_pa_detail records for upload (columnar buffer → dict)."""
+    return records_from_columns(
+        {
+            'pa_id': details.column('pa_id'),
+            'player_id': details.column('player_id'),
+            'player_role': details.column('player_role'),
+            'talent_type': details.column('talent_type'),
+            'elo_before': details.column('elo_before'),
+            'elo_after': details.column('elo_after'),
+        },
+        round_columns=['elo_before', 'elo_after'],
+    )
 
 
 def _prepare_talent_ohlc_records(ohlc_list: list[dict]) -> list[dict]:
     """talent_daily_ohlc records for upload."""
-    records = []
-    for ohlc in ohlc_list:
-        records.append({
-            'player_id': int(ohlc['player_id']),
-            'game_date': ohlc['game_date'],
-            'talent_type': ohlc['talent_type'],
-            'elo_type': ohlc.get('elo_type', 'SEASON'),
-            'open_elo': round(float(ohlc['open']), 4),
-            'high_elo': round(float(ohlc['high']), 4),
-            'low_elo': round(float(ohlc['low']), 4),
-            'close_elo': round(float(ohlc['close']), 4),
-            'total_pa': int(ohlc.get('total_pa', 0)),
-        })
-    return records
-
-
-def delete_date_data(client, target_date: date):
-    """날짜별 기존 데이터 삭제 (idempotent 재처리용).
-
-    삭제 순서: elo_pa_detail → daily_ohlc → plate_appearances (FK 의존성).
+    return records_from_columns(
+        {
+            'player_id': [o['player_id'] for o in ohlc_list],
+            'game_date': [o['game_date'] for o in ohlc_list],
+            'talent_type': [o['talent_type'] for o in ohlc_list],
+            'elo_type': [o.get('elo_type', 'SEASON') for o in ohlc_list],
+            'open_elo': [o['open'] for o in ohlc_list],
+            'high_elo': [o['high'] for o in ohlc_list],
+            'low_elo': [o['low'] for o in ohlc_list],
+            'close_elo': [o['close'] for o in ohlc_list],
+            'total_pa': [o.get('total_pa', 0) for o in ohlc_list],
+        },
+        int_columns=['player_id', 'total_pa'],
+        round_columns=['open_elo', 'high_elo', 'low_elo', 'close_elo'],
+    )
+
+
+DELETE_CHUNK_SIZE = 200
+DELETE_WORKERS = 4
+
+
+def delete_date_data(client, target_date: date, workers: int = DELETE_WORKERS) -> dict[str, int]:
+    """날짜별 기존 데이터 삭제 (idempotent 재처리용) → 테이블별 삭제 행 수.
+
+    삭제 순서: elo_pa_detail / talent_pa_detail → daily_ohlc / talent_daily_ohlc →
+    plate_appearances (FK 의존성). delete_date_data RPC(migration 007)가 있으면 요청 1회,
+    RPC가 없으면(PGRST202 / 404) pa_id chunk 삭제를 workers개 동시에 실행.
+    그 외 RPC 오류(timeout, 권한 등)는 그대로 raise.
     """
     date_str = target_date.isoformat()
     logger.info(f"Deleting existing data for {date_str}...")
 
+    try:
+        response = client.rpc('delete_date_data', {'p_game_date': date_str}).execute()
+    except Exception as e:
+        if not is_missing_function(e):
+            raise
+        logger.info(f"  delete_date_data RPC unavailable ({e}); falling back to chunked deletes")
+        return _delete_date_data_chunked(client, date_str, workers)
+    deleted = {row['table_name']: int(row['deleted']) for row in response.data}
+    logger.info(f"  Deleted via RPC: {deleted}")
+    return deleted
+
+
+def _delete_date_data_chunked(client, date_str: str, workers: int) -> dict[str, int]:
+    """RPC 없는 backend용: pa_id chunk 단위 detail 삭제를 병렬로, 나머지는 game_date 필터 1회씩."""
     # 1. 해당 날짜 PA ID 목록 조회
-    pa_ids = []
-    offset = 0
-    page_size = 1000
-    while True:
-        response = (
-            client.table('plate_appearances')
-            .select('pa_id')
-            .eq('game_date', date_str)
-            .range(offset, offset + page_size - 1)
-            .execute()
+    pa_ids = read_table(client, 'plate_appearances', 'pa_id', key='pa_id',
+                        filters=[('eq', 'game_date', date_str)], workers=1)['pa_id'].tolist()
+
+    def delete_chunk(task: tuple[str, list]) -> int:
+        table_name, chunk = task
+        response = client.table(table_name).delete().in_('pa_id', chunk).execute()
+        return len(response.data or [])
+
+    # 2. elo_pa_detail / talent_pa_detail 삭제 (pa_id chunk, 병렬)
+    deleted = {'elo_pa_detail': 0, 'talent_pa_detail': 0}
+    tasks = [
+        (table_name, pa_ids[i:i + DELETE_CHUNK_SIZE])
+        for table_name in deleted for i in range(0, len(pa_ids), DELETE_CHUNK_SIZE)
+    ]
+    if tasks:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for (table_name, _), n in zip(tasks, pool.map(delete_chunk, tasks)):
+                deleted[table_name] += n
+
+    # 3. daily_ohlc / talent_daily_ohlc → 4. plate_appearances (game_date 기준)
+    for table_name in ('daily_ohlc', 'talent_daily_ohlc', 'plate_appearances'):
+        response = client.table(table_name).delete().eq('game_date', date_str).execute()
+        deleted[table_name] = len(response.data or [])
+    logger.info(f"  Deleted ({len(pa_ids):,} PAs, {len(tasks)} chunk requests): {deleted}")
+    return deleted
+
+
+def load_plate_appearances(client, after: date) -> pd.DataFrame:
+    """after 이후(미포함) 날짜의 plate_appearances (convert_statcast_to_pa와 같은 정렬)."""
+    pa_df = read_table(client, 'plate_appearances', '*', key='pa_id',
+                       filters=[('gt', 'game_date', after.isoformat())])
+    if pa_df.empty:
+        return pa_df
+    return pa_df.sort_values(['game_date', 'game_pk', 'at_bat_number'], kind='stable').reset_index(drop=True)
+
+
+# remote 상태 내용 signal (이 값이 없으면 local state cache를 믿지 않음)
+WATERMARK_CHECKSUM_KEYS = ('player_elo_checksum', 'talent_checksum')
+
+
+def fetch_state_watermark(client) -> dict:
+    """Remote 상태 watermark: 마지막 PA 날짜 + player_elo / talent_player_current row 수 / checksum.
+
+    checksum(state_checksum RPC, migration 008)은 row 수가 같아도 값이 바뀌면
+    (run_elo.py 전체 재업로드, 설정 변경) 달라짐. RPC가 없으면 checksum None.
+    """
+    last = (
+        client.table('plate_appearances')
+        .select('game_date')
+        .order('game_date', desc=True)
+        .limit(1)
+        .execute()
+    )
+    watermark = {'last_date': str(last.data[0]['game_date'])[:10] if last.data else None}
+
+    try:
+        rows = client.rpc('state_checksum', {}).execute().data
+    except Exception as e:
+        if not is_missing_function(e):
+            raise
+        logger.info(f"  state_checksum RPC unavailable ({e}); local state cache disabled")
+        elo_count = client.table('player_elo').select('player_id', count='exact').limit(1).execute()
+        talent_count = client.table('talent_player_current').select('player_id', count='exact').limit(1).execute()
+        return {
+            **watermark,
+            'player_elo_rows': int(elo_count.count or 0),
+            'talent_rows': int(talent_count.count or 0),
+            'player_elo_checksum': None,
+            'talent_checksum': None,
+        }
+
+    by_table = {row['table_name']: row for row in rows or []}
+    elo = by_table.get('player_elo', {})
+    talent = by_table.get('talent_player_current', {})
+    return {
+        **watermark,
+        'player_elo_rows': int(elo.get('row_count') or 0),
+        'talent_rows': int(talent.get('row_count') or 0),
+        'player_elo_checksum': elo.get('checksum'),
+        'talent_checksum': talent.get('checksum'),
+    }
+
+
+def _replay_snapshot_date(store: SnapshotStore, target_date: date, watermark: dict) -> Optional[date]:
+    """force 재처리 시작 snapshot 날짜 (target_date 이전 마지막, ELO / talent 모두 있을 때만).
+
+    store에 기록된 watermark가 현재 remote watermark(checksum 포함)와 다르면 snapshot은
+    stale (run_elo.py 재계산, 다른 머신의 실행) → None. 아무것도 삭제하지 않음
+    (target_date 이후 snapshot은 replay가 다시 저장한 뒤 _commit_snapshots에서 정리).
+    """
+    if not all(watermark.get(k) for k in WATERMARK_CHECKSUM_KEYS):
+        logger.warning("  Remote state checksum unavailable; cannot validate state snapshots")
+        return None
+    if not store.matches(watermark):
+        logger.warning("  State snapshots do not match the remote state (rebuilt or updated elsewhere)")
+        return None
+    elo_date = store.latest_before('elo', target_date)
+    talent_date = store.latest_before('talent', target_date)
+    if elo_date is None or talent_date != elo_date:
+        return None
+    return elo_date
+
+
+def _require_replay_base(replay_from: Optional[date], target: str, reapply_without_snapshot: bool) -> None:
+    """force인데 replay할 snapshot이 없으면 (삭제 전에) 중단, opt-in이면 경고만."""
+    if replay_from is not None:
+        return
+    if not reapply_without_snapshot:
+        raise RuntimeError(
+            f"No state snapshot before {target} matches the remote state: re-applying {target} on the "
+            f"current player_elo / talent state would count it twice. Rebuild with scripts/run_elo.py, "
+            f"or pass reapply_without_snapshot=True (--reapply-without-snapshot) to accept that."
         )
-        rows = response.data
-        if not rows:
-            break
-        pa_ids.extend(r['pa_id'] for r in rows)
-        offset += page_size
-        if len(rows) < page_size:
-            break
-
-    if pa_ids:
-        # 2. elo_pa_detail 삭제 (pa_id 기준)
-        batch_size = 100
-        for i in range(0, len(pa_ids), batch_size):
-            batch = pa_ids[i:i + batch_size]
-            client.table('elo_pa_detail').delete().in_('pa_id', batch).execute()
-        logger.info(f"  Deleted {len(pa_ids)} elo_pa_detail records")
-
-        # 2b. talent_pa_detail 삭제 (pa_id 기준)
-        for i in range(0, len(pa_ids), batch_size):
-            batch = pa_ids[i:i + batch_size]
-            client.table('talent_pa_detail').delete().in_('pa_id', batch).execute()
-        logger.info(f"  Deleted {len(pa_ids)} talent_pa_detail records")
-
-    # 3. daily_ohlc 삭제 (game_date 기준)
-    client.table('daily_ohlc').delete().eq('game_date', date_str).execute()
-    logger.info(f"  Deleted daily_ohlc for {date_str}")
-
-    # 3b. talent_daily_ohlc 삭제 (game_date 기준)
-    client.table('talent_daily_ohlc').delete().eq('game_date', date_str).execute()
-    logger.info(f"  Deleted talent_daily_ohlc for {date_str}")
-
-    # 4. plate_appearances 삭제
-    client.table('plate_appearances').delete().eq('game_date', date_str).execute()
-    logger.info(f"  Deleted plate_appearances for {date_str}")
-
-
-def _prepare_pa_detail_records(pa_details: list[dict]) -> list[dict]:
-    """elo_pa_detail 레코드 변환 (run_elo.py 로직 재사용)."""
-    records = []
-    for d in pa_details:
-        records.append({
-            'pa_id': int(d['pa_id']),
-            'batter_id': int(d['batter_id']),
-            'pitcher_id': int(d['pitcher_id']),
-            'result_type': d['result_type'],
-            'batter_elo_before': round(d['batter_elo_before'], 4),
-            'batter_elo_after': round(d['batter_elo_after'], 4),
-            'pitcher_elo_before': round(d['pitcher_elo_before'], 4),
-            'pitcher_elo_after': round(d['pitcher_elo_after'], 4),
-            'on_base_delta': round(d['elo_delta'], 4),
+    logger.warning(f"  No state snapshot before {target}: re-applying on current player_elo state")
+
+
+def _commit_snapshots(store: SnapshotStore, watermark: dict,
+                      replay_start: Optional[date] = None, replayed_dates: Iterable[str] = ()) -> None:
+    """성공한 실행 끝: replay가 다시 쓰지 않은 replay_start 이후 snapshot 삭제 + remote watermark 기록."""
+    if replay_start is not None:
+        for kind in SNAPSHOT_KINDS:
+            store.discard_from(kind, replay_start, keep=replayed_dates)
+    store.save_watermark(watermark)
+
+
+def _replay_frame(client, replay_from: date, fresh_df: pd.DataFrame) -> pd.DataFrame:
+    """snapshot(replay_from) 이후 replay할 PA 전체 (날짜 순).
+
+    snapshot이 D-1보다 오래됐으면 그 사이 처리된 날짜도 포함해야 상태가 이어짐:
+    replay_from 이후 저장된 plate_appearances를 읽고, fresh_df 날짜는 새로 fetch한 행으로 교체.
+    """
+    stored = load_plate_appearances(client, after=replay_from)
+    if stored.empty:
+        return fresh_df
+    stored = stored[~np.isin(game_date_strings(stored), game_date_strings(fresh_df))]
+    frame = pd.concat([stored, fresh_df], ignore_index=True)
+    order = np.argsort(game_date_strings(frame), kind='stable')
+    return frame.iloc[order].reset_index(drop=True)
+
+
+def _prepare_pa_detail_records(pa_details: DetailBuffer) -> list[dict]:
+    """elo_pa_detail 레코드 변환 (컬럼 버퍼 → dict, run_elo.py 로직 재사용)."""
+    return records_from_columns(
+        {
+            'pa_id': pa_details.column('pa_id'),
+            'batter_id': pa_details.column('batter_id'),
+            'pitcher_id': pa_details.column('pitcher_id'),
+            'result_type': pa_details.column('result_type'),
+            'batter_elo_before': pa_details.column('batter_elo_before'),
+            'batter_elo_after': pa_details.column('batter_elo_after'),
+            'pitcher_elo_before': pa_details.column('pitcher_elo_before'),
+            'pitcher_elo_after': pa_details.column('pitcher_elo_after'),
+            'on_base_delta': pa_details.column('elo_delta'),
             'power_delta': 0.0,
-        })
-    return records
+        },
+        round_columns=['batter_elo_before', 'batter_elo_after', 'pitcher_elo_before',
+                       'pitcher_elo_after', 'on_base_delta'],
+    )
 
 
 def _prepare_ohlc_records(daily_ohlc) -> list[dict]:
     """daily_ohlc 레코드 변환 (run_elo.py 로직 재사용)."""
-    records = []
-    for ohlc in daily_ohlc:
-        records.append({
-            'player_id': int(ohlc.player_id),
-            'game_date': ohlc.game_date.isoformat(),
-            'elo_type': ohlc.elo_type,
-            'open': round(ohlc.open_elo, 4),
-            'high': round(ohlc.high_elo, 4),
-            'low': round(ohlc.low_elo, 4),
-            'close': round(ohlc.close_elo, 4),
-            'games_played': ohlc.games_played,
-            'total_pa': ohlc.total_pa,
-            'role': ohlc.role,
-        })
-    return records
-
-
-def run_daily_pipeline(target_date: date = None, force: bool = False) -> dict:
+    return records_from_columns(
+        {
+            'player_id': [o.player_id for o in daily_ohlc],
+            'game_date': [o.game_date for o in daily_ohlc],
+            'elo_type': [o.elo_type for o in daily_ohlc],
+            'open': [o.open_elo for o in daily_ohlc],
+            'high': [o.high_elo for o in daily_ohlc],
+            'low': [o.low_elo for o in daily_ohlc],
+            'close': [o.close_elo for o in daily_ohlc],
+            'games_played': [o.games_played for o in daily_ohlc],
+            'total_pa': [o.total_pa for o in daily_ohlc],
+            'role': [o.role for o in daily_ohlc],
+        },
+        int_columns=['player_id'],
+        round_columns=['open', 'high', 'low', 'close'],
+        date_columns=['game_date'],
+    )
+
+
+def _processed_dates(client, start_date: date, end_date: date) -> dict[str, int]:
+    """[start_date, end_date] 중 이미 처리된 날짜 → PA 수 (pa_id / game_date 컬럼만 조회)."""
+    frame = read_table(client, 'plate_appearances', 'game_date', key='pa_id', filters=[
+        ('gte', 'game_date', start_date.isoformat()),
+        ('lte', 'game_date', end_date.isoformat()),
+    ])
+    if frame.empty:
+        return {}
+    return frame['game_date'].astype(str).str[:10].value_counts(sort=False).to_dict()
+
+
+def _start_batches(client, store: SnapshotStore, cache: StateCache,
+                   replay_from: Optional[date], watermark: Optional[dict],
+                   elo_engine: str = DEFAULT_ELO_ENGINE) -> tuple[EloBatch, TalentBatch, str]:
+    """시작 상태가 복원된 (EloBatch, TalentBatch, state_source).
+
+    force replay는 snapshot, 아니면 watermark(checksum 포함)가 같은 local cache → 없으면 Supabase 페이징.
+    watermark는 당일 PA 업로드 전에 조회한 값 (캐시 저장 시점과 같은 기준).
+    """
+    elo_kwargs = dict(re24_baseline=RE24Baseline(), park_factor=ParkFactor(), snapshot_store=store,
+                      engine=elo_engine)
+    talent_batch = TalentBatch(storage='matrix', snapshot_store=store)
+
+    if replay_from is not None:
+        batch = EloBatch(**elo_kwargs)
+        batch.restore_snapshot(store.load('elo', replay_from))
+        talent_batch.restore_snapshot(store.load('talent', replay_from))
+        return batch, talent_batch, 'snapshot'
+
+    has_checksum = watermark is not None and all(watermark.get(k) for k in WATERMARK_CHECKSUM_KEYS)
+    cached = cache.load(watermark) if has_checksum else None
+    if cached is not None:
+        logger.info(f"  Loaded states from local cache ({cached.watermark})")
+        batch = EloBatch(**elo_kwargs)
+        batch.restore_snapshot(cached.elo)
+        talent_batch.restore_snapshot(cached.talent)
+        return batch, talent_batch, 'cache'
+
+    batch = EloBatch(initial_states=load_current_elo_states(client), **elo_kwargs)
+    talent_batch.restore_snapshot(load_current_talent_arrays(client))
+    return batch, talent_batch, 'supabase'
+
+
+def _upload_batch_outputs(client, batch: EloBatch, talent_batch: TalentBatch,
+                          metrics: StageMetrics) -> dict:
+    """EloBatch / TalentBatch 출력 업로드 → 테이블별 업로드 수 (레코드 변환 포함 테이블별 stage)."""
+    # player_elo (active_only=True → 이번 실행에 활동한 선수만)
+    logger.info("  Uploading player_elo (active only)...")
+    with metrics.stage('upload_player_elo') as stage:
+        player_records = batch.get_player_elo_records(active_only=True)
+        elo_uploaded = stage.rows = upload_table(client, 'player_elo', player_records)
+
+    logger.info("  Uploading elo_pa_detail...")
+    with metrics.stage('upload_elo_pa_detail') as stage:
+        pa_detail_records = _prepare_pa_detail_records(batch.pa_details)
+        detail_uploaded = stage.rows = upload_table(client, 'elo_pa_detail', pa_detail_records)
+
+    logger.info("  Uploading daily_ohlc...")
+    with metrics.stage('upload_daily_ohlc') as stage:
+        ohlc_records = _prepare_ohlc_records(batch.daily_ohlc)
+        ohlc_uploaded = stage.rows = upload_table(client, 'daily_ohlc', ohlc_records,
+                                                  on_conflict='player_id,game_date,elo_type,role')
+
+    logger.info("  Uploading talent_player_current (active only)...")
+    with metrics.stage('upload_talent_player_current') as stage:
+        talent_player_records = talent_batch.get_talent_player_records(active_only=True)
+        talent_player_uploaded = stage.rows = upload_table(client, 'talent_player_current',
+                                                           talent_player_records)
+
+    logger.info("  Uploading talent_pa_detail...")
+    with metrics.stage('upload_talent_pa_detail') as stage:
+        talent_detail_records = _prepare_talent_pa_detail_records(talent_batch.talent_pa_details)
+        talent_detail_uploaded = stage.rows = upload_table(client, 'talent_pa_detail', talent_detail_records,
+                                                           on_conflict='pa_id,player_id,talent_type')
+
+    logger.info("  Uploading talent_daily_ohlc...")
+    with metrics.stage('upload_talent_daily_ohlc') as stage:
+        talent_ohlc_records = _prepare_talent_ohlc_records(talent_batch.talent_daily_ohlc)
+        talent_ohlc_uploaded = stage.rows = upload_table(client, 'talent_daily_ohlc', talent_ohlc_records,
+                                                         on_conflict='player_id,game_date,talent_type,elo_type')
+
+    return {
+        'elo_uploaded': elo_uploaded,
+        'detail_uploaded': detail_uploaded,
+        'ohlc_uploaded': ohlc_uploaded,
+        'talent_player_uploaded': talent_player_uploaded,
+        'talent_detail_uploaded': talent_detail_uploaded,
+        'talent_ohlc_uploaded': talent_ohlc_uploaded,
+    }
+
+
+def _finish_metrics(result: dict, metrics: StageMetrics, labels: dict) -> dict:
+    """단계별 측정값을 결과 dict에 추가하고 로그 / metrics 파일에 기록."""
+    result['total_seconds'] = round(metrics.total_seconds, 3)
+    result['stages'] = metrics.summary()
+    metrics.log()
+    metrics.write(labels=labels)
+    return result
+
+
+def _register_new_players(pa_df: pd.DataFrame, client,
+                          known: Optional[KnownPlayerIndex] = None) -> int:
+    """known player index에 없는 선수만 Supabase 확인 → 신규 등록 후 index에 반영."""
+    known = known if known is not None else KnownPlayerIndex()
+    new_ids = detect_new_player_ids_batch(pa_df, client, known=known)
+    if not new_ids:
+        return 0
+    count = register_new_players(new_ids, pa_df, client)
+    known.add(new_ids)
+    known.save()
+    return count
+
+
+def run_daily_pipeline(target_date: date = None, force: bool = False,
+                       snapshot_store: Optional[SnapshotStore] = None,
+                       state_cache: Optional[StateCache] = None,
+                       refresh_statcast: bool = False,
+                       known_players: Optional[KnownPlayerIndex] = None,
+                       elo_engine: str = DEFAULT_ELO_ENGINE,
+                       reapply_without_snapshot: bool = False) -> dict:
     """메인 파이프라인.
 
     Args:
         target_date: 처리할 날짜 (None이면 어제)
         force: True면 이미 처리된 날짜도 삭제 후 재처리
+               (D 이전 마지막 snapshot 복원 → snapshot 이후 날짜 전체 replay)
+        snapshot_store: 날짜별 state snapshot 저장소 (None이면 SnapshotStore() 기본 경로)
+        state_cache: 최종 상태 local cache (None이면 StateCache() 기본 경로)
+        refresh_statcast: True면 로컬 Statcast 캐시를 무시하고 재수집
+        known_players: 등록 player_id local index (None이면 KnownPlayerIndex() 기본 경로)
+        elo_engine: EloBatch engine ('array' 기본, 'python' 루프와 결과 동일)
+        reapply_without_snapshot: force인데 유효한 snapshot이 없을 때 현재 상태 위에 D를 다시
+               적용 (이중 반영을 감수하는 opt-in; False면 RuntimeError, 아무것도 삭제하지 않음)
 
     Returns:
-        dict with status and stats
+        dict with status and stats (성공 시 'stages': 단계별 seconds / rows / rows_per_sec / peak RSS,
+        같은 값을 ELO_METRICS_FILE(JSON lines 또는 .prom)에도 기록)
     """
     from src.etl.fetch_statcast import get_yesterday
 
@@ -286,6 +551,11 @@ def run_daily_pipeline(target_date: date = None, force: bool = False) -> dict:
     logger.info(f"=== Daily ELO Pipeline: {date_str} ===")
 
     client = get_supabase_client()
+    store = snapshot_store or SnapshotStore()
+    cache = state_cache or StateCache()
+    metrics = StageMetrics('daily')
+    replay_from: Optional[date] = None
+    discard_start: Optional[date] = None    # force: 재처리 전 상태 기준 snapshot 시작 날짜
 
     # 1. Idempotency check
     existing = (
@@ -297,21 +567,28 @@ def run_daily_pipeline(target_date: date = None, force: bool = False) -> dict:
     )
     if existing.count and existing.count > 0:
         if force:
+            replay_from = _replay_snapshot_date(store, target_date, fetch_state_watermark(client))
+            _require_replay_base(replay_from, date_str, reapply_without_snapshot)
             logger.info(f"  Force mode: deleting existing {existing.count} PAs for {date_str}")
-            delete_date_data(client, target_date)
+            with metrics.stage('delete', rows=existing.count):
+                delete_date_data(client, target_date)
+            discard_start = target_date
         else:
             logger.info(f"  Already processed: {existing.count} PAs for {date_str}. Use --force to reprocess.")
             return {'status': 'already_processed', 'date': date_str, 'existing_pa_count': existing.count}
 
     # 2. Fetch Statcast
-    statcast_df = fetch_statcast_date(target_date)
+    with metrics.stage('fetch') as stage:
+        statcast_df = fetch_statcast_date(target_date, refresh=refresh_statcast)
+        stage.rows = len(statcast_df)
     if statcast_df.empty:
         logger.info(f"  No data for {date_str} (off-day or off-season)")
         return {'status': 'no_data', 'date': date_str}
 
     # 3. ETL: pitch → PA
     logger.info("  Converting pitches to plate appearances...")
-    pa_df = convert_statcast_to_pa(statcast_df)
+    with metrics.stage('convert', rows=len(statcast_df)):
+        pa_df = convert_statcast_to_pa(statcast_df)
     logger.info(f"  {len(pa_df):,} plate appearances")
 
     if pa_df.empty:
@@ -319,84 +596,204 @@ def run_daily_pipeline(target_date: date = None, force: bool = False) -> dict:
         return {'status': 'no_pa', 'date': date_str}
 
     # 4. 신규 선수 감지 + 등록
-    new_ids = detect_new_player_ids_batch(pa_df, client)
-    new_player_count = 0
-    if new_ids:
-        new_player_count = register_new_players(new_ids, pa_df, client)
+    with metrics.stage('register', rows=len(pa_df)):
+        new_player_count = _register_new_players(pa_df, client, known_players)
 
-    # 5. plate_appearances upsert
+    # 5. plate_appearances upsert (cache watermark는 업로드 전에 조회)
+    watermark = fetch_state_watermark(client) if replay_from is None else None
     logger.info("  Uploading plate appearances...")
-    pa_records = prepare_pa_records(pa_df)
-    pa_uploaded = upload_table(client, 'plate_appearances', pa_records)
-
-    # 6. 기존 ELO 상태 로드
-    initial_states = load_current_elo_states(client)
+    with metrics.stage('upload_plate_appearances') as stage:
+        pa_records = prepare_pa_records(pa_df)
+        pa_uploaded = stage.rows = upload_table(client, 'plate_appearances', pa_records)
+
+    # 6. 시작 상태: force 재처리는 snapshot 복원 + snapshot 이후 처리된 날짜 전체 replay,
+    #    아니면 watermark가 같은 local cache → 없으면 Supabase 페이징
+    with metrics.stage('state_load') as stage:
+        batch, talent_batch, state_source = _start_batches(client, store, cache, replay_from, watermark, elo_engine)
+        if replay_from is not None:
+            replay_df = _replay_frame(client, replay_from, pa_df)
+            logger.info(f"  Replaying {len(replay_df):,} PAs from snapshot {replay_from.isoformat()}")
+        else:
+            replay_df = pa_df
+        stage.rows = len(batch.players)
 
-    # 7. 증분 ELO 계산
+    # 7. 증분 ELO + Talent ELO (9D) 계산
     logger.info("  Running incremental ELO calculation...")
-    baseline = RE24Baseline()
-    park_factor = ParkFactor()
-    batch = EloBatch(
-        re24_baseline=baseline,
-        park_factor=park_factor,
-        initial_states=initial_states,
-    )
-    batch.process(pa_df)
+    with metrics.stage('elo_process', rows=len(replay_df)):
+        batch.process(replay_df)
+    logger.info("  Running incremental Talent ELO calculation...")
+    with metrics.stage('talent_process', rows=len(replay_df)):
+        talent_batch.process(replay_df)
 
-    # 8. 결과 업로드
-    # 8a. player_elo (active_only=True → 당일 활동 선수만)
-    logger.info("  Uploading player_elo (active only)...")
-    player_records = batch.get_player_elo_records(active_only=True)
-    elo_uploaded = upload_table(client, 'player_elo', player_records)
+    # 8. 결과 업로드: player_elo, elo_pa_detail, daily_ohlc, talent_*
+    uploads = _upload_batch_outputs(client, batch, talent_batch, metrics)
 
-    # 8b. elo_pa_detail
-    logger.info("  Uploading elo_pa_detail...")
-    pa_detail_records = _prepare_pa_detail_records(batch.pa_details)
-    detail_uploaded = upload_table(client, 'elo_pa_detail', pa_detail_records)
+    # 9. 최종 상태 → local cache, snapshot 정리 + watermark (업로드 후 remote watermark 기준)
+    with metrics.stage('state_save'):
+        final_watermark = fetch_state_watermark(client)
+        cache.save(final_watermark, batch.snapshot_state(), talent_batch.snapshot_state())
+        _commit_snapshots(store, final_watermark, discard_start, game_date_strings(replay_df))
 
-    # 8c. daily_ohlc
-    logger.info("  Uploading daily_ohlc...")
-    ohlc_records = _prepare_ohlc_records(batch.daily_ohlc)
-    ohlc_uploaded = upload_table(client, 'daily_ohlc', ohlc_records,
-                                 on_conflict='player_id,game_date,elo_type,role')
+    result = {
+        'status': 'success',
+        'date': date_str,
+        'pitches_fetched': len(statcast_df),
+        'pa_count': len(pa_df),
+        'new_players': new_player_count,
+        'replayed_from': replay_from.isoformat() if replay_from else None,
+        'replayed_pa_count': len(replay_df),
+        'state_source': state_source,
+        'active_players': len(batch._active_player_ids),
+        'pa_uploaded': pa_uploaded,
+        **uploads,
+    }
+    logger.info(f"  === Done: {result} ===")
+    return _finish_metrics(result, metrics, labels={'date': date_str})
 
-    # 9. Talent ELO (incremental 9D)
-    logger.info("  Running incremental Talent ELO calculation...")
-    initial_batters, initial_pitchers = load_current_talent_states(client)
-    talent_batch = TalentBatch(initial_batters=initial_batters, initial_pitchers=initial_pitchers)
-    talent_batch.process(pa_df)
 
-    # 9a. talent_player_current (active_only=True)
-    logger.info("  Uploading talent_player_current (active only)...")
-    talent_player_records = talent_batch.get_talent_player_records(active_only=True)
-    talent_player_uploaded = upload_table(client, 'talent_player_current', talent_player_records)
+def run_range_pipeline(start_date: date, end_date: date, force: bool = False,
+                       checkpoint_days: Optional[int] = None,
+                       snapshot_store: Optional[SnapshotStore] = None,
+                       state_cache: Optional[StateCache] = None,
+                       refresh_statcast: bool = False,
+                       known_players: Optional[KnownPlayerIndex] = None,
+                       elo_engine: str = DEFAULT_ELO_ENGINE,
+                       reapply_without_snapshot: bool = False) -> dict:
+    """날짜 범위 in-memory 처리 (장애 후 catch-up용).
 
-    # 9b. talent_pa_detail
-    logger.info("  Uploading talent_pa_detail...")
-    talent_detail_records = _prepare_talent_pa_detail_records(talent_batch.talent_pa_details)
-    talent_detail_uploaded = upload_table(client, 'talent_pa_detail', talent_detail_records,
-                                          on_conflict='pa_id,player_id,talent_type')
+    run_daily_pipeline을 날짜마다 호출하는 대신 범위 전체를 한 번에 fetch하고,
+    상태는 한 번만 로드해 EloBatch / TalentBatch를 날짜 간에 메모리에 유지.
+    업로드는 checkpoint_days일마다 (None이면 마지막에 한 번) 큰 batch로 flush.
 
-    # 9c. talent_daily_ohlc
-    logger.info("  Uploading talent_daily_ohlc...")
-    talent_ohlc_records = _prepare_talent_ohlc_records(talent_batch.talent_daily_ohlc)
-    talent_ohlc_uploaded = upload_table(client, 'talent_daily_ohlc', talent_ohlc_records,
-                                        on_conflict='player_id,game_date,talent_type,elo_type')
+    Args:
+        start_date, end_date: 처리 범위 (inclusive)
+        force: True면 범위 내 처리된 날짜 삭제 후 재처리
+               (start 이전 마지막 snapshot 복원 → snapshot 이후 처리된 날짜 + 범위 전체 replay)
+        checkpoint_days: flush 간격 (처리 날짜 수)
+        snapshot_store, state_cache, refresh_statcast, known_players, elo_engine,
+        reapply_without_snapshot: run_daily_pipeline과 동일
+
+    Returns:
+        dict with status, per-day PA counts ('days'), skipped dates, upload stats and
+        'stages' (checkpoint별 같은 단계는 합산)
+    """
+    start_str, end_str = start_date.isoformat(), end_date.isoformat()
+    logger.info(f"=== Range ELO Pipeline: {start_str} ~ {end_str} ===")
 
+    client = get_supabase_client()
+    store = snapshot_store or SnapshotStore()
+    cache = state_cache or StateCache()
+    metrics = StageMetrics('range')
+    replay_from: Optional[date] = None
+    discard_start: Optional[date] = None
+
+    # 1. Idempotency check (범위 전체 한 번)
+    processed = _processed_dates(client, start_date, end_date)
+    skipped: list[str] = []
+    if processed:
+        if force:
+            replay_from = _replay_snapshot_date(store, start_date, fetch_state_watermark(client))
+            _require_replay_base(replay_from, start_str, reapply_without_snapshot)
+            logger.info(f"  Force mode: deleting {len(processed)} processed dates in range")
+            with metrics.stage('delete', rows=sum(processed.values())):
+                for day in sorted(processed):
+                    delete_date_data(client, date.fromisoformat(day))
+            discard_start = start_date
+        else:
+            skipped = sorted(processed)
+            logger.info(f"  Already processed, skipping: {', '.join(skipped)}. Use --force to reprocess.")
+
+    # 2-3. Fetch + ETL (범위 전체 한 번)
+    with metrics.stage('fetch') as stage:
+        statcast_df = fetch_statcast_range(start_date, end_date, refresh=refresh_statcast)
+        stage.rows = len(statcast_df)
+    with metrics.stage('convert', rows=len(statcast_df)):
+        pa_df = convert_statcast_to_pa(statcast_df) if not statcast_df.empty else pd.DataFrame()
+    if not pa_df.empty and skipped:
+        pa_df = pa_df[~np.isin(game_date_strings(pa_df), skipped)].reset_index(drop=True)
+    if pa_df.empty:
+        logger.info(f"  No new PAs for {start_str} ~ {end_str}")
+        return {'status': 'no_data', 'start': start_str, 'end': end_str, 'days': [], 'skipped': skipped}
+    pa_dates = pd.Series(game_date_strings(pa_df))
+    days = sorted(pa_dates.unique())
+    logger.info(f"  {len(pa_df):,} plate appearances over {len(days)} dates")
+
+    # 4. 신규 선수 감지 + 등록 (한 번)
+    with metrics.stage('register', rows=len(pa_df)):
+        new_player_count = _register_new_players(pa_df, client, known_players)
+
+    # 5. 시작 상태 (한 번, PA 업로드 전 watermark 기준)
+    watermark = fetch_state_watermark(client) if replay_from is None else None
+    with metrics.stage('state_load') as stage:
+        batch, talent_batch, state_source = _start_batches(client, store, cache, replay_from, watermark, elo_engine)
+        # force replay: snapshot 이후 처리된 날짜 중 범위 앞 / 뒤 PA (범위 안은 새로 fetch한 pa_df)
+        earlier_df = later_df = pd.DataFrame()
+        if replay_from is not None:
+            stored = load_plate_appearances(client, after=replay_from)
+            if not stored.empty:
+                stored_dates = game_date_strings(stored)
+                earlier_df = stored[stored_dates < start_str].reset_index(drop=True)
+                later_df = stored[stored_dates > end_str].reset_index(drop=True)
+        stage.rows = len(batch.players)
+
+    # 6. checkpoint 단위: 계산 → plate_appearances → 결과 flush
+    step = checkpoint_days or len(days)
+    totals: dict[str, int] = {'pa_uploaded': 0}
+    active: set[int] = set()
+    for i in range(0, len(days), step):
+        chunk_days = days[i:i + step]
+        chunk_df = pa_df[pa_dates.isin(chunk_days).to_numpy()].reset_index(drop=True)
+        parts = [chunk_df]
+        if i == 0 and not earlier_df.empty:
+            parts.insert(0, earlier_df)
+            logger.info(f"  Replaying {len(earlier_df):,} earlier PAs from snapshot {replay_from.isoformat()}")
+        if i + step >= len(days) and not later_df.empty:
+            parts.append(later_df)
+            logger.info(f"  Replaying {len(later_df):,} later PAs from snapshot {replay_from.isoformat()}")
+        replay_df = pd.concat(parts, ignore_index=True) if len(parts) > 1 else chunk_df
+
+        logger.info(f"  Processing {chunk_days[0]} ~ {chunk_days[-1]} ({len(chunk_df):,} PAs)...")
+        with metrics.stage('elo_process', rows=len(replay_df)):
+            batch.process(replay_df)
+        with metrics.stage('talent_process', rows=len(replay_df)):
+            talent_batch.process(replay_df)
+
+        logger.info("  Uploading plate appearances...")
+        with metrics.stage('upload_plate_appearances') as stage:
+            stage.rows = upload_table(client, 'plate_appearances', prepare_pa_records(chunk_df))
+        totals['pa_uploaded'] += stage.rows
+        for key, count in _upload_batch_outputs(client, batch, talent_batch, metrics).items():
+            totals[key] = totals.get(key, 0) + count
+        active |= batch._active_player_ids
+        batch.reset_outputs()
+        talent_batch.reset_outputs()
+
+    # 7. 최종 상태 → local cache, snapshot 정리 + watermark
+    with metrics.stage('state_save'):
+        final_watermark = fetch_state_watermark(client)
+        cache.save(final_watermark, batch.snapshot_state(), talent_batch.snapshot_state())
+        replayed_dates = set(days)
+        for part in (earlier_df, later_df):
+            if not part.empty:
+                replayed_dates.update(game_date_strings(part))
+        _commit_snapshots(store, final_watermark, discard_start, replayed_dates)
+
+    day_counts = pa_dates.value_counts()
     result = {
         'status': 'success',
-        'date': date_str,
+        'start': start_str,
+        'end': end_str,
+        'days': [{'date': day, 'pa_count': int(day_counts[day])} for day in days],
+        'skipped': skipped,
         'pitches_fetched': len(statcast_df),
         'pa_count': len(pa_df),
         'new_players': new_player_count,
-        'active_players': len(batch._active_player_ids),
-        'pa_uploaded': pa_uploaded,
-        'elo_uploaded': elo_uploaded,
-        'detail_uploaded': detail_uploaded,
-        'ohlc_uploaded': ohlc_uploaded,
-        'talent_player_uploaded': talent_player_uploaded,
-        'talent_detail_uploaded': talent_detail_uploaded,
-        'talent_ohlc_uploaded': talent_ohlc_uploaded,
+        'replayed_from': replay_from.isoformat() if replay_from else None,
+        'replayed_pa_count': len(earlier_df) + len(pa_df) + len(later_df),
+        'state_source': state_source,
+        'active_players': len(active),
+        'checkpoints': -(-len(days) // step),
+        **totals,
     }
     logger.info(f"  === Done: {result} ===")
-    return result
+    return _finish_metrics(result, metrics, labels={'start': start_str, 'end': end_str})
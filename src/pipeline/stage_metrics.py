@@ -0,0 +1,183 @@
+"""Pipeline Stage Metrics — 단계별 wall time / 처리량 / peak RSS 기록.
+
+run_daily_pipeline / run_range_pipeline의 각 단계(fetch, convert, register, PA upsert,
+state load, EloBatch.process, 테이블별 upload, talent 계산 / upload ...)를 감싸서
+
+    seconds       단계 wall time (같은 이름이 여러 번이면 합계, range checkpoint 등)
+    rows          처리 행 수 (단계가 지정, 없으면 None)
+    rows_per_sec  rows / seconds
+    peak_rss_mb   단계 종료 시점 프로세스 peak RSS (getrusage ru_maxrss, 단조 증가)
+    rss_growth_mb 단계 중 peak RSS 증가분 (0보다 크면 이 단계가 최고치 갱신)
+
+을 모으고, 결과 dict의 'stages'와 metrics 파일에 기록해 날짜별 추이를 볼 수 있게 함.
+
+metrics 파일 (ELO_METRICS_FILE로 변경, 기본 data/metrics/pipeline_metrics.jsonl):
+    *.prom   Prometheus textfile (node_exporter textfile collector, 실행마다 덮어씀)
+    그 외    JSON lines (실행마다 1줄 append)
+
+Usage:
+    metrics = StageMetrics('daily')
+    with metrics.stage('fetch') as stage:
+        df = fetch(...)
+        stage.rows = len(df)
+    result['stages'] = metrics.summary()
+    metrics.write(labels={'date': date_str})
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRICS_PATH = Path(__file__).parent.parent.parent / 'data' / 'metrics' / 'pipeline_metrics.jsonl'
+METRIC_PREFIX = 'elo_pipeline'
+
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """프로세스 peak RSS (bytes, 측정 불가면 None). Linux ru_maxrss는 KB, macOS는 bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return None if value is None else round(value / 2**20, 1)
+
+
+class StageRun:
+    """with metrics.stage(...) 블록 안에서 rows를 채우는 handle."""
+
+    def __init__(self, rows: Optional[int] = None):
+        self.rows = rows
+
+
+class StageMetrics:
+    """이름별 단계 측정값 누적 (삽입 순서 유지)."""
+
+    def __init__(self, pipeline: str):
+        self.pipeline = pipeline
+        self.stages: dict[str, dict] = {}
+        self._started = time.perf_counter()
+        self._wall_started = time.time()
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None) -> Iterator[StageRun]:
+        run = StageRun(rows)
+        rss_before = peak_rss_bytes()
+        started = time.perf_counter()
+        try:
+            yield run
+        finally:
+            self.record(name, time.perf_counter() - started, run.rows, rss_before, peak_rss_bytes())
+
+    def record(self, name: str, seconds: float, rows: Optional[int] = None,
+               rss_before: Optional[int] = None, rss_after: Optional[int] = None) -> dict:
+        entry = self.stages.setdefault(name, {'seconds': 0.0, 'rows': None, 'calls': 0,
+                                              'peak_rss_bytes': None, 'rss_growth_bytes': 0})
+        entry['seconds'] += seconds
+        entry['calls'] += 1
+        if rows is not None:
+            entry['rows'] = (entry['rows'] or 0) + int(rows)
+        if rss_after is not None:
+            entry['peak_rss_bytes'] = max(entry['peak_rss_bytes'] or 0, rss_after)
+            if rss_before is not None:
+                entry['rss_growth_bytes'] += rss_after - rss_before
+        return entry
+
+    @property
+    def total_seconds(self) -> float:
+        return time.perf_counter() - self._started
+
+    def summary(self) -> dict[str, dict]:
+        """단계 이름 → {seconds, rows, rows_per_sec, peak_rss_mb, rss_growth_mb, calls}."""
+        out = {}
+        for name, entry in self.stages.items():
+            seconds, rows = entry['seconds'], entry['rows']
+            out[name] = {
+                'seconds': round(seconds, 3),
+                'rows': rows,
+                'rows_per_sec': round(rows / seconds, 1) if rows is not None and seconds > 0 else None,
+                'peak_rss_mb': _mb(entry['peak_rss_bytes']),
+                'rss_growth_mb': _mb(entry['rss_growth_bytes']),
+                'calls': entry['calls'],
+            }
+        return out
+
+    def log(self) -> None:
+        for name, s in self.summary().items():
+            rate = f", {s['rows_per_sec']:,.0f} rows/s" if s['rows_per_sec'] is not None else ''
+            logger.info(f"  [{name}] {s['seconds']:.2f}s{rate}, peak RSS {s['peak_rss_mb']} MB")
+
+    def to_json_line(self, labels: Optional[dict] = None) -> str:
+        record = {
+            'pipeline': self.pipeline,
+            'timestamp': self._wall_started,
+            **(labels or {}),
+            'total_seconds': round(self.total_seconds, 3),
+            'stages': self.summary(),
+        }
+        return json.dumps(record, default=str)
+
+    def to_prometheus(self, labels: Optional[dict] = None) -> str:
+        """Prometheus text exposition format (gauge per stage)."""
+        base = {'pipeline': self.pipeline, **(labels or {})}
+
+        def fmt(extra: dict) -> str:
+            items = {**base, **extra}
+            return ','.join(f'{k}="{_escape(v)}"' for k, v in items.items())
+
+        series = [
+            ('stage_seconds', 'Wall time per pipeline stage', lambda e: e['seconds']),
+            ('stage_rows', 'Rows processed per pipeline stage', lambda e: e['rows']),
+            ('stage_rows_per_second', 'Throughput per pipeline stage',
+             lambda e: e['rows'] / e['seconds'] if e['rows'] is not None and e['seconds'] > 0 else None),
+            ('stage_peak_rss_bytes', 'Process peak RSS at the end of the stage', lambda e: e['peak_rss_bytes']),
+        ]
+        lines = []
+        for metric, help_text, value_of in series:
+            name = f"{METRIC_PREFIX}_{metric}"
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            for stage, entry in self.stages.items():
+                value = value_of(entry)
+                if value is not None:
+                    lines.append(f"{name}{{{fmt({'stage': stage})}}} {value:g}")
+        for metric, help_text, value in (
+            ('total_seconds', 'Wall time of the whole pipeline run', self.total_seconds),
+            ('last_run_timestamp_seconds', 'Start time of the last pipeline run', self._wall_started),
+        ):
+            name = f"{METRIC_PREFIX}_{metric}"
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name}{{{fmt({})}}} {value:.3f}"]
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: Union[Path, str, None] = None, labels: Optional[dict] = None) -> Optional[Path]:
+        """metrics 파일 기록 (.prom → 덮어쓰기, 그 외 → JSON line append). 실패 시 경고만."""
+        path = Path(path) if path else Path(os.environ.get('ELO_METRICS_FILE', DEFAULT_METRICS_PATH))
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.suffix == '.prom':
+                tmp = path.with_suffix('.prom.tmp')
+                tmp.write_text(self.to_prometheus(labels))
+                os.replace(tmp, path)
+            else:
+                with open(path, 'a') as f:
+                    f.write(self.to_json_line(labels) + '\n')
+        except OSError as e:
+            logger.warning(f"  Pipeline metrics not written ({e})")
+            return None
+        return path
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
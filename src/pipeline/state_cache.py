@@ -0,0 +1,117 @@
+"""Local Warm-State Cache — 마지막 파이프라인 실행의 최종 ELO / talent 상태.
+
+run_daily_pipeline은 매번 player_elo / talent_player_current 전체를 1,000행씩
+페이징해서 상태를 복원. 실행이 끝날 때 최종 상태(EloBatch.snapshot_state,
+TalentBatch.snapshot_state)를 remote watermark와 함께 npz 한 파일로 저장하고,
+다음 실행에서 watermark가 같으면 Supabase 대신 이 파일에서 복원.
+row 수만으로는 값이 바뀐 재업로드를 구분 못 하므로 watermark에 remote checksum
+(state_checksum RPC)을 포함하고, scripts/run_elo.py 전체 재계산은 캐시를 삭제.
+
+파일 구성:
+    _version        STATE_CACHE_VERSION (다르면 stale)
+    _watermark      JSON (last_date, player_elo / talent_player_current row 수 / checksum)
+    _content_hash   상태 배열 sha256 (불일치 시 stale)
+    elo__*          EloBatch.snapshot_state() 배열
+    talent__*       TalentBatch.snapshot_state() 배열
+
+Usage:
+    cache = StateCache()
+    cached = cache.load(watermark)        # None이면 Supabase에서 로드
+    ...
+    cache.save(watermark, batch.snapshot_state(), talent_batch.snapshot_state())
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+STATE_CACHE_VERSION = 1
+DEFAULT_STATE_CACHE_PATH = Path(__file__).parent.parent.parent / 'data' / 'cache' / 'state_cache.npz'
+
+_SECTIONS = ('elo', 'talent')
+
+
+class CachedState(NamedTuple):
+    """캐시에서 복원한 상태 (EloBatch / TalentBatch.restore_snapshot 입력)."""
+    elo: dict[str, np.ndarray]
+    talent: dict[str, np.ndarray]
+    watermark: dict
+
+
+def content_hash(sections: dict[str, dict[str, np.ndarray]]) -> str:
+    """상태 배열 sha256 (section / 배열 이름 순, dtype + shape + bytes)."""
+    digest = hashlib.sha256()
+    for section in sorted(sections):
+        for name in sorted(sections[section]):
+            arr = np.ascontiguousarray(sections[section][name])
+            digest.update(f"{section}/{name}/{arr.dtype.str}/{arr.shape}".encode())
+            digest.update(arr.tobytes())
+    return digest.hexdigest()
+
+
+def _normalize_watermark(watermark: dict) -> dict:
+    return json.loads(json.dumps(watermark, sort_keys=True, default=str))
+
+
+class StateCache:
+    """버전 / watermark / content hash로 검증하는 단일 npz 상태 캐시."""
+
+    def __init__(self, path: Union[Path, str, None] = None):
+        self.path = Path(path) if path else Path(os.environ.get('ELO_STATE_CACHE', DEFAULT_STATE_CACHE_PATH))
+
+    def save(self, watermark: dict, elo: dict[str, np.ndarray], talent: dict[str, np.ndarray]) -> Path:
+        """최종 상태 저장 (임시 파일 → rename)."""
+        sections = {'elo': elo, 'talent': talent}
+        arrays = {
+            f"{section}__{name}": value
+            for section, values in sections.items() for name, value in values.items()
+        }
+        arrays['_version'] = np.array(STATE_CACHE_VERSION)
+        arrays['_watermark'] = np.array(json.dumps(_normalize_watermark(watermark), sort_keys=True))
+        arrays['_content_hash'] = np.array(content_hash(sections))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, self.path)
+        return self.path
+
+    def load(self, watermark: Optional[dict] = None) -> Optional[CachedState]:
+        """캐시 상태 반환. 파일 없음 / 버전·hash 불일치 / watermark 불일치면 None."""
+        if not self.path.exists():
+            return None
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError) as e:
+            logger.warning(f"  State cache unreadable ({e}); ignoring")
+            return None
+
+        if int(arrays.pop('_version', -1)) != STATE_CACHE_VERSION:
+            logger.info("  State cache version mismatch; ignoring")
+            return None
+        cached_watermark = json.loads(str(arrays.pop('_watermark')))
+        stored_hash = str(arrays.pop('_content_hash'))
+        sections: dict[str, dict[str, np.ndarray]] = {section: {} for section in _SECTIONS}
+        for key, value in arrays.items():
+            section, _, name = key.partition('__')
+            if section in sections:
+                sections[section][name] = value
+        if content_hash(sections) != stored_hash:
+            logger.warning("  State cache content hash mismatch; ignoring")
+            return None
+        if watermark is not None and cached_watermark != _normalize_watermark(watermark):
+            logger.info(f"  State cache stale (cached {cached_watermark}, remote {watermark})")
+            return None
+        return CachedState(elo=sections['elo'], talent=sections['talent'], watermark=cached_watermark)
+
+    def invalidate(self) -> None:
+        if self.path.exists():
+            self.path.unlink()
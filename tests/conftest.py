@@ -0,0 +1,178 @@
+"""Shared pytest fixtures."""
+import threading
+
+import pytest
+from postgrest.exceptions import APIError
+
+
+@pytest.fixture(autouse=True)
+def _isolated_statcast_cache(tmp_path, monkeypatch):
+    """Statcast 캐시를 테스트별 임시 디렉토리로 (data/statcast 오염 방지)."""
+    monkeypatch.setenv('STATCAST_CACHE_DIR', str(tmp_path / 'statcast_cache'))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_player_metadata_cache(tmp_path, monkeypatch):
+    """선수 / 팀 메타데이터 캐시를 테스트별 임시 파일로 (process memo 초기화)."""
+    import src.etl.player_registry as player_registry
+
+    monkeypatch.setenv('PLAYER_METADATA_CACHE', str(tmp_path / 'player_metadata.json'))
+    monkeypatch.setattr(player_registry, '_TEAM_MAP', {})
+
+
+@pytest.fixture(autouse=True)
+def _isolated_known_player_index(tmp_path, monkeypatch):
+    """등록 player_id index를 테스트별 임시 파일로 (data/cache 오염 방지)."""
+    monkeypatch.setenv('KNOWN_PLAYER_INDEX', str(tmp_path / 'known_player_ids.npz'))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_pipeline_metrics(tmp_path, monkeypatch):
+    """파이프라인 단계 metrics 파일을 테스트별 임시 파일로."""
+    monkeypatch.setenv('ELO_METRICS_FILE', str(tmp_path / 'pipeline_metrics.jsonl'))
+
+
+class FakeResponse:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """postgrest 요청 builder의 in-memory 대체 (select / 필터 / order / limit / range / delete / upsert)."""
+
+    _OPS = {
+        'eq': lambda v, x: v == x,
+        'neq': lambda v, x: v != x,
+        'gt': lambda v, x: v is not None and v > x,
+        'gte': lambda v, x: v is not None and v >= x,
+        'lt': lambda v, x: v is not None and v < x,
+        'lte': lambda v, x: v is not None and v <= x,
+        'in_': lambda v, x: v in x,
+    }
+
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.action = 'select'
+        self.columns = None
+        self.count = None
+        self.filters = []
+        self.orders = []
+        self.offset = 0
+        self.max_rows = None
+        self.payload = None
+        self.on_conflict = None
+
+    def select(self, columns='*', count=None):
+        self.columns = [c.strip() for c in columns.split(',')] if columns.strip() != '*' else None
+        self.count = count
+        return self
+
+    def __getattr__(self, op):
+        if op not in self._OPS:
+            raise AttributeError(op)
+
+        def apply(column, value):
+            self.filters.append((column, self._OPS[op], value))
+            return self
+        return apply
+
+    def order(self, column, desc=False):
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, n):
+        self.max_rows = n
+        return self
+
+    def range(self, start, end):
+        self.offset, self.max_rows = start, end - start + 1
+        return self
+
+    def delete(self):
+        self.action = 'delete'
+        return self
+
+    def upsert(self, records, on_conflict=None):
+        self.action, self.payload, self.on_conflict = 'upsert', records, on_conflict
+        return self
+
+    def _matches(self, row):
+        return all(op(row.get(column), value) for column, op, value in self.filters)
+
+    def execute(self):
+        with self.client.lock:
+            return self._execute()
+
+    def _execute(self):
+        self.client.requests.append((self.table, self.action))
+        rows = self.client.tables.setdefault(self.table, [])
+        if self.action == 'delete':
+            kept = [r for r in rows if not self._matches(r)]
+            deleted = [r for r in rows if self._matches(r)]
+            self.client.tables[self.table] = kept
+            return FakeResponse(deleted)
+        if self.action == 'upsert':
+            keys = (self.on_conflict or self.client.primary_keys.get(self.table, 'id')).split(',')
+            index = {tuple(r.get(k) for k in keys): i for i, r in enumerate(rows)}
+            for record in self.payload:
+                key = tuple(record.get(k) for k in keys)
+                if key in index:
+                    rows[index[key]] = {**rows[index[key]], **record}
+                else:
+                    index[key] = len(rows)
+                    rows.append(dict(record))
+            return FakeResponse(self.payload)
+        matched = [r for r in rows if self._matches(r)]
+        for column, desc in reversed(self.orders):
+            matched.sort(key=lambda r: r.get(column), reverse=desc)
+        count = len(matched) if self.count else None
+        end = None if self.max_rows is None else self.offset + min(self.max_rows, self.client.max_rows)
+        if end is None:
+            end = self.offset + self.client.max_rows
+        page = matched[self.offset:end]
+        if self.columns is not None:
+            page = [{c: r.get(c) for c in self.columns} for r in page]
+        return FakeResponse([dict(r) for r in page], count)
+
+
+class FakeRpc:
+    def __init__(self, client, name, params):
+        self.client = client
+        self.name = name
+        self.params = params
+
+    def execute(self):
+        self.client.requests.append((self.name, 'rpc'))
+        if self.name not in self.client.functions:
+            raise APIError({'code': 'PGRST202', 'message': f"Could not find the function public.{self.name}"})
+        return FakeResponse(self.client.functions[self.name](self.client, **self.params))
+
+
+class FakeSupabase:
+    """In-memory Supabase client.
+
+    tables: 테이블명 → row dict list, max_rows: 서버 응답 상한,
+    functions: RPC 이름 → fn(client, **params) → rows (없는 RPC는 예외).
+    """
+
+    def __init__(self, tables=None, primary_keys=None, max_rows=1000, functions=None):
+        self.tables = {name: [dict(r) for r in rows] for name, rows in (tables or {}).items()}
+        self.primary_keys = primary_keys or {}
+        self.max_rows = max_rows
+        self.functions = dict(functions or {})
+        self.requests = []
+        self.lock = threading.RLock()
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, name, params=None):
+        return FakeRpc(self, name, params or {})
+
+
+@pytest.fixture
+def fake_supabase():
+    """FakeSupabase factory: fake_supabase({'player_elo': rows}, max_rows=1000)."""
+    return FakeSupabase
@@ -0,0 +1,95 @@
+"""Chunked parallel Statcast backfill (backfill_fetcher) 테스트 — 로컬 fetch stand-in 사용."""
+import threading
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from src.etl.backfill_fetcher import backfill_statcast, date_chunks
+from src.etl.statcast_cache import StatcastCache
+
+
+class FakeSavant:
+    """statcast(start_dt, end_dt) stand-in: 월요일은 경기 없음, 날짜당 R 3개 + S 1개."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls: list[tuple[str, str]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, start_dt: str, end_dt: str) -> pd.DataFrame:
+        with self._lock:
+            self.calls.append((start_dt, end_dt))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if start_dt == self.fail_on:
+                raise ConnectionError("savant timeout")
+            start, end = date.fromisoformat(start_dt), date.fromisoformat(end_dt)
+            rows = []
+            day = start
+            while day <= end:
+                if day.weekday() != 0:
+                    for i, game_type in enumerate('RRRS'):
+                        rows.append({'game_date': pd.Timestamp(day), 'game_type': game_type,
+                                     'game_pk': day.toordinal(), 'at_bat_number': i + 1,
+                                     'batter': 100 + i, 'pitcher': 200, 'events': 'single',
+                                     'pitch_name': 'Slider'})
+                day += timedelta(days=1)
+            return pd.DataFrame(rows)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+START, END = date(2024, 4, 1), date(2024, 5, 5)  # 35일, 월요일 5개
+
+
+class TestDateChunks:
+    def test_weekly_chunks_cover_range(self):
+        chunks = date_chunks(START, END, 7)
+        assert len(chunks) == 5
+        assert chunks[0] == (START, date(2024, 4, 7))
+        assert chunks[-1][1] == END
+
+    def test_short_tail_and_invalid(self):
+        assert date_chunks(date(2024, 4, 1), date(2024, 4, 9), 7)[-1] == (date(2024, 4, 8), date(2024, 4, 9))
+        with pytest.raises(ValueError):
+            date_chunks(START, END, 0)
+
+
+class TestBackfill:
+    def test_writes_filtered_projected_partitions(self, tmp_path):
+        cache = StatcastCache(tmp_path)
+        fake = FakeSavant()
+        result = backfill_statcast(START, END, cache=cache, workers=3, fetch_fn=fake)
+
+        assert result['chunks'] == 5 and not result['failed']
+        assert len(result['days']) == 35
+        assert sum(1 for rows in result['days'].values() if rows == 0) == 5  # 월요일
+        assert cache.missing(START, END) == []
+        df = cache.read('2024-04-02')
+        assert len(df) == 3 and (df['game_type'] == 'R').all()
+        assert 'pitch_name' not in df.columns
+
+    def test_bounded_parallelism(self, tmp_path):
+        fake = FakeSavant(delay=0.05)
+        backfill_statcast(START, END, cache=StatcastCache(tmp_path), workers=2, chunk_days=3, fetch_fn=fake)
+        assert len(fake.calls) == 12
+        assert fake.max_active == 2
+
+    def test_skips_cached_chunks_and_reports_failures(self, tmp_path):
+        cache = StatcastCache(tmp_path)
+        fake = FakeSavant(fail_on='2024-04-15')
+        first = backfill_statcast(START, END, cache=cache, fetch_fn=fake)
+        assert first['failed'][0][:2] == (date(2024, 4, 15), date(2024, 4, 21))
+
+        retry = FakeSavant()
+        second = backfill_statcast(START, END, cache=cache, fetch_fn=retry)
+        assert retry.calls == [('2024-04-15', '2024-04-21')]
+        assert second['skipped'] == 4 and not second['failed']
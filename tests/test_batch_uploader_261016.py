@@ -0,0 +1,186 @@
+"""BatchUploader 테스트 (지연 주입 local fake client)."""
+
+import threading
+import time
+
+import pytest
+
+import src.etl.batch_uploader as batch_uploader
+from src.etl.batch_uploader import BatchSizer, BatchUploader, estimate_row_bytes
+from src.etl.upload_to_supabase import upload_table
+
+
+class FakeTable:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+
+    def upsert(self, records, on_conflict=None):
+        self.client.calls.append((self.name, len(records), on_conflict))
+        self._records = records
+        self._on_conflict = on_conflict
+        return self
+
+    def execute(self):
+        return self.client.apply(self.name, self._records, self._on_conflict)
+
+
+class FakeClient:
+    """upsert마다 latency(rows)초 대기, fail_first번째 호출까지 예외."""
+
+    def __init__(self, latency=lambda rows: 0.0, fail_first=0):
+        self.latency = latency
+        self.fail_first = fail_first
+        self.calls = []
+        self.rows = {}
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._attempts = 0
+
+    def table(self, name):
+        return FakeTable(self, name)
+
+    def apply(self, name, records, on_conflict):
+        with self._lock:
+            self._attempts += 1
+            if self._attempts <= self.fail_first:
+                raise ConnectionError('injected failure')
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency(len(records)))
+            columns = on_conflict.split(',') if on_conflict else ['id']
+            keys = [tuple(r[c] for c in columns) for r in records]
+            if len(set(keys)) != len(keys):
+                raise ValueError('ON CONFLICT DO UPDATE command cannot affect row a second time')
+            with self._lock:
+                self.batches.append(len(records))
+                for key, r in zip(keys, records):
+                    self.rows[(name,) + key] = r
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _records(n):
+    return [{'id': i, 'value': i * 0.5} for i in range(n)]
+
+
+class TestBatchUploader:
+    def test_uploads_all_rows(self):
+        client = FakeClient()
+        n = BatchUploader(client, workers=4, batch_size=100).upload('t', _records(1234))
+        assert n == 1234
+        assert len(client.rows) == 1234
+        assert sum(client.batches) == 1234
+
+    def test_concurrency_reduces_wall_time(self):
+        records = _records(2000)
+        timings = {}
+        for workers in (1, 4):
+            client = FakeClient(latency=lambda rows: 0.02)
+            uploader = BatchUploader(client, workers=workers, batch_size=100, adaptive=False)
+            started = time.perf_counter()
+            uploader.upload('t', records)
+            timings[workers] = time.perf_counter() - started
+            if workers == 4:
+                assert client.max_in_flight == 4
+        assert timings[4] < timings[1] / 2
+
+    def test_retry_with_backoff(self):
+        client = FakeClient(fail_first=2)
+        delays = []
+        uploader = BatchUploader(client, workers=1, batch_size=50, sleep=delays.append)
+        assert uploader.upload('t', _records(120)) == 120
+        assert uploader.stats['retries'] == 2
+        assert len(delays) == 2 and delays[1] > delays[0]
+        assert len(client.rows) == 120
+
+    def test_retries_exhausted_raises(self):
+        client = FakeClient(fail_first=100)
+        uploader = BatchUploader(client, workers=2, batch_size=50, max_retries=2, sleep=lambda s: None)
+        with pytest.raises(ConnectionError):
+            uploader.upload('t', _records(200))
+
+    def test_duplicate_conflict_keys_keep_last_write(self):
+        # 같은 키가 여러 번 → 나중 레코드가 최종값, 한 배치에 같은 키 2회 금지
+        records = [{'player_id': i % 50, 'game_date': '2025-04-01', 'seq': i} for i in range(1000)]
+        client = FakeClient(latency=lambda rows: 0.001)
+        uploader = BatchUploader(client, workers=4, batch_size=200)
+        assert uploader.upload('ohlc', records, on_conflict='player_id,game_date') == 1000
+        assert uploader.stats['ordered'] is True
+        for pid in range(50):
+            assert client.rows[('ohlc', pid, '2025-04-01')]['seq'] == 950 + pid
+
+    @pytest.mark.parametrize('table, kwargs', [('t', {'key': 'id'}), ('player_elo', {})])
+    def test_duplicate_primary_keys_keep_last_write(self, table, kwargs):
+        # on_conflict 없는 PK upsert: key 인자 또는 테이블 PK로 같은 중복 처리
+        records = [{'id': i % 40, 'player_id': i % 40, 'seq': i} for i in range(800)]
+        client = FakeClient(latency=lambda rows: 0.001)
+        uploader = BatchUploader(client, workers=4, batch_size=150)
+        assert uploader.upload(table, records, **kwargs) == 800
+        assert uploader.stats['ordered'] is True
+        assert {c[2] for c in client.calls} == {None}
+        for pid in range(40):
+            assert client.rows[(table, pid)]['seq'] == 760 + pid
+
+    def test_payload_estimated_once_per_upload(self, monkeypatch):
+        encoded = []
+        real_dumps = batch_uploader.dumps
+        monkeypatch.setattr(batch_uploader, 'dumps', lambda rows: encoded.append(len(rows)) or real_dumps(rows))
+        client = FakeClient()
+        uploader = BatchUploader(client, workers=2, batch_size=100, max_payload_bytes=60_000)
+        uploader.upload('t', _records(3000))
+        assert encoded == [batch_uploader.PAYLOAD_SAMPLE_ROWS]
+        # payload cap은 추정 row bytes로 계속 적용
+        assert uploader.stats['batch_size'] <= 60_000 / estimate_row_bytes(_records(3000)) + 1
+
+    def test_unique_conflict_keys_run_unordered(self):
+        records = [{'player_id': i, 'game_date': '2025-04-01'} for i in range(300)]
+        uploader = BatchUploader(FakeClient(), workers=4, batch_size=50)
+        uploader.upload('ohlc', records, on_conflict='player_id,game_date')
+        assert uploader.stats['ordered'] is False
+
+    def test_adaptive_batch_grows_when_fast(self):
+        client = FakeClient(latency=lambda rows: 0.001)
+        uploader = BatchUploader(client, workers=1, batch_size=100, max_batch_size=2000)
+        uploader.upload('t', _records(5000))
+        assert max(client.batches) > 100
+        assert uploader.stats['batch_size'] <= 2000
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError):
+            BatchUploader(FakeClient(), workers=0)
+
+    def test_upload_table_passes_on_conflict(self):
+        client = FakeClient()
+        records = [{'player_id': i, 'game_date': '2025-04-01'} for i in range(10)]
+        assert upload_table(client, 'ohlc', records, on_conflict='player_id,game_date', workers=2) == 10
+        assert {c[2] for c in client.calls} == {'player_id,game_date'}
+        assert upload_table(client, 'ohlc', []) == 0
+
+
+class TestEstimateRowBytes:
+    def test_sample_matches_full_encode_for_uniform_rows(self):
+        records = _records(10_000)
+        full = len(batch_uploader.dumps(records)) / len(records)
+        assert estimate_row_bytes(records) == pytest.approx(full, rel=0.1)
+        assert estimate_row_bytes([]) == 0.0
+
+
+class TestBatchSizer:
+    def test_slow_batches_shrink(self):
+        sizer = BatchSizer(1000, target_latency=1.0)
+        assert sizer.observe(1000, latency=4.0, payload_bytes=100) == 500
+
+    def test_payload_cap(self):
+        sizer = BatchSizer(1000, max_payload_bytes=10_000)
+        assert sizer.observe(1000, latency=0.01, payload_bytes=100_000) == 100
+
+    def test_shrink_floor(self):
+        sizer = BatchSizer(200, min_size=100)
+        sizer.shrink()
+        sizer.shrink()
+        assert sizer.size == 100
@@ -0,0 +1,128 @@
+"""Force 재처리용 bulk delete 테스트.
+
+- migration 007 DELETE 문: SQLite stand-in에서 날짜 범위 / FK 순서 확인
+- delete_date_data: RPC 1회 경로, RPC 없는 backend의 병렬 chunk fallback,
+  RPC 실행 오류는 fallback 없이 raise
+"""
+import re
+import sqlite3
+from datetime import date
+from pathlib import Path
+
+import pytest
+from postgrest.exceptions import APIError
+
+from src.pipeline.daily_pipeline import DELETE_CHUNK_SIZE, delete_date_data
+
+MIGRATION = Path(__file__).parent.parent / 'scripts' / 'migrations' / '007_delete_date_rpc.sql'
+TARGET = date(2025, 4, 2)
+
+
+def _tables(n_per_day=450):
+    tables = {name: [] for name in ('plate_appearances', 'elo_pa_detail', 'talent_pa_detail',
+                                    'daily_ohlc', 'talent_daily_ohlc')}
+    for day in (1, 2, 3):
+        game_date = f"2025-04-{day:02d}"
+        for i in range(n_per_day):
+            pa_id = day * 1_000_000 + i
+            tables['plate_appearances'].append({'pa_id': pa_id, 'game_date': game_date})
+            tables['elo_pa_detail'].append({'pa_id': pa_id})
+            for talent_type in ('contact', 'power'):
+                tables['talent_pa_detail'].append({'pa_id': pa_id, 'talent_type': talent_type})
+        tables['daily_ohlc'].append({'player_id': 1, 'game_date': game_date})
+        tables['talent_daily_ohlc'].append({'player_id': 1, 'game_date': game_date})
+    return tables
+
+
+def _migration_deletes() -> list[str]:
+    sql = MIGRATION.read_text()
+    return [re.sub(r'\s+', ' ', stmt) for stmt in re.findall(r'DELETE FROM .*?;', sql, flags=re.S)]
+
+
+def _rpc_delete_date_data(client, p_game_date):
+    """migration 007과 같은 순서 / 조건의 in-memory 구현."""
+    pa_ids = {r['pa_id'] for r in client.tables['plate_appearances'] if r['game_date'] == p_game_date}
+    result = []
+    for name, drop in (
+        ('elo_pa_detail', lambda r: r['pa_id'] in pa_ids),
+        ('talent_pa_detail', lambda r: r['pa_id'] in pa_ids),
+        ('daily_ohlc', lambda r: r['game_date'] == p_game_date),
+        ('talent_daily_ohlc', lambda r: r['game_date'] == p_game_date),
+        ('plate_appearances', lambda r: r['game_date'] == p_game_date),
+    ):
+        before = len(client.tables[name])
+        client.tables[name] = [r for r in client.tables[name] if not drop(r)]
+        result.append({'table_name': name, 'deleted': before - len(client.tables[name])})
+    return result
+
+
+class TestMigrationSql:
+    def test_deletes_run_on_sqlite(self):
+        conn = sqlite3.connect(':memory:')
+        conn.execute('PRAGMA foreign_keys = ON')
+        conn.executescript("""
+            CREATE TABLE plate_appearances (pa_id INTEGER PRIMARY KEY, game_date TEXT NOT NULL);
+            CREATE TABLE elo_pa_detail (pa_id INTEGER PRIMARY KEY REFERENCES plate_appearances(pa_id));
+            CREATE TABLE talent_pa_detail (id INTEGER PRIMARY KEY, pa_id INTEGER REFERENCES plate_appearances(pa_id),
+                                           talent_type TEXT);
+            CREATE TABLE daily_ohlc (id INTEGER PRIMARY KEY, player_id INTEGER, game_date TEXT);
+            CREATE TABLE talent_daily_ohlc (id INTEGER PRIMARY KEY, player_id INTEGER, game_date TEXT);
+        """)
+        for name, rows in _tables(n_per_day=50).items():
+            columns = list(rows[0])
+            conn.executemany(
+                f"INSERT INTO {name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                [tuple(r[c] for c in columns) for r in rows],
+            )
+
+        statements = _migration_deletes()
+        assert [s.split()[2] for s in statements] == [
+            'elo_pa_detail', 'talent_pa_detail', 'daily_ohlc', 'talent_daily_ohlc', 'plate_appearances',
+        ]
+        deleted = []
+        for stmt in statements:
+            deleted.append(conn.execute(stmt.replace('p_game_date', ':game_date'),
+                                        {'game_date': TARGET.isoformat()}).rowcount)
+        assert deleted == [50, 100, 1, 1, 50]
+
+        remaining = conn.execute("SELECT DISTINCT game_date FROM plate_appearances ORDER BY 1").fetchall()
+        assert remaining == [('2025-04-01',), ('2025-04-03',)]
+        assert conn.execute("SELECT COUNT(*) FROM talent_pa_detail").fetchone()[0] == 200
+
+
+class TestDeleteDateData:
+    def test_rpc_single_request(self, fake_supabase):
+        client = fake_supabase(_tables(), functions={'delete_date_data': _rpc_delete_date_data})
+        deleted = delete_date_data(client, TARGET)
+        assert client.requests == [('delete_date_data', 'rpc')]
+        assert deleted == {'elo_pa_detail': 450, 'talent_pa_detail': 900, 'daily_ohlc': 1,
+                           'talent_daily_ohlc': 1, 'plate_appearances': 450}
+
+    def test_chunked_fallback(self, fake_supabase):
+        client = fake_supabase(_tables())
+        deleted = delete_date_data(client, TARGET, workers=4)
+
+        assert deleted == {'elo_pa_detail': 450, 'talent_pa_detail': 900, 'daily_ohlc': 1,
+                           'talent_daily_ohlc': 1, 'plate_appearances': 450}
+        assert {r['game_date'] for r in client.tables['plate_appearances']} == {'2025-04-01', '2025-04-03'}
+        assert len(client.tables['talent_pa_detail']) == 1800
+        # rpc 1 + pa_id 페이지 1 + detail chunk + 테이블 삭제 3
+        chunks = 2 * -(-450 // DELETE_CHUNK_SIZE)
+        assert len(client.requests) == 1 + 1 + chunks + 3
+        assert client.requests[-1] == ('plate_appearances', 'delete')
+
+    def test_no_rows(self, fake_supabase):
+        client = fake_supabase(_tables())
+        deleted = delete_date_data(client, date(2025, 5, 1))
+        assert sum(deleted.values()) == 0
+
+    @pytest.mark.parametrize('code', ['57014', '42501', 'PGRST301'])
+    def test_rpc_failure_is_not_masked(self, fake_supabase, code):
+        def failing(client, p_game_date):
+            raise APIError({'code': code, 'message': 'canceling statement due to statement timeout'})
+
+        client = fake_supabase(_tables(), functions={'delete_date_data': failing})
+        with pytest.raises(APIError):
+            delete_date_data(client, TARGET)
+        assert client.requests == [('delete_date_data', 'rpc')]
+        assert len(client.tables['plate_appearances']) == 3 * 450
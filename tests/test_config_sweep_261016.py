@@ -0,0 +1,122 @@
+"""Config sweep (config_sweep) 테스트.
+
+- run_elo_sweep 변형별 결과 == 같은 설정의 EloBatch replay
+- run_talent_sweep 변형별 결과 == 같은 config의 TalentBatch season ELO
+- summary 지표 (zero-sum drift / spread / top-N overlap)
+"""
+import numpy as np
+import pytest
+
+from src.engine.config_sweep import EloVariant, run_elo_sweep, run_talent_sweep
+from src.engine.elo_batch import EloBatch
+from src.engine.multi_elo_config import MultiEloConfig
+from src.engine.park_factor import ParkFactor
+from src.engine.re24_baseline import RE24Baseline
+from src.engine.talent_batch import TalentBatch
+from tests.test_elo_array_engine_261016 import _random_season
+
+VARIANTS = [
+    EloVariant('baseline'),
+    EloVariant('k8', k_factor=8.0),
+    EloVariant('hr20', event_k_overrides={'HR': 20.0, 'StrikeOut': 9.0}),
+    EloVariant('alpha0', physics_alpha=0.0),
+    EloVariant('alpha_hi', k_factor=30.0, physics_alpha=0.9),
+]
+
+
+class TestEloSweep:
+    def test_matches_per_variant_replay(self):
+        pa_df = _random_season(2500, seed=9)
+        baseline, park = RE24Baseline(), ParkFactor()
+        result = run_elo_sweep(pa_df, VARIANTS, re24_baseline=baseline, park_factor=park)
+
+        for i, variant in enumerate(VARIANTS):
+            batch = EloBatch(
+                k_factor=variant.k_factor, re24_baseline=baseline, park_factor=park,
+                event_k_factors=variant.event_k_factors, physics_alpha=variant.physics_alpha,
+                engine='array',
+            )
+            batch.process(pa_df)
+            assert result.player_ids.tolist() == list(batch.players)
+            states = list(batch.players.values())
+            assert result.batting_elo[i].tolist() == [s.batting_elo for s in states]
+            assert result.pitching_elo[i].tolist() == [s.pitching_elo for s in states]
+            assert result.batting_pa.tolist() == [s.batting_pa for s in states]
+            ratings = result.ratings(variant.name)
+            assert ratings['batting_elo'].tolist() == [s.batting_elo for s in states]
+
+    def test_variants_differ(self):
+        result = run_elo_sweep(_random_season(1000), [VARIANTS[0], VARIANTS[2]])
+        assert not np.array_equal(result.batting_elo[0], result.batting_elo[1])
+
+    def test_summary(self):
+        pa_df = _random_season(2000, seed=1)
+        summary = run_elo_sweep(pa_df, VARIANTS).summary(top_n=10)
+        assert summary['variant'].tolist() == [v.name for v in VARIANTS]
+        assert summary.loc[0, 'batting_top_overlap'] == 1.0
+        assert summary.loc[0, 'pitching_top_overlap'] == 1.0
+        assert summary['batting_top_overlap'].between(0, 1).all()
+        assert (summary['batting_spread'] > 0).all()
+        # 에러 마스크 / clamp 외에는 zero-sum → drift는 전체 ELO 변동보다 훨씬 작음
+        batch = EloBatch(engine='array')
+        batch.process(pa_df)
+        drift = sum(s.batting_elo + s.pitching_elo - 3000.0 for s in batch.players.values())
+        assert summary.loc[0, 'zero_sum_drift'] == pytest.approx(drift)
+
+    def test_requires_variants(self):
+        with pytest.raises(ValueError):
+            run_elo_sweep(_random_season(10), [])
+
+    def test_unknown_variant_name(self):
+        result = run_elo_sweep(_random_season(50), VARIANTS[:1])
+        with pytest.raises(KeyError):
+            result.ratings('nope')
+
+
+class TestTalentSweep:
+    def test_matches_per_config_replay(self):
+        pa_df = _random_season(1500, seed=6)
+        base = MultiEloConfig()
+        configs = [
+            base,
+            base.with_expected_divisors(batter={'contact': 200.0}, pitcher={'stuff': 90.0}),
+            base.with_expected_divisors(batter={'clutch': 400.0, 'power': 120.0}),
+        ]
+        result = run_talent_sweep(pa_df, configs, names=['base', 'a', 'b'])
+
+        for i, config in enumerate(configs):
+            batch = TalentBatch(config=config)
+            batch.process(pa_df)
+            batters = batch.state_mgr.all_batters
+            pitchers = batch.state_mgr.all_pitchers
+            assert result.batter_ids.tolist() == list(batters)
+            assert result.pitcher_ids.tolist() == list(pitchers)
+            np.testing.assert_array_equal(
+                result.batter_elo[i], np.array([d.season.elo_dimensions for d in batters.values()]))
+            np.testing.assert_array_equal(
+                result.pitcher_elo[i], np.array([d.season.elo_dimensions for d in pitchers.values()]))
+            assert result.batter_pa.tolist() == [d.season.pa_count for d in batters.values()]
+
+            records = {(r['player_id'], r['player_role'], r['talent_type']): r['season_elo']
+                       for r in batch.get_talent_player_records()}
+            ratings = result.ratings(i)
+            assert len(ratings) == len(records)
+            for row in ratings.itertuples():
+                assert records[(row.player_id, row.player_role, row.talent_type)] == row.season_elo
+
+        summary = result.summary(top_n=5)
+        assert summary['variant'].tolist() == ['base', 'a', 'b']
+        assert summary.loc[0, 'batter_top_overlap'] == 1.0
+        assert (summary['pitcher_spread'] > 0).all()
+
+    def test_with_expected_divisors_leaves_original(self):
+        base = MultiEloConfig()
+        variant = base.with_expected_divisors(batter={'contact': 999.0})
+        assert variant.get_expected_divisor('contact') == 999.0
+        assert base.get_expected_divisor('contact') == 127.0
+        with pytest.raises(ValueError):
+            base.with_expected_divisors(pitcher={'contact': 1.0})
+
+    def test_names_length_mismatch(self):
+        with pytest.raises(ValueError):
+            run_talent_sweep(_random_season(10), [MultiEloConfig()], names=['a', 'b'])
@@ -238,7 +238,7 @@ class TestLoadCurrentEloStates:
             {'player_id': 200, 'composite_elo': 1400.0, 'pa_count': 80,
              'batting_elo': 1500.0, 'pitching_elo': 1400.0, 'batting_pa': 0, 'pitching_pa': 80},
         ]
-        client.table.return_value.select.return_value.range.return_value.execute.return_value = response
+        client.table.return_value.select.return_value.order.return_value.limit.return_value.execute.return_value = response
 
         states = load_current_elo_states(client)
         assert len(states) == 2
@@ -254,7 +254,7 @@ class TestLoadCurrentEloStates:
         client = MagicMock()
         response = MagicMock()
         response.data = []
-        client.table.return_value.select.return_value.range.return_value.execute.return_value = response
+        client.table.return_value.select.return_value.order.return_value.limit.return_value.execute.return_value = response
 
         states = load_current_elo_states(client)
         assert len(states) == 0
@@ -265,10 +265,12 @@ class TestDeleteDateData:
         from src.pipeline.daily_pipeline import delete_date_data
 
         client = MagicMock()
+        # delete_date_data RPC 없음 → chunk 삭제 fallback
+        client.rpc.side_effect = Exception('PGRST202: function not found')
         # Mock PA ID lookup
         pa_response = MagicMock()
         pa_response.data = [{'pa_id': 1001}, {'pa_id': 1002}]
-        client.table.return_value.select.return_value.eq.return_value.range.return_value.execute.return_value = pa_response
+        client.table.return_value.select.return_value.eq.return_value.order.return_value.limit.return_value.execute.return_value = pa_response
 
         # Mock delete chains
         delete_chain = MagicMock()
@@ -0,0 +1,90 @@
+"""Columnar DetailBuffer 테스트.
+
+- append / extend 혼합 + 용량 확장
+- category code (None → -1, 신규 값 등록, code dtype 확장)
+- to_frame() / to_arrow() view가 버퍼 메모리를 공유
+- EloBatch / TalentBatch detail 버퍼 + upload 레코드 변환
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.engine.detail_buffer import CATEGORY, DetailBuffer
+from src.engine.elo_batch import EloBatch
+from src.engine.talent_batch import TalentBatch
+from src.pipeline.daily_pipeline import (
+    _prepare_pa_detail_records,
+    _prepare_talent_pa_detail_records,
+)
+from tests.test_elo_array_engine_261016 import _random_season
+
+SCHEMA = {'pa_id': 'int64', 'result_type': CATEGORY, 'elo': 'float64'}
+
+
+def _buffer(capacity=2) -> DetailBuffer:
+    buf = DetailBuffer(SCHEMA, capacity=capacity)
+    buf.append(pa_id=1, result_type='HR', elo=1500.5)
+    buf.extend({'pa_id': [2, 3, 4], 'result_type': ['BB', None, 'HR'], 'elo': [1.0, 2.0, 3.0]})
+    buf.append(pa_id=5, result_type=float('nan'), elo=4.0)
+    return buf
+
+
+class TestDetailBuffer:
+    def test_rows_and_growth(self):
+        buf = _buffer()
+        assert len(buf) == 5
+        assert buf[0] == {'pa_id': 1, 'result_type': 'HR', 'elo': 1500.5}
+        assert buf[-1] == {'pa_id': 5, 'result_type': None, 'elo': 4.0}
+        assert [r['result_type'] for r in buf] == ['HR', 'BB', None, 'HR', None]
+        with pytest.raises(IndexError):
+            buf[5]
+
+    def test_row_values_are_python_scalars(self):
+        row = _buffer()[1]
+        assert type(row['pa_id']) is int
+        assert type(row['elo']) is float
+
+    def test_frame_is_view(self):
+        buf = _buffer(capacity=16)
+        df = buf.to_frame()
+        assert df['result_type'].dtype == 'category'
+        assert df['result_type'].isna().tolist() == [False, False, True, False, True]
+        assert np.shares_memory(df['elo'].to_numpy(), buf._data['elo'])
+        assert np.shares_memory(df['pa_id'].to_numpy(), buf._data['pa_id'])
+        assert np.shares_memory(df['result_type'].array.codes, buf._data['result_type'])
+
+    def test_arrow_view(self):
+        table = _buffer().to_arrow()
+        assert table.column('result_type').to_pylist() == ['HR', 'BB', None, 'HR', None]
+        assert table.column('pa_id').to_pylist() == [1, 2, 3, 4, 5]
+
+    def test_code_dtype_widens(self):
+        buf = DetailBuffer({'k': CATEGORY})
+        buf.extend({'k': [f'v{i}' for i in range(300)]})
+        buf.append(k='v5')
+        assert buf._data['k'].dtype == np.int16
+        assert buf[299]['k'] == 'v299'
+        assert buf[300]['k'] == 'v5'
+
+
+class TestBatchDetailBuffers:
+    def test_elo_upload_records(self):
+        batch = EloBatch(engine='array')
+        batch.process(_random_season(200))
+        records = _prepare_pa_detail_records(batch.pa_details)
+        assert len(records) == 200
+        first = batch.pa_details[0]
+        assert records[0]['pa_id'] == first['pa_id']
+        assert records[0]['batter_elo_after'] == round(first['batter_elo_after'], 4)
+        assert records[0]['on_base_delta'] == round(first['elo_delta'], 4)
+
+    def test_talent_upload_records(self):
+        batch = TalentBatch()
+        batch.process(_random_season(200))
+        df = batch.talent_pa_details.to_frame()
+        assert set(df['player_role'].cat.categories) <= {'batter', 'pitcher'}
+        records = _prepare_talent_pa_detail_records(batch.talent_pa_details)
+        assert len(records) == len(df)
+        assert records[0]['talent_type'] == df['talent_type'].iloc[0]
+        assert records[0]['elo_after'] == round(float(df['elo_after'].iloc[0]), 4)
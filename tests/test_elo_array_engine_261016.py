@@ -0,0 +1,184 @@
+"""Array 엔진 (EloBatch(engine='array')) 테스트.
+
+- PlayerIndex: 인터닝 순서/재사용
+- EloArrayState: PlayerEloState dict ↔ 배열 왕복
+- Parity: python 모드와 players / pa_details / daily_ohlc bit 단위 동일
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.engine.elo_arrays import EloArrayState, base_out_states
+from src.engine.elo_batch import EloBatch
+from src.engine.elo_calculator import PlayerEloState
+from src.engine.park_factor import ParkFactor
+from src.engine.player_index import PlayerIndex
+from src.engine.re24_baseline import RE24Baseline
+
+RESULT_TYPES = ['Single', 'Double', 'Triple', 'HR', 'BB', 'IBB', 'HBP',
+                'StrikeOut', 'OUT', 'SAC', 'FC', 'E', 'GIDP']
+TEAMS = ['COL', 'SEA', 'NYY', 'BOS', 'LAD', 'XXX']
+
+
+def _random_season(n_pa: int = 3000, n_days: int = 12, seed: int = 7) -> pd.DataFrame:
+    """재현 가능한 랜덤 PA DataFrame (NaN rv/xwoba, 에러, TWP 포함)."""
+    rng = np.random.default_rng(seed)
+    batters = np.arange(100, 160)
+    pitchers = np.arange(200, 230)
+    batter_id = rng.choice(batters, n_pa)
+    pitcher_id = rng.choice(pitchers, n_pa)
+    batter_id[::97] = 660271   # TWP batting
+    pitcher_id[::89] = 660271  # TWP pitching
+    rv = rng.normal(0.0, 0.5, n_pa)
+    rv[::31] = np.nan
+    xwoba = rng.uniform(0.0, 1.5, n_pa)
+    xwoba[::5] = np.nan
+    days = np.sort(rng.integers(0, n_days, n_pa))
+    return pd.DataFrame({
+        'pa_id': np.arange(n_pa) + 1_000_000,
+        'game_pk': 1000 + days,
+        'game_date': (pd.Timestamp('2025-04-01') + pd.to_timedelta(days, unit='D')).strftime('%Y-%m-%d'),
+        'batter_id': batter_id,
+        'pitcher_id': pitcher_id,
+        'result_type': rng.choice(RESULT_TYPES, n_pa),
+        'delta_run_exp': rv,
+        'on_1b': rng.random(n_pa) < 0.3,
+        'on_2b': rng.random(n_pa) < 0.2,
+        'on_3b': rng.random(n_pa) < 0.1,
+        'outs_when_up': rng.integers(0, 3, n_pa),
+        'home_team': rng.choice(TEAMS, n_pa),
+        'xwoba': xwoba,
+    })
+
+
+def _assert_same_results(a: EloBatch, b: EloBatch):
+    assert a.players.keys() == b.players.keys()
+    for pid, s in a.players.items():
+        assert s == b.players[pid], f"player {pid}: {s} != {b.players[pid]}"
+    assert list(a.pa_details) == list(b.pa_details)
+    assert a.daily_ohlc == b.daily_ohlc
+    assert a._active_player_ids == b._active_player_ids
+
+
+class TestPlayerIndex:
+    def test_intern_assigns_dense_indices(self):
+        index = PlayerIndex()
+        assert index.intern(660271) == 0
+        assert index.intern(543037) == 1
+        assert index.intern(660271) == 0
+        assert len(index) == 2
+
+    def test_intern_many_preserves_first_seen_order(self):
+        index = PlayerIndex([5])
+        idx = index.intern_many(np.array([9, 5, 7, 9]))
+        assert idx.tolist() == [1, 0, 2, 1]
+        assert index.ids.tolist() == [5, 9, 7]
+
+
+class TestEloArrayState:
+    def test_round_trip(self):
+        states = {
+            100: PlayerEloState(player_id=100, batting_elo=1600.0, batting_pa=50, cumulative_rv=1.5),
+            200: PlayerEloState(player_id=200, pitching_elo=1400.0, pitching_pa=80),
+        }
+        arrays = EloArrayState.from_player_states(states)
+        assert arrays.batting_elo.tolist() == [1600.0, 1500.0]
+        out = {}
+        arrays.to_player_states(out)
+        assert out == states
+
+    def test_sync_size_grows_with_defaults(self):
+        arrays = EloArrayState()
+        arrays.index.intern(1)
+        arrays.sync_size()
+        assert arrays.batting_elo.tolist() == [1500.0]
+        assert arrays.batting_pa.tolist() == [0]
+
+
+class TestBaseOutStates:
+    def test_matches_row_encoding(self):
+        pa_df = _random_season(200)
+        expected = [
+            int(bool(r['on_1b'])) + int(bool(r['on_2b'])) * 2
+            + int(bool(r['on_3b'])) * 4 + int(r['outs_when_up']) * 8
+            for _, r in pa_df.iterrows()
+        ]
+        assert base_out_states(pa_df).tolist() == expected
+
+
+class TestArrayEngineParity:
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError):
+            EloBatch(engine='gpu')
+
+    def test_matches_python_engine_plain(self):
+        pa_df = _random_season()
+        py = EloBatch()
+        py.process(pa_df)
+        arr = EloBatch(engine='array')
+        arr.process(pa_df)
+        _assert_same_results(py, arr)
+
+    def test_matches_python_engine_with_v53_modules(self):
+        pa_df = _random_season(seed=11)
+        baseline, park = RE24Baseline(), ParkFactor()
+        py = EloBatch(re24_baseline=baseline, park_factor=park)
+        py.process(pa_df)
+        arr = EloBatch(re24_baseline=baseline, park_factor=park, engine='array')
+        arr.process(pa_df)
+        _assert_same_results(py, arr)
+
+    def test_matches_python_engine_with_initial_states(self):
+        pa_df = _random_season(500, seed=3)
+        states = {
+            100: PlayerEloState(player_id=100, batting_elo=1650.0, batting_pa=40),
+            200: PlayerEloState(player_id=200, pitching_elo=520.0, pitching_pa=90),
+            999: PlayerEloState(player_id=999, batting_elo=1450.0, batting_pa=10),
+        }
+        py = EloBatch(initial_states={k: PlayerEloState(**vars(v)) for k, v in states.items()})
+        py.process(pa_df)
+        arr = EloBatch(initial_states={k: PlayerEloState(**vars(v)) for k, v in states.items()},
+                       engine='array')
+        arr.process(pa_df)
+        _assert_same_results(py, arr)
+        assert arr.get_player_elo_records() == py.get_player_elo_records()
+
+    def test_missing_optional_columns(self):
+        pa_df = _random_season(300)[['pa_id', 'game_pk', 'game_date', 'batter_id',
+                                     'pitcher_id', 'result_type', 'delta_run_exp']]
+        py = EloBatch()
+        py.process(pa_df)
+        arr = EloBatch(engine='array')
+        arr.process(pa_df)
+        _assert_same_results(py, arr)
+
+    def test_timestamp_game_dates(self):
+        pa_df = _random_season(300)
+        pa_df['game_date'] = pd.to_datetime(pa_df['game_date'])
+        py = EloBatch()
+        py.process(pa_df)
+        arr = EloBatch(engine='array')
+        arr.process(pa_df)
+        _assert_same_results(py, arr)
+
+    def test_empty_frame(self):
+        batch = EloBatch(engine='array')
+        batch.process(_random_season(10).iloc[0:0])
+        assert batch.players == {}
+        assert batch.daily_ohlc == []
+
+
+class TestLastGameDateIndex:
+    @pytest.mark.parametrize('engine', ['python', 'array'])
+    def test_matches_max_ohlc_date(self, engine):
+        states = {999: PlayerEloState(player_id=999, batting_elo=1450.0, batting_pa=10)}
+        batch = EloBatch(initial_states=states, engine=engine)
+        batch.process(_random_season(800, n_days=40, seed=21))
+        expected = {}
+        for o in batch.daily_ohlc:
+            expected[o.player_id] = max(expected.get(o.player_id, o.game_date), o.game_date)
+        for rec in batch.get_player_elo_records():
+            last = expected.get(rec['player_id'])
+            assert rec['last_game_date'] == (last.isoformat() if last else None)
+        assert batch._last_game_date.keys() == expected.keys()
@@ -0,0 +1,98 @@
+"""ELO feature pre-pass (compute_elo_features) 테스트.
+
+각 컬럼이 EloCalculator.compute_deltas의 PA별 결과와 bit 단위로 동일한지 검증.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.engine.elo_batch import EloBatch
+from src.engine.elo_calculator import EloCalculator
+from src.engine.elo_features import FEATURE_COLUMNS, compute_elo_features
+from src.engine.park_factor import ParkFactor
+from src.engine.re24_baseline import RE24Baseline
+from tests.test_elo_array_engine_261016 import _random_season
+
+
+def _scalar_reference(pa_df: pd.DataFrame, calc: EloCalculator) -> list[tuple]:
+    """iterrows + compute_deltas 기준값 (EloBatch python 모드와 동일한 입력 변환)."""
+    out = []
+    for _, row in pa_df.iterrows():
+        rv = row.get('delta_run_exp')
+        if pd.isna(rv):
+            rv = None
+        xwoba = row.get('xwoba')
+        if xwoba is not None and pd.isna(xwoba):
+            xwoba = None
+        state = (int(bool(row.get('on_1b'))) + int(bool(row.get('on_2b'))) * 2
+                 + int(bool(row.get('on_3b'))) * 4 + int(row.get('outs_when_up', 0)) * 8)
+        out.append(calc.compute_deltas(
+            rv, state=state, home_team=row.get('home_team'),
+            result_type=row.get('result_type'), xwoba=xwoba,
+        ))
+    return out
+
+
+@pytest.mark.parametrize('with_modules', [False, True])
+def test_features_match_compute_deltas(with_modules):
+    pa_df = _random_season(1500, seed=5).astype({'result_type': object, 'home_team': object})
+    pa_df.loc[pa_df.index[::50], 'result_type'] = None
+    pa_df.loc[pa_df.index[::40], 'home_team'] = None
+    kwargs = {'re24_baseline': RE24Baseline(), 'park_factor': ParkFactor()} if with_modules else {}
+    calc = EloCalculator(park_factor_obj=kwargs.get('park_factor'),
+                         re24_baseline=kwargs.get('re24_baseline'))
+
+    features = compute_elo_features(pa_df, **kwargs)
+    expected = _scalar_reference(pa_df, calc)
+
+    assert list(features.columns) == FEATURE_COLUMNS
+    for i, (bd, pd_, kb, pm, ke) in enumerate(expected):
+        row = features.iloc[i]
+        assert row['batter_delta'] == bd
+        assert row['pitcher_delta'] == pd_
+        assert row['k_base'] == kb
+        assert row['physics_mod'] == pm
+        assert row['k_effective'] == ke
+
+
+def test_rv_diff_nan_when_rv_missing():
+    pa_df = _random_season(100)
+    features = compute_elo_features(pa_df, re24_baseline=RE24Baseline())
+    missing = ~features['has_rv']
+    assert missing.any()
+    assert features.loc[missing, 'rv_diff'].isna().all()
+    assert (features.loc[missing, 'batter_delta'] == 0.0).all()
+
+
+def test_field_error_never_rewards_batter():
+    pa_df = pd.DataFrame({
+        'result_type': ['E', 'E', 'Single'],
+        'delta_run_exp': [0.5, -0.5, 0.5],
+    })
+    features = compute_elo_features(pa_df, k_factor=12.0)
+    # E는 K=0 → delta 0, 'E' 마스크로 양수 batter delta 차단
+    assert features['batter_delta'].tolist()[:2] == [0.0, 0.0]
+    assert features['batter_delta'].iloc[2] > 0
+
+
+def test_state_column_matches_encoding():
+    pa_df = pd.DataFrame({
+        'delta_run_exp': [0.1, 0.2],
+        'on_1b': [True, False], 'on_2b': [False, True], 'on_3b': [True, True],
+        'outs_when_up': [2, 1],
+    })
+    features = compute_elo_features(pa_df)
+    assert features['state'].tolist() == [1 + 4 + 16, 2 + 4 + 8]
+
+
+def test_batch_compute_features_uses_batch_modules():
+    baseline, park = RE24Baseline(), ParkFactor()
+    batch = EloBatch(re24_baseline=baseline, park_factor=park, engine='array')
+    pa_df = _random_season(200)
+    direct = compute_elo_features(pa_df, re24_baseline=baseline, park_factor=park)
+    pd.testing.assert_frame_equal(batch.compute_features(pa_df), direct)
+    assert not math.isnan(direct['k_effective'].sum())
+    assert np.isfinite(direct['physics_mod']).all()
@@ -335,7 +335,7 @@ class TestMockPipelineEndToEnd:
         # load_current_elo_states → empty (fresh start)
         elo_state_resp = MagicMock()
         elo_state_resp.data = []
-        client.table.return_value.select.return_value.range.return_value.execute.return_value = elo_state_resp
+        client.table.return_value.select.return_value.order.return_value.limit.return_value.execute.return_value = elo_state_resp
 
         # ─── Run pipeline ───
         with patch('src.pipeline.daily_pipeline.fetch_statcast_date', return_value=statcast_df):
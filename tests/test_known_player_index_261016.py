@@ -0,0 +1,96 @@
+"""KnownPlayerIndex + detect_new_player_ids_batch(known=...) 테스트 (in-memory FakeSupabase)."""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.etl.known_player_index import KnownPlayerIndex
+from src.etl.player_registry import detect_new_player_ids_batch
+
+
+def _players(ids):
+    return {'players': [{'player_id': pid, 'full_name': f'P {pid}'} for pid in ids]}
+
+
+def _pa(batters, pitchers):
+    return pd.DataFrame({'batter_id': batters, 'pitcher_id': pitchers})
+
+
+class TestKnownPlayerIndex:
+    def test_contains_add_and_roundtrip(self, tmp_path):
+        path = tmp_path / 'known.npz'
+        index = KnownPlayerIndex(path)
+        assert len(index) == 0 and index.needs_reconcile()
+
+        index.add([30, 10, 20, 10])
+        assert index.ids.tolist() == [10, 20, 30]
+        assert index.contains([20, 25, 40, 10]).tolist() == [True, False, False, True]
+        assert index.unknown(np.array([10, 99])) == {99}
+        index.reconciled_at = time.time()
+        index.save()
+
+        reloaded = KnownPlayerIndex(path)
+        assert reloaded.ids.tolist() == [10, 20, 30]
+        assert not reloaded.needs_reconcile()
+
+    def test_reconcile_replaces_with_remote(self, tmp_path, fake_supabase):
+        index = KnownPlayerIndex(tmp_path / 'known.npz')
+        index.add([1, 2, 9_999])
+        client = fake_supabase(_players(range(1, 2_501)))
+        assert index.reconcile(client) == 2_500
+        assert index.unknown([9_999, 2_500]) == {9_999}
+
+    def test_reconcile_interval(self, tmp_path):
+        index = KnownPlayerIndex(tmp_path / 'known.npz', reconcile_days=7)
+        index.add([1])
+        index.reconciled_at = time.time() - 6 * 86400
+        assert not index.needs_reconcile()
+        index.reconciled_at = time.time() - 8 * 86400
+        assert index.needs_reconcile()
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        path = tmp_path / 'known.npz'
+        path.write_bytes(b'not an npz')
+        assert len(KnownPlayerIndex(path)) == 0
+
+
+class TestDetectWithIndex:
+    def test_known_players_need_no_network(self, tmp_path, fake_supabase):
+        client = fake_supabase(_players([1, 2, 3, 4]))
+        index = KnownPlayerIndex(tmp_path / 'known.npz')
+
+        # 첫 실행: 빈 index → 전체 reconcile
+        assert detect_new_player_ids_batch(_pa([1, 2], [3, 4]), client, known=index) == set()
+        assert client.requests
+
+        client.requests.clear()
+        again = KnownPlayerIndex(tmp_path / 'known.npz')
+        assert detect_new_player_ids_batch(_pa([2, 1], [4, 3]), client, known=again) == set()
+        assert client.requests == []
+
+    def test_unknown_ids_verified_remotely(self, tmp_path, fake_supabase):
+        index = KnownPlayerIndex(tmp_path / 'known.npz')
+        index.add([1, 2])
+        index.reconciled_at = time.time()
+        # 5는 index 밖에서 (수동) 등록됨, 6은 진짜 신규
+        client = fake_supabase(_players([1, 2, 5]))
+
+        assert detect_new_player_ids_batch(_pa([1, 5], [2, 6]), client, known=index) == {6}
+        assert client.requests == [('players', 'select')]
+        assert KnownPlayerIndex(tmp_path / 'known.npz').ids.tolist() == [1, 2, 5]
+
+    def test_pipeline_registration_updates_index(self, tmp_path, fake_supabase):
+        from unittest.mock import patch
+
+        from src.pipeline.daily_pipeline import _register_new_players
+
+        path = tmp_path / 'known.npz'
+        client = fake_supabase(_players([1, 2]), primary_keys={'players': 'player_id'})
+        with patch('src.pipeline.daily_pipeline.register_new_players', return_value=1) as register:
+            assert _register_new_players(_pa([1], [7]), client, KnownPlayerIndex(path)) == 1
+        assert register.call_args[0][0] == {7}
+
+        client.requests.clear()
+        assert _register_new_players(_pa([7], [2]), client, KnownPlayerIndex(path)) == 0
+        assert client.requests == []
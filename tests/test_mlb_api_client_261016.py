@@ -0,0 +1,147 @@
+"""MlbApiClient / PlayerMetadataCache 테스트 (지연을 주입한 local HTTP stub)."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+
+from src.etl.player_metadata_cache import PlayerMetadataCache
+from src.etl.player_registry import MlbApiClient, register_new_players
+
+LATENCY = 0.2
+FAILING_ID = 13
+
+
+class StubMlbApi:
+    """/api/v1/teams, /api/v1/people?personIds=... 를 흉내내는 local HTTP server."""
+
+    def __init__(self, latency=LATENCY):
+        self.latency = latency
+        self.requests = []
+        self.fail_teams = False
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                stub.requests.append(url.path)
+                time.sleep(stub.latency)
+                if url.path == '/api/v1/teams' and stub.fail_teams:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                if url.path == '/api/v1/teams':
+                    body = {'teams': [{'id': 147, 'abbreviation': 'NYY'}, {'id': 119, 'abbreviation': 'LAD'}]}
+                elif url.path == '/api/v1/people':
+                    ids = [int(x) for x in query['personIds'][0].split(',')]
+                    if FAILING_ID in ids:
+                        self.send_response(500)
+                        self.end_headers()
+                        return
+                    body = {'people': [
+                        {'id': pid, 'firstName': 'F', 'lastName': str(pid), 'fullName': f'F {pid}',
+                         'currentTeam': {'id': 147 if pid % 2 else 119},
+                         'primaryPosition': {'abbreviation': 'P'}}
+                        for pid in ids
+                    ]}
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/api/v1"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    with StubMlbApi() as server:
+        yield server
+
+
+class TestMlbApiClient:
+    def test_many_players_in_about_one_round_trip(self, stub, tmp_path):
+        cache = PlayerMetadataCache(tmp_path / 'meta.json')
+        api = MlbApiClient(base_url=stub.base_url, cache=cache, chunk_size=50, workers=4)
+        ids = list(range(1000, 1120))
+
+        started = time.perf_counter()
+        players = api.fetch_players(ids)
+        elapsed = time.perf_counter() - started
+
+        assert sorted(players) == ids
+        assert players[1001]['team'] == 'NYY' and players[1000]['team'] == 'LAD'
+        assert players[1001]['full_name'] == 'F 1001'
+        # teams 1회 + people 3 chunk, 모두 동시에 → 순차 120 × LATENCY와 무관
+        assert sorted(stub.requests) == ['/api/v1/people'] * 3 + ['/api/v1/teams']
+        assert elapsed < 3 * LATENCY
+
+    def test_cache_reused_across_clients(self, stub, tmp_path):
+        path = tmp_path / 'meta.json'
+        MlbApiClient(base_url=stub.base_url, cache=PlayerMetadataCache(path)).fetch_players([1, 2])
+        stub.requests.clear()
+
+        players = MlbApiClient(base_url=stub.base_url, cache=PlayerMetadataCache(path)).fetch_players([1, 2])
+        assert sorted(players) == [1, 2]
+        assert stub.requests == []
+
+    def test_ttl_expiry_refetches(self, stub, tmp_path):
+        path = tmp_path / 'meta.json'
+        MlbApiClient(base_url=stub.base_url, cache=PlayerMetadataCache(path)).fetch_players([1])
+        stub.requests.clear()
+
+        expired = PlayerMetadataCache(path, player_ttl=0)
+        MlbApiClient(base_url=stub.base_url, cache=expired).fetch_players([1])
+        assert stub.requests == ['/api/v1/people']   # teams는 아직 TTL 내
+
+    def test_failed_chunk_omitted(self, stub, tmp_path):
+        api = MlbApiClient(base_url=stub.base_url, cache=PlayerMetadataCache(tmp_path / 'm.json'), chunk_size=2)
+        players = api.fetch_players([FAILING_ID, 14, 15, 16])
+        assert sorted(players) == [15, 16]
+
+    def test_players_not_cached_without_team_map(self, stub, tmp_path):
+        path = tmp_path / 'meta.json'
+        stub.fail_teams = True
+        players = MlbApiClient(base_url=stub.base_url, cache=PlayerMetadataCache(path)).fetch_players([1])
+        assert players[1]['team'] == ''
+
+        stub.fail_teams = False
+        stub.requests.clear()
+        players = MlbApiClient(base_url=stub.base_url, cache=PlayerMetadataCache(path)).fetch_players([1])
+        assert players[1]['team'] == 'NYY'
+        assert sorted(stub.requests) == ['/api/v1/people', '/api/v1/teams']
+
+
+class TestRegisterWithStub:
+    def test_register_uses_batch_fetch_and_fallback(self, stub, tmp_path, fake_supabase):
+        client = fake_supabase({'players': []}, primary_keys={'players': 'player_id'})
+        api = MlbApiClient(base_url=stub.base_url, cache=PlayerMetadataCache(tmp_path / 'm.json'), chunk_size=1)
+        pa_df = pd.DataFrame({'batter_id': [FAILING_ID], 'pitcher_id': [21]})
+
+        assert register_new_players({FAILING_ID, 21}, pa_df, client, api=api) == 2
+        rows = {r['player_id']: r for r in client.tables['players']}
+        assert rows[21]['full_name'] == 'F 21'
+        assert rows[FAILING_ID]['full_name'] == f'Player {FAILING_ID}'
@@ -0,0 +1,193 @@
+"""Compiled talent tables (MultiEloConfig.tables) 테스트.
+
+- 텐서 값이 config getter와 일치
+- 벡터화된 MultiEloEngine이 기존 차원별 루프(dict 조회) 구현과 일치
+  (np.power는 Python pow와 1 ulp 차이가 날 수 있어 rtol=1e-12)
+"""
+import numpy as np
+import pytest
+import yaml
+
+from src.engine.multi_elo_config import BATTER_TO_PITCHER, PITCHER_TO_BATTER, MultiEloConfig
+from src.engine.multi_elo_engine import MultiEloEngine
+from src.engine.multi_elo_types import (
+    BatterTalentState, PitcherTalentState,
+    BATTER_DIM_NAMES, PITCHER_DIM_NAMES,
+    reliability_ramp,
+)
+
+EVENTS = ['Single', 'Double', 'Triple', 'HR', 'BB', 'HBP', 'IBB',
+          'StrikeOut', 'OUT', 'FC', 'GIDP', 'SAC', 'E', 'Unknown', None]
+
+
+def _reference_deltas(engine: MultiEloEngine, batter, pitcher, result_type,
+                      leverage_index=1.0, is_risp=False):
+    """기존 차원별 루프 구현 (getter + dict 조회)."""
+    config = engine.config
+    batter_weights = config.get_event_weights(result_type)
+    pitcher_weights = config.get_pitcher_event_weights(result_type)
+    clutch_mult = engine.get_clutch_multiplier(leverage_index)
+    if is_risp and clutch_mult == 0.0:
+        clutch_mult = 0.5
+    if result_type == "GIDP":
+        clutch_mult *= batter_weights.get("clutch_multiplier", 1.0)
+
+    batter_deltas = np.zeros(5)
+    pitcher_deltas = np.zeros(4)
+    for b_idx, b_dim in enumerate(BATTER_DIM_NAMES):
+        weight = batter_weights.get(b_dim, 0.0)
+        if b_dim == "clutch":
+            base_weight = batter_weights.get("clutch_base", 0.0)
+            weight = base_weight * (1.0 + clutch_mult) if clutch_mult > 0 else base_weight * 0.5
+        if weight == 0.0:
+            continue
+        p_dim = BATTER_TO_PITCHER.get(b_dim)
+        k = config.get_batter_k_factor(b_dim)
+        scale = config.get_batter_scale(b_dim)
+        reliability = engine.calculate_reliability(int(batter.event_counts[b_idx]), b_dim)
+        if p_dim is None:
+            expected = 0.5
+        else:
+            p_idx = PITCHER_DIM_NAMES.index(p_dim)
+            divisor = (config.get_expected_divisor(b_dim)
+                       + config.get_expected_divisor(p_dim, is_pitcher=True)) / 2
+            expected = engine.calculate_expected_score(
+                batter.elo_dimensions[b_idx], pitcher.elo_dimensions[p_idx], divisor=divisor)
+        actual = 1.0 if weight > 0 else 0.0
+        batter_deltas[b_idx] = k * scale * abs(weight) * (actual - expected) * reliability
+
+    for p_idx, p_dim in enumerate(PITCHER_DIM_NAMES):
+        weight = pitcher_weights.get(p_dim, 0.0)
+        if p_dim == "clutch":
+            base_weight = pitcher_weights.get("clutch_base", 0.0)
+            weight = base_weight * (1.0 + clutch_mult) if clutch_mult > 0 else base_weight * 0.5
+        if weight == 0.0:
+            continue
+        b_dim = PITCHER_TO_BATTER.get(p_dim)
+        b_idx = BATTER_DIM_NAMES.index(b_dim)
+        k = config.get_pitcher_k_factor(p_dim)
+        scale = config.get_pitcher_scale(p_dim)
+        reliability = engine.calculate_reliability(
+            int(pitcher.event_counts[p_idx]), p_dim, is_pitcher=True)
+        divisor = (config.get_expected_divisor(b_dim)
+                   + config.get_expected_divisor(p_dim, is_pitcher=True)) / 2
+        expected = engine.calculate_expected_score(
+            pitcher.elo_dimensions[p_idx], batter.elo_dimensions[b_idx], divisor=divisor)
+        actual = 1.0 if weight > 0 else 0.0
+        pitcher_deltas[p_idx] += k * scale * abs(weight) * (actual - expected) * reliability
+    return batter_deltas, pitcher_deltas
+
+
+class TestCompiledTables:
+
+    def test_weights_match_getters(self):
+        config = MultiEloConfig()
+        tables = config.tables
+        for event, code in tables.event_codes.items():
+            bw = config.get_event_weights(event)
+            pw = config.get_pitcher_event_weights(event)
+            assert tables.batter_weights[code].tolist() == [
+                bw['clutch_base'] if d == 'clutch' else bw[d] for d in BATTER_DIM_NAMES]
+            assert tables.pitcher_weights[code].tolist() == [
+                pw['clutch_base'] if d == 'clutch' else pw[d] for d in PITCHER_DIM_NAMES]
+        assert tables.clutch_multiplier[tables.event_code('GIDP')] == 2.0
+        assert not tables.batter_weights[tables.event_code('Unknown')].any()
+
+    def test_dimension_tables(self):
+        config = MultiEloConfig()
+        tables = config.tables
+        assert tables.batter_k_scale[1] == config.get_batter_k_factor('power') * config.get_batter_scale('power')
+        assert tables.pitcher_threshold.tolist() == [400, 400, 400, 100]
+        assert tables.batter_opp_idx.tolist() == [0, 1, 2, -1, 3]
+        assert tables.pitcher_opp_idx.tolist() == [0, 0, 2, 4]
+        assert np.isnan(tables.batter_divisor[3])
+        assert tables.pitcher_divisor[1] == (127.0 + 181.0) / 2
+
+
+class TestVectorizedEngineParity:
+
+    @pytest.mark.parametrize('seed', [0, 1, 2])
+    def test_matches_reference_loop(self, seed):
+        rng = np.random.default_rng(seed)
+        engine = MultiEloEngine()
+        for _ in range(400):
+            batter = BatterTalentState(
+                player_id=1,
+                elo_dimensions=rng.uniform(900, 2100, 5),
+                event_counts=rng.integers(0, 500, 5).astype(float),
+            )
+            pitcher = PitcherTalentState(
+                player_id=2,
+                elo_dimensions=rng.uniform(900, 2100, 4),
+                event_counts=rng.integers(0, 500, 4).astype(float),
+            )
+            event = EVENTS[rng.integers(len(EVENTS))]
+            leverage = float(rng.choice([0.5, 1.0, 1.7, 3.0, 6.0]))
+            is_risp = bool(rng.random() < 0.3)
+            expected_b, expected_p = _reference_deltas(
+                engine, batter, pitcher, event, leverage, is_risp)
+            b_counts = batter.event_counts.copy()
+
+            result = engine.process_plate_appearance(
+                batter, pitcher, event, leverage_index=leverage, is_risp=is_risp)
+
+            np.testing.assert_allclose(result.batter_deltas, expected_b, rtol=1e-12, atol=0)
+            np.testing.assert_allclose(result.pitcher_deltas, expected_p, rtol=1e-12, atol=0)
+            assert (batter.event_counts - b_counts).tolist() == (expected_b != 0).astype(float).tolist()
+
+
+@pytest.fixture
+def edge_config(tmp_path):
+    """HR에 clutch_multiplier, contact / pitcher clutch threshold 0인 config."""
+    with open(MultiEloConfig.DEFAULT_CONFIG_PATH, encoding='utf-8') as f:
+        raw = yaml.safe_load(f)
+    raw['event_weights']['HR']['clutch_multiplier'] = 3.0
+    raw['batter_dimensions'][0]['reliability_threshold'] = 0
+    raw['pitcher_dimensions'][3]['reliability_threshold'] = 0
+    path = tmp_path / 'edge.yaml'
+    path.write_text(yaml.safe_dump(raw, allow_unicode=True), encoding='utf-8')
+    return MultiEloConfig(path)
+
+
+class TestLegacyEdgeSemantics:
+
+    def test_clutch_multiplier_gidp_only(self, edge_config):
+        tables = edge_config.tables
+        assert tables.clutch_multiplier[tables.event_code('GIDP')] == 2.0
+        assert tables.clutch_multiplier[tables.event_code('HR')] == 1.0
+        mask = np.ones(len(tables.clutch_multiplier), dtype=bool)
+        mask[tables.event_code('GIDP')] = False
+        assert (tables.clutch_multiplier[mask] == 1.0).all()
+
+    def test_reliability_ramp_zero_threshold(self):
+        counts = np.array([0.0, 0.0, 50.0, 400.0, 500.0])
+        threshold = np.array([0.0, 400.0, 400.0, 400.0, 400.0])
+        assert reliability_ramp(counts, threshold).tolist() == pytest.approx([1.0, 0.3, 0.3875, 1.0, 1.0])
+
+    @pytest.mark.parametrize('seed', [0, 1])
+    def test_engine_matches_reference_loop(self, edge_config, seed):
+        rng = np.random.default_rng(seed)
+        engine = MultiEloEngine(edge_config)
+        for _ in range(200):
+            batter = BatterTalentState(
+                player_id=1,
+                elo_dimensions=rng.uniform(900, 2100, 5),
+                event_counts=rng.integers(0, 3, 5).astype(float),
+            )
+            pitcher = PitcherTalentState(
+                player_id=2,
+                elo_dimensions=rng.uniform(900, 2100, 4),
+                event_counts=rng.integers(0, 3, 4).astype(float),
+            )
+            event = EVENTS[rng.integers(len(EVENTS))]
+            leverage = float(rng.choice([0.5, 1.0, 3.0]))
+            is_risp = bool(rng.random() < 0.5)
+            expected_b, expected_p = _reference_deltas(
+                engine, batter, pitcher, event, leverage, is_risp)
+
+            result = engine.process_plate_appearance(
+                batter, pitcher, event, leverage_index=leverage, is_risp=is_risp)
+
+            assert np.isfinite(result.batter_deltas).all() and np.isfinite(result.pitcher_deltas).all()
+            np.testing.assert_allclose(result.batter_deltas, expected_b, rtol=1e-12, atol=0)
+            np.testing.assert_allclose(result.pitcher_deltas, expected_p, rtol=1e-12, atol=0)
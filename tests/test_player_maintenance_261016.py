@@ -0,0 +1,117 @@
+"""Player maintenance engine (team backfill / 정규화) + TokenBucket 테스트."""
+
+import threading
+
+import pytest
+
+from src.etl.player_maintenance import (
+    TeamResolver, backfill_player_teams, normalize_team_names, plan_team_backfill,
+)
+from src.etl.rate_limiter import TokenBucket
+
+MLB_TEAMS = [
+    {'id': 147, 'name': 'New York Yankees', 'abbreviation': 'NYY'},
+    {'id': 119, 'name': 'Los Angeles Dodgers', 'abbreviation': 'LAD'},
+]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+class StubApi:
+    """MlbApiClient.fetch_players 대체 (요청된 ID 기록)."""
+
+    def __init__(self, records):
+        self.records = records
+        self.requested = []
+
+    def fetch_players(self, ids):
+        self.requested.append(sorted(ids))
+        return {pid: self.records[pid] for pid in ids if pid in self.records}
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=5, clock=clock, sleep=clock.sleep)
+        waits = [bucket.acquire() for _ in range(15)]
+        assert waits[:5] == [0.0] * 5
+        assert all(w > 0 for w in waits[5:])
+        # 5개 burst 이후 10개는 초당 10개 → 약 1초
+        assert clock.now == pytest.approx(1.0)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestTeamResolver:
+    def test_one_map_for_ids_names_abbrevs_and_milb(self):
+        resolver = TeamResolver(MLB_TEAMS)
+        assert resolver.resolve('New York Yankees') == 'NYY'
+        assert resolver.resolve(119) == 'LAD'
+        assert resolver.resolve('LAD') == 'LAD'
+        assert resolver.resolve('Scranton/Wilkes-Barre RailRiders') == 'NYY'
+        assert resolver.resolve('Nowhere Nine') is None
+
+
+class TestNormalizeTeamNames:
+    def test_all_rows_normalized_in_batches(self, fake_supabase):
+        names = ['New York Yankees', 'LAD', 'Oklahoma City Comets', 'Nowhere Nine', '']
+        rows = [{'player_id': i, 'full_name': f'P {i}', 'team': names[i % 5]} for i in range(1, 2_501)]
+        client = fake_supabase({'players': rows}, primary_keys={'players': 'player_id'})
+
+        stats = normalize_team_names(client, TeamResolver(MLB_TEAMS), workers=4)
+
+        assert stats['total'] == 2_000
+        assert stats['updated'] == 1_000 and stats['skipped'] == 500
+        assert len(stats['unknown']) == 500
+        teams = {r['player_id']: r['team'] for r in client.tables['players']}
+        assert teams[5] == 'NYY' and teams[2] == 'LAD' and teams[3] == 'Nowhere Nine'
+        assert teams[2_495] == 'NYY'          # 200행 제한 없이 끝까지
+        upserts = [r for r in client.requests if r == ('players', 'upsert')]
+        assert 0 < len(upserts) <= 10
+
+
+class TestBackfillPlayerTeams:
+    def test_backfill_updates_team_and_fallback_names(self, fake_supabase):
+        rows = [{'player_id': i, 'first_name': '', 'last_name': '', 'full_name': f'Player {i}',
+                 'team': '', 'position': ''} for i in range(1, 301)]
+        rows.append({'player_id': 999, 'first_name': 'A', 'last_name': 'B', 'full_name': 'A B',
+                     'team': 'NYY', 'position': 'C'})
+        client = fake_supabase({'players': rows}, primary_keys={'players': 'player_id'})
+        api = StubApi({
+            i: {'player_id': i, 'first_name': 'F', 'last_name': str(i), 'full_name': f'F {i}',
+                'team': 'LAD' if i % 3 else '', 'position': 'P'}
+            for i in range(1, 301)
+        })
+
+        stats = backfill_player_teams(client, api)
+
+        assert api.requested == [list(range(1, 301))]
+        assert stats['total'] == 300 and stats['updated'] == 200
+        assert stats['still_empty'] == list(range(3, 301, 3))
+        by_id = {r['player_id']: r for r in client.tables['players']}
+        assert by_id[1]['team'] == 'LAD' and by_id[1]['full_name'] == 'F 1'
+        assert by_id[3]['team'] == ''
+        assert by_id[999]['team'] == 'NYY'
+
+    def test_real_names_kept(self):
+        import pandas as pd
+
+        players = pd.DataFrame([{'player_id': 5, 'first_name': 'Real', 'last_name': 'Name',
+                                 'full_name': 'Real Name', 'position': ''}])
+        records, _ = plan_team_backfill(players, {5: {'team': 'NYY', 'position': 'SS', 'full_name': 'X Y',
+                                                      'first_name': 'X', 'last_name': 'Y'}})
+        assert records == [{'player_id': 5, 'first_name': 'Real', 'last_name': 'Name',
+                            'full_name': 'Real Name', 'team': 'NYY', 'position': 'SS'}]
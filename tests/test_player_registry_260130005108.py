@@ -129,16 +129,16 @@ class TestFetchPlayerFromMlbApi:
 
 
 class TestRegisterNewPlayers:
-    @patch('src.etl.player_registry.fetch_player_from_mlb_api')
+    @patch('src.etl.player_registry.MlbApiClient.fetch_players')
     def test_registers_via_mlb_api(self, mock_fetch):
-        mock_fetch.return_value = {
+        mock_fetch.return_value = {999: {
             'player_id': 999,
             'first_name': 'New',
             'last_name': 'Player',
             'full_name': 'New Player',
             'team': 'NYY',
             'position': 'SS',
-        }
+        }}
         client = MagicMock()
         pa_df = pd.DataFrame({'batter_id': [999], 'pitcher_id': [200]})
 
@@ -146,10 +146,10 @@ class TestRegisterNewPlayers:
         assert count == 1
         client.table.return_value.upsert.assert_called_once()
 
-    @patch('src.etl.player_registry.fetch_player_from_mlb_api')
+    @patch('src.etl.player_registry.MlbApiClient.fetch_players')
     def test_fallback_on_api_failure(self, mock_fetch):
         """API 실패 시 fallback 레코드 생성."""
-        mock_fetch.return_value = None
+        mock_fetch.return_value = {}
         client = MagicMock()
         pa_df = pd.DataFrame({'batter_id': [888], 'pitcher_id': [200]})
 
@@ -165,13 +165,13 @@ class TestRegisterNewPlayers:
         count = register_new_players(set(), pa_df, client)
         assert count == 0
 
-    @patch('src.etl.player_registry.fetch_player_from_mlb_api')
+    @patch('src.etl.player_registry.MlbApiClient.fetch_players')
     def test_multiple_new_players(self, mock_fetch):
-        mock_fetch.side_effect = [
-            {'player_id': 111, 'first_name': 'A', 'last_name': 'B',
-             'full_name': 'A B', 'team': 'BOS', 'position': 'C'},
-            None,  # second player API fails
-        ]
+        mock_fetch.return_value = {
+            111: {'player_id': 111, 'first_name': 'A', 'last_name': 'B',
+                  'full_name': 'A B', 'team': 'BOS', 'position': 'C'},
+            # 222: API 실패 → fallback
+        }
         client = MagicMock()
         pa_df = pd.DataFrame({'batter_id': [111, 222], 'pitcher_id': [200, 200]})
 
@@ -0,0 +1,205 @@
+"""run_range_pipeline (daily_elo --range in-memory 모드) 테스트.
+
+- 범위 fetch / 상태 로드 1회, 결과 = 날짜 전체를 한 EloBatch로 처리한 것과 동일
+- checkpoint_days: flush 횟수만 달라지고 업로드 내용은 같음
+- 기본 EloBatch engine은 array (python engine과 업로드 내용 동일)
+- 이미 처리된 날짜는 force 없이 skip
+- force: start 이전 snapshot 복원 후 snapshot 이후 처리된 날짜까지 replay
+  (snapshot이 없으면 삭제 전에 실패, reapply_without_snapshot=True일 때만 재적용)
+"""
+from collections import defaultdict
+from datetime import date
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.engine.elo_batch import EloBatch
+from src.engine.park_factor import ParkFactor
+from src.engine.re24_baseline import RE24Baseline
+from src.engine.state_snapshot import SnapshotStore
+from src.engine.talent_batch import TalentBatch
+from src.pipeline.daily_pipeline import run_range_pipeline, talent_rows_to_arrays
+from src.pipeline.state_cache import StateCache
+from tests.test_elo_array_engine_261016 import _random_season
+from tests.test_state_snapshot_261016 import REMOTE_WATERMARK
+
+
+@pytest.fixture
+def season():
+    return _random_season(900, n_days=4, seed=21)
+
+
+@pytest.fixture
+def pipeline_mocks(season):
+    uploads = defaultdict(list)
+
+    def _upload(client, table, records, **kw):
+        uploads[table].append(records)
+        return len(records)
+
+    targets = {
+        'client': 'get_supabase_client',
+        'processed': '_processed_dates',
+        'fetch': 'fetch_statcast_range',
+        'convert': 'convert_statcast_to_pa',
+        'detect': 'detect_new_player_ids_batch',
+        'watermark': 'fetch_state_watermark',
+        'load_elo': 'load_current_elo_states',
+        'load_talent': 'load_current_talent_arrays',
+        'upload': 'upload_table',
+    }
+    patchers = {k: patch(f'src.pipeline.daily_pipeline.{v}') for k, v in targets.items()}
+    mocks = {k: p.start() for k, p in patchers.items()}
+    mocks['processed'].return_value = {}
+    mocks['fetch'].return_value = pd.DataFrame({'x': [1]})
+    mocks['convert'].return_value = season
+    mocks['detect'].return_value = []
+    mocks['watermark'].return_value = {'last_date': None}
+    mocks['load_elo'].return_value = {}
+    mocks['load_talent'].return_value = talent_rows_to_arrays([])
+    mocks['upload'].side_effect = _upload
+    mocks['uploads'] = uploads
+    yield mocks
+    for p in patchers.values():
+        p.stop()
+
+
+def _run(tmp_path, season, **kwargs):
+    days = sorted(season['game_date'].unique())
+    return run_range_pipeline(
+        date.fromisoformat(days[0]), date.fromisoformat(days[-1]),
+        snapshot_store=SnapshotStore(tmp_path / 'snap'),
+        state_cache=StateCache(tmp_path / 'cache.npz'), **kwargs,
+    )
+
+
+def _flat(uploads, table):
+    return [r for records in uploads[table] for r in records]
+
+
+class TestRangePipeline:
+    def test_single_load_and_flush(self, pipeline_mocks, season, tmp_path):
+        result = _run(tmp_path, season)
+
+        assert result['status'] == 'success'
+        assert result['checkpoints'] == 1
+        assert [d['pa_count'] for d in result['days']] == \
+            season.groupby('game_date').size().tolist()
+        pipeline_mocks['fetch'].assert_called_once()
+        pipeline_mocks['load_elo'].assert_called_once()
+        pipeline_mocks['load_talent'].assert_called_once()
+
+        uploads = pipeline_mocks['uploads']
+        assert len(uploads['player_elo']) == 1
+        assert result['pa_uploaded'] == len(season)
+        assert result['detail_uploaded'] == len(season)
+
+        expected = EloBatch(re24_baseline=RE24Baseline(), park_factor=ParkFactor())
+        expected.process(season)
+        assert _flat(uploads, 'player_elo') == expected.get_player_elo_records(active_only=True)
+
+    def test_checkpoints_upload_same_content(self, pipeline_mocks, season, tmp_path):
+        single = _run(tmp_path / 'a', season)
+        single_uploads = {t: _flat(pipeline_mocks['uploads'], t) for t in list(pipeline_mocks['uploads'])}
+        pipeline_mocks['uploads'].clear()
+
+        chunked = _run(tmp_path / 'b', season, checkpoint_days=1)
+        uploads = pipeline_mocks['uploads']
+
+        assert chunked['checkpoints'] == 4
+        assert len(uploads['player_elo']) == 4
+        assert chunked['active_players'] == single['active_players']
+        for table in ('elo_pa_detail', 'daily_ohlc', 'talent_pa_detail', 'talent_daily_ohlc', 'plate_appearances'):
+            assert _flat(uploads, table) == single_uploads[table], table
+
+        # player_elo: 마지막 업로드 값 = single flush 값
+        latest = {r['player_id']: r for r in _flat(uploads, 'player_elo')}
+        assert latest == {r['player_id']: r for r in single_uploads['player_elo']}
+
+    def test_array_engine_by_default_matches_python(self, pipeline_mocks, season, tmp_path):
+        with patch('src.pipeline.daily_pipeline.EloBatch', wraps=EloBatch) as spy:
+            _run(tmp_path / 'a', season)
+        assert spy.call_args.kwargs['engine'] == 'array'
+        array_uploads = {t: _flat(pipeline_mocks['uploads'], t) for t in list(pipeline_mocks['uploads'])}
+        pipeline_mocks['uploads'].clear()
+
+        _run(tmp_path / 'b', season, elo_engine='python')
+        for table in ('player_elo', 'elo_pa_detail', 'daily_ohlc'):
+            assert _flat(pipeline_mocks['uploads'], table) == array_uploads[table], table
+
+    def test_skips_processed_dates(self, pipeline_mocks, season, tmp_path):
+        days = sorted(season['game_date'].unique())
+        pipeline_mocks['processed'].return_value = {days[1]: 120}
+
+        result = _run(tmp_path, season)
+
+        assert result['skipped'] == [days[1]]
+        assert [d['date'] for d in result['days']] == [days[0], days[2], days[3]]
+        assert result['pa_count'] == int((season['game_date'] != days[1]).sum())
+
+    def test_watermark_read_before_pa_upload(self, pipeline_mocks, season, tmp_path):
+        events = []
+        pipeline_mocks['watermark'].side_effect = lambda client: events.append('watermark') or {'last_date': None}
+        upload = pipeline_mocks['upload'].side_effect
+        pipeline_mocks['upload'].side_effect = \
+            lambda client, table, records, **kw: events.append(table) or upload(client, table, records, **kw)
+
+        _run(tmp_path, season)
+
+        assert events.index('watermark') < events.index('plate_appearances')
+
+    def test_force_replays_processed_days_before_range_from_stale_snapshot(self, pipeline_mocks, tmp_path):
+        pa_df = _random_season(1200, n_days=5, seed=31)
+        days = sorted(pa_df['game_date'].unique())
+        store = SnapshotStore(tmp_path / 'snap')
+        full = EloBatch(re24_baseline=RE24Baseline(), park_factor=ParkFactor(), snapshot_store=store)
+        full.process(pa_df)
+        TalentBatch(snapshot_store=store).process(pa_df)
+        # days[1]은 처리됐지만 로컬 snapshot 없음 → days[0] snapshot에서 시작해야 함
+        for kind in ('elo', 'talent'):
+            store.path(kind, days[1]).unlink()
+        store.save_watermark(REMOTE_WATERMARK)
+        pipeline_mocks['watermark'].return_value = REMOTE_WATERMARK
+
+        in_range = pa_df['game_date'].isin(days[2:4])
+        pipeline_mocks['processed'].return_value = {day: 100 for day in days[2:4]}
+        pipeline_mocks['convert'].return_value = pa_df[in_range].reset_index(drop=True)
+
+        def stored_after(client, after):
+            return pa_df[(pa_df['game_date'] > after.isoformat()) & ~in_range].reset_index(drop=True)
+
+        with patch('src.pipeline.daily_pipeline.delete_date_data') as mock_delete, \
+                patch('src.pipeline.daily_pipeline.load_plate_appearances', side_effect=stored_after):
+            result = run_range_pipeline(
+                date.fromisoformat(days[2]), date.fromisoformat(days[3]), force=True,
+                snapshot_store=store, state_cache=StateCache(tmp_path / 'cache.npz'),
+            )
+
+        assert mock_delete.call_count == 2
+        assert result['replayed_from'] == days[0]
+        assert result['state_source'] == 'snapshot'
+        assert result['replayed_pa_count'] == int((pa_df['game_date'] > days[0]).sum())
+        pipeline_mocks['load_elo'].assert_not_called()
+
+        expected = {r['player_id']: r for r in full.get_player_elo_records()}
+        uploaded = _flat(pipeline_mocks['uploads'], 'player_elo')
+        assert uploaded
+        for record in uploaded:
+            assert record == expected[record['player_id']]
+        assert [d.isoformat() for d in store.dates('elo')] == days
+
+    def test_force_without_snapshot_fails_before_deleting(self, pipeline_mocks, season, tmp_path):
+        days = sorted(season['game_date'].unique())
+        pipeline_mocks['processed'].return_value = {days[0]: 100}
+        pipeline_mocks['watermark'].return_value = REMOTE_WATERMARK
+
+        with patch('src.pipeline.daily_pipeline.delete_date_data') as mock_delete:
+            with pytest.raises(RuntimeError, match='count it twice'):
+                _run(tmp_path, season, force=True)
+            mock_delete.assert_not_called()
+            pipeline_mocks['fetch'].assert_not_called()
+
+            result = _run(tmp_path, season, force=True, reapply_without_snapshot=True)
+        assert result['status'] == 'success' and result['replayed_from'] is None
+        assert mock_delete.call_count == 1
@@ -0,0 +1,188 @@
+"""Columnar record serializer 테스트 (기존 레코드 루프와 값 동일성)."""
+
+import json
+import math
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.etl.record_serializer as record_serializer
+from src.engine.detail_buffer import DetailBuffer
+from src.engine.elo_batch import DailyOhlc
+from src.etl.record_serializer import (
+    date_column,
+    dumps,
+    encode_json_batches,
+    frame_to_records,
+    int_column,
+    records_from_columns,
+    round_array,
+    round_column,
+)
+from src.etl.upload_to_supabase import prepare_pa_records
+from src.pipeline.daily_pipeline import (
+    _prepare_ohlc_records,
+    _prepare_pa_detail_records,
+    _prepare_talent_ohlc_records,
+)
+
+
+def _bits(values) -> list[int]:
+    return np.asarray(values, dtype=np.float64).view(np.int64).tolist()
+
+
+class TestRoundArray:
+    def test_matches_python_round_random(self):
+        rng = np.random.default_rng(17)
+        x = np.concatenate([
+            rng.normal(1500, 200, 50_000),
+            rng.normal(0, 5, 50_000),
+            rng.uniform(-1, 1, 50_000),
+        ])
+        assert _bits(round_array(x)) == _bits([round(v, 4) for v in x.tolist()])
+
+    def test_matches_python_round_ties(self):
+        # 10진 tie (x.xxxx5) — binary 표현에 따라 위/아래로 갈림
+        x = np.array([n / 100_000 for n in range(-20_005, 20_005, 10)] +
+                     [1500.00005, 1500.00015, 0.00005, 2.675, 1e15 + 0.5, 1e300])
+        assert _bits(round_array(x)) == _bits([round(v, 4) for v in x.tolist()])
+        assert _bits(round_array(x, 2)) == _bits([round(v, 2) for v in x.tolist()])
+
+    def test_nan_and_inf(self):
+        out = round_column([1.23456, float('nan'), float('inf')])
+        assert out[0] == 1.2346
+        assert out[1] is None
+        assert out[2] == float('inf')
+
+
+class TestColumns:
+    def test_int_column_nullable(self):
+        assert int_column(np.array([1.0, np.nan, 3.0])) == [1, None, 3]
+        out = int_column(np.array([7, 8], dtype=np.int32))
+        assert out == [7, 8] and type(out[0]) is int
+
+    def test_date_column(self):
+        dt = pd.Series(pd.to_datetime(['2025-04-01', None]))
+        assert date_column(dt) == ['2025-04-01', None]
+        assert date_column([date(2025, 4, 2), '2025-04-03', None]) == ['2025-04-02', '2025-04-03', None]
+
+    def test_records_from_columns_scalar_and_category(self):
+        records = records_from_columns({
+            'pa_id': np.array([1, 2], dtype=np.int64),
+            'result_type': pd.Categorical.from_codes([0, -1], categories=['HR']),
+            'elo': np.array([1500.123456, np.nan]),
+            'power_delta': 0.0,
+        }, round_columns=['elo'])
+        assert records == [
+            {'pa_id': 1, 'result_type': 'HR', 'elo': 1500.1235, 'power_delta': 0.0},
+            {'pa_id': 2, 'result_type': None, 'elo': None, 'power_delta': 0.0},
+        ]
+
+    def test_frame_to_records_matches_to_dict(self):
+        df = pd.DataFrame({
+            'player_id': [1, 2],
+            'name': ['A', None],
+            'team': [np.nan, 'NYY'],
+            'elo': [1500.5, np.nan],
+            'active': [True, False],
+        })
+        expected = df.to_dict('records')
+        for r in expected:
+            for k, v in r.items():
+                if isinstance(v, float) and math.isnan(v):
+                    r[k] = None
+        assert frame_to_records(df) == expected
+
+    def test_empty(self):
+        assert records_from_columns({'a': np.array([]), 'b': 0.0}) == []
+
+
+class TestProducers:
+    def test_pa_detail_records_match_loop(self):
+        rng = np.random.default_rng(3)
+        n = 500
+        buf = DetailBuffer({
+            'pa_id': 'int64', 'batter_id': 'int64', 'pitcher_id': 'int64', 'result_type': 'category',
+            'batter_elo_before': 'float64', 'batter_elo_after': 'float64',
+            'pitcher_elo_before': 'float64', 'pitcher_elo_after': 'float64', 'elo_delta': 'float64',
+        })
+        buf.extend({
+            'pa_id': np.arange(n), 'batter_id': rng.integers(1, 50, n), 'pitcher_id': rng.integers(50, 99, n),
+            'result_type': rng.choice(['HR', 'OUT', '1B'], n),
+            'batter_elo_before': rng.normal(1500, 100, n), 'batter_elo_after': rng.normal(1500, 100, n),
+            'pitcher_elo_before': rng.normal(1500, 100, n), 'pitcher_elo_after': rng.normal(1500, 100, n),
+            'elo_delta': rng.normal(0, 4, n),
+        })
+        cols = buf.to_lists()
+        expected = [
+            {
+                'pa_id': cols['pa_id'][i],
+                'batter_id': cols['batter_id'][i],
+                'pitcher_id': cols['pitcher_id'][i],
+                'result_type': cols['result_type'][i],
+                'batter_elo_before': round(cols['batter_elo_before'][i], 4),
+                'batter_elo_after': round(cols['batter_elo_after'][i], 4),
+                'pitcher_elo_before': round(cols['pitcher_elo_before'][i], 4),
+                'pitcher_elo_after': round(cols['pitcher_elo_after'][i], 4),
+                'on_base_delta': round(cols['elo_delta'][i], 4),
+                'power_delta': 0.0,
+            }
+            for i in range(n)
+        ]
+        assert _prepare_pa_detail_records(buf) == expected
+
+    def test_ohlc_records(self):
+        ohlc = [DailyOhlc(player_id=np.int64(7), game_date=date(2025, 4, 1), elo_type='SEASON',
+                          open_elo=1500.00005, high_elo=1510.123456, low_elo=1499.0, close_elo=1505.55555,
+                          games_played=1, total_pa=4, role='BATTING')]
+        r = _prepare_ohlc_records(ohlc)[0]
+        assert r['player_id'] == 7 and type(r['player_id']) is int
+        assert r['game_date'] == '2025-04-01'
+        assert r['open'] == round(1500.00005, 4)
+        assert r['close'] == round(1505.55555, 4)
+        assert (r['games_played'], r['total_pa'], r['role']) == (1, 4, 'BATTING')
+
+    def test_talent_ohlc_defaults(self):
+        r = _prepare_talent_ohlc_records([{
+            'player_id': 7, 'game_date': '2025-04-01', 'talent_type': 'contact',
+            'open': 1500.123456, 'high': 1501, 'low': 1499, 'close': 1500.5,
+        }])[0]
+        assert r['elo_type'] == 'SEASON'
+        assert r['total_pa'] == 0
+        assert r['open_elo'] == 1500.1235
+        assert r['high_elo'] == 1501.0
+
+    def test_pa_records_nullable_int(self):
+        df = pd.DataFrame({
+            'pa_id': [1, 2], 'game_date': pd.to_datetime(['2025-04-01', '2025-04-02']),
+            'bat_score': [3.0, np.nan], 'xwoba': [0.4, np.nan],
+        })
+        records = prepare_pa_records(df)
+        assert records[0]['bat_score'] == 3 and type(records[0]['bat_score']) is int
+        assert records[1]['bat_score'] is None
+        assert records[1]['xwoba'] is None
+        assert records[1]['game_date'] == '2025-04-02'
+
+
+class TestJsonEncoding:
+    RECORDS = [{'a': 1, 'b': float('nan'), 'c': 'x'}, {'a': np.int64(2), 'b': 1.5, 'c': None}]
+
+    def test_dumps_nan_to_null(self):
+        assert json.loads(dumps(self.RECORDS)) == [
+            {'a': 1, 'b': None, 'c': 'x'}, {'a': 2, 'b': 1.5, 'c': None},
+        ]
+
+    def test_stdlib_fallback_matches(self, monkeypatch):
+        expected = json.loads(dumps(self.RECORDS))
+        monkeypatch.setattr(record_serializer, 'orjson', None)
+        assert json.loads(dumps(self.RECORDS)) == expected
+
+    def test_encode_json_batches(self):
+        records = [{'i': i} for i in range(5)]
+        batches = [json.loads(b) for b in encode_json_batches(records, batch_size=2)]
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert sum(batches, []) == records
+        with pytest.raises(ValueError):
+            list(encode_json_batches(records, batch_size=0))
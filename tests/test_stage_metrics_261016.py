@@ -0,0 +1,116 @@
+"""Pipeline stage metrics (단계별 wall time / rows / peak RSS) 테스트."""
+
+import json
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from src.pipeline.stage_metrics import StageMetrics, peak_rss_bytes
+from tests.test_elo_array_engine_261016 import _random_season
+
+
+class TestStageMetrics:
+    def test_stage_records_time_rows_and_rss(self):
+        metrics = StageMetrics('daily')
+        with metrics.stage('fetch') as stage:
+            stage.rows = 500
+        with metrics.stage('upload_player_elo', rows=10):
+            pass
+        summary = metrics.summary()
+        assert list(summary) == ['fetch', 'upload_player_elo']
+        assert summary['fetch']['rows'] == 500 and summary['fetch']['calls'] == 1
+        assert summary['fetch']['seconds'] >= 0
+        if peak_rss_bytes() is not None:
+            assert summary['fetch']['peak_rss_mb'] > 0
+
+    def test_repeated_stage_accumulates(self):
+        metrics = StageMetrics('range')
+        metrics.record('elo_process', 2.0, rows=100)
+        metrics.record('elo_process', 3.0, rows=400)
+        metrics.record('state_save', 0.5)
+        summary = metrics.summary()
+        assert summary['elo_process'] == pytest.approx(
+            {'seconds': 5.0, 'rows': 500, 'rows_per_sec': 100.0, 'peak_rss_mb': None,
+             'rss_growth_mb': 0.0, 'calls': 2})
+        assert summary['state_save']['rows_per_sec'] is None
+
+    def test_stage_recorded_on_exception(self):
+        metrics = StageMetrics('daily')
+        with pytest.raises(RuntimeError):
+            with metrics.stage('upload_daily_ohlc'):
+                raise RuntimeError('boom')
+        assert metrics.summary()['upload_daily_ohlc']['calls'] == 1
+
+    def test_json_lines_append(self, tmp_path):
+        path = tmp_path / 'm.jsonl'
+        for day in ('2025-04-01', '2025-04-02'):
+            metrics = StageMetrics('daily')
+            metrics.record('fetch', 1.5, rows=3000)
+            assert metrics.write(path, labels={'date': day}) == path
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line['date'] for line in lines] == ['2025-04-01', '2025-04-02']
+        assert lines[0]['stages']['fetch']['rows_per_sec'] == 2000.0
+
+    def test_prometheus_textfile(self, tmp_path):
+        path = tmp_path / 'elo.prom'
+        metrics = StageMetrics('daily')
+        metrics.record('fetch', 2.0, rows=1000, rss_before=10, rss_after=2048)
+        metrics.write(path, labels={'date': '2025-04-01'})
+        text = path.read_text()
+        assert '# TYPE elo_pipeline_stage_seconds gauge' in text
+        assert 'elo_pipeline_stage_rows_per_second{pipeline="daily",date="2025-04-01",stage="fetch"} 500' in text
+        assert 'elo_pipeline_stage_peak_rss_bytes{pipeline="daily",date="2025-04-01",stage="fetch"} 2048' in text
+        metrics.write(path)      # 덮어쓰기
+        assert path.read_text().count('# TYPE elo_pipeline_stage_seconds gauge') == 1
+
+
+class TestPipelineStages:
+    @patch('src.pipeline.daily_pipeline.fetch_state_watermark', return_value={'last_date': None})
+    @patch('src.pipeline.daily_pipeline.upload_table')
+    @patch('src.pipeline.daily_pipeline.load_current_talent_arrays')
+    @patch('src.pipeline.daily_pipeline.load_current_elo_states', return_value={})
+    @patch('src.pipeline.daily_pipeline.detect_new_player_ids_batch', return_value=[])
+    @patch('src.pipeline.daily_pipeline.convert_statcast_to_pa')
+    @patch('src.pipeline.daily_pipeline.fetch_statcast_date')
+    @patch('src.pipeline.daily_pipeline.get_supabase_client')
+    def test_daily_result_and_metrics_file(
+        self, mock_client, mock_fetch, mock_convert, _detect, _load_elo,
+        mock_load_talent, mock_upload, _watermark, tmp_path, monkeypatch,
+    ):
+        from src.engine.state_snapshot import SnapshotStore
+        from src.pipeline.daily_pipeline import run_daily_pipeline, talent_rows_to_arrays
+        from src.pipeline.state_cache import StateCache
+
+        metrics_path = tmp_path / 'daily.jsonl'
+        monkeypatch.setenv('ELO_METRICS_FILE', str(metrics_path))
+        pa_df = _random_season(300, n_days=1, seed=9)
+        existing = MagicMock()
+        existing.count = 0
+        mock_client.return_value.table.return_value.select.return_value.eq.return_value \
+            .limit.return_value.execute.return_value = existing
+        mock_fetch.return_value = pd.DataFrame({'x': range(1200)})
+        mock_convert.return_value = pa_df
+        mock_load_talent.return_value = talent_rows_to_arrays([])
+        mock_upload.side_effect = lambda client, table, records, **kw: len(records)
+
+        result = run_daily_pipeline(target_date=date(2025, 4, 1),
+                                    snapshot_store=SnapshotStore(tmp_path / 'snap'),
+                                    state_cache=StateCache(tmp_path / 'cache.npz'))
+
+        stages = result['stages']
+        assert list(stages) == [
+            'fetch', 'convert', 'register', 'upload_plate_appearances', 'state_load',
+            'elo_process', 'talent_process', 'upload_player_elo', 'upload_elo_pa_detail',
+            'upload_daily_ohlc', 'upload_talent_player_current', 'upload_talent_pa_detail',
+            'upload_talent_daily_ohlc', 'state_save',
+        ]
+        assert stages['fetch']['rows'] == 1200
+        assert stages['elo_process']['rows'] == len(pa_df)
+        assert stages['upload_elo_pa_detail']['rows'] == result['detail_uploaded']
+        assert result['total_seconds'] >= sum(s['seconds'] for s in stages.values()) - 0.01
+
+        logged = json.loads(metrics_path.read_text())
+        assert logged['pipeline'] == 'daily' and logged['date'] == '2025-04-01'
+        assert logged['stages'] == stages
@@ -0,0 +1,96 @@
+"""Statcast pitch cache (statcast_cache) + cache-first fetch 테스트."""
+from datetime import date
+from unittest.mock import patch
+
+import pandas as pd
+
+from src.etl.fetch_statcast import fetch_statcast_date, fetch_statcast_range
+from src.etl.statcast_cache import STATCAST_CACHE_COLUMNS, StatcastCache
+
+
+def _pitches(day: str, n: int = 4, game_type: str = 'R') -> pd.DataFrame:
+    return pd.DataFrame({
+        'game_pk': [1] * n,
+        'game_date': pd.to_datetime([day] * n),
+        'game_type': [game_type] * n,
+        'at_bat_number': list(range(1, n + 1)),
+        'batter': [100 + i for i in range(n)],
+        'pitcher': [200] * n,
+        'events': ['single', None, 'strikeout', None][:n],
+        'pitch_name': ['4-Seam Fastball'] * n,  # 캐시 대상 아님
+    })
+
+
+class TestStatcastCache:
+    def test_write_read_projects_columns(self, tmp_path):
+        cache = StatcastCache(tmp_path)
+        assert cache.write(date(2025, 4, 1), _pitches('2025-04-01')) == 4
+
+        df = cache.read('2025-04-01')
+        assert 'pitch_name' not in df.columns
+        assert set(df.columns) <= set(STATCAST_CACHE_COLUMNS)
+        assert df['batter'].tolist() == [100, 101, 102, 103]
+        entry = cache.manifest()['2025-04-01']
+        assert entry['rows'] == 4 and entry['fetched_at']
+        assert cache.path('2025-04-01').parent.name == 'game_date=2025-04-01'
+
+    def test_write_frame_partitions_and_records_off_days(self, tmp_path):
+        cache = StatcastCache(tmp_path)
+        frame = pd.concat([_pitches('2025-04-01'), _pitches('2025-04-03', 2)], ignore_index=True)
+        written = cache.write_frame(frame, date(2025, 4, 1), date(2025, 4, 5))
+
+        # 04-02는 경기 없는 날, 04-04 / 04-05는 아직 데이터가 없을 수 있어 미기록
+        assert written == {'2025-04-01': 4, '2025-04-03': 2, '2025-04-02': 0}
+        assert cache.missing(date(2025, 4, 1), date(2025, 4, 5)) == [date(2025, 4, 4), date(2025, 4, 5)]
+        assert len(cache.read_range(date(2025, 4, 1), date(2025, 4, 3))) == 6
+
+    def test_invalidate(self, tmp_path):
+        cache = StatcastCache(tmp_path)
+        cache.write('2025-04-01', _pitches('2025-04-01'))
+        cache.invalidate('2025-04-01')
+        assert not cache.has('2025-04-01')
+        assert not cache.path('2025-04-01').exists()
+
+
+class TestCacheFirstFetch:
+    @patch('src.etl.fetch_statcast.statcast')
+    def test_date_fetch_hits_cache_second_time(self, mock_statcast):
+        mock_statcast.return_value = pd.concat(
+            [_pitches('2025-04-01'), _pitches('2025-04-01', 2, game_type='S')], ignore_index=True)
+
+        first = fetch_statcast_date(date(2025, 4, 1))
+        second = fetch_statcast_date(date(2025, 4, 1))
+
+        assert mock_statcast.call_count == 1
+        assert len(first) == len(second) == 4
+        assert (second['game_type'] == 'R').all()
+        pd.testing.assert_frame_equal(second, first[second.columns.tolist()])
+
+        fetch_statcast_date(date(2025, 4, 1), refresh=True)
+        assert mock_statcast.call_count == 2
+
+    @patch('src.etl.fetch_statcast.statcast')
+    def test_empty_day_not_cached(self, mock_statcast, tmp_path):
+        mock_statcast.return_value = pd.DataFrame()
+        cache = StatcastCache(tmp_path)
+        with patch('src.etl.fetch_statcast.time.sleep'):
+            assert fetch_statcast_date(date(2025, 4, 2), cache=cache).empty
+        assert not cache.has(date(2025, 4, 2))
+
+    @patch('src.etl.fetch_statcast.statcast')
+    def test_range_fetches_only_missing_span(self, mock_statcast, tmp_path):
+        cache = StatcastCache(tmp_path)
+        cache.write('2025-04-01', _pitches('2025-04-01'))
+        cache.write('2025-04-02', _pitches('2025-04-02'))
+        mock_statcast.return_value = _pitches('2025-04-03', 3)
+
+        df = fetch_statcast_range(date(2025, 4, 1), date(2025, 4, 3), cache=cache)
+
+        mock_statcast.assert_called_once_with(start_dt='2025-04-03', end_dt='2025-04-03')
+        assert len(df) == 11
+        assert pd.to_datetime(df['game_date']).is_monotonic_increasing
+
+        # 전부 캐시됨 → 네트워크 없이
+        again = fetch_statcast_range(date(2025, 4, 1), date(2025, 4, 3), cache=cache)
+        assert mock_statcast.call_count == 1
+        assert len(again) == 11
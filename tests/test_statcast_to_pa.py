@@ -1,7 +1,10 @@
 """Statcast → Plate Appearance 변환 테스트."""
 
+import numpy as np
 import pandas as pd
+import pytest
 from src.etl.statcast_to_pa import convert_statcast_to_pa
+from src.etl.upload_to_supabase import prepare_pa_records
 
 
 def _make_statcast_row(**overrides):
@@ -104,3 +107,57 @@ def test_output_columns():
     ]
     for col in required:
         assert col in result.columns, f"Missing column: {col}"
+
+
+def test_compact_dtypes():
+    """int32 id / int8 outs·inning / bool 주자 / float32 physics / categorical."""
+    rows = [_make_statcast_row(at_bat_number=i, events='double') for i in range(1, 4)]
+    result = convert_statcast_to_pa(pd.DataFrame(rows))
+    assert result['pa_id'].dtype == 'int64'
+    assert result['batter_id'].dtype == 'int32'
+    assert result['outs_when_up'].dtype == 'int8'
+    assert result['inning'].dtype == 'int8'
+    assert result['on_1b'].dtype == bool
+    assert result['launch_speed'].dtype == 'float32'
+    assert result['xwoba'].dtype == 'float64'
+    assert result['result_type'].dtype == 'category'
+    assert result['home_team'].dtype == 'category'
+
+
+def test_unknown_events_default_to_out_and_warn_once(caplog):
+    """미등록 event → 'OUT', 종류별 경고 1회."""
+    rows = [_make_statcast_row(events='mystery', at_bat_number=i) for i in range(1, 4)]
+    with caplog.at_level('WARNING', logger='src.etl.event_mapper'):
+        result = convert_statcast_to_pa(pd.DataFrame(rows))
+    assert list(result['result_type']) == ['OUT'] * 3
+    assert len(caplog.records) == 1
+    assert 'mystery' in caplog.records[0].getMessage()
+
+
+def test_missing_scores_become_nullable():
+    """결측 score / outs → nullable Int (<NA>), 업로드 레코드는 None."""
+    rows = [_make_statcast_row(at_bat_number=i, bat_score=i, fld_score=2) for i in range(1, 4)]
+    rows[1].update(bat_score=np.nan, outs_when_up=None)
+    result = convert_statcast_to_pa(pd.DataFrame(rows))
+    assert result['bat_score'].dtype == 'Int16'
+    assert result['outs_when_up'].dtype == 'Int8'
+    assert result['fld_score'].dtype == 'int16'
+    assert result['bat_score'].isna().tolist() == [False, True, False]
+    records = prepare_pa_records(result)
+    assert [r['bat_score'] for r in records] == [1, None, 3]
+    assert [r['outs_when_up'] for r in records] == [0, None, 0]
+
+
+def test_nullable_int_input():
+    """pandas nullable Int64 입력 (parquet 캐시 등)도 결측 허용."""
+    df = pd.DataFrame([_make_statcast_row(at_bat_number=i) for i in range(1, 3)])
+    df['fld_score'] = pd.array([4, None], dtype='Int64')
+    result = convert_statcast_to_pa(df)
+    assert result['fld_score'].dtype == 'Int16'
+    assert result['fld_score'].tolist()[0] == 4 and pd.isna(result['fld_score'].tolist()[1])
+
+
+def test_non_integer_score_raises():
+    rows = [_make_statcast_row(bat_score=1.5)]
+    with pytest.raises(ValueError, match='bat_score'):
+        convert_statcast_to_pa(pd.DataFrame(rows))
@@ -0,0 +1,180 @@
+"""Local warm-state cache (state_cache) 테스트.
+
+- 저장/로드 round trip, watermark / 버전 / content hash 불일치 → stale
+- run_daily_pipeline: 캐시가 remote watermark와 같으면 Supabase 상태 로드 생략
+  (checksum이 다르거나 없으면 Supabase)
+- fetch_state_watermark: state_checksum RPC / RPC 없는 backend
+"""
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from postgrest.exceptions import APIError
+
+from src.engine.elo_batch import EloBatch
+from src.engine.talent_batch import TalentBatch
+from src.pipeline.daily_pipeline import fetch_state_watermark
+from src.pipeline.state_cache import StateCache
+from tests.test_elo_array_engine_261016 import _random_season
+
+WATERMARK = {'last_date': '2025-04-05', 'player_elo_rows': 93, 'talent_rows': 795}
+
+
+def _batches(n_pa=400):
+    pa_df = _random_season(n_pa, n_days=3)
+    batch = EloBatch(engine='array')
+    batch.process(pa_df)
+    talent = TalentBatch()
+    talent.process(pa_df)
+    return batch, talent
+
+
+class TestStateCache:
+    def test_round_trip(self, tmp_path):
+        batch, talent = _batches()
+        cache = StateCache(tmp_path / 'state.npz')
+        cache.save(WATERMARK, batch.snapshot_state(), talent.snapshot_state())
+
+        cached = cache.load(dict(WATERMARK))
+        assert cached.watermark == WATERMARK
+        restored = EloBatch()
+        restored.restore_snapshot(cached.elo)
+        assert restored.players == batch.players
+        restored_talent = TalentBatch()
+        restored_talent.restore_snapshot(cached.talent)
+        assert restored_talent.get_talent_player_records() == talent.get_talent_player_records()
+
+    def test_stale_watermark(self, tmp_path):
+        batch, talent = _batches(100)
+        cache = StateCache(tmp_path / 'state.npz')
+        cache.save(WATERMARK, batch.snapshot_state(), talent.snapshot_state())
+        assert cache.load({**WATERMARK, 'last_date': '2025-04-06'}) is None
+        assert cache.load({**WATERMARK, 'talent_rows': 796}) is None
+        assert cache.load() is not None  # watermark 미지정 → 검증 생략
+
+    def test_missing_file(self, tmp_path):
+        assert StateCache(tmp_path / 'none.npz').load(WATERMARK) is None
+
+    def test_version_and_hash_mismatch(self, tmp_path):
+        batch, talent = _batches(100)
+        cache = StateCache(tmp_path / 'state.npz')
+        cache.save(WATERMARK, batch.snapshot_state(), talent.snapshot_state())
+        with np.load(cache.path) as data:
+            arrays = {k: data[k] for k in data.files}
+
+        tampered = dict(arrays, **{'elo__batting_elo': arrays['elo__batting_elo'] + 1.0})
+        np.savez(cache.path, **tampered)
+        assert cache.load(WATERMARK) is None
+
+        old = dict(arrays, _version=np.array(0))
+        np.savez(cache.path, **old)
+        assert cache.load(WATERMARK) is None
+
+        cache.invalidate()
+        assert not cache.path.exists()
+
+    def test_env_default_path(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('ELO_STATE_CACHE', str(tmp_path / 'x.npz'))
+        assert StateCache().path == tmp_path / 'x.npz'
+
+
+class TestPipelineUsesCache:
+    @patch('src.pipeline.daily_pipeline.fetch_state_watermark')
+    @patch('src.pipeline.daily_pipeline.upload_table')
+    @patch('src.pipeline.daily_pipeline.load_current_talent_arrays')
+    @patch('src.pipeline.daily_pipeline.load_current_elo_states')
+    @patch('src.pipeline.daily_pipeline.detect_new_player_ids_batch', return_value=[])
+    @patch('src.pipeline.daily_pipeline.convert_statcast_to_pa')
+    @patch('src.pipeline.daily_pipeline.fetch_statcast_date')
+    @patch('src.pipeline.daily_pipeline.get_supabase_client')
+    def test_second_run_reads_cache(
+        self, mock_client, mock_fetch, mock_convert, _detect,
+        mock_load_elo, mock_load_talent, mock_upload, mock_watermark, tmp_path,
+    ):
+        from src.engine.state_snapshot import SnapshotStore
+        from src.pipeline.daily_pipeline import run_daily_pipeline, talent_rows_to_arrays
+
+        pa_df = _random_season(600, n_days=2, seed=4)
+        day1, day2 = sorted(pa_df['game_date'].unique())
+        existing = MagicMock()
+        existing.count = 0
+        mock_client.return_value.table.return_value.select.return_value.eq.return_value \
+            .limit.return_value.execute.return_value = existing
+        mock_fetch.return_value = pd.DataFrame({'x': [1]})
+        mock_load_elo.return_value = {}
+        mock_load_talent.return_value = talent_rows_to_arrays([])
+        mock_upload.side_effect = lambda client, table, records, **kw: len(records)
+        kwargs = dict(snapshot_store=SnapshotStore(tmp_path / 'snap'),
+                      state_cache=StateCache(tmp_path / 'cache.npz'))
+
+        remote = {'last_date': day1, 'player_elo_checksum': 'a1', 'talent_checksum': 'b1'}
+        mock_watermark.return_value = remote
+        mock_convert.return_value = pa_df[pa_df['game_date'] == day1].reset_index(drop=True)
+        first = run_daily_pipeline(target_date=date.fromisoformat(day1), **kwargs)
+        assert first['state_source'] == 'supabase'
+
+        mock_convert.return_value = pa_df[pa_df['game_date'] == day2].reset_index(drop=True)
+        mock_load_elo.reset_mock()
+        mock_upload.reset_mock()
+        second = run_daily_pipeline(target_date=date.fromisoformat(day2), **kwargs)
+        assert second['state_source'] == 'cache'
+        mock_load_elo.assert_not_called()
+
+        uploaded = {call.args[1]: call.args[2] for call in mock_upload.call_args_list}
+
+        # 캐시 경로 = 같은 설정으로 두 날짜를 한 번에 처리한 결과
+        from src.engine.park_factor import ParkFactor
+        from src.engine.re24_baseline import RE24Baseline
+        expected = EloBatch(re24_baseline=RE24Baseline(), park_factor=ParkFactor())
+        expected.process(pa_df)
+        for record in uploaded['player_elo']:
+            state = expected.players[record['player_id']]
+            assert record['batting_elo'] == state.batting_elo
+            assert record['pitching_elo'] == state.pitching_elo
+
+        # row 수 / 날짜가 같아도 remote 값이 바뀌면 (run_elo.py 재업로드 등) Supabase로 fallback
+        mock_watermark.return_value = {**remote, 'player_elo_checksum': 'a2'}
+        third = run_daily_pipeline(target_date=date.fromisoformat(day2), **kwargs)
+        assert third['state_source'] == 'supabase'
+
+        # checksum 없는 watermark (state_checksum RPC 미설치)는 캐시를 믿지 않음
+        mock_watermark.return_value = {**remote, 'player_elo_checksum': None}
+        fourth = run_daily_pipeline(target_date=date.fromisoformat(day2), **kwargs)
+        assert fourth['state_source'] == 'supabase'
+
+
+def _checksum_rows(client):
+    return [
+        {'table_name': 'player_elo', 'row_count': len(client.tables['player_elo']), 'checksum': 'e' * 32},
+        {'table_name': 'talent_player_current', 'row_count': 18, 'checksum': 'f' * 32},
+    ]
+
+
+class TestFetchStateWatermark:
+    TABLES = {
+        'plate_appearances': [{'pa_id': 1, 'game_date': '2025-04-01'}, {'pa_id': 2, 'game_date': '2025-04-03'}],
+        'player_elo': [{'player_id': 1}, {'player_id': 2}],
+        'talent_player_current': [{'player_id': 1}],
+    }
+
+    def test_checksum_rpc(self, fake_supabase):
+        client = fake_supabase(self.TABLES, functions={'state_checksum': _checksum_rows})
+        assert fetch_state_watermark(client) == {
+            'last_date': '2025-04-03', 'player_elo_rows': 2, 'talent_rows': 18,
+            'player_elo_checksum': 'e' * 32, 'talent_checksum': 'f' * 32,
+        }
+
+    def test_missing_rpc_falls_back_to_counts(self, fake_supabase):
+        client = fake_supabase(self.TABLES)
+        watermark = fetch_state_watermark(client)
+        assert watermark['player_elo_rows'] == 2 and watermark['talent_rows'] == 1
+        assert watermark['player_elo_checksum'] is None and watermark['talent_checksum'] is None
+
+    def test_rpc_failure_raises(self, fake_supabase):
+        def failing(client):
+            raise APIError({'code': '57014', 'message': 'statement timeout'})
+
+        with pytest.raises(APIError):
+            fetch_state_watermark(fake_supabase(self.TABLES, functions={'state_checksum': failing}))
@@ -0,0 +1,297 @@
+"""Day-boundary state snapshot (state_snapshot) + suffix replay 테스트.
+
+- SnapshotStore: 저장/로드/날짜 조회/삭제
+- EloBatch / TalentBatch: 날짜마다 snapshot 저장, D-1 snapshot 복원 + D.. replay == 전체 처리
+- run_daily_pipeline(force=True): snapshot 복원 후 D..최신 날짜 replay
+  (remote watermark와 다른 snapshot은 쓰지 않고, 실패 / 검증 실패 시 snapshot 보존)
+"""
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.engine.elo_batch import EloBatch
+from src.engine.state_snapshot import SnapshotStore
+from src.engine.talent_batch import TalentBatch
+from tests.test_elo_array_engine_261016 import _assert_same_results, _random_season
+
+
+REMOTE_WATERMARK = {
+    'last_date': '2025-04-05', 'player_elo_rows': 10, 'talent_rows': 90,
+    'player_elo_checksum': 'e1', 'talent_checksum': 't1',
+}
+
+
+def _split_at(pa_df: pd.DataFrame, day: str):
+    return pa_df[pa_df['game_date'] < day], pa_df[pa_df['game_date'] >= day]
+
+
+class TestSnapshotStore:
+    def test_save_load_and_dates(self, tmp_path):
+        store = SnapshotStore(tmp_path)
+        store.save('elo', date(2025, 4, 2), {'x': np.arange(3)})
+        store.save('elo', '2025-04-01', {'x': np.arange(2)})
+        store.save('talent', date(2025, 4, 1), {'y': np.ones(1)})
+
+        assert store.dates('elo') == [date(2025, 4, 1), date(2025, 4, 2)]
+        assert store.load('elo', '2025-04-02')['x'].tolist() == [0, 1, 2]
+        assert store.latest_before('elo', date(2025, 4, 2)) == date(2025, 4, 1)
+        assert store.latest_before('elo', date(2025, 4, 1)) is None
+        assert store.latest_before('talent', date(2025, 5, 1)) == date(2025, 4, 1)
+
+        assert store.discard_from('elo', date(2025, 4, 2)) == 1
+        assert store.dates('elo') == [date(2025, 4, 1)]
+        assert not list(tmp_path.rglob('*.tmp'))
+
+    def test_discard_keep_and_clear(self, tmp_path):
+        store = SnapshotStore(tmp_path)
+        for day in ('2025-04-01', '2025-04-02', '2025-04-03'):
+            store.save('elo', day, {'x': np.arange(1)})
+            store.save('talent', day, {'x': np.arange(1)})
+        assert store.discard_from('elo', '2025-04-02', keep=['2025-04-03']) == 1
+        assert [d.isoformat() for d in store.dates('elo')] == ['2025-04-01', '2025-04-03']
+
+        store.save_watermark(REMOTE_WATERMARK)
+        assert store.clear() == 5
+        assert store.dates('elo') == store.dates('talent') == []
+        assert store.load_watermark() is None
+
+    def test_watermark_matches(self, tmp_path):
+        store = SnapshotStore(tmp_path)
+        assert not store.matches(REMOTE_WATERMARK)
+        store.save_watermark(REMOTE_WATERMARK)
+        assert store.matches(dict(REMOTE_WATERMARK))
+        assert not store.matches({**REMOTE_WATERMARK, 'player_elo_checksum': 'e2'})
+
+    def test_unknown_kind(self, tmp_path):
+        with pytest.raises(ValueError):
+            SnapshotStore(tmp_path).dates('ohlc')
+
+    def test_env_default_root(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('ELO_SNAPSHOT_DIR', str(tmp_path))
+        assert SnapshotStore().root == tmp_path
+
+
+class TestEloBatchSnapshots:
+    @pytest.mark.parametrize('engine', ['python', 'array', 'wavefront'])
+    def test_suffix_replay_matches_full_run(self, tmp_path, engine):
+        pa_df = _random_season(1500, n_days=8, seed=21)
+        full = EloBatch(engine=engine, snapshot_store=SnapshotStore(tmp_path / 'full'))
+        full.process(pa_df)
+        store = full.snapshot_store
+        assert [d.isoformat() for d in store.dates('elo')] == sorted(pa_df['game_date'].unique())
+
+        # 날짜 D 재처리: D-1 snapshot 복원 → D.. replay
+        day = sorted(pa_df['game_date'].unique())[5]
+        prev = store.latest_before('elo', day)
+        _, suffix = _split_at(pa_df, day)
+        replay = EloBatch(engine=engine)
+        replay.restore_snapshot(store.load('elo', prev))
+        replay.process(suffix)
+
+        assert replay.players == full.players
+        assert replay._last_game_date == full._last_game_date
+        assert replay.get_player_elo_records() == full.get_player_elo_records()
+
+    def test_snapshot_round_trip(self, tmp_path):
+        batch = EloBatch(engine='array')
+        batch.process(_random_season(300))
+        restored = EloBatch()
+        restored.restore_snapshot(batch.snapshot_state())
+        assert restored.players == batch.players
+        assert restored._last_game_date == batch._last_game_date
+
+    def test_engines_write_same_snapshots(self, tmp_path):
+        pa_df = _random_season(600, n_days=4, seed=2)
+        py = EloBatch(snapshot_store=SnapshotStore(tmp_path / 'py'))
+        py.process(pa_df)
+        arr = EloBatch(engine='array', snapshot_store=SnapshotStore(tmp_path / 'arr'))
+        arr.process(pa_df)
+        _assert_same_results(py, arr)
+        for d in py.snapshot_store.dates('elo'):
+            a, b = py.snapshot_store.load('elo', d), arr.snapshot_store.load('elo', d)
+            assert a.keys() == b.keys()
+            for key in a:
+                np.testing.assert_array_equal(a[key], b[key])
+
+
+class TestTalentBatchSnapshots:
+    @pytest.mark.parametrize('mode', [{}, {'storage': 'matrix'}, {'wavefront': True}])
+    def test_suffix_replay_matches_full_run(self, tmp_path, mode):
+        pa_df = _random_season(1200, n_days=6, seed=8)
+        full = TalentBatch(snapshot_store=SnapshotStore(tmp_path), **mode)
+        full.process(pa_df)
+        store = full.snapshot_store
+        assert len(store.dates('talent')) == pa_df['game_date'].nunique()
+
+        day = sorted(pa_df['game_date'].unique())[3]
+        _, suffix = _split_at(pa_df, day)
+        replay = TalentBatch(**mode)
+        replay.restore_snapshot(store.load('talent', store.latest_before('talent', day)))
+        replay.process(suffix)
+
+        assert replay.get_talent_player_records() == full.get_talent_player_records()
+        suffix_ohlc = [r for r in full.talent_daily_ohlc if r['game_date'] >= day]
+        assert replay.talent_daily_ohlc == suffix_ohlc
+
+
+def _stored_after(pa_df: pd.DataFrame, deleted: str):
+    """load_plate_appearances 대체: force로 삭제된 날짜를 뺀 저장 PA 중 after 이후."""
+    def load(client, after):
+        rows = pa_df[(pa_df['game_date'] > after.isoformat()) & (pa_df['game_date'] != deleted)]
+        return rows.reset_index(drop=True)
+    return load
+
+
+@pytest.fixture
+def force_mocks():
+    targets = {
+        'client': 'get_supabase_client',
+        'delete': 'delete_date_data',
+        'fetch': 'fetch_statcast_date',
+        'convert': 'convert_statcast_to_pa',
+        'detect': 'detect_new_player_ids_batch',
+        'load_elo': 'load_current_elo_states',
+        'load_talent': 'load_current_talent_arrays',
+        'load_pa': 'load_plate_appearances',
+        'upload': 'upload_table',
+        'watermark': 'fetch_state_watermark',
+    }
+    patchers = {k: patch(f'src.pipeline.daily_pipeline.{v}') for k, v in targets.items()}
+    mocks = {k: p.start() for k, p in patchers.items()}
+    existing = MagicMock()
+    existing.count = 100
+    mocks['client'].return_value.table.return_value.select.return_value.eq.return_value \
+        .limit.return_value.execute.return_value = existing
+    mocks['fetch'].return_value = pd.DataFrame({'x': [1]})
+    mocks['detect'].return_value = []
+    mocks['watermark'].return_value = REMOTE_WATERMARK
+    mocks['upload'].side_effect = lambda client, table, records, **kw: len(records)
+    yield mocks
+    for p in patchers.values():
+        p.stop()
+
+
+class TestForceReplay:
+    def _full_run(self, pa_df, store):
+        from src.engine.park_factor import ParkFactor
+        from src.engine.re24_baseline import RE24Baseline
+
+        full = EloBatch(re24_baseline=RE24Baseline(), park_factor=ParkFactor(), snapshot_store=store)
+        full.process(pa_df)
+        talent = TalentBatch(snapshot_store=store)
+        talent.process(pa_df)
+        store.save_watermark(REMOTE_WATERMARK)   # 이전 파이프라인 실행이 기록한 remote 상태
+        return full, talent
+
+    def _force(self, force_mocks, pa_df, day, store, tmp_path, **kwargs):
+        from src.pipeline.daily_pipeline import run_daily_pipeline
+        from src.pipeline.state_cache import StateCache
+
+        force_mocks['convert'].return_value = pa_df[pa_df['game_date'] == day].reset_index(drop=True)
+        force_mocks['load_pa'].side_effect = _stored_after(pa_df, deleted=day)
+        return run_daily_pipeline(target_date=date.fromisoformat(day), force=True, snapshot_store=store,
+                                  state_cache=StateCache(tmp_path / 'cache.npz'), **kwargs)
+
+    def test_force_restores_previous_snapshot_and_replays_suffix(self, force_mocks, tmp_path):
+        pa_df = _random_season(900, n_days=5, seed=13)
+        days = sorted(pa_df['game_date'].unique())
+        store = SnapshotStore(tmp_path)
+        full, _ = self._full_run(pa_df, store)
+
+        result = self._force(force_mocks, pa_df, days[2], store, tmp_path)
+
+        assert result['status'] == 'success'
+        assert result['replayed_from'] == days[1]
+        assert result['state_source'] == 'snapshot'
+        assert result['replayed_pa_count'] == int((pa_df['game_date'] >= days[2]).sum())
+        force_mocks['delete'].assert_called_once()
+        force_mocks['load_elo'].assert_not_called()
+        force_mocks['load_talent'].assert_not_called()
+
+        uploaded = {call.args[1]: call.args[2] for call in force_mocks['upload'].call_args_list}
+        expected = {r['player_id']: r for r in full.get_player_elo_records()}
+        for record in uploaded['player_elo']:
+            assert record == expected[record['player_id']]
+
+    def test_stale_snapshot_replays_processed_days_in_between(self, force_mocks, tmp_path):
+        pa_df = _random_season(900, n_days=5, seed=13)
+        days = sorted(pa_df['game_date'].unique())
+        store = SnapshotStore(tmp_path)
+        full, talent = self._full_run(pa_df, store)
+        # days[1]은 처리됐지만 (다른 머신 nightly 등) 로컬 snapshot 없음
+        for kind in ('elo', 'talent'):
+            store.path(kind, days[1]).unlink()
+
+        result = self._force(force_mocks, pa_df, days[2], store, tmp_path)
+
+        assert result['replayed_from'] == days[0]
+        assert result['replayed_pa_count'] == int((pa_df['game_date'] > days[0]).sum())
+        uploaded = {call.args[1]: call.args[2] for call in force_mocks['upload'].call_args_list}
+        expected = {r['player_id']: r for r in full.get_player_elo_records()}
+        assert len(uploaded['player_elo']) > 0
+        for record in uploaded['player_elo']:
+            assert record == expected[record['player_id']]
+        key = lambda r: (r['player_id'], r['player_role'], r['talent_type'])
+        expected_talent = {key(r): r for r in talent.get_talent_player_records()}
+        for record in uploaded['talent_player_current']:
+            assert record == pytest.approx(expected_talent[key(record)])
+        # replay가 빠진 날짜 snapshot을 다시 저장
+        assert [d.isoformat() for d in store.dates('elo')] == days
+
+    def test_force_without_snapshot_fails_before_deleting(self, force_mocks, tmp_path):
+        pa_df = _random_season(600, n_days=3, seed=5)
+        days = sorted(pa_df['game_date'].unique())
+        store = SnapshotStore(tmp_path)
+        self._full_run(pa_df, store)
+        store.path('talent', days[0]).unlink()
+
+        with pytest.raises(RuntimeError, match='count it twice'):
+            self._force(force_mocks, pa_df, days[1], store, tmp_path)
+        force_mocks['delete'].assert_not_called()
+        force_mocks['fetch'].assert_not_called()
+        assert [d.isoformat() for d in store.dates('elo')] == days
+
+    def test_reapply_opt_in_discards_snapshots_after_target(self, force_mocks, tmp_path):
+        pa_df = _random_season(600, n_days=3, seed=5)
+        days = sorted(pa_df['game_date'].unique())
+        store = SnapshotStore(tmp_path)
+        self._full_run(pa_df, store)
+        store.path('talent', days[0]).unlink()
+        force_mocks['load_elo'].return_value = {}
+        from src.pipeline.daily_pipeline import talent_rows_to_arrays
+        force_mocks['load_talent'].return_value = talent_rows_to_arrays([])
+
+        result = self._force(force_mocks, pa_df, days[1], store, tmp_path, reapply_without_snapshot=True)
+
+        assert result['replayed_from'] is None
+        force_mocks['load_pa'].assert_not_called()
+        # 재처리 전 기준 snapshot(days[2])은 삭제, days[1]은 새로 저장
+        assert [d.isoformat() for d in store.dates('elo')] == days[:2]
+
+    def test_stale_snapshots_after_rebuild_are_not_replayed(self, force_mocks, tmp_path):
+        pa_df = _random_season(600, n_days=3, seed=5)
+        days = sorted(pa_df['game_date'].unique())
+        store = SnapshotStore(tmp_path)
+        self._full_run(pa_df, store)
+        # run_elo.py 재계산 / 설정 변경 후 remote checksum이 바뀜
+        force_mocks['watermark'].return_value = {**REMOTE_WATERMARK, 'player_elo_checksum': 'rebuilt'}
+
+        with pytest.raises(RuntimeError):
+            self._force(force_mocks, pa_df, days[2], store, tmp_path)
+        force_mocks['delete'].assert_not_called()
+        assert [d.isoformat() for d in store.dates('talent')] == days
+
+    def test_failed_fetch_keeps_snapshots(self, force_mocks, tmp_path):
+        pa_df = _random_season(600, n_days=3, seed=5)
+        days = sorted(pa_df['game_date'].unique())
+        store = SnapshotStore(tmp_path)
+        self._full_run(pa_df, store)
+        force_mocks['fetch'].side_effect = ConnectionError('savant down')
+
+        with pytest.raises(ConnectionError):
+            self._force(force_mocks, pa_df, days[1], store, tmp_path)
+        assert [d.isoformat() for d in store.dates('elo')] == days
+        assert store.matches(REMOTE_WATERMARK)
@@ -0,0 +1,94 @@
+"""Synthetic season generator + benchmark suite 테스트."""
+
+import pandas as pd
+import pytest
+
+import scripts.bench_suite as bench_suite
+from scripts.bench_suite import Case, compare, load_baselines, run_suite, save_baselines
+from src.etl.statcast_to_pa import OUTPUT_COLUMNS, convert_statcast_to_pa
+from src.etl.synthetic_season import (
+    RESULT_MIX, TEAMS, TWO_WAY_PLAYER_ID, SyntheticLeague, synthetic_pa, synthetic_statcast,
+)
+
+
+@pytest.fixture(scope='module')
+def day_pa():
+    return synthetic_pa('day', seed=7)
+
+
+class TestSyntheticPa:
+    def test_deterministic(self, day_pa):
+        pd.testing.assert_frame_equal(day_pa, synthetic_pa('day', seed=7))
+        assert not day_pa.equals(synthetic_pa('day', seed=8))
+
+    def test_shape_and_states(self, day_pa):
+        assert list(day_pa.columns) == OUTPUT_COLUMNS
+        assert day_pa['game_pk'].nunique() == len(TEAMS) // 2
+        assert day_pa['home_team'].nunique() == len(TEAMS) // 2
+        assert day_pa['outs_when_up'].between(0, 2).all()
+        assert day_pa['pa_id'].is_unique
+        # 경기마다 양 팀 9이닝 이상, 이닝당 최소 3타석
+        per_game = day_pa.groupby('game_pk').size()
+        assert (per_game >= 2 * 9 * 3).all()
+
+    def test_result_mix(self):
+        pa = synthetic_pa('season', seed=3).head(40_000)
+        share = pa['result_type'].astype(str).value_counts(normalize=True)
+        assert share['StrikeOut'] == pytest.approx(RESULT_MIX['StrikeOut'], abs=0.01)
+        assert share['Single'] == pytest.approx(RESULT_MIX['Single'], abs=0.01)
+        assert share['HR'] == pytest.approx(RESULT_MIX['HR'], abs=0.005)
+
+    def test_league_size(self):
+        league = SyntheticLeague(seed=1)
+        assert 1_400 <= len(league.player_ids) <= 1_500
+        assert TWO_WAY_PLAYER_ID in league.batters and TWO_WAY_PLAYER_ID in league.pitchers
+
+    def test_unknown_scale(self):
+        with pytest.raises(ValueError):
+            synthetic_pa('fortnight')
+
+
+class TestSyntheticStatcast:
+    def test_convert_round_trip(self, day_pa):
+        pitches = synthetic_statcast(pa_df=day_pa, seed=7)
+        assert len(pitches) > 3 * len(day_pa)
+        assert pitches['events'].notna().sum() == len(day_pa)
+        pd.testing.assert_frame_equal(convert_statcast_to_pa(pitches), day_pa)
+
+
+class TestBenchSuite:
+    def test_run_suite_and_compare(self, tmp_path):
+        results = run_suite('day', repeat=1, only=['convert_statcast_to_pa', 'get_player_elo_records'],
+                            min_time=0.02)
+        assert list(results) == ['convert_statcast_to_pa', 'get_player_elo_records']
+        assert results['get_player_elo_records']['rows'] > 0
+
+        path = save_baselines(results, 'day', tmp_path / 'baselines.json')
+        baseline = load_baselines(path)['day']['cases']
+        assert compare(results, baseline) == {}
+        slower = {name: {**r, 'seconds': r['seconds'] * 2 + 0.01} for name, r in results.items()}
+        assert set(compare(slower, baseline, threshold=1.25)) == set(results)
+
+    def test_noise_floor(self):
+        baseline = {'tiny': 0.001, 'big': 1.0}
+        results = {'tiny': {'seconds': 0.0025}, 'big': {'seconds': 1.3}}
+        # 2.5x지만 1.5ms 차이 → timer 잡음
+        assert compare(results, baseline, threshold=1.25) == {'big': pytest.approx(1.3)}
+
+    def test_warmup_untimed_and_min_time(self, monkeypatch):
+        calls = []
+        case = Case(lambda w: w.scale, lambda scale: calls.append(scale), lambda w: 1)
+        monkeypatch.setitem(bench_suite.CASES, 'probe', case)
+
+        results = run_suite('season', repeat=2, only=['probe'], min_time=0.0,
+                            workload=bench_suite.Workload('season'))
+        assert calls == ['day', 'season', 'season']      # day 규모 warm-up 1회 후 측정
+        assert results['probe']['rounds'] == 2
+
+        calls.clear()
+        results = run_suite('day', repeat=1, only=['probe'], min_time=0.01, warmup=False)
+        assert results['probe']['rounds'] > 1 and len(calls) == results['probe']['rounds']
+
+    def test_unknown_case(self):
+        with pytest.raises(ValueError):
+            run_suite('day', only=['nope'])
@@ -0,0 +1,110 @@
+"""Keyset-paginated table reader 테스트 (in-memory FakeSupabase)."""
+
+import pandas as pd
+import pytest
+
+from src.etl.table_reader import iter_pages, key_bounds, read_table, split_key_range
+
+
+def _pa_rows(n, start=717_000_001):
+    return [
+        {'pa_id': start + i * 7, 'game_date': f"2025-04-{1 + i % 28:02d}", 'result_type': 'OUT'}
+        for i in range(n)
+    ]
+
+
+class TestIterPages:
+    def test_keyset_pages_cover_table_once(self, fake_supabase):
+        rows = _pa_rows(2_345)
+        client = fake_supabase({'plate_appearances': rows})
+        pages = list(iter_pages(client, 'plate_appearances', 'pa_id, game_date', key='pa_id'))
+        assert [len(p) for p in pages] == [1000, 1000, 345]
+        assert all(isinstance(p, pd.DataFrame) for p in pages)
+        ids = pd.concat(pages)['pa_id'].tolist()
+        assert ids == sorted(r['pa_id'] for r in rows)
+
+    def test_filters_and_key_added_to_select(self, fake_supabase):
+        client = fake_supabase({'plate_appearances': _pa_rows(100)})
+        pages = list(iter_pages(client, 'plate_appearances', 'game_date', key='pa_id',
+                                filters=[('eq', 'game_date', '2025-04-01')]))
+        frame = pd.concat(pages)
+        assert list(frame.columns) == ['pa_id', 'game_date']
+        assert set(frame['game_date']) == {'2025-04-01'}
+
+    def test_stable_under_concurrent_deletes(self, fake_supabase):
+        # offset 페이징은 앞쪽 행이 지워지면 다음 페이지를 건너뜀; keyset은 그대로
+        rows = _pa_rows(300)
+        client = fake_supabase({'plate_appearances': rows})
+        pages = iter_pages(client, 'plate_appearances', 'pa_id', key='pa_id', page_size=100)
+        seen = next(pages)['pa_id'].tolist()
+        client.tables['plate_appearances'] = rows[50:]
+        for page in pages:
+            seen.extend(page['pa_id'].tolist())
+        assert seen == [r['pa_id'] for r in rows]
+
+    def test_non_unique_key_keeps_groups_whole(self, fake_supabase):
+        rows = [{'player_id': pid, 'talent_type': t} for pid in range(40) for t in 'abcdefg']
+        client = fake_supabase({'talent_player_current': rows}, max_rows=50)
+        pages = list(iter_pages(client, 'talent_player_current', 'player_id, talent_type',
+                                key='player_id', page_size=50, unique=False))
+        frame = pd.concat(pages)
+        assert len(frame) == len(rows)
+        assert frame.groupby('player_id').size().eq(7).all()
+
+    def test_non_unique_group_larger_than_page(self, fake_supabase):
+        rows = [{'player_id': 1, 'talent_type': str(i)} for i in range(20)]
+        client = fake_supabase({'t': rows}, max_rows=10)
+        with pytest.raises(ValueError):
+            list(iter_pages(client, 't', 'player_id', key='player_id', page_size=10, unique=False))
+
+
+class TestReadTable:
+    def test_parallel_matches_sequential(self, fake_supabase):
+        rows = _pa_rows(5_000)
+        client = fake_supabase({'plate_appearances': rows})
+        sequential = read_table(client, 'plate_appearances', '*', key='pa_id', workers=1)
+        client.requests.clear()
+        parallel = read_table(client, 'plate_appearances', '*', key='pa_id', workers=4)
+        pd.testing.assert_frame_equal(parallel, sequential)
+        assert parallel['pa_id'].is_monotonic_increasing
+        # 2 bound 조회 + 구간별 페이지 (구간당 < 1000행 → 구간당 1회)
+        assert len(client.requests) <= 2 + 16
+
+    def test_empty_result_has_columns(self, fake_supabase):
+        client = fake_supabase({'player_elo': []})
+        frame = read_table(client, 'player_elo', 'player_id, batting_elo', key='player_id')
+        assert frame.empty
+        assert list(frame.columns) == ['player_id', 'batting_elo']
+
+    def test_key_bounds_and_split(self, fake_supabase):
+        client = fake_supabase({'t': [{'id': i} for i in (5, 9, 42)]})
+        assert key_bounds(client, 't', 'id') == (5, 42)
+        assert key_bounds(client, 't', 'id', filters=[('gt', 'id', 100)]) is None
+        ranges = split_key_range(5, 42, 4)
+        assert ranges[0][0] == 5 and ranges[-1][1] == 43
+        assert all(lo < hi for lo, hi in ranges)
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        assert split_key_range(3, 4, 10) == [(3, 4), (4, 5)]
+
+
+class TestPipelineReaders:
+    def test_processed_dates(self, fake_supabase):
+        from datetime import date
+        from src.pipeline.daily_pipeline import _processed_dates
+
+        client = fake_supabase({'plate_appearances': _pa_rows(2_800)})
+        counts = _processed_dates(client, date(2025, 4, 1), date(2025, 4, 2))
+        assert counts == {'2025-04-01': 100, '2025-04-02': 100}
+
+    def test_load_current_elo_states_null_defaults(self, fake_supabase):
+        from src.engine.elo_config import INITIAL_ELO
+        from src.pipeline.daily_pipeline import load_current_elo_states
+
+        client = fake_supabase({'player_elo': [
+            {'player_id': 7, 'batting_elo': None, 'pitching_elo': 1480.5, 'batting_pa': None, 'pitching_pa': 12},
+        ]})
+        state = load_current_elo_states(client)[7]
+        assert state.batting_elo == INITIAL_ELO
+        assert state.pitching_elo == 1480.5
+        assert (state.batting_pa, state.pitching_pa) == (0, 12)
+        assert type(state.pitching_pa) is int
@@ -0,0 +1,143 @@
+"""talent_player_current 행 → talent 상태 vectorized hydration 테스트.
+
+- talent_rows_to_arrays: (player_id, talent_type) pivot, 누락 / None 처리
+- TalentStateManager.from_arrays(storage='matrix'): matrix에 직접 기록
+- load_current_talent_states: 기존 행 단위 루프와 같은 결과
+"""
+import numpy as np
+
+from src.engine.multi_elo_types import DEFAULT_ELO
+from src.engine.talent_batch import TalentBatch
+from src.engine.talent_state_manager import TalentStateManager
+from src.pipeline.daily_pipeline import (
+    load_current_talent_states,
+    talent_rows_to_arrays,
+)
+from tests.test_elo_array_engine_261016 import _random_season
+
+
+def _processed_batch(n_pa=500):
+    batch = TalentBatch()
+    batch.process(_random_season(n_pa, n_days=3, seed=7))
+    return batch
+
+
+class TestTalentRowsToArrays:
+    def test_round_trip_from_records(self):
+        batch = _processed_batch()
+        arrays = talent_rows_to_arrays(batch.get_talent_player_records())
+        expected = batch.snapshot_state()
+
+        np.testing.assert_array_equal(arrays['batter_id'], expected['batter_id'])
+        np.testing.assert_array_equal(arrays['pitcher_id'], expected['pitcher_id'])
+        for prefix in ('batter', 'pitcher'):
+            for scope in ('season', 'career'):
+                np.testing.assert_array_equal(arrays[f'{prefix}_{scope}_elo'],
+                                              expected[f'{prefix}_{scope}_elo'])
+            # DB에는 season count만 있음 → career도 season 값
+            np.testing.assert_array_equal(arrays[f'{prefix}_career_counts'],
+                                          expected[f'{prefix}_season_counts'])
+            np.testing.assert_array_equal(arrays[f'{prefix}_career_pa'],
+                                          expected[f'{prefix}_season_pa'])
+
+    def test_missing_and_null_cells(self):
+        rows = [
+            {'player_id': 5, 'player_role': 'batter', 'talent_type': 'power',
+             'season_elo': 1600.0, 'career_elo': None, 'event_count': 3, 'pa_count': 9},
+            {'player_id': 5, 'player_role': 'batter', 'talent_type': 'unknown_dim',
+             'season_elo': 1.0, 'career_elo': 1.0, 'event_count': 1, 'pa_count': 1},
+            {'player_id': 8, 'player_role': 'pitcher', 'talent_type': 'stuff',
+             'season_elo': None, 'career_elo': 1450.0, 'event_count': None, 'pa_count': None},
+        ]
+        arrays = talent_rows_to_arrays(rows)
+
+        assert arrays['batter_id'].tolist() == [5]
+        season = arrays['batter_season_elo'][0]
+        assert season[1] == 1600.0
+        assert (np.delete(season, 1) == DEFAULT_ELO).all()
+        assert arrays['batter_career_elo'][0, 1] == DEFAULT_ELO
+        assert arrays['batter_season_counts'][0, 1] == 3
+        assert arrays['batter_season_pa'].tolist() == [9]
+
+        assert arrays['pitcher_id'].tolist() == [8]
+        assert arrays['pitcher_season_elo'][0, 0] == DEFAULT_ELO
+        assert arrays['pitcher_career_elo'][0, 0] == 1450.0
+        assert arrays['pitcher_season_pa'].tolist() == [0]
+        assert arrays['pitcher_role'].tolist() == ['starter']
+
+    def test_empty(self):
+        arrays = talent_rows_to_arrays([])
+        mgr = TalentStateManager.from_arrays(arrays, storage='matrix')
+        assert not mgr.all_batters and not mgr.all_pitchers
+        assert arrays['batter_season_elo'].shape == (0, 5)
+
+
+class TestMatrixHydration:
+    def test_matrix_matches_dict(self):
+        snapshot = _processed_batch().snapshot_state()
+        as_dict = TalentStateManager.from_arrays(snapshot, storage='dict').to_arrays()
+        as_matrix = TalentStateManager.from_arrays(snapshot, storage='matrix')
+
+        assert as_matrix.storage == 'matrix'
+        for name, values in as_matrix.to_arrays().items():
+            np.testing.assert_array_equal(values, as_dict[name], err_msg=name)
+
+    def test_views_write_matrix(self):
+        snapshot = _processed_batch(200).snapshot_state()
+        mgr = TalentStateManager.from_arrays(snapshot, storage='matrix')
+        pid = int(snapshot['batter_id'][0])
+        mgr.all_batters[pid].season.apply_deltas(np.full(5, 1.0))
+        np.testing.assert_array_equal(mgr.batter_matrix.season_elo[0],
+                                      snapshot['batter_season_elo'][0] + 1.0)
+
+
+def _legacy_load(rows):
+    """기존 load_current_talent_states 행 단위 루프 (비교용)."""
+    from src.engine.multi_elo_types import BATTER_DIM_NAMES, PITCHER_DIM_NAMES
+    from src.engine.talent_state_manager import DualBatterState, DualPitcherState
+    batters, pitchers = {}, {}
+    for row in rows:
+        pid, role, talent_type = row['player_id'], row['player_role'], row['talent_type']
+        season_elo = row.get('season_elo', DEFAULT_ELO) or DEFAULT_ELO
+        career_elo = row.get('career_elo', DEFAULT_ELO) or DEFAULT_ELO
+        event_count = row.get('event_count', 0) or 0
+        pa_count = row.get('pa_count', 0) or 0
+        if role == 'batter' and talent_type in BATTER_DIM_NAMES:
+            dual = batters.setdefault(pid, DualBatterState(player_id=pid))
+            idx = BATTER_DIM_NAMES.index(talent_type)
+            dual.season.pa_count = dual.career.pa_count = pa_count
+        elif role == 'pitcher' and talent_type in PITCHER_DIM_NAMES:
+            dual = pitchers.setdefault(pid, DualPitcherState(player_id=pid))
+            idx = PITCHER_DIM_NAMES.index(talent_type)
+            dual.season.bfp_count = dual.career.bfp_count = pa_count
+        else:
+            continue
+        dual.season.elo_dimensions[idx] = season_elo
+        dual.career.elo_dimensions[idx] = career_elo
+        dual.season.event_counts[idx] = event_count
+        dual.career.event_counts[idx] = event_count
+    return batters, pitchers
+
+
+class TestLoadCurrentTalentStates:
+    def test_matches_row_loop(self, fake_supabase):
+        rows = _processed_batch().get_talent_player_records()
+        client = fake_supabase({'talent_player_current': rows})
+
+        batters, pitchers = load_current_talent_states(client)
+        # keyset 페이징은 player_id 순으로 반환
+        legacy_batters, legacy_pitchers = _legacy_load(sorted(rows, key=lambda r: r['player_id']))
+
+        assert list(batters) == list(legacy_batters)
+        assert list(pitchers) == list(legacy_pitchers)
+        for pid, dual in legacy_batters.items():
+            for scope in ('season', 'career'):
+                got, want = getattr(batters[pid], scope), getattr(dual, scope)
+                np.testing.assert_array_equal(got.elo_dimensions, want.elo_dimensions)
+                np.testing.assert_array_equal(got.event_counts, want.event_counts)
+                assert got.pa_count == want.pa_count
+        for pid, dual in legacy_pitchers.items():
+            got, want = pitchers[pid].season, dual.season
+            np.testing.assert_array_equal(got.elo_dimensions, want.elo_dimensions)
+            assert got.bfp_count == want.bfp_count
+            assert got.role == want.role
@@ -0,0 +1,120 @@
+"""Talent season kernel (talent_kernel / TalentBatch(jit=True)) 테스트.
+
+- 타석별 before/delta/after가 MultiEloEngine.process_plate_appearance(+career 반영)와 1e-9 이내 일치
+  (interpreted 커널은 항상, Numba 커널은 설치된 경우)
+- TalentBatch jit 경로: details / OHLC / player records가 기본 경로와 일치 (TWP clutch 공유 키 포함)
+- Numba 미설치 시 MultiEloEngine 경로로 fallback
+"""
+import numpy as np
+import pytest
+
+import src.engine.talent_batch as talent_batch_module
+from src.engine.multi_elo_config import MultiEloConfig
+from src.engine.multi_elo_engine import MultiEloEngine
+from src.engine.talent_batch import TalentBatch
+from src.engine.talent_kernel import HAVE_NUMBA, clutch_scales, run_talent_kernel
+from src.engine.talent_state_manager import DualBatterState, TalentStateManager
+from tests.test_elo_array_engine_261016 import _random_season
+
+EVENTS = ['Single', 'Double', 'Triple', 'HR', 'BB', 'HBP', 'IBB',
+          'StrikeOut', 'OUT', 'FC', 'GIDP', 'SAC', 'E', 'Unknown']
+JIT_MODES = [False, pytest.param(True, marks=pytest.mark.skipif(
+    not HAVE_NUMBA, reason="numba not installed"))]
+
+
+def _random_pas(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.choice(EVENTS, n), rng.integers(0, 25, n), rng.integers(0, 15, n),
+            rng.random(n) < 0.3)
+
+
+def _assert_close(a, b):
+    np.testing.assert_allclose(a, b, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('jit', JIT_MODES)
+def test_kernel_matches_engine_per_pa(jit):
+    config = MultiEloConfig()
+    engine = MultiEloEngine(config)
+    events, batters, pitchers, risp = _random_pas()
+
+    ref = TalentStateManager()
+    expected = []
+    for event, b, p, is_risp in zip(events.tolist(), batters.tolist(), pitchers.tolist(), risp.tolist()):
+        bd, pd_ = ref.get_or_create_batter(b), ref.get_or_create_pitcher(p)
+        before = np.concatenate([bd.season.elo_dimensions, pd_.season.elo_dimensions])
+        result = engine.process_plate_appearance(bd.season, pd_.season, event, is_risp=is_risp)
+        bd.career.apply_deltas(result.batter_deltas)
+        bd.career.event_counts += result.batter_deltas != 0
+        bd.career.increment_pa()
+        pd_.career.apply_deltas(result.pitcher_deltas)
+        pd_.career.event_counts += result.pitcher_deltas != 0
+        pd_.career.increment_bfp()
+        expected.append((before, np.concatenate([result.batter_deltas, result.pitcher_deltas]),
+                         np.concatenate([result.batter_elo_after, result.pitcher_elo_after])))
+
+    mgr = TalentStateManager(storage='matrix')
+    for b in batters.tolist():
+        mgr.get_or_create_batter(b)
+    for p in pitchers.tolist():
+        mgr.get_or_create_pitcher(p)
+    codes = np.array([config.tables.event_code(e) for e in events.tolist()])
+    before, deltas, after = run_talent_kernel(
+        config, mgr,
+        codes,
+        mgr.batter_matrix.index.intern_many(batters),
+        mgr.pitcher_matrix.index.intern_many(pitchers),
+        clutch_scales(config, codes, risp),
+        jit=jit,
+    )
+
+    for i, (exp_before, exp_delta, exp_after) in enumerate(expected):
+        _assert_close(before[i], exp_before)
+        _assert_close(deltas[i], exp_delta)
+        _assert_close(after[i], exp_after)
+        assert ((deltas[i] != 0) == (exp_delta != 0)).all()
+    for pid, dual in ref.all_batters.items():
+        view = mgr.get_or_create_batter(pid)
+        _assert_close(view.career.elo_dimensions, dual.career.elo_dimensions)
+        assert view.season.event_counts.tolist() == dual.season.event_counts.tolist()
+        assert view.career.pa_count == dual.career.pa_count
+
+
+def _assert_rows_close(rows_a, rows_b):
+    assert len(rows_a) == len(rows_b)
+    for a, b in zip(rows_a, rows_b):
+        assert a.keys() == b.keys()
+        for key, value in a.items():
+            if isinstance(value, float):
+                assert b[key] == pytest.approx(value, rel=1e-9, abs=1e-9), key
+            else:
+                assert b[key] == value, key
+
+
+@pytest.mark.skipif(not HAVE_NUMBA, reason="numba not installed")
+def test_batch_jit_matches_default_path():
+    pa_df = _random_season(2500, seed=4)
+
+    def initial_batters():
+        dual = DualBatterState(player_id=660271)  # TWP: batter + pitcher clutch share an OHLC key
+        dual.season.elo_dimensions[4] = 1620.0
+        return {660271: dual}
+
+    ref = TalentBatch(initial_batters=initial_batters())
+    ref.process(pa_df)
+    fast = TalentBatch(initial_batters=initial_batters(), jit=True)
+    fast.process(pa_df)
+
+    assert fast.state_mgr.storage == 'matrix'
+    _assert_rows_close(list(ref.talent_pa_details), list(fast.talent_pa_details))
+    _assert_rows_close(ref.talent_daily_ohlc, fast.talent_daily_ohlc)
+    _assert_rows_close(ref.get_talent_player_records(), fast.get_talent_player_records())
+    assert fast._active_player_ids == ref._active_player_ids
+
+
+def test_jit_falls_back_without_numba(monkeypatch):
+    monkeypatch.setattr(talent_batch_module, 'HAVE_NUMBA', False)
+    batch = TalentBatch(jit=True)
+    assert batch.jit is False
+    batch.process(_random_season(50))
+    assert len(batch.talent_pa_details) > 0
@@ -0,0 +1,111 @@
+"""Talent matrix storage (TalentStateManager storage='matrix') 테스트.
+
+- TalentMatrix 행 추가/확장, row view in-place 업데이트
+- Dual*State view 호환 (apply_deltas, reset_season)
+- TalentBatch dict / matrix 모드 결과 동일
+"""
+import numpy as np
+import pytest
+
+from src.engine.multi_elo_types import DEFAULT_ELO, BATTER_DIM_COUNT
+from src.engine.talent_batch import TalentBatch
+from src.engine.talent_matrix import BatterRowView, TalentMatrix
+from src.engine.talent_state_manager import (
+    DualBatterState,
+    DualPitcherState,
+    TalentStateManager,
+)
+from tests.test_elo_array_engine_261016 import _random_season
+
+
+class TestTalentMatrix:
+
+    def test_views_survive_growth(self):
+        store = TalentMatrix(BATTER_DIM_COUNT, capacity=2)
+        view = BatterRowView(store, store.add(100), "season")
+        view.apply_deltas(np.array([10.0, 0, 0, 0, 0]))
+        for pid in range(200, 210):
+            store.add(pid)
+        assert len(store) == 11
+        assert view.elo_dimensions[0] == pytest.approx(1510.0)
+        assert view.player_id == 100
+
+    def test_apply_deltas_in_place(self):
+        store = TalentMatrix(BATTER_DIM_COUNT)
+        view = BatterRowView(store, store.add(100), "career")
+        view.apply_deltas(np.array([5000.0, -5000.0, 1.0, 0, 0]))
+        assert store.career_elo[0].tolist() == [3000.0, 500.0, 1501.0, DEFAULT_ELO, DEFAULT_ELO]
+        assert np.shares_memory(view.elo_dimensions, store.career_elo)
+        assert store.season_elo[0].tolist() == [DEFAULT_ELO] * 5
+
+    def test_counts_and_pa(self):
+        store = TalentMatrix(BATTER_DIM_COUNT)
+        view = BatterRowView(store, store.add(100), "season")
+        view.event_counts += np.array([1, 0, 1, 0, 0]) != 0
+        view.increment_pa()
+        assert store.season_counts[0].tolist() == [1, 0, 1, 0, 0]
+        assert view.pa_count == 1
+
+    def test_unknown_scope_rejected(self):
+        with pytest.raises(ValueError):
+            BatterRowView(TalentMatrix(BATTER_DIM_COUNT), 0, "lifetime")
+
+
+class TestMatrixStateManager:
+
+    def test_initial_states_copied(self):
+        dual = DualPitcherState(player_id=200)
+        dual.season.elo_dimensions[2] = 1600.0
+        dual.career.bfp_count = 77
+        dual.season.role = "closer"
+        mgr = TalentStateManager(initial_pitchers={200: dual}, storage="matrix")
+        p = mgr.get_or_create_pitcher(200)
+        assert p.season.elo_dimensions[2] == 1600.0
+        assert p.career.bfp_count == 77
+        assert p.season.role == "closer"
+        assert mgr.pitcher_matrix.elo("season").shape == (1, 4)
+
+    def test_reset_season_keeps_career(self):
+        mgr = TalentStateManager(storage="matrix")
+        b = mgr.get_or_create_batter(100)
+        b.apply_deltas(np.array([30.0, 0, 0, 0, 0]))
+        mgr.reset_season(2026)
+        assert b.season.elo_dimensions[0] == DEFAULT_ELO
+        assert b.season.pa_count == 0
+        assert b.career.elo_dimensions[0] == pytest.approx(1530.0)
+        assert b.career.pa_count == 1
+
+    def test_dual_reset_season_stays_attached(self):
+        mgr = TalentStateManager(storage="matrix")
+        b = mgr.get_or_create_batter(100)
+        b.apply_deltas(np.array([30.0, 0, 0, 0, 0]))
+        b.reset_season()
+        assert isinstance(b.season, BatterRowView)
+        assert mgr.batter_matrix.season_elo[0, 0] == DEFAULT_ELO
+
+    def test_unknown_storage_rejected(self):
+        with pytest.raises(ValueError):
+            TalentStateManager(storage="sparse")
+
+
+class TestTalentBatchMatrixParity:
+
+    def test_matches_dict_storage(self):
+        pa_df = _random_season(1500, seed=9)
+
+        def initial_batters():
+            dual = DualBatterState(player_id=100)
+            dual.career.elo_dimensions[:] = 1550.0
+            dual.career.pa_count = 300
+            dual.season.event_counts[:] = 120
+            return {100: dual}
+
+        results = []
+        for storage in ("dict", "matrix"):
+            batch = TalentBatch(initial_batters=initial_batters(), storage=storage)
+            batch.process(pa_df)
+            results.append(batch)
+        py, mx = results
+        assert list(py.talent_pa_details) == list(mx.talent_pa_details)
+        assert py.talent_daily_ohlc == mx.talent_daily_ohlc
+        assert py.get_talent_player_records() == mx.get_talent_player_records()
@@ -35,6 +35,13 @@ class TestBatterTalentState:
         assert s.elo_dimensions[0] == pytest.approx(1510.0)
         assert s.elo_dimensions[1] == pytest.approx(1495.0)
 
+    def test_apply_deltas_keeps_caller_array(self):
+        initial = np.array([1500] * 5)
+        s = BatterTalentState(player_id=100, elo_dimensions=initial)
+        s.apply_deltas(np.array([10.5, 0, 0, 0, 0]))
+        assert s.elo_dimensions[0] == pytest.approx(1510.5)
+        assert initial.tolist() == [1500] * 5
+
     def test_clamp_elo_min(self):
         s = BatterTalentState(player_id=100)
         s.apply_deltas(np.array([-1500.0, 0, 0, 0, 0]))
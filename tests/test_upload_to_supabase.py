@@ -82,3 +82,16 @@ def test_prepare_pa_records_nan_to_none():
     assert r['launch_speed'] is None
     assert r['launch_angle'] is None
     assert r['xwoba'] is None
+
+
+def test_prepare_pa_records_float32_rounding():
+    """compact schema float32 physics → 원래 소수값."""
+    import numpy as np
+    df = pd.DataFrame({
+        'pa_id': [1], 'game_date': [pd.Timestamp('2025-04-01')],
+        'launch_speed': np.array([95.2], dtype=np.float32),
+        'launch_angle': np.array([np.nan], dtype=np.float32),
+    })
+    r = prepare_pa_records(df)[0]
+    assert r['launch_speed'] == 95.2
+    assert r['launch_angle'] is None
@@ -0,0 +1,124 @@
+"""Wavefront scheduler (wavefront) + EloBatch/TalentBatch wavefront 모드 테스트.
+
+- wave 내 선수 중복 없음, 선수별 PA 순서 보존, 날짜마다 wave 0부터
+- EloBatch(engine='wavefront') / TalentBatch(wavefront=True)가 순차 처리와 동일
+- 날짜별 병렬도 지표 (wave_stats)
+"""
+import numpy as np
+import pytest
+
+from src.engine.elo_arrays import day_run_ids, game_date_strings
+from src.engine.elo_batch import EloBatch
+from src.engine.elo_calculator import PlayerEloState
+from src.engine.park_factor import ParkFactor
+from src.engine.re24_baseline import RE24Baseline
+from src.engine.talent_batch import TalentBatch
+from src.engine.talent_state_manager import DualBatterState
+from src.engine.wavefront import build_wavefront, wavefront_day_stats, wavefront_levels
+from tests.test_elo_array_engine_261016 import _assert_same_results, _random_season
+
+
+def _schedule(pa_df):
+    dates = game_date_strings(pa_df)
+    runs = day_run_ids(dates)
+    return dates, runs, build_wavefront(runs, pa_df['batter_id'], pa_df['pitcher_id'])
+
+
+class TestWavefrontScheduler:
+    def test_levels_follow_shared_players(self):
+        runs = np.array([0, 0, 0, 0, 1, 1])
+        batters = np.array([1, 2, 1, 3, 1, 2])
+        pitchers = np.array([10, 11, 11, 12, 10, 10])
+        assert wavefront_levels(runs, batters, pitchers).tolist() == [0, 0, 1, 0, 0, 1]
+
+    def test_waves_share_no_player_and_keep_player_order(self):
+        pa_df = _random_season(2000, seed=5)
+        _, runs, schedule = _schedule(pa_df)
+        batters = pa_df['batter_id'].to_numpy()
+        pitchers = pa_df['pitcher_id'].to_numpy()
+
+        seen = []
+        for wave in schedule.waves():
+            players = [pid for i in wave.tolist() for pid in {batters[i], pitchers[i]}]
+            assert len(set(players)) == len(players)
+            assert len(np.unique(runs[wave])) == 1
+            assert (np.diff(wave) > 0).all()
+            seen.append(wave)
+        order = np.concatenate(seen)
+        assert sorted(order.tolist()) == list(range(len(pa_df)))
+
+        # 선수별 실행 순서 = 원래 PA 순서
+        position = np.empty(len(order), dtype=np.int64)
+        position[order] = np.arange(len(order))
+        for pid in [660271, 100, 200]:
+            rows = np.flatnonzero((batters == pid) | (pitchers == pid))
+            assert (np.diff(position[rows]) > 0).all()
+
+    def test_day_stats(self):
+        pa_df = _random_season(1500, seed=2)
+        dates, _, schedule = _schedule(pa_df)
+        stats = wavefront_day_stats(schedule, dates)
+        assert [s['game_date'] for s in stats] == list(dict.fromkeys(dates.tolist()))
+        assert sum(s['pa'] for s in stats) == len(pa_df)
+        assert sum(s['waves'] for s in stats) == schedule.n_waves
+        for s in stats:
+            assert 1 <= s['max_width'] <= s['pa']
+            assert s['parallelism'] == pytest.approx(s['pa'] / s['waves'])
+            assert s['parallelism'] > 1
+
+    def test_empty(self):
+        schedule = build_wavefront(np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0))
+        assert schedule.n_waves == 0
+        assert list(schedule.waves()) == []
+        assert wavefront_day_stats(schedule, np.zeros(0, dtype=object)) == []
+
+
+class TestEloBatchWavefront:
+    def test_matches_python_engine(self):
+        pa_df = _random_season(seed=11)
+        baseline, park = RE24Baseline(), ParkFactor()
+        py = EloBatch(re24_baseline=baseline, park_factor=park)
+        py.process(pa_df)
+        wf = EloBatch(re24_baseline=baseline, park_factor=park, engine='wavefront')
+        wf.process(pa_df)
+        _assert_same_results(py, wf)
+        assert wf.get_player_elo_records() == py.get_player_elo_records()
+        assert len(wf.wave_stats) == pa_df['game_date'].nunique()
+
+    def test_matches_with_initial_states_and_min_elo(self):
+        pa_df = _random_season(800, seed=3)
+        states = {
+            100: PlayerEloState(player_id=100, batting_elo=505.0, batting_pa=40),
+            200: PlayerEloState(player_id=200, pitching_elo=501.0, pitching_pa=90),
+        }
+        py = EloBatch(initial_states={k: PlayerEloState(**vars(v)) for k, v in states.items()})
+        py.process(pa_df)
+        wf = EloBatch(initial_states={k: PlayerEloState(**vars(v)) for k, v in states.items()},
+                      engine='wavefront')
+        wf.process(pa_df)
+        _assert_same_results(py, wf)
+
+
+class TestTalentBatchWavefront:
+    def test_matches_sequential(self):
+        pa_df = _random_season(2500, seed=4)
+
+        def initial_batters():
+            dual = DualBatterState(player_id=660271)  # TWP clutch 공유 OHLC 키
+            dual.season.elo_dimensions[4] = 1620.0
+            return {660271: dual}
+
+        seq = TalentBatch(initial_batters=initial_batters())
+        seq.process(pa_df)
+        wf = TalentBatch(initial_batters=initial_batters(), wavefront=True)
+        wf.process(pa_df)
+
+        assert wf.state_mgr.storage == 'matrix'
+        assert list(wf.talent_pa_details) == list(seq.talent_pa_details)
+        assert wf.talent_daily_ohlc == seq.talent_daily_ohlc
+        assert wf.get_talent_player_records() == seq.get_talent_player_records()
+        assert [s['game_date'] for s in wf.wave_stats] == sorted(pa_df['game_date'].unique())
+
+    def test_jit_and_wavefront_exclusive(self):
+        with pytest.raises(ValueError):
+            TalentBatch(jit=True, wavefront=True)